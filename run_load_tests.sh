@@ -45,6 +45,12 @@ quick_performance_check() {
     python -m pytest tests/test_performance.py -v -k "test_vector_operations or test_entity_operations" -s --tb=short
 }
 
+# Function to benchmark the client against the in-process fake server (no SpacetimeDB needed)
+fake_server_benchmarks() {
+    echo -e "\n${GREEN}🧪 Running client benchmarks against the fake SpacetimeDB server...${NC}"
+    python -m pytest tests/test_client_benchmarks.py -v -s --tb=short
+}
+
 # Function to check system resources
 check_system_resources() {
     echo -e "\n${GREEN}💻 System Resources:${NC}"
@@ -174,6 +180,10 @@ if [ "$1" == "--quick" ]; then
     check_system_resources
     quick_performance_check
     exit 0
+elif [ "$1" == "--fake-server" ]; then
+    check_system_resources
+    fake_server_benchmarks
+    exit 0
 elif [ "$1" == "--all" ]; then
     CHOICE=9
 else
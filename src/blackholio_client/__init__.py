@@ -14,58 +14,146 @@ __author__ = "Elite Engineering Team"
 __email__ = "engineering@blackholio.com"
 __license__ = "MIT"
 
-# Core imports for easy access - using modernized SDK implementation
-from .connection.modernized_spacetimedb_client import BlackholioClient
-from .config.environment import EnvironmentConfig, get_environment_config
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
-# Create alias for backward compatibility
-get_global_config = get_environment_config
-from .models.game_entities import GameEntity, GamePlayer, GameCircle, Vector2
-from .auth.auth_client import AuthenticatedClient
-from .auth.identity_manager import IdentityManager, Identity
-from .auth.token_manager import TokenManager, AuthToken
-from .reducers.reducer_client import ReducerClient, ReducerResult
-from .reducers.action_formatter import ActionFormatter, Action
-from .reducers.game_reducers import GameReducers
-from .integration.client_generator import SpacetimeDBClientGenerator
-from .integration.client_loader import ClientLoader
-from .integration.server_manager import ServerManager
-from .factory.client_factory import create_client, get_client_factory
-from .factory.base import ClientFactory
-from .exceptions.connection_errors import (
-    BlackholioConnectionError,
-    BlackholioConfigurationError,
-    ServerConfigurationError,
-    SpacetimeDBError
-)
-
-# NEW: Unified API imports
-from .client import GameClient, create_game_client
-from .interfaces.connection_interface import ConnectionInterface, ConnectionState
-from .interfaces.auth_interface import AuthInterface
-from .interfaces.subscription_interface import SubscriptionInterface, SubscriptionState
-from .interfaces.reducer_interface import ReducerInterface, ReducerStatus
-from .interfaces.game_client_interface import GameClientInterface
+# Public API, loaded on first attribute access (PEP 562) so that importing the
+# package does not pull in the connection stack, auth/cryptography, the event
+# system or the integration tooling until they are used.
+_LAZY_IMPORTS: Dict[str, Tuple[str, str]] = {
+    # Core imports for easy access - using modernized SDK implementation
+    "BlackholioClient": ("connection.modernized_spacetimedb_client", "BlackholioClient"),
+    "EnvironmentConfig": ("config.environment", "EnvironmentConfig"),
+    "get_environment_config": ("config.environment", "get_environment_config"),
+    # Alias for backward compatibility
+    "get_global_config": ("config.environment", "get_environment_config"),
+    "GameEntity": ("models.game_entities", "GameEntity"),
+    "GamePlayer": ("models.game_entities", "GamePlayer"),
+    "GameCircle": ("models.game_entities", "GameCircle"),
+    "Vector2": ("models.game_entities", "Vector2"),
+    "AuthenticatedClient": ("auth.auth_client", "AuthenticatedClient"),
+    "IdentityManager": ("auth.identity_manager", "IdentityManager"),
+    "Identity": ("auth.identity_manager", "Identity"),
+    "TokenManager": ("auth.token_manager", "TokenManager"),
+    "AuthToken": ("auth.token_manager", "AuthToken"),
+    "ReducerClient": ("reducers.reducer_client", "ReducerClient"),
+    "ReducerResult": ("reducers.reducer_client", "ReducerResult"),
+    "ActionFormatter": ("reducers.action_formatter", "ActionFormatter"),
+    "Action": ("reducers.action_formatter", "Action"),
+    "GameReducers": ("reducers.game_reducers", "GameReducers"),
+    "SpacetimeDBClientGenerator": ("integration.client_generator", "SpacetimeDBClientGenerator"),
+    "ClientLoader": ("integration.client_loader", "ClientLoader"),
+    "ServerManager": ("integration.server_manager", "ServerManager"),
+    "create_client": ("factory.client_factory", "create_client"),
+    "get_client_factory": ("factory.client_factory", "get_client_factory"),
+    "ClientFactory": ("factory.base", "ClientFactory"),
+    "BlackholioConnectionError": ("exceptions.connection_errors", "BlackholioConnectionError"),
+    "BlackholioConfigurationError": ("exceptions.connection_errors", "BlackholioConfigurationError"),
+    "ServerConfigurationError": ("exceptions.connection_errors", "ServerConfigurationError"),
+    "SpacetimeDBError": ("exceptions.connection_errors", "SpacetimeDBError"),
+    
+    # NEW: Unified API imports
+    "GameClient": ("client", "GameClient"),
+    "create_game_client": ("client", "create_game_client"),
+    "ConnectionInterface": ("interfaces.connection_interface", "ConnectionInterface"),
+    "ConnectionState": ("interfaces.connection_interface", "ConnectionState"),
+    "AuthInterface": ("interfaces.auth_interface", "AuthInterface"),
+    "SubscriptionInterface": ("interfaces.subscription_interface", "SubscriptionInterface"),
+    "SubscriptionState": ("interfaces.subscription_interface", "SubscriptionState"),
+    "ReducerInterface": ("interfaces.reducer_interface", "ReducerInterface"),
+    "ReducerStatus": ("interfaces.reducer_interface", "ReducerStatus"),
+    "GameClientInterface": ("interfaces.game_client_interface", "GameClientInterface"),
+    
+    # Multi-agent vector environment
+    "VectorGameEnv": ("vector_env", "VectorGameEnv"),
+    "VectorEnvConfig": ("vector_env", "VectorEnvConfig"),
+    "ShardedVectorGameEnv": ("vector_env", "ShardedVectorGameEnv"),
+}
 
 # Event System imports
-from .events import (
-    Event, EventType, EventPriority,
-    EventManager, GlobalEventManager,
-    EventSubscriber, CallbackEventSubscriber,
-    EventPublisher, GameEventPublisher, ConnectionEventPublisher,
-    AsyncEventHandler, SyncEventHandler,
-    # Game events
-    GameEvent, PlayerJoinedEvent, PlayerLeftEvent,
-    EntityCreatedEvent, EntityUpdatedEvent, EntityDestroyedEvent,
-    GameStateChangedEvent, PlayerMovedEvent, PlayerSplitEvent,
-    # Connection events
-    ConnectionEvent, ConnectionEstablishedEvent, ConnectionLostEvent,
-    ConnectionReconnectingEvent, SubscriptionStateChangedEvent,
-    TableDataReceivedEvent, ReducerExecutedEvent, AuthenticationEvent,
-    # Utilities
-    EventFilter, EventThrottle, EventBatch,
-    get_global_event_manager, reset_global_event_manager
-)
+_LAZY_IMPORTS.update({
+    name: ("events", name) for name in (
+        "Event", "EventType", "EventPriority",
+        "EventManager", "GlobalEventManager",
+        "EventSubscriber", "CallbackEventSubscriber",
+        "EventPublisher", "GameEventPublisher", "ConnectionEventPublisher",
+        "AsyncEventHandler", "SyncEventHandler",
+        # Game events
+        "GameEvent", "PlayerJoinedEvent", "PlayerLeftEvent",
+        "EntityCreatedEvent", "EntityUpdatedEvent", "EntityDestroyedEvent",
+        "GameStateChangedEvent", "PlayerMovedEvent", "PlayerSplitEvent",
+        # Connection events
+        "ConnectionEvent", "ConnectionEstablishedEvent", "ConnectionLostEvent",
+        "ConnectionReconnectingEvent", "SubscriptionStateChangedEvent",
+        "TableDataReceivedEvent", "ReducerExecutedEvent", "AuthenticationEvent",
+        # Utilities
+        "EventFilter", "EventThrottle", "EventBatch",
+        "get_global_event_manager", "reset_global_event_manager",
+    )
+})
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public API name on first access and cache it on the package."""
+    try:
+        module_name, attribute = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily loaded names in dir()."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    from .connection.modernized_spacetimedb_client import BlackholioClient
+    from .config.environment import EnvironmentConfig, get_environment_config
+    get_global_config = get_environment_config
+    from .models.game_entities import GameEntity, GamePlayer, GameCircle, Vector2
+    from .auth.auth_client import AuthenticatedClient
+    from .auth.identity_manager import IdentityManager, Identity
+    from .auth.token_manager import TokenManager, AuthToken
+    from .reducers.reducer_client import ReducerClient, ReducerResult
+    from .reducers.action_formatter import ActionFormatter, Action
+    from .reducers.game_reducers import GameReducers
+    from .integration.client_generator import SpacetimeDBClientGenerator
+    from .integration.client_loader import ClientLoader
+    from .integration.server_manager import ServerManager
+    from .factory.client_factory import create_client, get_client_factory
+    from .factory.base import ClientFactory
+    from .exceptions.connection_errors import (
+        BlackholioConnectionError,
+        BlackholioConfigurationError,
+        ServerConfigurationError,
+        SpacetimeDBError
+    )
+    from .client import GameClient, create_game_client
+    from .interfaces.connection_interface import ConnectionInterface, ConnectionState
+    from .interfaces.auth_interface import AuthInterface
+    from .interfaces.subscription_interface import SubscriptionInterface, SubscriptionState
+    from .interfaces.reducer_interface import ReducerInterface, ReducerStatus
+    from .interfaces.game_client_interface import GameClientInterface
+    from .vector_env import VectorGameEnv, VectorEnvConfig, ShardedVectorGameEnv
+    from .events import (
+        Event, EventType, EventPriority,
+        EventManager, GlobalEventManager,
+        EventSubscriber, CallbackEventSubscriber,
+        EventPublisher, GameEventPublisher, ConnectionEventPublisher,
+        AsyncEventHandler, SyncEventHandler,
+        GameEvent, PlayerJoinedEvent, PlayerLeftEvent,
+        EntityCreatedEvent, EntityUpdatedEvent, EntityDestroyedEvent,
+        GameStateChangedEvent, PlayerMovedEvent, PlayerSplitEvent,
+        ConnectionEvent, ConnectionEstablishedEvent, ConnectionLostEvent,
+        ConnectionReconnectingEvent, SubscriptionStateChangedEvent,
+        TableDataReceivedEvent, ReducerExecutedEvent, AuthenticationEvent,
+        EventFilter, EventThrottle, EventBatch,
+        get_global_event_manager, reset_global_event_manager
+    )
 
 # Package metadata
 __all__ = [
@@ -111,6 +199,11 @@ __all__ = [
     "ReducerStatus",
     "GameClientInterface",
     
+    # Multi-agent vector environment
+    "VectorGameEnv",
+    "VectorEnvConfig",
+    "ShardedVectorGameEnv",
+    
     # Event System
     "Event", "EventType", "EventPriority",
     "EventManager", "GlobalEventManager",
@@ -5,6 +5,7 @@ Provides identity creation, management, and authentication for SpacetimeDB conne
 """
 
 from .identity_manager import IdentityManager, Identity
+from .credential_cache import CredentialCache, get_credential_cache
 from .token_manager import TokenManager
 from .auth_client import AuthenticatedClient
 
@@ -12,5 +13,7 @@ __all__ = [
     "IdentityManager",
     "Identity", 
     "TokenManager",
-    "AuthenticatedClient"
+    "AuthenticatedClient",
+    "CredentialCache",
+    "get_credential_cache"
 ]
\ No newline at end of file
@@ -0,0 +1,229 @@
+"""
+Credential Cache - Process-Shared Cache for Credential and Identity Files
+
+Keeps parsed credential/identity JSON files in memory so repeated
+connects do not re-read and re-parse them. Entries are invalidated when
+the file's mtime or size changes, and writes are atomic (temp file plus
+rename) and can be pushed off the event loop.
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+
+def atomic_write_json(path: PathLike, data: Dict[str, Any], mode: int = 0o600) -> None:
+    """
+    Write JSON to a file atomically.
+
+    The data is written to a temporary file in the same directory and
+    renamed over the target, so readers never see a partial file.
+
+    Args:
+        path: Destination file
+        data: JSON-serializable data
+        mode: File permissions on Unix-like systems
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.name != 'nt':  # Unix-like systems
+            os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except Exception:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+class CredentialCache:
+    """
+    In-memory cache of parsed JSON files keyed by path.
+
+    A cached entry is reused as long as the file's (mtime, size) signature
+    is unchanged, so edits by other processes are still picked up. Reads
+    return copies; callers may modify them freely.
+    """
+
+    def __init__(self):
+        """Initialize credential cache."""
+        self._entries: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._errors = 0
+
+    @staticmethod
+    def _signature(path: Path) -> Optional[Tuple[int, int]]:
+        """Get the (mtime_ns, size) signature of a file, or None if missing."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def read(self, path: PathLike) -> Optional[Dict[str, Any]]:
+        """
+        Read a JSON file through the cache.
+
+        Args:
+            path: File to read
+
+        Returns:
+            Parsed data, or None if the file is missing or unreadable
+        """
+        path = Path(path)
+        signature = self._signature(path)
+        if signature is None:
+            with self._lock:
+                self._entries.pop(path, None)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self._hits += 1
+                return copy.deepcopy(entry[1])
+            self._misses += 1
+
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except Exception as e:
+            with self._lock:
+                self._errors += 1
+            logger.debug(f"Failed to read {path}: {e}")
+            return None
+
+        with self._lock:
+            self._entries[path] = (signature, data)
+        return copy.deepcopy(data)
+
+    def is_fresh(self, path: PathLike) -> bool:
+        """Check if a file can be served from memory without touching its contents."""
+        path = Path(path)
+        signature = self._signature(path)
+        with self._lock:
+            entry = self._entries.get(path)
+        return signature is not None and entry is not None and entry[0] == signature
+
+    def write(self, path: PathLike, data: Dict[str, Any], mode: int = 0o600) -> None:
+        """
+        Atomically write a JSON file and cache its contents.
+
+        Args:
+            path: Destination file
+            data: JSON-serializable data
+            mode: File permissions on Unix-like systems
+        """
+        path = Path(path)
+        with self._write_lock:
+            self._write(path, data, mode)
+
+    def update(self, path: PathLike, key: str, value: Any, mode: int = 0o600) -> None:
+        """
+        Set one key in a JSON object file, preserving the other keys.
+
+        Args:
+            path: File holding a JSON object
+            key: Key to set
+            value: Value to store
+            mode: File permissions on Unix-like systems
+        """
+        path = Path(path)
+        with self._write_lock:
+            data = self.read(path) or {}
+            data[key] = value
+            self._write(path, data, mode)
+
+    def _write(self, path: Path, data: Dict[str, Any], mode: int) -> None:
+        """Write a file and refresh its cache entry (write lock held)."""
+        atomic_write_json(path, data, mode)
+        signature = self._signature(path)
+        with self._lock:
+            self._writes += 1
+            if signature is not None:
+                self._entries[path] = (signature, copy.deepcopy(data))
+
+    async def read_async(self, path: PathLike) -> Optional[Dict[str, Any]]:
+        """Read a JSON file, doing any disk I/O in the default executor."""
+        if self.is_fresh(path):
+            return self.read(path)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.read, path)
+
+    async def write_async(self, path: PathLike, data: Dict[str, Any], mode: int = 0o600) -> None:
+        """Atomically write a JSON file in the default executor."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.write, path, data, mode)
+
+    async def update_async(self, path: PathLike, key: str, value: Any, mode: int = 0o600) -> None:
+        """Set one key in a JSON object file in the default executor."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.update, path, key, value, mode)
+
+    def invalidate(self, path: Optional[PathLike] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            path: File to drop (drops everything if None)
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(path), None)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get credential cache statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'writes': self._writes,
+                'errors': self._errors
+            }
+
+
+# Global credential cache instance
+_credential_cache: Optional[CredentialCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_credential_cache() -> CredentialCache:
+    """Get the process-wide credential cache."""
+    global _credential_cache
+
+    if _credential_cache is None:
+        with _cache_lock:
+            if _credential_cache is None:
+                _credential_cache = CredentialCache()
+
+    return _credential_cache
@@ -6,7 +6,6 @@ with support for cryptographic key generation and persistence.
 """
 
 import os
-import json
 import logging
 import hashlib
 import secrets
@@ -16,6 +15,7 @@ from typing import Dict, Any, Optional, Union
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ed25519
 
+from .credential_cache import get_credential_cache
 from ..exceptions.connection_errors import (
     AuthenticationError,
     DataValidationError,
@@ -178,8 +178,10 @@ class IdentityManager:
         if os.name != 'nt':  # Unix-like systems
             os.chmod(self.identity_dir, 0o700)
         
+        # Identities are loaded lazily, one file at a time, on first use
         self._identities: Dict[str, Identity] = {}
-        self._load_identities()
+        self._all_loaded = False
+        self._cache = get_credential_cache()
         
         logger.info(f"Identity manager initialized with directory: {self.identity_dir}")
     
@@ -202,7 +204,7 @@ class IdentityManager:
         
         name = name.strip()
         
-        if name in self._identities:
+        if self.load_identity(name) is not None:
             raise ValueError(f"Identity '{name}' already exists")
         
         # Generate Ed25519 key pair
@@ -256,7 +258,10 @@ class IdentityManager:
         Returns:
             Identity object or None if not found
         """
-        return self._identities.get(name)
+        identity = self._identities.get(name)
+        if identity is None and not self._all_loaded:
+            identity = self._load_identity_file(self.identity_dir / f"{name}.json")
+        return identity
     
     def get_identity_by_id(self, identity_id: str) -> Optional[Identity]:
         """
@@ -268,6 +273,7 @@ class IdentityManager:
         Returns:
             Identity object or None if not found
         """
+        self._load_identities()
         for identity in self._identities.values():
             if identity.identity_id == identity_id:
                 return identity
@@ -280,6 +286,7 @@ class IdentityManager:
         Returns:
             Dictionary mapping names to Identity objects
         """
+        self._load_identities()
         return self._identities.copy()
     
     def delete_identity(self, name: str) -> bool:
@@ -292,7 +299,7 @@ class IdentityManager:
         Returns:
             True if deleted, False if not found
         """
-        if name not in self._identities:
+        if self.load_identity(name) is None:
             return False
         
         # Remove from memory
@@ -303,6 +310,7 @@ class IdentityManager:
         try:
             if identity_file.exists():
                 identity_file.unlink()
+            self._cache.invalidate(identity_file)
             logger.info(f"Deleted identity: {name}")
             return True
         except Exception as e:
@@ -318,10 +326,11 @@ class IdentityManager:
         Args:
             name: Identity name
         """
-        if name in self._identities:
+        identity = self.load_identity(name)
+        if identity is not None:
             import time
-            self._identities[name].last_used = time.time()
-            self._save_identity(self._identities[name])
+            identity.last_used = time.time()
+            self._save_identity(identity)
     
     def export_identity(self, name: str, password: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
@@ -368,7 +377,7 @@ class IdentityManager:
             
             identity = Identity.from_dict(data)
             
-            if identity.name in self._identities and not overwrite:
+            if not overwrite and self.load_identity(identity.name) is not None:
                 raise ValueError(f"Identity '{identity.name}' already exists")
             
             self._identities[identity.name] = identity
@@ -391,25 +400,35 @@ class IdentityManager:
         # Return first 16 bytes as hex string
         return hash_bytes[:16].hex()
     
+    def _load_identity_file(self, identity_file: Path) -> Optional[Identity]:
+        """Load a single identity file through the shared credential cache."""
+        try:
+            identity_file = Path(identity_file).resolve()
+            if not str(identity_file).startswith(str(Path.cwd())):
+                raise ValueError(f"Path traversal detected: {identity_file}")
+            
+            data = self._cache.read(identity_file)
+            if data is None:
+                return None
+            
+            identity = Identity.from_dict(data)
+            self._identities[identity.name] = identity
+            return identity
+            
+        except Exception as e:
+            logger.error(f"Failed to load identity from {identity_file}: {e}")
+            return None
+    
     def _load_identities(self):
-        """Load all identities from storage."""
-        if not self.identity_dir.exists():
+        """Load all identities from storage (only needed for listing and ID lookups)."""
+        if self._all_loaded or not self.identity_dir.exists():
             return
         
         for identity_file in self.identity_dir.glob("*.json"):
-            try:
-                identity_file = Path(identity_file).resolve()
-                if not str(identity_file).startswith(str(Path.cwd())):
-                    raise ValueError(f"Path traversal detected: {identity_file}")
-                with open(identity_file, 'r') as f:
-                    data = json.load(f)
-                
-                identity = Identity.from_dict(data)
-                self._identities[identity.name] = identity
-                
-            except Exception as e:
-                logger.error(f"Failed to load identity from {identity_file}: {e}")
+            if identity_file.stem not in self._identities:
+                self._load_identity_file(identity_file)
         
+        self._all_loaded = True
         logger.info(f"Loaded {len(self._identities)} identities")
     
     def _save_identity(self, identity: Identity):
@@ -421,12 +440,9 @@ class IdentityManager:
             identity_file = Path(identity_file).resolve()
             if not str(identity_file).startswith(str(Path.cwd())):
                 raise ValueError(f"Path traversal detected: {identity_file}")
-            with open(identity_file, 'w') as f:
-                json.dump(identity.to_dict(), f, indent=2)
             
-            # Set secure permissions (owner read/write only)
-            if os.name != 'nt':  # Unix-like systems
-                os.chmod(identity_file, 0o600)
+            # Atomic write with secure permissions (owner read/write only)
+            self._cache.write(identity_file, identity.to_dict(), mode=0o600)
                 
         except Exception as e:
             logger.error(f"Failed to save identity {identity.name}: {e}")
@@ -8,20 +8,32 @@ functionality from the interfaces into a single, easy-to-use client class.
 import asyncio
 import json
 import logging
+import threading
 import uuid
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple, Union, Iterable, Mapping
 from datetime import datetime
 
 from .interfaces.game_client_interface import GameClientInterface
 from .interfaces.connection_interface import ConnectionState
 from .interfaces.subscription_interface import SubscriptionState
 from .interfaces.reducer_interface import ReducerStatus
-from .models.game_entities import GamePlayer, GameEntity, GameCircle, Vector2
+from .models.game_entities import GamePlayer, GameEntity, GameCircle, Vector2, EntityType
+from .models.physics import calculate_center_of_mass
+from .models.interpolation import InterpolationBuffer, InterpolationConfig
+from .models.prediction import LocalPlayerPredictor, PredictionConfig
+from .models.snapshots import VersionedMap
+from .models.training_export import TrainingDataExporter, ExportConfig
+from .events.change_stream import ChangeStream, ChangeStreamConfig, INSERT, UPDATE, DELETE
+from .connection.interest_management import InterestManager, InterestConfiguration
+from .reducers.input_channel import InputChannel, InputChannelConfig
+from .reducers.outcome_tracker import ReducerOutcomeTracker
 from .connection.modernized_spacetimedb_client import ModernizedSpacetimeDBConnection
 from .connection.server_config import ServerConfig
+from .connection.frame_recording import FrameRecorder, FrameReplayer, RecordedFrame
 from .config.environment import EnvironmentConfig
 from .factory.client_factory import get_client_factory
 from .exceptions.connection_errors import BlackholioTimeoutError, BlackholioConnectionError
+from .utils.debugging import get_span_profiler
 from pathlib import Path
 
 
@@ -86,18 +98,47 @@ class GameClient(GameClientInterface):
         self._is_in_game = False
         self._local_player = None
         
-        # Data caches
-        self._entities: Dict[int, GameEntity] = {}
-        self._players: Dict[int, GamePlayer] = {}
-        self._circles: Dict[int, GameCircle] = {}
+        # Data caches (copy-on-write, so get_all_* can hand out snapshots)
+        self._entities: VersionedMap = VersionedMap()
+        self._players: VersionedMap = VersionedMap()
+        self._circles: VersionedMap = VersionedMap()
+        self._entities.add_index('entity_type', lambda entity: entity.entity_type)
+        self._circles.add_index('player_id', lambda circle: circle.player_id)
+        self._circles.add_index('circle_type', lambda circle: circle.circle_type.lower())
         self._game_config: Dict[str, Any] = {}
         
         # Subscription state
         self._subscribed_tables: List[str] = []
         self._subscription_states: Dict[str, SubscriptionState] = {}
         
-        # Reducer tracking
-        self._pending_reducers: Dict[str, ReducerStatus] = {}
+        # Reducer tracking (correlated with TransactionUpdate by request id)
+        self._reducer_outcomes = ReducerOutcomeTracker()
+        
+        # Area-of-interest subscriptions (disabled until enabled explicitly)
+        self._interest_manager: Optional[InterestManager] = None
+        self._out_of_view_circles: Dict[str, GameCircle] = {}  # Circles of evicted entities
+        
+        # Latest-wins input channel (disabled until enabled explicitly)
+        self._input_channel: Optional[InputChannel] = None
+        
+        # Entity position interpolation (disabled until enabled explicitly)
+        self._interpolation: Optional[InterpolationBuffer] = None
+        
+        # Local player prediction (disabled until enabled explicitly)
+        self._predictor: Optional[LocalPlayerPredictor] = None
+        
+        # Change stream of cache deltas (disabled until enabled explicitly)
+        self._change_stream: Optional[ChangeStream] = None
+        
+        # Training data export (disabled until enabled explicitly)
+        self._training_exporter: Optional[TrainingDataExporter] = None
+        self._last_input: Optional[Vector2] = None
+        
+        # Snapshot resume state (diff the next snapshot instead of re-hydrating)
+        self._resume_pending = False
+        self._resume_session: Optional[Dict[str, Any]] = None
+        self._resume_seen: Optional[Dict[str, Set[str]]] = None
+        self._last_resume_diff: Dict[str, int] = {}
         
         # Event callbacks
         self._callbacks: Dict[str, List[Callable]] = {
@@ -130,6 +171,7 @@ class GameClient(GameClientInterface):
             'failed_reducers': 0,
             'messages_received': 0,
             'messages_sent': 0,
+            'resumed_snapshots': 0,
             'start_time': datetime.now(),
             'last_activity': datetime.now()
         }
@@ -141,6 +183,9 @@ class GameClient(GameClientInterface):
         self._is_connecting = False
         self._direct_connection_ref: Optional[Any] = None  # For early callback registration
         
+        # Capture of inbound frames, kept across reconnects
+        self._frame_recorder: Optional[FrameRecorder] = None
+        
         # Configure auto-reconnect if enabled
         if self._auto_reconnect:
             self.enable_auto_reconnect()
@@ -191,6 +236,14 @@ class GameClient(GameClientInterface):
                 # Create connection object
                 direct_connection = SpacetimeDBConnection(server_config)
                 
+                # Carry credentials and subscriptions over from the previous session
+                if self._resume_session:
+                    direct_connection.restore_session(self._resume_session)
+                    self._resume_session = None
+                
+                if self._frame_recorder is not None:
+                    direct_connection.set_frame_recorder(self._frame_recorder)
+                
                 # Register event handlers BEFORE connecting
                 logger.info("🎯 Registering event handlers BEFORE connection starts processing messages")
                 self._register_early_event_handlers(direct_connection)
@@ -258,6 +311,16 @@ class GameClient(GameClientInterface):
                 self._entities.clear()
                 self._players.clear()
                 self._circles.clear()
+                self._out_of_view_circles.clear()
+                if self._interest_manager:
+                    self._interest_manager.reset()
+                if self._input_channel:
+                    await self._input_channel.reset()
+                if self._interpolation is not None:
+                    self._interpolation.clear()
+                if self._predictor is not None:
+                    self._predictor.reset()
+                self._reducer_outcomes.clear()
                 
                 # Disconnect the active connection
                 if self._active_connection:
@@ -287,9 +350,26 @@ class GameClient(GameClientInterface):
         self._callbacks['error'].append(callback)
 
     async def reconnect(self) -> bool:
-        """Attempt to reconnect to the server."""
+        """
+        Attempt to reconnect to the server, resuming the previous session.
+        
+        Cached state is kept and the new snapshot is applied as a diff, so
+        only real inserts/updates/deletes fire callbacks.
+        """
+        previous_connection = self._active_connection or self._direct_connection_ref
         self._connection_state = ConnectionState.RECONNECTING
         self._notify_connection_state_changed()
+        
+        if previous_connection is not None:
+            if hasattr(previous_connection, 'get_session_state'):
+                self._resume_session = previous_connection.get_session_state()
+            try:
+                await previous_connection.disconnect()
+            except Exception as e:
+                logger.debug(f"Error closing previous connection: {e}")
+            self._active_connection = None
+        
+        self._resume_pending = bool(self._entities or self._players or self._circles)
         return await self.connect()
 
     def enable_auto_reconnect(self, max_attempts: int = 10, delay: float = 1.0, exponential_backoff: bool = True) -> None:
@@ -411,21 +491,68 @@ class GameClient(GameClientInterface):
         """Get all entities belonging to the local player."""
         if not self._local_player:
             return []
+        return self.get_player_entities(self._local_player.player_id)
+
+    def get_player_entities(self, player_id: str) -> List[GameEntity]:
+        """
+        Get the entities owned by a player.
+        
+        Ownership comes from circle rows (circle.player_id), looked up through
+        a maintained index, so the cost is proportional to the result.
         
-        return [entity for entity in self._entities.values() 
-                if hasattr(entity, 'player_id') and entity.player_id == self._local_player.player_id]
+        Args:
+            player_id: Owning player's ID
+            
+        Returns:
+            Cached entities of the player's circles
+        """
+        entities = (self._entities.get(entity_id)
+                    for entity_id in self._circles.index('player_id').keys(str(player_id)))
+        return [entity for entity in entities if entity is not None]
 
-    def get_all_entities(self) -> Dict[int, GameEntity]:
-        """Get all game entities."""
-        return self._entities.copy()
+    def get_entities_by_type(self, entity_type: Union[EntityType, str]) -> List[GameEntity]:
+        """
+        Get cached entities of one type (e.g. EntityType.FOOD).
+        
+        Args:
+            entity_type: EntityType or its value
+            
+        Returns:
+            Entities of that type
+        """
+        if not isinstance(entity_type, EntityType):
+            entity_type = EntityType(str(entity_type).lower())
+        return [self._entities[entity_id] for entity_id in self._entities.index('entity_type').keys(entity_type)]
 
-    def get_all_players(self) -> Dict[int, GamePlayer]:
-        """Get all players in the game."""
-        return self._players.copy()
+    def get_circles_by_type(self, circle_type: str) -> List[GameCircle]:
+        """
+        Get cached circles of one circle type (e.g. "food"), case-insensitively.
+        
+        Args:
+            circle_type: Circle type
+            
+        Returns:
+            Circles of that type
+        """
+        return [self._circles[circle_id] for circle_id in self._circles.index('circle_type').keys(circle_type.lower())]
+
+    def get_all_entities(self) -> Mapping[str, GameEntity]:
+        """
+        Get all game entities.
+        
+        Returns an immutable MapSnapshot of the cache: obtaining it does not
+        copy the entities, later updates do not change it, and
+        ``snapshot.diff(older)`` lists what changed between two calls.
+        """
+        return self._entities.snapshot()
 
-    def get_all_circles(self) -> Dict[int, GameCircle]:
-        """Get all circles in the game."""
-        return self._circles.copy()
+    def get_all_players(self) -> Mapping[str, GamePlayer]:
+        """Get all players in the game (immutable snapshot, see get_all_entities)."""
+        return self._players.snapshot()
+
+    def get_all_circles(self) -> Mapping[str, GameCircle]:
+        """Get all circles in the game (immutable snapshot, see get_all_entities)."""
+        return self._circles.snapshot()
 
     def get_entities_near(self, position: Vector2, radius: float) -> List[GameEntity]:
         """Get entities within a radius of a position."""
@@ -440,6 +567,166 @@ class GameClient(GameClientInterface):
         """Get current game configuration."""
         return self._game_config.copy()
 
+    # Area-of-Interest Subscriptions
+    def enable_interest_management(self, config: Optional[InterestConfiguration] = None,
+                                   query_builder: Optional[Callable] = None) -> InterestManager:
+        """
+        Only receive and cache spatial rows around the local player.
+        
+        The subscription follows the local player's view distance and is moved
+        with hysteresis as the player travels. Rows outside the area of interest
+        are evicted from the caches without firing destroy callbacks, and
+        circles are only cached while their entity is.
+        
+        SpacetimeDB cannot filter on ``entity.position`` fields, so by default
+        whole tables stay subscribed and filtering happens on the client; pass
+        ``column_query_builder()`` for servers with scalar position columns.
+        
+        Args:
+            config: Interest configuration (uses defaults if None)
+            query_builder: Optional builder for the spatial subscription query
+            
+        Returns:
+            The active InterestManager
+        """
+        self._interest_manager = InterestManager(config, query_builder)
+        return self._interest_manager
+
+    async def disable_interest_management(self) -> None:
+        """Stop following the local player and go back to full-table subscriptions."""
+        manager = self._interest_manager
+        self._interest_manager = None
+        self._out_of_view_circles.clear()
+        if manager and self._active_connection and hasattr(self._active_connection, 'subscribe_queries'):
+            manager.reset()
+            await self._active_connection.subscribe_queries(manager.build_queries())
+
+    async def update_interest(self, position: Optional[Vector2] = None, mass: Optional[float] = None) -> bool:
+        """
+        Re-evaluate the area of interest and re-subscribe if the player moved far enough.
+        
+        Args:
+            position: Focus position (defaults to the local player's center of mass)
+            mass: Focus mass (defaults to the local player's total mass)
+            
+        Returns:
+            True if the area of interest moved
+        """
+        if not self._interest_manager:
+            return False
+        
+        if position is None or mass is None:
+            focus = self._get_interest_focus()
+            if focus is None:
+                return False
+            position = focus[0] if position is None else position
+            mass = focus[1] if mass is None else mass
+        
+        queries = self._interest_manager.update(position, mass)
+        if queries is None:
+            return False
+        
+        # Whole-table queries stay the same as the region moves: nothing to re-send
+        if (queries != self._interest_manager.subscribed_queries and self._active_connection
+                and hasattr(self._active_connection, 'subscribe_queries')):
+            try:
+                await self._active_connection.subscribe_queries(queries)
+                self._interest_manager.mark_subscribed(queries)
+            except Exception as e:
+                logger.error(f"Failed to move area-of-interest subscription: {e}")
+        
+        self._evict_out_of_interest()
+        return True
+
+    def get_interest_statistics(self) -> Dict[str, Any]:
+        """Get area-of-interest metrics (rows received vs. rows in view)."""
+        if not self._interest_manager:
+            return {'enabled': False}
+        return {'enabled': True, **self._interest_manager.get_statistics()}
+
+    def _get_interest_focus(self) -> Optional[tuple]:
+        """Get the (center, mass) the area of interest should follow."""
+        local_entities = self.get_local_player_entities()
+        if local_entities:
+            total_mass = sum(entity.mass for entity in local_entities)
+            return calculate_center_of_mass(local_entities), total_mass
+        if self._local_player:
+            return self._local_player.position, self._local_player.mass
+        return None
+
+    def _accept_interest_row(self, entity: GameEntity) -> bool:
+        """Record a spatial row and check whether it lies in the area of interest."""
+        accepted = self._interest_manager.contains(entity.position)
+        self._interest_manager.record_row(accepted)
+        return accepted
+
+    def _evict_out_of_interest(self) -> None:
+        """Drop cached entities (and their circles) outside the area of interest."""
+        manager = self._interest_manager
+        if not manager:
+            return
+        
+        evicted = [entity_id for entity_id, entity in self._entities.items()
+                   if not manager.contains(entity.position)]
+        for entity_id in evicted:
+            self._evict_entity(entity_id)
+        
+        if evicted:
+            manager.record_evictions(len(evicted))
+            logger.debug(f"Evicted {len(evicted)} entities outside the area of interest")
+            # A resumed snapshot publishes its batch once its stale rows are deleted
+            if self._change_stream is not None and self._resume_seen is None:
+                self._change_stream.commit()
+        manager.set_rows_in_view(len(self._entities))
+
+    def _evict_entity(self, entity_id: str) -> bool:
+        """Drop an entity and its circle from the caches, recording the deletes on the change stream."""
+        entity = self._entities.pop(entity_id, None)
+        if entity is None:
+            return False
+        circle = self._circles.pop(entity_id, None)
+        if circle is not None:
+            # Kept aside in case the entity comes back into view
+            self._out_of_view_circles[entity_id] = circle
+        if self._change_stream is not None:
+            self._change_stream.record('entity', DELETE, entity_id, entity)
+            if circle is not None:
+                self._change_stream.record('circle', DELETE, entity_id, circle)
+        if self._interpolation is not None:
+            self._interpolation.remove(entity_id)
+        return True
+
+    def _cache_circle(self, circle: GameCircle) -> None:
+        """Cache a circle row, or keep it aside while its entity is outside the area of interest."""
+        if self._interest_manager and circle.entity_id not in self._entities:
+            self._out_of_view_circles[circle.circle_id] = circle
+            return
+        if self._change_stream is not None:
+            self._record_change('circle', circle.circle_id, circle, self._circles.get(circle.circle_id))
+        self._circles[circle.circle_id] = circle
+
+    def _is_local_player_row(self, row_data: Dict[str, Any]) -> bool:
+        """Check whether a player row belongs to this client's identity."""
+        if not isinstance(row_data, dict):
+            return False
+        return self._is_own_identity(row_data.get('identity'))
+
+    def _is_own_identity(self, identity: Any) -> bool:
+        """Check whether an identity value (hex string or wrapped dict) is this client's."""
+        if not self._identity:
+            return False
+        if isinstance(identity, dict):
+            identity = identity.get('__identity__', next(iter(identity.values()), None))
+        if identity is None:
+            return False
+        row_identity = str(identity).lower()
+        own_identity = str(self._identity).lower()
+        if row_identity.startswith('0x'):
+            row_identity = row_identity[2:]
+        if own_identity.startswith('0x'):
+            own_identity = own_identity[2:]
+        return row_identity == own_identity
+
     # Subscription Interface Implementation (simplified)
     async def subscribe_to_tables(self, table_names: List[str]) -> bool:
         """Subscribe to specific tables for real-time updates."""
@@ -473,43 +760,72 @@ class GameClient(GameClientInterface):
 
     # Reducer Interface Implementation (simplified)
     async def call_reducer(self, reducer_name: str, *args, request_id: Optional[str] = None, timeout: Optional[float] = None) -> bool:
-        """Call a reducer on the SpacetimeDB server."""
+        """
+        Call a reducer on the SpacetimeDB server.
+        
+        Returns True once the call is sent. The call stays PENDING until the
+        matching TransactionUpdate arrives; use call_reducer_with_response()
+        to wait for the committed outcome.
+        """
+        _, sent = await self._send_reducer(reducer_name, args, request_id)
+        return sent
+
+    async def _send_reducer(self, reducer_name: str, args: tuple, request_id: Optional[str] = None) -> Tuple[str, bool]:
+        """Register and send a reducer call, returning its request id and whether it was sent."""
         if not request_id:
             request_id = str(uuid.uuid4())
         
         if not self._active_connection:
             logger.error(f"❌ [REDUCER] Cannot call reducer '{reducer_name}': No active connection")
             self._stats['failed_reducers'] += 1
-            return False
+            return request_id, False
         
-        self._pending_reducers[request_id] = ReducerStatus.PENDING
+        wire_id, _ = self._reducer_outcomes.register(request_id, reducer_name)
         self._stats['reducer_calls'] += 1
         
         try:
             logger.info(f"🚀 [REDUCER] Calling reducer '{reducer_name}' with args: {args}")
             
             # Delegate to the actual connection implementation
-            result = await self._active_connection.call_reducer(reducer_name, list(args))
-            
-            self._pending_reducers[request_id] = ReducerStatus.SUCCESS
-            self._stats['successful_reducers'] += 1
+            await self._active_connection.call_reducer(reducer_name, list(args), request_id=wire_id)
             
-            logger.info(f"✅ [REDUCER] Reducer '{reducer_name}' executed successfully")
-            return True
+            logger.info(f"📤 [REDUCER] Reducer '{reducer_name}' sent (request {wire_id})")
+            return request_id, True
             
         except Exception as e:
             logger.error(f"❌ [REDUCER] Reducer '{reducer_name}' failed: {e}")
-            self._pending_reducers[request_id] = ReducerStatus.FAILED
+            self._reducer_outcomes.fail(request_id, str(e))
             self._stats['failed_reducers'] += 1
-            return False
+            return request_id, False
 
     async def call_reducer_with_response(self, reducer_name: str, *args, request_id: Optional[str] = None, timeout: Optional[float] = 10.0) -> Dict[str, Any]:
-        """Call a reducer and wait for response."""
-        success = await self.call_reducer(reducer_name, *args, request_id=request_id, timeout=timeout)
+        """
+        Call a reducer and wait for the server's committed outcome.
+        
+        Returns:
+            Dictionary with success, request_id, status (SUCCESS, FAILED or
+            TIMEOUT), error and commit_latency (seconds from send to commit)
+        """
+        request_id = request_id or str(uuid.uuid4())
+        
+        if not self._active_connection:
+            self._stats['failed_reducers'] += 1
+            return {
+                'success': False,
+                'request_id': request_id,
+                'status': ReducerStatus.FAILED,
+                'error': 'No active connection',
+                'commit_latency': None
+            }
+        
+        await self._send_reducer(reducer_name, args, request_id)
+        outcome = await self._reducer_outcomes.wait_for(request_id, timeout)
         return {
-            'success': success,
+            'success': outcome.is_success,
             'request_id': request_id,
-            'status': ReducerStatus.SUCCESS if success else ReducerStatus.FAILED
+            'status': outcome.status,
+            'error': outcome.error,
+            'commit_latency': outcome.commit_latency
         }
 
     # Game-specific reducer methods
@@ -522,8 +838,262 @@ class GameClient(GameClientInterface):
 
     async def update_player_input(self, direction: Dict[str, float]) -> bool:
         """Update player input direction."""
+        self._last_input = Vector2.from_dict(direction)
+        if self._predictor is not None:
+            self._predictor.apply_input(Vector2.from_dict(direction))
+        if self._input_channel:
+            return self._input_channel.submit(direction)
+        if self._predictor is not None:
+            self._predictor.mark_sent()
         return await self.call_reducer("update_player_input", direction)
 
+    def enable_input_channel(self, config: Optional[InputChannelConfig] = None) -> InputChannel:
+        """
+        Send player input at most once per server tick, latest direction wins.
+        
+        Once enabled, update_player_input() and move_player() return as soon as
+        the direction is recorded; sends are skipped while the direction stays
+        within the configured epsilon.
+        
+        Args:
+            config: Input channel configuration (uses defaults if None)
+            
+        Returns:
+            The active InputChannel
+        """
+        self._input_channel = InputChannel(self._send_player_input, config)
+        return self._input_channel
+
+    async def disable_input_channel(self) -> None:
+        """Flush pending input and go back to one reducer call per update."""
+        channel = self._input_channel
+        self._input_channel = None
+        if channel:
+            await channel.close()
+
+    def get_input_statistics(self) -> Dict[str, Any]:
+        """Get input channel statistics."""
+        if not self._input_channel:
+            return {'enabled': False}
+        return {'enabled': True, **self._input_channel.get_statistics()}
+
+    def enable_interpolation(self, config: Optional[InterpolationConfig] = None) -> InterpolationBuffer:
+        """
+        Keep a short position history per entity for smooth rendering between server ticks.
+        
+        Every cached entity insert or update is recorded with its arrival time
+        (time.monotonic). Requires numpy.
+        
+        Args:
+            config: Interpolation configuration (uses defaults if None)
+            
+        Returns:
+            The active InterpolationBuffer
+        """
+        self._interpolation = InterpolationBuffer(config)
+        for entity in self._entities.values():
+            self._interpolation.push(entity.entity_id, entity.position)
+        return self._interpolation
+
+    def disable_interpolation(self) -> None:
+        """Stop recording entity position history."""
+        self._interpolation = None
+
+    def get_interpolated_positions(self, render_time: Optional[float] = None,
+                                   entity_ids: Optional[List[str]] = None) -> Tuple[List[str], Any]:
+        """
+        Get entity positions at a render time in one vectorised call.
+        
+        Args:
+            render_time: time.monotonic() render time (now if None)
+            entity_ids: Entities to sample (all cached entities if None)
+            
+        Returns:
+            (entity IDs, numpy array of shape (n, 2) with their x, y positions)
+            
+        Raises:
+            RuntimeError: If interpolation is not enabled
+        """
+        if self._interpolation is None:
+            raise RuntimeError("Interpolation is not enabled; call enable_interpolation() first")
+        return self._interpolation.sample(render_time, entity_ids)
+
+    def get_interpolation_statistics(self) -> Dict[str, Any]:
+        """Get entity interpolation statistics."""
+        if self._interpolation is None:
+            return {'enabled': False}
+        return {'enabled': True, **self._interpolation.get_statistics()}
+
+    def enable_prediction(self, config: Optional[PredictionConfig] = None) -> LocalPlayerPredictor:
+        """
+        Move the local player immediately on input instead of waiting for the server.
+        
+        Inputs from update_player_input()/move_player() are applied to a local
+        simulation; each database update rebases it on the local player's
+        authoritative position and replays inputs the server has not seen yet.
+        
+        Args:
+            config: Prediction configuration (uses defaults if None)
+            
+        Returns:
+            The active LocalPlayerPredictor
+        """
+        self._predictor = LocalPlayerPredictor(config)
+        self._reconcile_prediction()
+        return self._predictor
+
+    def disable_prediction(self) -> None:
+        """Stop predicting local player movement."""
+        self._predictor = None
+
+    def get_predicted_position(self) -> Optional[Vector2]:
+        """
+        Get the local player's predicted position.
+        
+        Returns:
+            Predicted position with corrections smoothed, or None if prediction is
+            disabled or no authoritative state has been received yet
+        """
+        if self._predictor is None or not self._predictor.has_state:
+            return None
+        return self._predictor.position
+
+    def get_prediction_statistics(self) -> Dict[str, Any]:
+        """Get local player prediction statistics."""
+        if self._predictor is None:
+            return {'enabled': False}
+        return {'enabled': True, **self._predictor.get_statistics()}
+
+    def enable_change_stream(self, config: Optional[ChangeStreamConfig] = None) -> ChangeStream:
+        """
+        Publish the cache changes of every database update to a bounded change stream.
+        
+        Consumers read it with changes() at their own pace; the receive path
+        never waits for them.
+        
+        Args:
+            config: Change stream configuration (uses defaults if None)
+            
+        Returns:
+            The active ChangeStream
+        """
+        if self._change_stream is not None:
+            self._change_stream.close()
+        self._change_stream = ChangeStream(config)
+        return self._change_stream
+
+    def disable_change_stream(self) -> None:
+        """Stop publishing changes; consumers finish with the batches already buffered."""
+        stream = self._change_stream
+        self._change_stream = None
+        if stream is not None:
+            stream.close()
+
+    def changes(self, tables: Optional[Iterable[str]] = None, since: Optional[int] = None):
+        """
+        Iterate over batched table deltas.
+        
+        Example:
+            async for batch in client.changes(tables=['entity'], since=cursor):
+                handle(batch.changes)
+                cursor = batch.cursor
+        
+        Args:
+            tables: Only yield changes to these tables ('player', 'entity',
+                'circle'; all tables if None)
+            since: Cursor of the last batch already processed (only new
+                batches if None)
+            
+        Returns:
+            Async iterator of ChangeBatch objects; raises ChangeStreamLagError
+            if the consumer falls further behind than the stream's capacity
+            
+        Raises:
+            RuntimeError: If the change stream is not enabled
+        """
+        if self._change_stream is None:
+            raise RuntimeError("Change stream is not enabled; call enable_change_stream() first")
+        return self._change_stream.changes(tables, since)
+
+    def get_change_stream_statistics(self) -> Dict[str, Any]:
+        """Get change stream statistics."""
+        if self._change_stream is None:
+            return {'enabled': False}
+        return {'enabled': True, **self._change_stream.get_statistics()}
+
+    def enable_training_export(self, config: Optional[ExportConfig] = None) -> TrainingDataExporter:
+        """
+        Stream every database update's world state and the local player's input to training data shards.
+        
+        Cache snapshots are queued to a background writer thread, which extracts
+        fixed-size feature vectors and writes .npy (or Parquet) shards. The
+        action of each row is the last direction passed to update_player_input().
+        Updates are never held up by the writer: when its queue is full the
+        tick is dropped and counted as ``ticks_dropped``, whatever
+        ``block_when_full`` says. Requires numpy.
+        
+        Args:
+            config: Export configuration (uses defaults if None)
+            
+        Returns:
+            The active TrainingDataExporter
+        """
+        previous = self._training_exporter
+        if previous is not None:
+            # Let the previous writer finish its queue off the receive path
+            threading.Thread(target=previous.close, name="training-data-close").start()
+        self._training_exporter = TrainingDataExporter(config)
+        return self._training_exporter
+
+    async def disable_training_export(self) -> None:
+        """Write the queued rows and stop exporting training data."""
+        exporter = self._training_exporter
+        self._training_exporter = None
+        if exporter is not None:
+            await asyncio.get_running_loop().run_in_executor(None, exporter.close)
+
+    def get_training_export_statistics(self) -> Dict[str, Any]:
+        """Get training data export statistics."""
+        if self._training_exporter is None:
+            return {'enabled': False}
+        return {'enabled': True, **self._training_exporter.get_statistics()}
+
+    def _record_training_step(self) -> None:
+        """Queue the current world state and last input for training data export."""
+        player_id = self._local_player.player_id if self._local_player else None
+        self._training_exporter.record(self._entities.snapshot(), self._circles.snapshot(),
+                                       player_id, self._last_input, block=False)
+
+    def _record_change(self, table: str, key: str, row: Any, old: Any) -> None:
+        """Record a cache write on the change stream; rewriting an equal row is not a change."""
+        if old is None:
+            self._change_stream.record(table, INSERT, key, row)
+        elif old != row:
+            self._change_stream.record(table, UPDATE, key, row, old)
+
+    def _reconcile_prediction(self) -> None:
+        """Rebase the prediction on the local player's authoritative position."""
+        focus = self._get_interest_focus()
+        if focus is not None:
+            self._predictor.reconcile(focus[0])
+
+    async def _send_player_input(self, direction: Dict[str, float]) -> bool:
+        """Send one input direction without per-call request tracking."""
+        if not self._active_connection:
+            return False
+        
+        self._stats['reducer_calls'] += 1
+        if self._predictor is not None:
+            self._predictor.mark_sent()
+        try:
+            await self._active_connection.call_reducer("update_player_input", [direction])
+            self._stats['successful_reducers'] += 1
+            return True
+        except Exception as e:
+            logger.debug(f"Input update failed: {e}")
+            self._stats['failed_reducers'] += 1
+            return False
+
     async def player_split(self) -> bool:
         """Split the player's entities."""
         return await self.call_reducer("player_split")
@@ -581,7 +1151,17 @@ class GameClient(GameClientInterface):
             'players_count': len(self._players),
             'circles_count': len(self._circles),
             'subscribed_tables_count': len(self._subscribed_tables),
-            'pending_reducers_count': len(self._pending_reducers)
+            'pending_reducers_count': len(self._reducer_outcomes.pending_ids()),
+            'reducer_outcomes': self._reducer_outcomes.get_statistics(),
+            'last_resume_diff': dict(self._last_resume_diff),
+            'interest': self.get_interest_statistics(),
+            'input': self.get_input_statistics(),
+            'interpolation': self.get_interpolation_statistics(),
+            'prediction': self.get_prediction_statistics(),
+            'change_stream': self.get_change_stream_statistics(),
+            'training_export': self.get_training_export_statistics(),
+            'profiler': get_span_profiler().get_statistics(),
+            'frame_recording': self._frame_recorder.get_statistics() if self._frame_recorder else None
         }
 
     def get_client_state(self) -> Dict[str, Any]:
@@ -610,6 +1190,77 @@ class GameClient(GameClientInterface):
         await self.unsubscribe_all()
         await self.disconnect()
 
+    # Frame Recording and Replay
+    def start_recording(self, path: Union[str, Path], compression: Optional[str] = None) -> FrameRecorder:
+        """
+        Record every inbound server frame to a file, across reconnects.
+        
+        Recordings include the IdentityToken frame and therefore the auth
+        token; treat them like credentials.
+        
+        Args:
+            path: Recording file (appended to if it exists)
+            compression: None, 'gzip' or 'zstd'
+            
+        Returns:
+            The frame recorder
+        """
+        self.stop_recording()
+        self._frame_recorder = FrameRecorder(path, compression=compression)
+        if self._active_connection is not None:
+            self._active_connection.set_frame_recorder(self._frame_recorder)
+        logger.info(f"Recording inbound frames to {path}")
+        return self._frame_recorder
+    
+    def stop_recording(self) -> Optional[Dict[str, Any]]:
+        """
+        Stop recording inbound frames and close the recording.
+        
+        Returns:
+            Recording statistics, or None if no recording was active
+        """
+        recorder, self._frame_recorder = self._frame_recorder, None
+        if recorder is None:
+            return None
+        if self._active_connection is not None:
+            self._active_connection.set_frame_recorder(None)
+        recorder.close()
+        return recorder.get_statistics()
+    
+    async def replay_recording(self, source: Union[str, Path, Iterable[RecordedFrame]],
+                               speed: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Replay recorded frames through the receive pipeline into this client's cache.
+        
+        Frames are decoded and dispatched by a server-less SpacetimeDBConnection
+        exactly as live frames are, so the replay exercises the same decode,
+        message processing and cache update code. The client should not be
+        connected while replaying.
+        
+        Args:
+            source: Recording file, or recorded frames
+            speed: Replay speed multiplier (1.0 = recorded pace, None = as fast as possible)
+            
+        Returns:
+            Replay statistics
+        """
+        from .connection.spacetimedb_connection import SpacetimeDBConnection
+        
+        connection = SpacetimeDBConnection(ServerConfig(
+            language=self._server_language,
+            host=self._config.server_ip,
+            port=self._config.server_port,
+            db_identity=self._database,
+            protocol=self._protocol,
+            use_ssl=False
+        ))
+        self._register_early_event_handlers(connection)
+        
+        replayer = FrameReplayer(source, speed=speed)
+        stats = await replayer.replay(connection)
+        stats['entities_count'] = len(self._entities)
+        return stats
+
     # Debug and Development Methods
     def enable_debug_logging(self, level: str = "DEBUG") -> None:
         """Enable debug logging for troubleshooting."""
@@ -727,7 +1378,7 @@ class GameClient(GameClientInterface):
                 'entities': len(self._entities),
                 'players': len(self._players),
                 'circles': len(self._circles),
-                'pending_reducers': len(self._pending_reducers)
+                'pending_reducers': len(self._reducer_outcomes.pending_ids())
             }
         }
 
@@ -942,30 +1593,166 @@ class GameClient(GameClientInterface):
             if isinstance(subscription_data, dict):
                 if 'database_update' in subscription_data:
                     db_update = subscription_data['database_update']
-                    await self._process_database_update(db_update)
                 elif 'tables' in subscription_data:
                     # Handle DatabaseUpdate format (type + tables directly)
-                    await self._process_database_update(subscription_data)
+                    db_update = subscription_data
                 else:
                     logger.warning(f"⚠️ Subscription data has unexpected format. Keys: {list(subscription_data.keys())[:10]}")
+                    return
+                
+                resume = self._resume_pending or data.get('resume') or subscription_data.get('resume')
+                if resume and (self._entities or self._players or self._circles):
+                    await self._apply_resume_snapshot(db_update)
+                else:
+                    await self._process_database_update(db_update)
                 
         except Exception as e:
             logger.error(f"Error handling initial subscription data: {e}")
     
+    async def _apply_resume_snapshot(self, db_update: Dict[str, Any]) -> None:
+        """
+        Apply a post-reconnect snapshot as a diff against the existing caches.
+        
+        Rows that are unchanged fire no callbacks, changed rows fire update
+        callbacks, new rows fire insert callbacks and cached rows missing from
+        the snapshot are deleted.
+        """
+        self._resume_pending = False
+        self._resume_seen = {'player': set(), 'entity': set(), 'circle': set()}
+        self._last_resume_diff = {'inserts': 0, 'updates': 0, 'deletes': 0, 'unchanged': 0}
+        
+        try:
+            await self._process_database_update(db_update)
+        finally:
+            seen = self._resume_seen
+            self._resume_seen = None
+        
+        for player_id in [key for key in self._players if key not in seen['player']]:
+            await self._process_table_delete('player', {'player_id': player_id})
+            self._last_resume_diff['deletes'] += 1
+        for entity_id in [key for key in self._entities if key not in seen['entity']]:
+            await self._process_table_delete('entity', {'entity_id': entity_id})
+            self._last_resume_diff['deletes'] += 1
+        for circle_id in [key for key in self._circles if key not in seen['circle']]:
+            await self._process_table_delete('circle', {'circle_id': circle_id})
+            self._last_resume_diff['deletes'] += 1
+        for circle_id in [key for key in self._out_of_view_circles if key not in seen['circle']]:
+            del self._out_of_view_circles[circle_id]
+        if self._change_stream is not None:
+            self._change_stream.commit()
+        if self._training_exporter is not None:
+            self._record_training_step()
+        
+        self._stats['resumed_snapshots'] += 1
+        logger.info(f"Resumed snapshot applied as diff: {self._last_resume_diff}")
+    
+    async def _resume_row(self, table_name: str, row_data: Dict[str, Any]) -> bool:
+        """
+        Handle a snapshot row during resume.
+        
+        Returns:
+            True if the row was fully handled, False if it should be inserted normally
+        """
+        if table_name in ['player', 'players']:
+            kind, cache, row = 'player', self._players, GamePlayer.from_dict(row_data)
+            key = row.player_id
+        elif table_name in ['entity', 'entities']:
+            kind, cache, row = 'entity', self._entities, GameEntity.from_dict(row_data)
+            key = row.entity_id
+        elif table_name in ['circle', 'circles']:
+            kind, cache, row = 'circle', self._circles, GameCircle.from_dict(row_data)
+            key = row.circle_id
+        else:
+            return False
+        
+        self._resume_seen[kind].add(key)
+        existing = cache.get(key)
+        if existing is None:
+            self._last_resume_diff['inserts'] += 1
+            return False
+        
+        if existing == row:
+            self._last_resume_diff['unchanged'] += 1
+            return True
+        
+        self._last_resume_diff['updates'] += 1
+        await self._process_table_update(table_name, row_data)
+        return True
+    
     async def _handle_transaction_update_data(self, data: Dict[str, Any]) -> None:
         """Handle transaction update data from connection."""
         try:
             logger.debug("Processing transaction update data")
             update_data = data.get('update_data', {})
             
-            # Process database_update if present
-            if 'database_update' in update_data:
-                db_update = update_data['database_update']
-                await self._process_database_update(db_update)
+            self._resolve_reducer_outcome(update_data)
+            
+            # Rows arrive as database_update or, in the v1 JSON protocol, under status.Committed
+            db_update = update_data.get('database_update')
+            if db_update is None:
+                status = update_data.get('status')
+                if isinstance(status, dict) and isinstance(status.get('Committed'), dict):
+                    db_update = status['Committed']
+            
+            if db_update is not None:
+                profiler = get_span_profiler()
+                started = profiler.start('cache_update')
+                try:
+                    await self._process_database_update(db_update)
+                finally:
+                    profiler.stop('cache_update', started)
                 
         except Exception as e:
             logger.error(f"Error handling transaction update data: {e}")
     
+    def _resolve_reducer_outcome(self, update_data: Dict[str, Any]) -> None:
+        """Resolve the pending reducer call a TransactionUpdate reports on."""
+        reducer_call = update_data.get('reducer_call')
+        if not isinstance(reducer_call, dict) or reducer_call.get('request_id') is None:
+            return
+        
+        # Request ids are per-connection counters; only our own calls count
+        caller_identity = update_data.get('caller_identity')
+        if caller_identity is not None and self._identity and not self._is_own_identity(caller_identity):
+            return
+        
+        status = update_data.get('status')
+        error = None
+        if isinstance(status, dict) and 'Committed' not in status:
+            if 'Failed' in status:
+                error = str(status['Failed'])
+            else:
+                error = next(iter(status), 'Unknown status')
+        elif isinstance(status, str) and status != 'Committed':
+            error = status
+        
+        outcome = self._reducer_outcomes.resolve(
+            int(reducer_call['request_id']),
+            ReducerStatus.FAILED if error else ReducerStatus.SUCCESS,
+            error=error,
+            energy_used=update_data.get('energy_quanta_used'),
+            execution_duration=update_data.get('total_host_execution_duration')
+        )
+        if outcome is None:
+            return
+        
+        if outcome.is_success:
+            self._stats['successful_reducers'] += 1
+        else:
+            self._stats['failed_reducers'] += 1
+            logger.warning(f"❌ [REDUCER] Reducer '{outcome.reducer_name}' failed on server: {error}")
+            for callback in self._callbacks['reducer_error']:
+                try:
+                    callback(outcome.request_id, error)
+                except Exception as e:
+                    logger.error(f"Error in reducer_error callback: {e}")
+        
+        for callback in self._callbacks['reducer_response']:
+            try:
+                callback(outcome.request_id, outcome.status, outcome.to_dict())
+            except Exception as e:
+                logger.error(f"Error in reducer_response callback: {e}")
+    
     async def _process_database_update(self, db_update: Dict[str, Any]) -> None:
         """Process database update and populate client caches."""
         try:
@@ -1083,6 +1870,7 @@ class GameClient(GameClientInterface):
                                 # Process inserts within this operation
                                 inserts = operation.get('inserts', [])
                                 logger.info(f"📊 Table '{table_name}' operation {op_idx} has {len(inserts)} inserts")
+                                inserted_keys = set()
                                 for insert_data in inserts:
                                     # Parse JSON string if needed
                                     if isinstance(insert_data, str):
@@ -1092,6 +1880,8 @@ class GameClient(GameClientInterface):
                                             logger.error(f"Failed to parse insert JSON: {e}")
                                             continue
                                     await self._process_table_insert(table_name, insert_data)
+                                    if isinstance(insert_data, dict):
+                                        inserted_keys.add(self._row_key(table_name, insert_data))
                                 
                                 # Process updates within this operation
                                 updates = operation.get('updates', [])
@@ -1117,6 +1907,9 @@ class GameClient(GameClientInterface):
                                         except json.JSONDecodeError as e:
                                             logger.error(f"Failed to parse delete JSON: {e}")
                                             continue
+                                    # A row deleted and re-inserted in one operation is an update
+                                    if isinstance(delete_data, dict) and self._row_key(table_name, delete_data) in inserted_keys:
+                                        continue
                                     await self._process_table_delete(table_name, delete_data)
                         else:
                             # Fallback to old format (direct inserts/updates/deletes at table level)
@@ -1165,6 +1958,20 @@ class GameClient(GameClientInterface):
                     logger.warning(f"⚠️ db_update content: {str(db_update)[:300]}")
                     
             logger.info(f"✅ Processed database update - Players: {len(self._players)}, Entities: {len(self._entities)}")
+            
+            if self._interest_manager:
+                await self.update_interest()
+                self._interest_manager.set_rows_in_view(len(self._entities))
+            
+            if self._predictor is not None:
+                self._reconcile_prediction()
+            
+            # A resumed snapshot commits once, after its stale rows are deleted
+            if self._change_stream is not None and self._resume_seen is None:
+                self._change_stream.commit()
+            
+            if self._training_exporter is not None and self._resume_seen is None:
+                self._record_training_step()
                     
         except Exception as e:
             logger.error(f"Error processing database update: {e}")
@@ -1174,10 +1981,17 @@ class GameClient(GameClientInterface):
     async def _process_table_insert(self, table_name: str, row_data: Dict[str, Any]) -> None:
         """Process table insert and update client cache."""
         try:
+            if self._resume_seen is not None and await self._resume_row(table_name, row_data):
+                return
+            
             if table_name in ['player', 'players']:
                 # Create GamePlayer object
                 player = GamePlayer.from_dict(row_data)
+                if self._change_stream is not None:
+                    self._record_change('player', player.player_id, player, self._players.get(player.player_id))
                 self._players[player.player_id] = player
+                if self._is_local_player_row(row_data):
+                    self._local_player = player
                 logger.debug(f"Added player {player.player_id} to cache")
                 
                 # Trigger callback
@@ -1190,7 +2004,18 @@ class GameClient(GameClientInterface):
             elif table_name in ['entity', 'entities']:
                 # Create GameEntity object
                 entity = GameEntity.from_dict(row_data)
+                if self._interest_manager and not self._accept_interest_row(entity):
+                    # A cached row re-inserted out of view has moved away: evict it
+                    if self._evict_entity(entity.entity_id):
+                        self._interest_manager.record_evictions(1)
+                    return
+                if self._change_stream is not None:
+                    self._record_change('entity', entity.entity_id, entity, self._entities.get(entity.entity_id))
                 self._entities[entity.entity_id] = entity
+                if self._out_of_view_circles and entity.entity_id in self._out_of_view_circles:
+                    self._cache_circle(self._out_of_view_circles.pop(entity.entity_id))
+                if self._interpolation is not None:
+                    self._interpolation.push(entity.entity_id, entity.position)
                 logger.debug(f"Added entity {entity.entity_id} to cache")
                 
                 # Trigger callback
@@ -1203,7 +2028,7 @@ class GameClient(GameClientInterface):
             elif table_name in ['circle', 'circles']:
                 # Create GameCircle object
                 circle = GameCircle.from_dict(row_data)
-                self._circles[circle.circle_id] = circle
+                self._cache_circle(circle)
                 logger.debug(f"Added circle {circle.circle_id} to cache")
                 
         except Exception as e:
@@ -1216,7 +2041,11 @@ class GameClient(GameClientInterface):
             if table_name in ['player', 'players']:
                 player = GamePlayer.from_dict(update_data)
                 old_player = self._players.get(player.player_id)
+                if self._change_stream is not None:
+                    self._record_change('player', player.player_id, player, old_player)
                 self._players[player.player_id] = player
+                if self._is_local_player_row(update_data):
+                    self._local_player = player
                 
                 # Trigger callback with old and new
                 for callback in self._callbacks.get('player_updated', []):
@@ -1227,8 +2056,19 @@ class GameClient(GameClientInterface):
                         
             elif table_name in ['entity', 'entities']:
                 entity = GameEntity.from_dict(update_data)
+                if self._interest_manager and not self._accept_interest_row(entity):
+                    # Moved out of view: evict silently instead of caching
+                    if self._evict_entity(entity.entity_id):
+                        self._interest_manager.record_evictions(1)
+                    return
                 old_entity = self._entities.get(entity.entity_id)
+                if self._change_stream is not None:
+                    self._record_change('entity', entity.entity_id, entity, old_entity)
                 self._entities[entity.entity_id] = entity
+                if self._out_of_view_circles and entity.entity_id in self._out_of_view_circles:
+                    self._cache_circle(self._out_of_view_circles.pop(entity.entity_id))
+                if self._interpolation is not None:
+                    self._interpolation.push(entity.entity_id, entity.position)
                 
                 # Trigger callback
                 for callback in self._callbacks['entity_updated']:
@@ -1237,6 +2077,10 @@ class GameClient(GameClientInterface):
                     except Exception as e:
                         logger.error(f"Error in entity_updated callback: {e}")
                         
+            elif table_name in ['circle', 'circles']:
+                circle = GameCircle.from_dict(update_data)
+                self._cache_circle(circle)
+                        
         except Exception as e:
             logger.error(f"Error processing {table_name} update: {e}")
     
@@ -1244,9 +2088,11 @@ class GameClient(GameClientInterface):
         """Process table delete and remove from client cache."""
         try:
             if table_name in ['player', 'players']:
-                player_id = delete_data.get('player_id')
+                player_id = self._row_key(table_name, delete_data)
                 if player_id and player_id in self._players:
                     player = self._players.pop(player_id)
+                    if self._change_stream is not None:
+                        self._change_stream.record('player', DELETE, player_id, player)
                     
                     # Trigger callback
                     for callback in self._callbacks['player_left']:
@@ -1256,9 +2102,13 @@ class GameClient(GameClientInterface):
                             logger.error(f"Error in player_left callback: {e}")
                             
             elif table_name in ['entity', 'entities']:
-                entity_id = delete_data.get('entity_id')
+                entity_id = self._row_key(table_name, delete_data)
                 if entity_id and entity_id in self._entities:
                     entity = self._entities.pop(entity_id)
+                    if self._change_stream is not None:
+                        self._change_stream.record('entity', DELETE, entity_id, entity)
+                    if self._interpolation is not None:
+                        self._interpolation.remove(entity.entity_id)
                     
                     # Trigger callback
                     for callback in self._callbacks['entity_destroyed']:
@@ -1267,9 +2117,27 @@ class GameClient(GameClientInterface):
                         except Exception as e:
                             logger.error(f"Error in entity_destroyed callback: {e}")
                             
+            elif table_name in ['circle', 'circles']:
+                circle_id = self._row_key(table_name, delete_data)
+                self._out_of_view_circles.pop(circle_id, None)
+                circle = self._circles.pop(circle_id, None)
+                if circle is not None and self._change_stream is not None:
+                    self._change_stream.record('circle', DELETE, circle_id, circle)
+                            
         except Exception as e:
             logger.error(f"Error processing {table_name} delete: {e}")
 
+    @staticmethod
+    def _row_key(table_name: str, row_data: Dict[str, Any]) -> Optional[str]:
+        """Get the cache key of a row, as the model's from_dict derives it."""
+        if table_name in ['player', 'players']:
+            key = row_data.get('player_id', row_data.get('entity_id'))
+        elif table_name in ['circle', 'circles']:
+            key = row_data.get('circle_id', row_data.get('entity_id'))
+        else:
+            key = row_data.get('entity_id')
+        return str(key) if key is not None else None
+
     # Event notification helpers
     def _notify_connection_state_changed(self) -> None:
         """Notify connection state change callbacks."""
@@ -1331,6 +2199,9 @@ class GameClient(GameClientInterface):
             self._entities.clear()
             self._players.clear()
             self._circles.clear()
+            self._out_of_view_circles.clear()
+            if self._interpolation is not None:
+                self._interpolation.clear()
 
     def get_subscription_info(self) -> Dict[str, Any]:
         return {
@@ -1345,14 +2216,11 @@ class GameClient(GameClientInterface):
         self._callbacks['reducer_error'].append(callback)
 
     def get_pending_reducers(self) -> List[str]:
-        return [req_id for req_id, status in self._pending_reducers.items() 
-                if status == ReducerStatus.PENDING]
+        self._reducer_outcomes.expire()
+        return self._reducer_outcomes.pending_ids()
 
     def cancel_reducer(self, request_id: str) -> bool:
-        if request_id in self._pending_reducers:
-            self._pending_reducers[request_id] = ReducerStatus.FAILED
-            return True
-        return False
+        return self._reducer_outcomes.cancel(request_id)
     
     @property
     def server_language(self) -> str:
@@ -1360,7 +2228,8 @@ class GameClient(GameClientInterface):
         return self._server_language
 
     def get_reducer_status(self, request_id: str) -> Optional[ReducerStatus]:
-        return self._pending_reducers.get(request_id)
+        self._reducer_outcomes.expire()
+        return self._reducer_outcomes.get_status(request_id)
 
     def get_reducer_info(self) -> Dict[str, Any]:
         return {
@@ -1368,7 +2237,8 @@ class GameClient(GameClientInterface):
             'successful_calls': self._stats['successful_reducers'],
             'failed_calls': self._stats['failed_reducers'],
             'pending_calls': len(self.get_pending_reducers()),
-            'pending_request_ids': self.get_pending_reducers()
+            'pending_request_ids': self.get_pending_reducers(),
+            'outcomes': self._reducer_outcomes.get_statistics()
         }
 
     def on_player_joined(self, callback: Callable[[GamePlayer], None]) -> None:
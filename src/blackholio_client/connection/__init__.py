@@ -25,6 +25,15 @@ from .connection_manager import (
 # Common utilities
 from .server_config import ServerConfig, SERVER_CONFIGS
 from .protocol_handlers import ProtocolHandler, V112ProtocolHandler
+from .interest_management import InterestManager, InterestConfiguration, InterestRegion, column_query_builder
+from .connect_limiter import (
+    ConnectRateLimiter,
+    get_connect_rate_limiter,
+    configure_connect_rate_limiter,
+    decorrelated_jitter
+)
+from .reducer_encoding import ReducerEncoderCache, ReducerMessageEncoder, build_reducer_args
+from .frame_recording import FrameRecorder, FrameReader, FrameReplayer, RecordedFrame, read_frames
 
 # Default to enhanced implementations
 get_connection_manager = get_enhanced_manager
@@ -54,4 +63,28 @@ __all__ = [
     "SERVER_CONFIGS",
     "ProtocolHandler",
     "V112ProtocolHandler",
+    
+    # Area-of-interest subscriptions
+    "InterestManager",
+    "InterestConfiguration",
+    "InterestRegion",
+    "column_query_builder",
+    
+    # Reconnect storm protection
+    "ConnectRateLimiter",
+    "get_connect_rate_limiter",
+    "configure_connect_rate_limiter",
+    "decorrelated_jitter",
+    
+    # Pre-compiled reducer frames
+    "ReducerEncoderCache",
+    "ReducerMessageEncoder",
+    "build_reducer_args",
+    
+    # Frame capture and replay
+    "FrameRecorder",
+    "FrameReader",
+    "FrameReplayer",
+    "RecordedFrame",
+    "read_frames",
 ]
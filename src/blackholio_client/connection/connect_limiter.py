@@ -0,0 +1,185 @@
+"""
+Connect Limiter - Process-Wide Connect Rate Limiting
+
+Provides a shared token bucket that paces new connection attempts across
+every SpacetimeDBConnection and ConnectionPool in the process, plus
+decorrelated-jitter backoff so agents restarted together do not reconnect
+in lockstep after a server restart.
+"""
+
+import asyncio
+import logging
+import secrets
+import threading
+import time
+from typing import Dict, Any, Optional
+
+
+logger = logging.getLogger(__name__)
+
+_random = secrets.SystemRandom()
+
+
+def decorrelated_jitter(previous_delay: float, base_delay: float, max_delay: float) -> float:
+    """
+    Calculate the next backoff delay using decorrelated jitter.
+
+    Each delay is drawn uniformly from ``[base_delay, previous_delay * 3]``
+    and capped at ``max_delay``, so independent clients spread out instead
+    of retrying on the same schedule.
+
+    Args:
+        previous_delay: Delay used for the previous attempt (base_delay for the first)
+        base_delay: Minimum delay
+        max_delay: Maximum delay
+
+    Returns:
+        Delay in seconds for the next attempt
+    """
+    upper = max(base_delay, previous_delay * 3)
+    return min(max_delay, _random.uniform(base_delay, upper))
+
+
+def _validate_bucket(rate: float, burst: int) -> None:
+    """Validate token bucket parameters."""
+    if rate <= 0:
+        raise ValueError("rate must be > 0")
+    if burst < 1:
+        raise ValueError("burst must be >= 1")
+
+
+class ConnectRateLimiter:
+    """
+    Token bucket limiting how fast new connections are opened.
+
+    Callers reserve a token before connecting; when the bucket is empty the
+    reservation is queued behind earlier ones and the caller sleeps until
+    its slot comes up. Reservations are handed out under a thread lock so
+    one limiter can be shared by connections on different event loops.
+    """
+
+    def __init__(self, rate: float = 20.0, burst: int = 10):
+        """
+        Initialize connect rate limiter.
+
+        Args:
+            rate: Sustained connect attempts per second
+            burst: Attempts allowed back-to-back when the bucket is full
+        """
+        _validate_bucket(rate, burst)
+        self._lock = threading.Lock()
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+
+        # Metrics
+        self._attempts = 0
+        self._queued_attempts = 0
+        self._waiting = 0
+        self._max_waiting = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    def configure(self, rate: float, burst: int) -> None:
+        """
+        Change the bucket rate and size.
+
+        Args:
+            rate: Sustained connect attempts per second
+            burst: Attempts allowed back-to-back when the bucket is full
+        """
+        _validate_bucket(rate, burst)
+        with self._lock:
+            self.rate = rate
+            self.burst = burst
+            self._tokens = min(self._tokens, float(burst))
+
+    def _reserve(self) -> float:
+        """Reserve a token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            self._tokens -= 1.0
+            self._attempts += 1
+
+            if self._tokens >= 0:
+                return 0.0
+
+            wait = -self._tokens / self.rate
+            self._queued_attempts += 1
+            self._waiting += 1
+            self._max_waiting = max(self._max_waiting, self._waiting)
+            return wait
+
+    async def acquire(self) -> float:
+        """
+        Wait for permission to open a connection.
+
+        Returns:
+            Time spent queued in seconds
+        """
+        wait = self._reserve()
+        if wait <= 0:
+            return 0.0
+
+        logger.debug(f"Connect attempt queued for {wait:.3f}s by rate limiter")
+        try:
+            await asyncio.sleep(wait)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+                self._total_wait_time += wait
+                self._max_wait_time = max(self._max_wait_time, wait)
+        return wait
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get connect rate limiter metrics."""
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'burst': self.burst,
+                'attempts': self._attempts,
+                'queued_attempts': self._queued_attempts,
+                'waiting': self._waiting,
+                'max_waiting': self._max_waiting,
+                'total_wait_time': self._total_wait_time,
+                'max_wait_time': self._max_wait_time,
+                'average_wait_time': (
+                    self._total_wait_time / self._queued_attempts if self._queued_attempts else 0.0
+                )
+            }
+
+
+# Process-wide limiter shared by all connections
+_connect_limiter: Optional[ConnectRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_connect_rate_limiter() -> ConnectRateLimiter:
+    """Get the process-wide connect rate limiter."""
+    global _connect_limiter
+
+    if _connect_limiter is None:
+        with _limiter_lock:
+            if _connect_limiter is None:
+                _connect_limiter = ConnectRateLimiter()
+
+    return _connect_limiter
+
+
+def configure_connect_rate_limiter(rate: float, burst: int) -> ConnectRateLimiter:
+    """
+    Configure the process-wide connect rate limiter.
+
+    Args:
+        rate: Sustained connect attempts per second
+        burst: Attempts allowed back-to-back when the bucket is full
+
+    Returns:
+        The shared limiter
+    """
+    limiter = get_connect_rate_limiter()
+    limiter.configure(rate, burst)
+    return limiter
@@ -12,10 +12,9 @@ import threading
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Any, Optional, List, Callable, AsyncGenerator, Set, Tuple
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Callable, AsyncGenerator, Set, Tuple
 from weakref import WeakSet
 
-from ..config.environment import EnvironmentConfig
 from ..exceptions.connection_errors import (
     BlackholioConnectionError,
     ServerUnavailableError,
@@ -26,6 +25,11 @@ from ..exceptions.connection_errors import (
 )
 from .server_config import ServerConfig
 from .spacetimedb_connection import SpacetimeDBConnection, ConnectionState
+from .connect_limiter import ConnectRateLimiter, get_connect_rate_limiter
+
+if TYPE_CHECKING:
+    # config.environment imports connection.server_config, so load it lazily
+    from ..config.environment import EnvironmentConfig
 
 
 logger = logging.getLogger(__name__)
@@ -219,17 +223,20 @@ class ConnectionPool:
     Advanced connection pool with health monitoring and automatic recovery.
     """
     
-    def __init__(self, server_config: ServerConfig, config: Optional[PoolConfiguration] = None):
+    def __init__(self, server_config: ServerConfig, config: Optional[PoolConfiguration] = None,
+                 connect_limiter: Optional[ConnectRateLimiter] = None):
         """
         Initialize connection pool.
         
         Args:
             server_config: Server configuration
             config: Pool configuration (uses defaults if None)
+            connect_limiter: Connect rate limiter (uses the process-wide one if None)
         """
         self.server_config = server_config
         self.config = config or PoolConfiguration()
         self.config.validate()
+        self.connect_limiter = connect_limiter or get_connect_rate_limiter()
         
         # Pool state
         self.state = PoolState.INACTIVE
@@ -422,7 +429,7 @@ class ConnectionPool:
     async def _create_connection(self) -> PooledConnection:
         """Create a new pooled connection."""
         try:
-            connection = SpacetimeDBConnection(self.server_config)
+            connection = SpacetimeDBConnection(self.server_config, connect_limiter=self.connect_limiter)
             pooled_conn = PooledConnection(connection=connection)
             
             # Connect to server
@@ -580,6 +587,7 @@ class ConnectionPool:
             'last_health_check': self.metrics.last_health_check,
             'circuit_breaker_state': self.circuit_breaker.state,
             'circuit_breaker_failures': self.circuit_breaker.failure_count,
+            'connect_limiter': self.connect_limiter.get_metrics(),
             'config': {
                 'min_connections': self.config.min_connections,
                 'max_connections': self.config.max_connections,
@@ -613,14 +621,16 @@ class ConnectionManager:
     and provides unified access to SpacetimeDB connections.
     """
     
-    def __init__(self, env_config: Optional[EnvironmentConfig] = None):
+    def __init__(self, env_config: Optional["EnvironmentConfig"] = None):
         """
         Initialize connection manager.
         
         Args:
-            env_config: Environment configuration (uses default if None)
+            env_config: Environment configuration (loaded from the environment if None)
         """
-        self.env_config = env_config or EnvironmentConfig()
+        from ..config.environment import get_environment_config
+        
+        self.env_config = env_config or get_environment_config()
         self.pools: Dict[str, ConnectionPool] = {}
         self.default_pool_config = PoolConfiguration()
         
@@ -702,6 +712,7 @@ class ConnectionManager:
         """Get global metrics across all pools."""
         total_metrics = {
             'total_pools': len(self.pools),
+            'connect_limiter': get_connect_rate_limiter().get_metrics(),
             'pools': {},
             'aggregate': {
                 'total_connections': 0,
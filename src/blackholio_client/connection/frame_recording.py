@@ -0,0 +1,395 @@
+"""
+Frame Recording - Capture and Replay of Inbound Server Frames
+
+Records every frame a SpacetimeDBConnection receives, with its arrival
+time, to a compact append-only file, and replays such a file back through
+the connection's receive pipeline (decode, message processing and the
+GameClient cache) without a server. Replays run at recorded speed, N times
+faster, or as fast as possible, so decode and cache throughput can be
+profiled and regression-tested on real traffic.
+
+File layout::
+
+    header:  b"BHFR" | u8 format version | u8 compression
+    records: i64 arrival time (ns since epoch) | u8 kind | u32 length | payload
+
+The header is never compressed. With gzip or zstd compression, the records
+that follow the header form one compressed stream per recording session,
+and sessions appended later add another gzip member or zstd frame.
+"""
+
+import asyncio
+import gzip
+import logging
+import os
+import struct
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Union, Iterable, Iterator, AsyncIterator
+
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+Frame = Union[str, bytes]
+
+MAGIC = b"BHFR"
+FORMAT_VERSION = 1
+
+COMPRESSION_CODES = {None: 0, 'gzip': 1, 'zstd': 2}
+COMPRESSION_NAMES = {code: name for name, code in COMPRESSION_CODES.items()}
+
+KIND_TEXT = 0
+KIND_BINARY = 1
+
+_HEADER = struct.Struct("<4sBB")
+_RECORD = struct.Struct("<qBI")
+
+
+def _zstandard():
+    """Import the optional zstandard module."""
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstd frame recordings need the 'zstandard' package (pip install zstandard)"
+        ) from None
+    return zstandard
+
+
+@dataclass
+class RecordedFrame:
+    """One recorded inbound frame."""
+    timestamp_ns: int  # Arrival time, nanoseconds since the Unix epoch
+    data: Frame  # TEXT frames as str, BINARY frames as bytes
+
+
+class FrameRecorder:
+    """
+    Append-only writer of inbound frames.
+
+    Records are buffered in memory and written once ``buffer_size`` bytes
+    have accumulated, on ``flush()`` and on ``close()``, so recording adds
+    little more than a copy to the receive path. Recording into an existing
+    file appends a new session to it.
+    """
+
+    def __init__(self, path: PathLike, compression: Optional[str] = None,
+                 compression_level: Optional[int] = None, buffer_size: int = 64 * 1024):
+        """
+        Initialize frame recorder.
+
+        Args:
+            path: Recording file (created if missing, appended to otherwise)
+            compression: None, 'gzip' or 'zstd'
+            compression_level: Compressor level (fast defaults: gzip 1, zstd 3)
+            buffer_size: Bytes buffered before a write
+
+        Raises:
+            ValueError: If the compression is unknown or differs from the existing file's
+            ImportError: If zstd is requested and zstandard is not installed
+        """
+        if compression not in COMPRESSION_CODES:
+            raise ValueError(f"Unknown compression {compression!r}; use None, 'gzip' or 'zstd'")
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be >= 1")
+
+        self.path = Path(path)
+        self.compression = compression
+        self._buffer_size = buffer_size
+        self._buffer = bytearray()
+
+        self._file = self._open_file()
+        if compression == 'gzip':
+            self._stream = gzip.GzipFile(fileobj=self._file, mode='ab',
+                                         compresslevel=compression_level or 1)
+        elif compression == 'zstd':
+            compressor = _zstandard().ZstdCompressor(level=compression_level or 3)
+            self._stream = compressor.stream_writer(self._file, closefd=False)
+        else:
+            self._stream = self._file
+
+        # Statistics
+        self._frames = 0
+        self._payload_bytes = 0
+        self._closed = False
+
+    def _open_file(self):
+        """Open the file for appending, writing or checking its header."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file = open(self.path, 'ab')
+        if file.tell() == 0:
+            file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, COMPRESSION_CODES[self.compression]))
+            return file
+
+        with open(self.path, 'rb') as existing:
+            _, compression = _read_header(existing)
+        if compression != self.compression:
+            file.close()
+            raise ValueError(
+                f"{self.path} is recorded with compression {compression!r}, not {self.compression!r}"
+            )
+        return file
+
+    def record(self, frame: Frame, timestamp_ns: Optional[int] = None) -> None:
+        """
+        Append one frame.
+
+        Args:
+            frame: Frame as received (str for TEXT, bytes for BINARY)
+            timestamp_ns: Arrival time (now if None)
+        """
+        if isinstance(frame, str):
+            kind, payload = KIND_TEXT, frame.encode('utf-8')
+        else:
+            kind, payload = KIND_BINARY, bytes(frame)
+
+        self._buffer += _RECORD.pack(timestamp_ns or time.time_ns(), kind, len(payload))
+        self._buffer += payload
+        self._frames += 1
+        self._payload_bytes += len(payload)
+        if len(self._buffer) >= self._buffer_size:
+            self._write_buffer()
+
+    def _write_buffer(self) -> None:
+        """Hand buffered records to the (compressing) stream."""
+        if self._buffer:
+            self._stream.write(self._buffer)
+            self._buffer = bytearray()
+
+    def flush(self) -> None:
+        """Write buffered records through to the file."""
+        if self._closed:
+            return
+        self._write_buffer()
+        if self.compression == 'zstd':
+            self._stream.flush(_zstandard().FLUSH_BLOCK)
+        else:
+            self._stream.flush()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Finish the session and close the file."""
+        if self._closed:
+            return
+        self._write_buffer()
+        if self._stream is not self._file:
+            self._stream.close()
+        self._file.close()
+        self._closed = True
+
+    def __enter__(self) -> 'FrameRecorder':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get recording statistics."""
+        try:
+            file_bytes = os.path.getsize(self.path)
+        except OSError:
+            file_bytes = 0
+        return {
+            'path': str(self.path),
+            'compression': self.compression,
+            'frames': self._frames,
+            'payload_bytes': self._payload_bytes,
+            'buffered_bytes': len(self._buffer),
+            'file_bytes': file_bytes,
+            'closed': self._closed
+        }
+
+
+def _read_header(file) -> tuple:
+    """Read and check a recording header."""
+    header = file.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError("Not a frame recording: file too short")
+    magic, version, code = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("Not a frame recording: bad magic")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported frame recording version {version}")
+    if code not in COMPRESSION_NAMES:
+        raise ValueError(f"Unknown frame recording compression code {code}")
+    return version, COMPRESSION_NAMES[code]
+
+
+class FrameReader:
+    """
+    Reader of frame recordings.
+
+    A record cut short at the end of the file (e.g. the recording process
+    was killed) ends iteration with a warning instead of an error.
+    """
+
+    def __init__(self, path: PathLike):
+        """
+        Initialize frame reader.
+
+        Args:
+            path: Recording file
+
+        Raises:
+            ValueError: If the file is not a frame recording
+        """
+        self.path = Path(path)
+        with open(self.path, 'rb') as file:
+            _, self.compression = _read_header(file)
+        self.truncated = False
+
+    def _open_stream(self, file):
+        """Wrap the file (positioned after the header) in a decompressor."""
+        if self.compression == 'gzip':
+            return gzip.GzipFile(fileobj=file, mode='rb')
+        if self.compression == 'zstd':
+            return _zstandard().ZstdDecompressor().stream_reader(file, read_across_frames=True, closefd=False)
+        return file
+
+    def __iter__(self) -> Iterator[RecordedFrame]:
+        with open(self.path, 'rb') as file:
+            _read_header(file)
+            stream = self._open_stream(file)
+            try:
+                while True:
+                    header = stream.read(_RECORD.size)
+                    if not header:
+                        return
+                    if len(header) < _RECORD.size:
+                        break
+                    timestamp_ns, kind, length = _RECORD.unpack(header)
+                    payload = stream.read(length)
+                    if len(payload) < length:
+                        break
+                    yield RecordedFrame(timestamp_ns, payload.decode('utf-8') if kind == KIND_TEXT else payload)
+            except (EOFError, OSError) as e:
+                logger.warning(f"Frame recording {self.path} ends in a damaged block: {e}")
+            except Exception as e:
+                if type(e).__name__ != 'ZstdError':
+                    raise
+                logger.warning(f"Frame recording {self.path} ends in a damaged block: {e}")
+            finally:
+                if stream is not file:
+                    stream.close()
+
+        self.truncated = True
+        logger.warning(f"Frame recording {self.path} ends in a partial record")
+
+
+def read_frames(path: PathLike) -> List[RecordedFrame]:
+    """Read every frame of a recording."""
+    return list(FrameReader(path))
+
+
+class ReplayWebSocket:
+    """
+    Stand-in websocket that yields recorded frames to a message handler.
+
+    Outgoing frames (e.g. reducer calls made while replaying) are counted
+    and dropped.
+    """
+
+    def __init__(self, frames: AsyncIterator[Frame]):
+        self._frames = frames
+        self.sent = 0
+        self.subprotocol = "v1.json.spacetimedb"
+
+    def __aiter__(self) -> AsyncIterator[Frame]:
+        return self._frames
+
+    async def send(self, frame: Frame) -> None:
+        self.sent += 1
+
+    async def close(self, *args, **kwargs) -> None:
+        pass
+
+
+class FrameReplayer:
+    """
+    Replay driver for frame recordings.
+
+    ``speed`` sets pacing: 1.0 replays with the recorded gaps between
+    frames, 10.0 ten times faster, and None (or 0) as fast as possible.
+    """
+
+    def __init__(self, source: Union[PathLike, Iterable[RecordedFrame]], speed: Optional[float] = None):
+        """
+        Initialize replayer.
+
+        Args:
+            source: Recording file, or recorded frames
+            speed: Replay speed multiplier (None or 0 = as fast as possible)
+        """
+        if speed is not None and speed < 0:
+            raise ValueError("speed must be >= 0")
+        if isinstance(source, (str, Path)):
+            source = FrameReader(source)
+        self.frames: List[RecordedFrame] = list(source)
+        self.speed = speed or None
+
+        # Statistics of the last replay
+        self._replayed = 0
+        self._bytes = 0
+        self._elapsed = 0.0
+        self._max_lag = 0.0
+
+    @property
+    def recorded_duration(self) -> float:
+        """Get the time between the first and last recorded frame, in seconds."""
+        if len(self.frames) < 2:
+            return 0.0
+        return (self.frames[-1].timestamp_ns - self.frames[0].timestamp_ns) / 1e9
+
+    async def iter_frames(self) -> AsyncIterator[Frame]:
+        """Yield frames, paced by ``speed``."""
+        self._replayed = 0
+        self._bytes = 0
+        self._max_lag = 0.0
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        first_ns = self.frames[0].timestamp_ns if self.frames else 0
+
+        for frame in self.frames:
+            if self.speed:
+                delay = started + (frame.timestamp_ns - first_ns) / 1e9 / self.speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    self._max_lag = max(self._max_lag, -delay)
+            self._replayed += 1
+            self._bytes += len(frame.data)
+            yield frame.data
+
+        self._elapsed = loop.time() - started
+
+    async def replay(self, connection: Any) -> Dict[str, Any]:
+        """
+        Feed the frames through a connection's receive pipeline.
+
+        Args:
+            connection: SpacetimeDBConnection whose message handler receives the frames
+
+        Returns:
+            Replay statistics
+        """
+        previous = connection.websocket
+        connection.websocket = ReplayWebSocket(self.iter_frames())
+        try:
+            await connection._message_handler()
+        finally:
+            connection.websocket = previous
+        return self.get_statistics()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get statistics of the last replay."""
+        return {
+            'frames': self._replayed,
+            'bytes': self._bytes,
+            'speed': self.speed,
+            'recorded_duration': self.recorded_duration,
+            'elapsed': self._elapsed,
+            'frames_per_second': self._replayed / self._elapsed if self._elapsed > 0 else 0.0,
+            'max_lag_ms': self._max_lag * 1000
+        }
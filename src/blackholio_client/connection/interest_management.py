@@ -0,0 +1,329 @@
+"""
+Interest Management - Area-of-Interest Subscriptions
+
+Maintains spatial subscription queries around the local player so that
+agents only receive rows inside their view distance, re-subscribing with
+hysteresis as the player moves and evicting out-of-range rows locally.
+
+SpacetimeDB's subscription SQL cannot filter on fields of product-typed
+columns such as ``entity.position``, so the default query builder
+subscribes to whole tables and the area of interest is applied on the
+client only. Servers that store positions in scalar columns can filter
+server-side with ``column_query_builder``.
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Callable, Set, Tuple
+
+from ..models.game_entities import Vector2
+from ..models.physics import calculate_view_distance
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class InterestConfiguration:
+    """Area-of-interest subscription configuration."""
+    cell_size: float = 250.0
+    view_margin: float = 1.25
+    hysteresis_cells: int = 1
+    resize_threshold: float = 0.2
+    min_resubscribe_interval: float = 0.5
+    spatial_tables: List[str] = field(default_factory=lambda: ["entity"])
+    global_tables: List[str] = field(default_factory=lambda: ["player", "circle", "food", "config"])
+
+    def validate(self) -> None:
+        """Validate configuration parameters."""
+        if self.cell_size <= 0:
+            raise ValueError("cell_size must be > 0")
+        if self.view_margin < 1.0:
+            raise ValueError("view_margin must be >= 1.0")
+        if self.hysteresis_cells < 0:
+            raise ValueError("hysteresis_cells must be >= 0")
+        if self.resize_threshold < 0:
+            raise ValueError("resize_threshold must be >= 0")
+        if self.min_resubscribe_interval < 0:
+            raise ValueError("min_resubscribe_interval must be >= 0")
+
+
+@dataclass(frozen=True)
+class InterestRegion:
+    """Cell-aligned rectangular region covered by the current subscription."""
+    min_cell_x: int
+    min_cell_y: int
+    max_cell_x: int
+    max_cell_y: int
+    cell_size: float
+    anchor_cell: Tuple[int, int]
+    view_distance: float
+
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """World-space bounds as (min_x, min_y, max_x, max_y)."""
+        return (
+            self.min_cell_x * self.cell_size,
+            self.min_cell_y * self.cell_size,
+            (self.max_cell_x + 1) * self.cell_size,
+            (self.max_cell_y + 1) * self.cell_size
+        )
+
+    @property
+    def cell_count(self) -> int:
+        """Number of grid cells covered by the region."""
+        return (self.max_cell_x - self.min_cell_x + 1) * (self.max_cell_y - self.min_cell_y + 1)
+
+    def cells(self) -> Set[Tuple[int, int]]:
+        """Get all grid cells covered by the region."""
+        return {
+            (cx, cy)
+            for cx in range(self.min_cell_x, self.max_cell_x + 1)
+            for cy in range(self.min_cell_y, self.max_cell_y + 1)
+        }
+
+    def contains(self, x: float, y: float) -> bool:
+        """Check if a world position lies inside the region."""
+        min_x, min_y, max_x, max_y = self.bounds
+        return min_x <= x < max_x and min_y <= y < max_y
+
+
+def default_query_builder(table: str, region: InterestRegion) -> str:
+    """
+    Build the subscription query for a spatial table.
+
+    Subscription SQL has no field access on product-typed columns, so the
+    whole table is subscribed and rows are filtered on the client.
+
+    Args:
+        table: Table name
+        region: Region to subscribe to (unused)
+
+    Returns:
+        SQL subscription query string
+    """
+    return f"SELECT * FROM {table}"
+
+
+def column_query_builder(x_column: str = "x", y_column: str = "y") -> Callable[[str, InterestRegion], str]:
+    """
+    Make a query builder that filters on scalar position columns server-side.
+
+    Args:
+        x_column: Column holding the x coordinate
+        y_column: Column holding the y coordinate
+
+    Returns:
+        Query builder for InterestManager
+    """
+    def build(table: str, region: InterestRegion) -> str:
+        min_x, min_y, max_x, max_y = region.bounds
+        return (
+            f"SELECT * FROM {table} WHERE "
+            f"{x_column} >= {min_x} AND {x_column} < {max_x} AND "
+            f"{y_column} >= {min_y} AND {y_column} < {max_y}"
+        )
+    return build
+
+
+class InterestManager:
+    """
+    Tracks the local player's area of interest and decides when the
+    subscription needs to move.
+
+    The subscribed region covers the player's view distance plus
+    ``hysteresis_cells`` of slack, so small movements never trigger a
+    re-subscription while the view stays fully covered.
+    """
+
+    def __init__(self, config: Optional[InterestConfiguration] = None,
+                 query_builder: Optional[Callable[[str, InterestRegion], str]] = None):
+        """
+        Initialize interest manager.
+
+        Args:
+            config: Interest configuration (uses defaults if None)
+            query_builder: Builds the spatial query for a table and region
+                (whole-table queries if None; see column_query_builder)
+        """
+        self.config = config or InterestConfiguration()
+        self.config.validate()
+        self.query_builder = query_builder or default_query_builder
+
+        self._region: Optional[InterestRegion] = None
+        self._subscribed_queries: Optional[List[str]] = None
+        self._last_resubscribe_time = 0.0
+
+        # Metrics
+        self._rows_received = 0
+        self._rows_accepted = 0
+        self._rows_evicted = 0
+        self._rows_in_view = 0
+        self._resubscriptions = 0
+        self._suppressed_resubscriptions = 0
+        self._subscriptions_sent = 0
+
+    @property
+    def region(self) -> Optional[InterestRegion]:
+        """Get the currently subscribed region."""
+        return self._region
+
+    @property
+    def subscribed_queries(self) -> Optional[List[str]]:
+        """Queries last sent to the server (None before the first subscription)."""
+        return self._subscribed_queries
+
+    def mark_subscribed(self, queries: List[str]) -> None:
+        """Record that a query set was sent to the server."""
+        self._subscribed_queries = list(queries)
+        self._subscriptions_sent += 1
+
+    def cell_of(self, position: Vector2) -> Tuple[int, int]:
+        """Get the grid cell containing a position."""
+        size = self.config.cell_size
+        return (int(math.floor(position.x / size)), int(math.floor(position.y / size)))
+
+    def compute_region(self, center: Vector2, mass: float) -> InterestRegion:
+        """
+        Compute the region to subscribe to for a player position and mass.
+
+        Args:
+            center: Player center position
+            mass: Player total mass
+
+        Returns:
+            Cell-aligned region covering the view distance plus hysteresis slack
+        """
+        size = self.config.cell_size
+        view_distance = calculate_view_distance(mass) * self.config.view_margin
+        reach = view_distance + self.config.hysteresis_cells * size
+
+        return InterestRegion(
+            min_cell_x=int(math.floor((center.x - reach) / size)),
+            min_cell_y=int(math.floor((center.y - reach) / size)),
+            max_cell_x=int(math.floor((center.x + reach) / size)),
+            max_cell_y=int(math.floor((center.y + reach) / size)),
+            cell_size=size,
+            anchor_cell=self.cell_of(center),
+            view_distance=view_distance
+        )
+
+    def needs_resubscribe(self, center: Vector2, mass: float, now: Optional[float] = None) -> bool:
+        """
+        Check whether the player has moved or grown enough to move the subscription.
+
+        Args:
+            center: Player center position
+            mass: Player total mass
+            now: Current time (uses time.time() if None)
+
+        Returns:
+            True if a new subscription should be sent
+        """
+        if self._region is None:
+            return True
+
+        cell_x, cell_y = self.cell_of(center)
+        anchor_x, anchor_y = self._region.anchor_cell
+        moved = max(abs(cell_x - anchor_x), abs(cell_y - anchor_y)) > self.config.hysteresis_cells
+
+        view_distance = calculate_view_distance(mass) * self.config.view_margin
+        resized = abs(view_distance / self._region.view_distance - 1.0) > self.config.resize_threshold
+
+        if not (moved or resized):
+            return False
+
+        now = time.time() if now is None else now
+        if now - self._last_resubscribe_time < self.config.min_resubscribe_interval:
+            self._suppressed_resubscriptions += 1
+            return False
+        return True
+
+    def update(self, center: Vector2, mass: float, now: Optional[float] = None) -> Optional[List[str]]:
+        """
+        Update the area of interest for a new player position.
+
+        Args:
+            center: Player center position
+            mass: Player total mass
+            now: Current time (uses time.time() if None)
+
+        Returns:
+            New subscription queries if the region moved, otherwise None
+        """
+        if not self.needs_resubscribe(center, mass, now):
+            return None
+
+        self._region = self.compute_region(center, mass)
+        self._last_resubscribe_time = time.time() if now is None else now
+        self._resubscriptions += 1
+
+        logger.debug(
+            f"Interest region moved to cells ({self._region.min_cell_x}, {self._region.min_cell_y})-"
+            f"({self._region.max_cell_x}, {self._region.max_cell_y}), {self._region.cell_count} cells"
+        )
+        return self.build_queries(self._region)
+
+    def build_queries(self, region: Optional[InterestRegion] = None) -> List[str]:
+        """
+        Build the full subscription query set for a region.
+
+        Args:
+            region: Region to subscribe to (uses current region if None)
+
+        Returns:
+            List of SQL query strings
+        """
+        region = region or self._region
+        queries = [f"SELECT * FROM {table}" for table in self.config.global_tables]
+        if region is None:
+            queries.extend(f"SELECT * FROM {table}" for table in self.config.spatial_tables)
+        else:
+            queries.extend(self.query_builder(table, region) for table in self.config.spatial_tables)
+        return queries
+
+    def contains(self, position: Vector2) -> bool:
+        """Check if a position is inside the area of interest (always True before the first update)."""
+        if self._region is None:
+            return True
+        return self._region.contains(position.x, position.y)
+
+    def record_row(self, accepted: bool) -> None:
+        """Record a spatial row received from the server."""
+        self._rows_received += 1
+        if accepted:
+            self._rows_accepted += 1
+
+    def record_evictions(self, count: int) -> None:
+        """Record rows evicted from the caches."""
+        self._rows_evicted += count
+
+    def set_rows_in_view(self, count: int) -> None:
+        """Record the number of spatial rows currently cached."""
+        self._rows_in_view = count
+
+    def reset(self) -> None:
+        """Forget the current region (e.g. after a disconnect)."""
+        self._region = None
+        self._subscribed_queries = None
+        self._last_resubscribe_time = 0.0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get interest management statistics."""
+        region = self._region
+        return {
+            'rows_received': self._rows_received,
+            'rows_accepted': self._rows_accepted,
+            'rows_rejected': self._rows_received - self._rows_accepted,
+            'rows_evicted': self._rows_evicted,
+            'rows_in_view': self._rows_in_view,
+            'in_view_ratio': self._rows_accepted / self._rows_received if self._rows_received else 1.0,
+            'resubscriptions': self._resubscriptions,
+            'suppressed_resubscriptions': self._suppressed_resubscriptions,
+            'subscriptions_sent': self._subscriptions_sent,
+            'region_cells': region.cell_count if region else 0,
+            'region_bounds': region.bounds if region else None,
+            'view_distance': region.view_distance if region else None
+        }
@@ -31,7 +31,6 @@ from spacetimedb_sdk import (
     subscribe_to_events
 )
 
-from ..config.environment import EnvironmentConfig
 from ..exceptions.connection_errors import (
     BlackholioConnectionError,
     ServerConfigurationError,
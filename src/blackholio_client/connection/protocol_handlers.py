@@ -8,9 +8,11 @@ Currently supports v1.1.2 protocol with extensibility for future versions.
 import json
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
 
+from ..models.game_entities import GameEntity, GamePlayer, GameCircle, Vector2
+
 
 logger = logging.getLogger(__name__)
 
@@ -547,170 +549,103 @@ class V112ProtocolHandler(ProtocolHandler):
             'timestamp': timestamp
         }
     
-    def _extract_entities(self, table_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _extract_entities(self, table_data: Any) -> List[GameEntity]:
         """
-        Extract entity data from table updates.
+        Extract entities from table updates.
         
-        Consolidates entity extraction logic from both projects.
+        Rows become GameEntity objects in one pass, ready for the cache.
         """
-        entities = []
-        
-        try:
-            # Handle different data structures
-            if isinstance(table_data, list):
-                for item in table_data:
-                    entity = self._parse_entity_item(item)
-                    if entity:
-                        entities.append(entity)
-            elif isinstance(table_data, dict):
-                if 'rows' in table_data:
-                    for row in table_data['rows']:
-                        entity = self._parse_entity_item(row)
-                        if entity:
-                            entities.append(entity)
-                else:
-                    # Single entity
-                    entity = self._parse_entity_item(table_data)
-                    if entity:
-                        entities.append(entity)
-        
-        except Exception as e:
-            logger.error(f"Error extracting entities: {e}")
-        
-        return entities
+        return self._extract_rows(table_data, self._entity_from_row, 'entities')
     
-    def _extract_players(self, table_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Extract player data from table updates."""
-        players = []
-        
-        try:
-            if isinstance(table_data, list):
-                for item in table_data:
-                    player = self._parse_player_item(item)
-                    if player:
-                        players.append(player)
-            elif isinstance(table_data, dict):
-                if 'rows' in table_data:
-                    for row in table_data['rows']:
-                        player = self._parse_player_item(row)
-                        if player:
-                            players.append(player)
-                else:
-                    player = self._parse_player_item(table_data)
-                    if player:
-                        players.append(player)
-        
-        except Exception as e:
-            logger.error(f"Error extracting players: {e}")
-        
-        return players
+    def _extract_players(self, table_data: Any) -> List[GamePlayer]:
+        """Extract players from table updates."""
+        return self._extract_rows(table_data, self._player_from_row, 'players')
     
-    def _extract_circles(self, table_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Extract circle data from table updates."""
-        circles = []
-        
-        try:
-            if isinstance(table_data, list):
-                for item in table_data:
-                    circle = self._parse_circle_item(item)
-                    if circle:
-                        circles.append(circle)
-            elif isinstance(table_data, dict):
-                if 'rows' in table_data:
-                    for row in table_data['rows']:
-                        circle = self._parse_circle_item(row)
-                        if circle:
-                            circles.append(circle)
-                else:
-                    circle = self._parse_circle_item(table_data)
-                    if circle:
-                        circles.append(circle)
-        
-        except Exception as e:
-            logger.error(f"Error extracting circles: {e}")
-        
-        return circles
+    def _extract_circles(self, table_data: Any) -> List[GameCircle]:
+        """Extract circles from table updates."""
+        return self._extract_rows(table_data, self._circle_from_row, 'circles')
     
-    def _parse_entity_item(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Parse individual entity item."""
-        try:
-            # Common entity fields from both projects
-            entity_data = {
-                'entity_id': item.get('entity_id') or item.get('id'),
-                'position': self._parse_position(item.get('position')),
-                'mass': item.get('mass', 0.0),
-                'radius': item.get('radius', 0.0),
-                'velocity': self._parse_position(item.get('velocity')),
-                'entity_type': item.get('entity_type', 'unknown')
-            }
-            
-            # Only return if we have essential data
-            if entity_data['entity_id'] is not None:
-                return entity_data
-                
-        except Exception as e:
-            logger.error(f"Error parsing entity item: {e}")
+    def _extract_rows(self, table_data: Any, build: Callable[[Dict[str, Any]], Any], kind: str) -> List[Any]:
+        """
+        Build model objects from a list of rows, a {'rows': [...]} table or a single row.
         
-        return None
+        Rows may be decoded dicts or the JSON strings of the v1 text protocol.
+        """
+        if isinstance(table_data, dict):
+            rows = table_data['rows'] if 'rows' in table_data else (table_data,)
+        elif isinstance(table_data, list):
+            rows = table_data
+        else:
+            return []
+        
+        models = []
+        for row in rows:
+            try:
+                if isinstance(row, str):
+                    row = json.loads(row)
+                model = build(row)
+            except Exception as e:
+                logger.error(f"Error extracting {kind}: {e}")
+                continue
+            if model is not None:
+                models.append(model)
+        return models
     
-    def _parse_player_item(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Parse individual player item."""
-        try:
-            player_data = {
-                'player_id': item.get('player_id') or item.get('id'),
-                'name': item.get('name') or item.get('player_name'),
-                'position': self._parse_position(item.get('position')),
-                'direction': self._parse_position(item.get('direction')),
-                'mass': item.get('mass', 0.0),
-                'radius': item.get('radius', 0.0),
-                'score': item.get('score', 0),
-                'is_active': item.get('is_active', True)
-            }
-            
-            if player_data['player_id'] is not None:
-                return player_data
-                
-        except Exception as e:
-            logger.error(f"Error parsing player item: {e}")
-        
-        return None
+    def _entity_from_row(self, row: Dict[str, Any]) -> Optional[GameEntity]:
+        """Build a GameEntity from one row."""
+        entity_id = row.get('entity_id') or row.get('id')
+        if entity_id is None:
+            return None
+        return GameEntity(
+            entity_id=str(entity_id),
+            position=_vector(row.get('position')),
+            velocity=_vector(row.get('velocity')),
+            mass=float(row.get('mass', 0.0)),
+            radius=float(row.get('radius', 0.0)),
+            entity_type=row.get('entity_type', 'unknown')
+        )
     
-    def _parse_circle_item(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Parse individual circle item."""
-        try:
-            circle_data = {
-                'circle_id': item.get('circle_id') or item.get('id'),
-                'position': self._parse_position(item.get('position')),
-                'radius': item.get('radius', 0.0),
-                'color': item.get('color'),
-                'circle_type': item.get('circle_type', 'unknown')
-            }
-            
-            if circle_data['circle_id'] is not None:
-                return circle_data
-                
-        except Exception as e:
-            logger.error(f"Error parsing circle item: {e}")
-        
-        return None
+    def _player_from_row(self, row: Dict[str, Any]) -> Optional[GamePlayer]:
+        """Build a GamePlayer from one row."""
+        player_id = row.get('player_id') or row.get('id')
+        if player_id is None:
+            return None
+        return GamePlayer(
+            entity_id=str(player_id),
+            player_id=str(player_id),
+            name=str(row.get('name') or row.get('player_name') or ''),
+            position=_vector(row.get('position')),
+            direction=_vector(row.get('direction')),
+            mass=float(row.get('mass', 0.0)),
+            radius=float(row.get('radius', 0.0)),
+            score=int(row.get('score', 0)),
+            is_active=bool(row.get('is_active', True))
+        )
     
-    def _parse_position(self, position_data: Any) -> Optional[Dict[str, float]]:
-        """Parse position data into consistent format."""
-        if not position_data:
+    def _circle_from_row(self, row: Dict[str, Any]) -> Optional[GameCircle]:
+        """Build a GameCircle from one row."""
+        circle_id = row.get('circle_id') or row.get('id')
+        if circle_id is None:
             return None
-        
-        try:
-            if isinstance(position_data, dict):
-                return {
-                    'x': float(position_data.get('x', 0.0)),
-                    'y': float(position_data.get('y', 0.0))
-                }
-            elif isinstance(position_data, (list, tuple)) and len(position_data) >= 2:
-                return {
-                    'x': float(position_data[0]),
-                    'y': float(position_data[1])
-                }
-        except (ValueError, TypeError) as e:
-            logger.error(f"Error parsing position data: {e}")
-        
-        return None
+        player_id = row.get('player_id')
+        return GameCircle(
+            entity_id=str(circle_id),
+            circle_id=str(circle_id),
+            player_id=str(player_id) if player_id is not None else None,
+            position=_vector(row.get('position')),
+            radius=float(row.get('radius', 0.0)),
+            color=row.get('color'),
+            circle_type=str(row.get('circle_type', 'unknown'))
+        )
+
+
+def _vector(position_data: Any) -> Vector2:
+    """Convert a {'x', 'y'} dict or [x, y] pair to a Vector2 (zero if missing or malformed)."""
+    try:
+        if isinstance(position_data, dict):
+            return Vector2(float(position_data.get('x', 0.0)), float(position_data.get('y', 0.0)))
+        if isinstance(position_data, (list, tuple)) and len(position_data) >= 2:
+            return Vector2(float(position_data[0]), float(position_data[1]))
+    except (ValueError, TypeError) as e:
+        logger.error(f"Error parsing position data: {e}")
+    return Vector2(0.0, 0.0)
@@ -0,0 +1,345 @@
+"""
+Reducer Encoding - Pre-Encoded CallReducer Message Templates
+
+Builds one encoder per reducer that turns positional arguments straight
+into the final CallReducer frame. The JSON envelope produced by the SDK
+protocol helper is captured once per reducer and split around the args
+and request id, so a call only has to encode its own arguments and join
+a few strings instead of building dicts and re-encoding the envelope.
+"""
+
+import json
+import logging
+import re
+from typing import Dict, Any, Optional, Sequence, Tuple, Union
+
+from ..exceptions.connection_errors import DataValidationError
+
+
+logger = logging.getLogger(__name__)
+
+# Parameter names for reducers whose arguments are not positional-generic
+REDUCER_PARAMETERS: Dict[str, Tuple[str, ...]] = {
+    'enter_game': ('name',),
+    'update_player_input': ('direction',),
+    'player_split': (),
+}
+
+_ARGS_SLOT = "\x00args\x00"
+_REQUEST_ID_SLOT = "\x00request_id\x00"
+_SLOT_PATTERN = re.compile(r'"\\u0000(args|request_id)\\u0000"')
+
+
+def _default(value: Any) -> Any:
+    """Serialize model objects (Vector2 and friends) via their to_dict()."""
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_encode_json = json.JSONEncoder(separators=(',', ':'), default=_default).encode
+
+
+def reducer_parameter_names(reducer_name: str, arg_count: int) -> Tuple[str, ...]:
+    """
+    Get the argument names a reducer call is encoded with.
+
+    Args:
+        reducer_name: Reducer name
+        arg_count: Number of positional arguments
+
+    Returns:
+        Parameter names, one per encoded argument
+    """
+    if arg_count == 0:
+        return ()
+    params = REDUCER_PARAMETERS.get(reducer_name)
+    if params is not None and (len(params) == arg_count or not params):
+        return params
+    if arg_count == 1:
+        return ('value',)
+    return tuple(f"arg{i}" for i in range(arg_count))
+
+
+def build_reducer_args(reducer_name: str, args: Sequence[Any]) -> Dict[str, Any]:
+    """
+    Convert positional reducer arguments to the named form the server expects.
+
+    Args:
+        reducer_name: Reducer name
+        args: Positional arguments
+
+    Returns:
+        Arguments keyed by parameter name
+    """
+    return dict(zip(reducer_parameter_names(reducer_name, len(args)), args))
+
+
+def stamp_request_id(message_data: Union[str, bytes], request_id: int) -> Union[str, bytes]:
+    """
+    Set the request id of an encoded CallReducer message.
+
+    The server echoes this id in the TransactionUpdate's ``reducer_call``,
+    which is how callers correlate a call with its committed outcome.
+
+    Args:
+        message_data: Encoded CallReducer message (JSON text or bytes)
+        request_id: u32 request id
+
+    Returns:
+        Message with the request id set, in the same type it was given
+    """
+    try:
+        payload = json.loads(message_data)
+    except (TypeError, ValueError):
+        return message_data
+
+    call = payload.get('CallReducer') if isinstance(payload, dict) else None
+    if not isinstance(call, dict):
+        return message_data
+
+    call['request_id'] = request_id
+    encoded = json.dumps(payload)
+    return encoded.encode('utf-8') if isinstance(message_data, bytes) else encoded
+
+
+class ReducerMessageEncoder:
+    """
+    Encoder for one reducer with a fixed argument count.
+
+    When the protocol helper emits a JSON CallReducer envelope, the
+    envelope is compiled into a template and each call only encodes its
+    arguments. Otherwise (e.g. a binary protocol) the encoder falls back
+    to the protocol helper for every call.
+    """
+
+    def __init__(self, reducer_name: str, parameter_names: Tuple[str, ...],
+                 protocol_helper: Any, text_frames: bool = True, validate: bool = False):
+        """
+        Initialize reducer message encoder.
+
+        Args:
+            reducer_name: Reducer name
+            parameter_names: Argument names, in positional order
+            protocol_helper: SDK protocol helper providing encode_reducer_call()
+            text_frames: Produce str (TEXT frames) instead of bytes
+            validate: Check every frame against the protocol helper's output
+        """
+        self.reducer_name = reducer_name
+        self.parameter_names = parameter_names
+        self.text_frames = text_frames
+        self.validate = validate
+        self._protocol_helper = protocol_helper
+
+        self._key_prefixes = tuple(_encode_json(name) + ':' for name in parameter_names)
+        self._template: Optional[list] = None
+        self._args_index = -1
+        self._request_id_index = -1
+        self._args_as_string = False
+        self.compiled = self._compile()
+
+    def _compile(self) -> bool:
+        """Capture the protocol helper's envelope for this reducer."""
+        try:
+            sample = self._protocol_helper.encode_reducer_call(self.reducer_name, {})
+            payload = json.loads(sample)
+        except (TypeError, ValueError):
+            return False
+        except Exception as e:
+            logger.debug(f"Could not compile encoder for reducer '{self.reducer_name}': {e}")
+            return False
+
+        call = payload.get('CallReducer') if isinstance(payload, dict) else None
+        if not isinstance(call, dict) or 'args' not in call:
+            return False
+
+        self._args_as_string = isinstance(call['args'], str)
+        call['args'] = _ARGS_SLOT
+        call['request_id'] = _REQUEST_ID_SLOT
+
+        parts = _SLOT_PATTERN.split(json.dumps(payload, separators=(',', ':')))
+        slots = parts[1::2]
+        if sorted(slots) != ['args', 'request_id']:
+            return False
+
+        self._args_index = 1 + 2 * slots.index('args')
+        self._request_id_index = 1 + 2 * slots.index('request_id')
+        self._template = parts
+        return True
+
+    def encode_args(self, args: Sequence[Any]) -> str:
+        """Encode positional arguments as the JSON args object."""
+        if not self._key_prefixes:
+            return '{}'
+        return '{' + ','.join(
+            prefix + _encode_json(value) for prefix, value in zip(self._key_prefixes, args)
+        ) + '}'
+
+    def encode(self, args: Sequence[Any], request_id: int = 0) -> Union[str, bytes]:
+        """
+        Encode a complete CallReducer frame.
+
+        Args:
+            args: Positional reducer arguments
+            request_id: u32 request id echoed back in the TransactionUpdate
+
+        Returns:
+            Frame payload (str for TEXT frames, bytes for BINARY frames)
+        """
+        if self._template is None:
+            frame = self._protocol_helper.encode_reducer_call(
+                self.reducer_name, dict(zip(self.parameter_names, args))
+            )
+            if request_id:
+                frame = stamp_request_id(frame, request_id)
+        else:
+            args_json = self.encode_args(args)
+            if self._args_as_string:
+                args_json = _encode_json(args_json)
+
+            parts = self._template.copy()
+            parts[self._args_index] = args_json
+            parts[self._request_id_index] = str(request_id)
+            frame = ''.join(parts)
+
+            if self.validate:
+                self._validate(frame, args)
+
+        if self.text_frames:
+            return frame.decode('utf-8') if isinstance(frame, bytes) else frame
+        return frame.encode('utf-8') if isinstance(frame, str) else frame
+
+    def _validate(self, frame: str, args: Sequence[Any]) -> None:
+        """Check a compiled frame against the protocol helper's encoding."""
+        expected = json.loads(self._protocol_helper.encode_reducer_call(
+            self.reducer_name, dict(zip(self.parameter_names, args))
+        ))
+        actual = json.loads(frame)
+
+        expected_call = expected.get('CallReducer', {})
+        actual_call = actual.get('CallReducer', {})
+        expected_args = expected_call.get('args')
+        actual_args = actual_call.get('args')
+        if self._args_as_string:
+            expected_args, actual_args = json.loads(expected_args), json.loads(actual_args)
+        # Normalize model objects the helper may have serialized differently
+        expected_args = json.loads(_encode_json(expected_args))
+
+        if (expected_args != actual_args or
+                expected_call.get('reducer') != actual_call.get('reducer')):
+            raise DataValidationError(
+                f"Compiled encoder for '{self.reducer_name}' produced {actual_call!r}, "
+                f"expected {expected_call!r}"
+            )
+
+
+class ReducerEncoderCache:
+    """
+    Per-connection cache of reducer encoders.
+
+    Encoders are compiled lazily the first time a reducer is called with a
+    given argument count and reused for every later call.
+    """
+
+    def __init__(self, protocol_helper: Any, text_frames: bool = True, validate: bool = False):
+        """
+        Initialize reducer encoder cache.
+
+        Args:
+            protocol_helper: SDK protocol helper providing encode_reducer_call()
+            text_frames: Produce str (TEXT frames) instead of bytes
+            validate: Check every compiled frame against the protocol helper
+        """
+        self._protocol_helper = protocol_helper
+        self.text_frames = text_frames
+        self.validate = validate
+        self._encoders: Dict[Tuple[str, Any], ReducerMessageEncoder] = {}
+
+        # Statistics
+        self._encoded = 0
+        self._fallback_encoded = 0
+
+    def get(self, reducer_name: str, arg_count: int) -> ReducerMessageEncoder:
+        """
+        Get the encoder for a reducer and argument count.
+
+        Args:
+            reducer_name: Reducer name
+            arg_count: Number of positional arguments
+
+        Returns:
+            Cached or newly compiled encoder
+        """
+        encoder = self._encoders.get((reducer_name, arg_count))
+        if encoder is None:
+            encoder = self._build((reducer_name, arg_count), reducer_name,
+                                  reducer_parameter_names(reducer_name, arg_count))
+        return encoder
+
+    def _build(self, key: Tuple[str, Any], reducer_name: str,
+               parameter_names: Tuple[str, ...]) -> ReducerMessageEncoder:
+        """Compile and cache an encoder."""
+        encoder = ReducerMessageEncoder(
+            reducer_name,
+            parameter_names,
+            self._protocol_helper,
+            text_frames=self.text_frames,
+            validate=self.validate
+        )
+        self._encoders[key] = encoder
+        logger.debug(f"Built {'compiled' if encoder.compiled else 'fallback'} encoder "
+                     f"for reducer '{reducer_name}' {parameter_names}")
+        return encoder
+
+    def encode(self, reducer_name: str, args: Sequence[Any], request_id: int = 0) -> Union[str, bytes]:
+        """
+        Encode a CallReducer frame from positional arguments.
+
+        Args:
+            reducer_name: Reducer name
+            args: Positional reducer arguments
+            request_id: u32 request id echoed back in the TransactionUpdate
+
+        Returns:
+            Frame payload ready to send
+        """
+        encoder = self.get(reducer_name, len(args))
+        self._encoded += 1
+        if not encoder.compiled:
+            self._fallback_encoded += 1
+        return encoder.encode(args, request_id)
+
+    def encode_named(self, reducer_name: str, args: Dict[str, Any], request_id: int = 0) -> Union[str, bytes]:
+        """
+        Encode a CallReducer frame from already-named arguments.
+
+        Args:
+            reducer_name: Reducer name
+            args: Arguments keyed by parameter name
+            request_id: u32 request id echoed back in the TransactionUpdate
+
+        Returns:
+            Frame payload ready to send
+        """
+        names = tuple(args)
+        encoder = self._encoders.get((reducer_name, names))
+        if encoder is None:
+            encoder = self._build((reducer_name, names), reducer_name, names)
+        self._encoded += 1
+        if not encoder.compiled:
+            self._fallback_encoded += 1
+        return encoder.encode(tuple(args.values()), request_id)
+
+    def clear(self) -> None:
+        """Drop all compiled encoders (e.g. after the protocol changes)."""
+        self._encoders.clear()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get reducer encoding statistics."""
+        return {
+            'encoders': len(self._encoders),
+            'compiled_encoders': sum(1 for encoder in self._encoders.values() if encoder.compiled),
+            'encoded': self._encoded,
+            'fallback_encoded': self._fallback_encoded,
+            'validate': self.validate
+        }
@@ -12,7 +12,7 @@ import os
 import time
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable, List, Union
+from typing import Dict, Any, Optional, Callable, List, Union, Sequence, Tuple
 import websockets
 from websockets.exceptions import ConnectionClosed, WebSocketException, InvalidStatus
 from websockets.client import WebSocketClientProtocol
@@ -37,8 +37,8 @@ except ImportError:
     # Fallback for older SDK versions
     pass
 
-from ..config.environment import EnvironmentConfig
 from ..models.game_entities import GameEntity, GamePlayer, GameCircle, Vector2
+from ..models.snapshots import VersionedMap, MapSnapshot
 from ..exceptions.connection_errors import (
     BlackholioConnectionError,
     ServerConfigurationError,
@@ -50,6 +50,10 @@ from ..exceptions.connection_errors import (
 )
 from .server_config import ServerConfig
 from .protocol_handlers import V112ProtocolHandler
+from .connect_limiter import ConnectRateLimiter, get_connect_rate_limiter, decorrelated_jitter
+from .reducer_encoding import ReducerEncoderCache, stamp_request_id
+from ..utils.debugging import get_span_profiler
+from .frame_recording import FrameRecorder
 
 
 logger = logging.getLogger(__name__)
@@ -72,7 +76,7 @@ class SpacetimeDBConnection:
     Supports SpacetimeDB v1.1.2 protocol with multi-server-language capability.
     """
     
-    def __init__(self, config: ServerConfig):
+    def __init__(self, config: ServerConfig, connect_limiter: Optional[ConnectRateLimiter] = None):
         self.config = config
         self.websocket: Optional[WebSocketClientProtocol] = None
         self.state = ConnectionState.DISCONNECTED
@@ -91,6 +95,15 @@ class SpacetimeDBConnection:
         self._protocol_validated = False
         self._protocol_version = "v1.json.spacetimedb"
         
+        # Per-reducer frame encoders (validated against the SDK in debug mode)
+        self._reducer_encoders = self._build_reducer_encoders()
+        
+        # Sampled hot-path latency spans (frame decode, dispatch, reducer sends)
+        self._profiler = get_span_profiler()
+        
+        # Optional capture of inbound frames for offline replay
+        self._frame_recorder: Optional[FrameRecorder] = None
+        
         # JWT Authentication state
         self._identity = None
         self._auth_token = None
@@ -101,8 +114,14 @@ class SpacetimeDBConnection:
         self._reconnect_attempts = 0
         self._max_reconnect_attempts = 5
         self._reconnect_delay = 2.0
+        self._max_reconnect_delay = 60.0
+        self._last_reconnect_delay: Optional[float] = None
         self._connection_timeout = 30.0
         
+        # Shared across the process so mass reconnects are paced
+        self._connect_limiter = connect_limiter or get_connect_rate_limiter()
+        self._connect_queue_time = 0.0
+        
         # Event callbacks
         self._event_callbacks: Dict[str, List[Callable]] = {}
         
@@ -130,8 +149,15 @@ class SpacetimeDBConnection:
         self._subscriptions_active = False
         self._last_data_received: Optional[float] = None
         self._subscription_tables: List[str] = []
+        self._subscription_queries: Optional[List[str]] = None  # Custom query set (e.g. area of interest)
         self._last_initial_subscription: Optional[Dict[str, Any]] = None  # Store InitialSubscription for later
         
+        # Resumable reconnect state
+        self._resume_pending = False  # Next snapshot should be diffed against existing caches
+        self._resume_started_at: Optional[float] = None
+        self._resume_count = 0
+        self._last_resume_duration: Optional[float] = None
+        
         logger.info(f"Initialized SpacetimeDB connection for {config.language} server at {config.host}")
         if not SDK_VALIDATION_AVAILABLE:
             logger.warning("Enhanced SDK protocol validation not available - using basic validation")
@@ -141,6 +167,21 @@ class SpacetimeDBConnection:
         Connect to SpacetimeDB server with retry logic.
         Consolidates connection patterns from both existing implementations.
         """
+        try:
+            return await self._connect_once()
+        except Exception as e:
+            return await self._handle_connection_error(e)
+    
+    async def _connect_once(self) -> bool:
+        """
+        Make a single connection attempt, paced by the shared connect limiter.
+        
+        Returns:
+            True if connected, False if the attempt failed without an exception
+            
+        Raises:
+            Exception: Errors from the attempt, for the caller's retry loop
+        """
         async with self._connection_lock:
             if self.state == ConnectionState.CONNECTED:
                 logger.warning("Already connected to SpacetimeDB")
@@ -153,8 +194,11 @@ class SpacetimeDBConnection:
             self.state = ConnectionState.CONNECTING
             
             try:
-                # Try to load existing credentials
-                await self._load_credentials()
+                self._connect_queue_time += await self._connect_limiter.acquire()
+                
+                # Reuse in-memory credentials (e.g. on reconnect), otherwise load stored ones
+                if not self._auth_token:
+                    await self._load_credentials()
                 
                 # Build WebSocket URL
                 ws_url = self._build_websocket_url()
@@ -216,6 +260,18 @@ class SpacetimeDBConnection:
                 identity_info = f" with identity: {self._identity}" if self._identity else ""
                 logger.info(f"✅ [TIMING] Total connection time: {total_connection_time:.3f}s")
                 logger.info(f"Successfully connected to SpacetimeDB{identity_info} - subscriptions {'active' if subscription_ready else 'pending'}")
+                
+                if self._resume_started_at is not None:
+                    self._last_resume_duration = time.time() - self._resume_started_at
+                    self._resume_started_at = None
+                    self._resume_count += 1
+                    logger.info(f"Resumed session in {self._last_resume_duration:.3f}s")
+                    await self._trigger_event('resumed', {
+                        'identity': self._identity,
+                        'duration': self._last_resume_duration,
+                        'resume_count': self._resume_count
+                    })
+                
                 await self._trigger_event('connected', {
                     'server': self.config.language,
                     'url': ws_url,
@@ -232,14 +288,12 @@ class SpacetimeDBConnection:
                     "initial_connection"
                 )
                 logger.error(f"Connection timeout: {error}")
-                await self._handle_connection_error(error)
-                return False
+                raise error from None
                 
             except Exception as e:
                 self.state = ConnectionState.FAILED
                 logger.error(f"Failed to connect to SpacetimeDB: {e}")
-                await self._handle_connection_error(e)
-                return False
+                raise
     
     async def disconnect(self):
         """Gracefully disconnect from SpacetimeDB server."""
@@ -252,6 +306,8 @@ class SpacetimeDBConnection:
             
             # Set state to disconnecting to prevent new operations
             self.state = ConnectionState.DISCONNECTED
+            self._resume_pending = False
+            self._resume_started_at = None
             
             # Step 1: Stop sending new messages by cancelling heartbeat first
             if self._heartbeat_task:
@@ -291,6 +347,9 @@ class SpacetimeDBConnection:
                     pass
                 self._message_handler_task = None
             
+            if self._frame_recorder is not None:
+                self._frame_recorder.flush()
+            
             # Step 5: Cancel all pending requests
             for request_id, future in self._pending_requests.items():
                 if not future.done():
@@ -466,13 +525,14 @@ class SpacetimeDBConnection:
     
     async def _load_credentials(self):
         """Load stored credentials if available and not expired."""
-        if not self._credentials_file.exists():
-            logger.debug("No credential file found")
-            return
+        # Imported here to avoid a circular import through the auth package
+        from ..auth.credential_cache import get_credential_cache
         
         try:
-            with open(self._credentials_file, 'r') as f:
-                data = json.load(f)
+            data = await get_credential_cache().read_async(self._credentials_file)
+            if data is None:
+                logger.debug("No credential file found")
+                return
             
             # Create key for this host/database combination
             key = f"{self.config.host}:{self.config.db_identity}"
@@ -522,6 +582,7 @@ class SpacetimeDBConnection:
                 elif negotiated_protocol == "v1.bsatn.spacetimedb":
                     logger.warning("Server negotiated binary protocol but client is configured for JSON")
                     self._protocol_version = negotiated_protocol
+                    self._reducer_encoders = self._build_reducer_encoders()
                     # We could switch to binary mode here if needed
                 else:
                     logger.warning(f"Unknown negotiated protocol: {negotiated_protocol}")
@@ -540,38 +601,62 @@ class SpacetimeDBConnection:
         if not self._identity or not self._auth_token:
             return
         
+        from ..auth.credential_cache import get_credential_cache
+        
         try:
-            # Ensure directory exists
-            self._credentials_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Load existing data
-            data = {}
-            if self._credentials_file.exists():
-                with open(self._credentials_file, 'r') as f:
-                    data = json.load(f)
-            
-            # Store credentials with key
+            # Merge into the shared file with an atomic write off the event loop
             key = f"{self.config.host}:{self.config.db_identity}"
-            data[key] = {
+            await get_credential_cache().update_async(self._credentials_file, key, {
                 'identity': self._identity,
                 'token': self._auth_token,
                 'host': self.config.host,
                 'database': self.config.db_identity,
                 'timestamp': time.time()
-            }
-            
-            # Save to file
-            with open(self._credentials_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            })
             
             logger.debug(f"Stored credentials for {key}")
             
         except Exception as e:
             logger.error(f"Failed to store credentials: {e}")
     
+    def get_session_state(self) -> Dict[str, Any]:
+        """
+        Get the state needed to resume this session on a new connection.
+        
+        Returns:
+            Dictionary with identity, token and subscription queries
+        """
+        return {
+            'identity': self._identity,
+            'token': self._auth_token,
+            'subscription_queries': list(self._subscription_queries) if self._subscription_queries else None
+        }
+    
+    def restore_session(self, session_state: Dict[str, Any]) -> None:
+        """
+        Seed this connection from a previous session before connecting.
+        
+        Credentials are reused from memory instead of re-reading the
+        credential file, and the next snapshot is flagged for diffing.
+        
+        Args:
+            session_state: State returned by get_session_state()
+        """
+        self._identity = session_state.get('identity') or self._identity
+        self._auth_token = session_state.get('token') or self._auth_token
+        if session_state.get('subscription_queries'):
+            self._subscription_queries = list(session_state['subscription_queries'])
+        self._resume_pending = True
+        self._resume_started_at = time.time()
+    
     
     async def _send_subscription_request(self):
         """Send initial subscription request using JSON protocol."""
+        # Re-use a custom query set if one was installed (e.g. area of interest)
+        if self._subscription_queries:
+            await self._send_subscribe_queries(self._subscription_queries)
+            return
+        
         # Get tables to subscribe to
         tables = ["entity", "player", "circle", "food", "config"]
         
@@ -607,6 +692,40 @@ class SpacetimeDBConnection:
             await self.websocket.send(binary_message)
             logger.info(f"Sent binary subscription request as BINARY frame ({len(binary_message)} bytes)")
     
+    async def subscribe_queries(self, query_strings: List[str]) -> None:
+        """
+        Replace the active subscription with a set of SQL queries.
+        
+        The query set is remembered and re-sent on reconnect.
+        
+        Args:
+            query_strings: SQL subscription queries
+        """
+        if not self.websocket or self.state != ConnectionState.CONNECTED:
+            raise BlackholioConnectionError("Not connected to SpacetimeDB")
+        
+        self._subscription_queries = list(query_strings)
+        await self._send_subscribe_queries(self._subscription_queries)
+    
+    async def _send_subscribe_queries(self, query_strings: List[str]) -> None:
+        """Send a Subscribe message carrying explicit query strings."""
+        self._request_counter += 1
+        json_message = json.dumps({
+            'Subscribe': {
+                'query_strings': query_strings,
+                'request_id': self._request_counter
+            }
+        })
+        
+        if self._protocol_version == "v1.json.spacetimedb":
+            await self.websocket.send(json_message)  # TEXT frame
+        else:
+            await self.websocket.send(json_message.encode('utf-8'))  # BINARY frame
+        
+        self._messages_sent += 1
+        self._bytes_sent += len(json_message)
+        logger.debug(f"Sent subscription with {len(query_strings)} queries")
+    
     async def _send_message(self, message: Dict[str, Any], request_id: Optional[str] = None) -> Optional[asyncio.Future]:
         """
         Send message to SpacetimeDB server with optional request tracking.
@@ -644,6 +763,8 @@ class SpacetimeDBConnection:
                 reducer_name = message.get('reducer', '')
                 args = message.get('args', {})
                 message_data = self.protocol_helper.encode_reducer_call(reducer_name, args)
+                if message.get('reducer_request_id') is not None:
+                    message_data = stamp_request_id(message_data, message['reducer_request_id'])
             elif 'query' in message:
                 # Use encode_one_off_query for query messages
                 query = message.get('query', '')
@@ -739,13 +860,27 @@ class SpacetimeDBConnection:
             
             raise SpacetimeDBError(f"Request '{message_type}' failed: {e}")
     
-    async def call_reducer(self, reducer_name: str, args: List[Any]) -> bool:
+    def _build_reducer_encoders(self) -> ReducerEncoderCache:
+        """Create reducer encoders for the current protocol."""
+        from ..config.environment import get_environment_config
+        
+        return ReducerEncoderCache(
+            self.protocol_helper,
+            text_frames=self._protocol_version == "v1.json.spacetimedb",
+            validate=get_environment_config().is_development_mode()
+        )
+    
+    async def call_reducer(self, reducer_name: str, args: List[Any], request_id: Optional[int] = None) -> bool:
         """
         Call a SpacetimeDB reducer.
         
+        The frame is written by the reducer's pre-compiled encoder, so the
+        envelope is not rebuilt for every call.
+        
         Args:
             reducer_name: Name of the reducer to call
             args: List of arguments to pass to the reducer
+            request_id: Optional u32 request id echoed back in the TransactionUpdate
             
         Returns:
             True if the reducer call was sent successfully
@@ -754,43 +889,55 @@ class SpacetimeDBConnection:
             raise BlackholioConnectionError("Not connected to SpacetimeDB")
         
         try:
-            # Convert args list to proper format for SpacetimeDB
-            # Each reducer has specific parameter names it expects
-            args_dict = {}
-            if args:
-                if reducer_name == "enter_game" and len(args) == 1:
-                    # enter_game expects "name" parameter
-                    args_dict = {"name": args[0]}
-                elif reducer_name == "update_player_input" and len(args) == 1:
-                    # update_player_input expects "direction" parameter
-                    # If the arg is already a dict with x,y, wrap it properly
-                    if isinstance(args[0], dict):
-                        args_dict = {"direction": args[0]}
-                    else:
-                        args_dict = {"direction": args[0]}
-                elif reducer_name == "player_split":
-                    # player_split takes no arguments
-                    args_dict = {}
-                elif len(args) == 1:
-                    # For other single argument reducers, pass the value directly
-                    args_dict = {"value": args[0]}
-                else:
-                    # For multiple arguments, create indexed dict
-                    args_dict = {f"arg{i}": arg for i, arg in enumerate(args)}
+            started = self._profiler.start('reducer_send')
+            try:
+                frame = self._reducer_encoders.encode(reducer_name, args, request_id or 0)
+                await self.websocket.send(frame)
+            finally:
+                self._profiler.stop('reducer_send', started)
             
-            # Use the existing _send_message method which handles reducer encoding
-            await self._send_message({
-                'reducer': reducer_name,
-                'args': args_dict
-            })
+            self._messages_sent += 1
+            self._bytes_sent += len(frame)
             
-            logger.info(f"✅ Called reducer '{reducer_name}' with args: {args}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"✅ Called reducer '{reducer_name}' with args: {args}")
             return True
             
         except Exception as e:
             logger.error(f"❌ Failed to call reducer '{reducer_name}': {e}")
             raise BlackholioConnectionError(f"Reducer call failed: {e}")
     
+    async def send_reducer_batch(self, calls: Sequence[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Send several reducer calls in one pass.
+        
+        Every frame is encoded before the first one is written, so a bad
+        call fails the batch without sending part of it, and the frames
+        then go out back-to-back.
+        
+        Args:
+            calls: (reducer_name, named args) pairs, in send order
+            
+        Returns:
+            Number of frames sent
+        """
+        if not self.websocket or self.state != ConnectionState.CONNECTED:
+            raise BlackholioConnectionError("Not connected to SpacetimeDB")
+        
+        frames = [self._reducer_encoders.encode_named(reducer_name, args) for reducer_name, args in calls]
+        try:
+            with self._profiler.span('reducer_batch_send'):
+                for frame in frames:
+                    await self.websocket.send(frame)
+                    self._messages_sent += 1
+                    self._bytes_sent += len(frame)
+        except Exception as e:
+            logger.error(f"❌ Failed to send reducer batch of {len(frames)}: {e}")
+            raise BlackholioConnectionError(f"Reducer batch failed: {e}")
+        
+        logger.debug(f"Sent reducer batch of {len(frames)} frames")
+        return len(frames)
+    
     async def _message_handler(self):
         """Handle incoming messages from SpacetimeDB with enhanced protocol validation."""
         try:
@@ -799,6 +946,9 @@ class SpacetimeDBConnection:
                     # Update statistics
                     self._messages_received += 1
                     
+                    if self._frame_recorder is not None:
+                        self._frame_recorder.record(message)
+                    
                     # Enhanced frame type validation
                     if isinstance(message, bytes):
                         # Binary message - should NOT happen with JSON protocol
@@ -807,19 +957,31 @@ class SpacetimeDBConnection:
                             logger.error("Protocol mismatch: negotiated JSON but received binary frame")
                             logger.debug(f"Binary frame length: {len(message)} bytes")
                             # Still try to handle it for robustness, but log the inconsistency
-                        data = await self._handle_binary_message(message)
+                        started = self._profiler.start('frame_decode')
+                        try:
+                            data = await self._handle_binary_message(message)
+                        finally:
+                            self._profiler.stop('frame_decode', started)
                     elif isinstance(message, str):
                         # Text message - this is expected with JSON protocol
                         self._bytes_received += len(message.encode('utf-8'))
                         logger.debug(f"Received TEXT frame ({len(message)} chars) - parsing with JSON protocol")
-                        data = await self._handle_text_message(message)
+                        started = self._profiler.start('frame_decode')
+                        try:
+                            data = await self._handle_text_message(message)
+                        finally:
+                            self._profiler.stop('frame_decode', started)
                     else:
                         logger.warning(f"Unknown message type: {type(message)}")
                         continue
                     
                     # Process the message
                     if data:
-                        await self._process_message(data)
+                        started = self._profiler.start('process_message')
+                        try:
+                            await self._process_message(data)
+                        finally:
+                            self._profiler.stop('process_message', started)
                         
                 except json.JSONDecodeError as e:
                     logger.error(f"Failed to parse JSON message: {e}")
@@ -1010,6 +1172,11 @@ class SpacetimeDBConnection:
                         else:
                             logger.warning(f"📨 [MESSAGE] Tables is unexpected type: {type(tables_data)}")
                         
+                        # Flag the snapshot so listeners can diff it against their caches
+                        if self._resume_pending:
+                            data['resume'] = True
+                            self._resume_pending = False
+                        
                         # Store as initial subscription for later processing
                         self._last_initial_subscription = data
                         logger.info(f"💾 [MESSAGE] Stored DatabaseUpdate as InitialSubscription data")
@@ -1040,6 +1207,11 @@ class SpacetimeDBConnection:
                 processed_data = {'type': message_type, 'subscription_data': data['InitialSubscription']}
                 logger.debug("Recognized InitialSubscription message")
                 
+                # Flag the snapshot so listeners can diff it against their caches
+                if self._resume_pending:
+                    processed_data['resume'] = True
+                    self._resume_pending = False
+                
                 # CRITICAL: Store the subscription data for later retrieval
                 # This solves the timing issue where events are fired before handlers are registered
                 self._last_initial_subscription = data['InitialSubscription']
@@ -1173,32 +1345,37 @@ class SpacetimeDBConnection:
         except Exception as e:
             logger.debug(f"Failed to send close frame: {e}")
     
-    async def _handle_connection_error(self, error: Exception):
-        """Handle connection errors with retry logic."""
-        previous_state = self.state
+    async def _handle_connection_error(self, error: Exception) -> bool:
+        """
+        Handle connection errors with an iterative retry loop.
+        
+        Backoff uses decorrelated jitter and every attempt goes through the
+        shared connect limiter, so many clients losing the same server do
+        not reconnect in lockstep.
         
+        Returns:
+            True if a retry reconnected successfully
+        """
         # Determine if error is retryable
         from ..exceptions.connection_errors import is_retryable_error
         
-        if not is_retryable_error(error) or self._reconnect_attempts >= self._max_reconnect_attempts:
-            self.state = ConnectionState.FAILED
-            logger.error(f"Connection failed permanently: {error}")
-            await self._trigger_event('connection_failed', {
-                'error': str(error),
-                'error_type': type(error).__name__,
-                'attempts': self._reconnect_attempts,
-                'retryable': is_retryable_error(error)
-            })
-            return
-        
-        if self._reconnect_attempts < self._max_reconnect_attempts:
+        delay = self._reconnect_delay
+        while True:
+            if not is_retryable_error(error) or self._reconnect_attempts >= self._max_reconnect_attempts:
+                self.state = ConnectionState.FAILED
+                logger.error(f"Connection failed permanently: {error}")
+                await self._trigger_event('connection_failed', {
+                    'error': str(error),
+                    'error_type': type(error).__name__,
+                    'attempts': self._reconnect_attempts,
+                    'retryable': is_retryable_error(error)
+                })
+                return False
+            
             self.state = ConnectionState.RECONNECTING
             self._reconnect_attempts += 1
-            
-            # Exponential backoff with jitter
-            delay = self._reconnect_delay * (2 ** (self._reconnect_attempts - 1))
-            jitter = delay * 0.1 * (2 * asyncio.get_event_loop().time() % 1 - 1)
-            delay = max(0.1, delay + jitter)
+            delay = decorrelated_jitter(delay, self._reconnect_delay, self._max_reconnect_delay)
+            self._last_reconnect_delay = delay
             
             logger.warning(
                 f"Connection error: {error}. Retrying in {delay:.1f}s "
@@ -1214,11 +1391,20 @@ class SpacetimeDBConnection:
             
             await asyncio.sleep(delay)
             
+            # Bail out if disconnect() was called while we were waiting
+            if self.state != ConnectionState.RECONNECTING:
+                return self.state == ConnectionState.CONNECTED
+            
             try:
-                await self.connect()
+                if await self._connect_once():
+                    return True
+                error = ConnectionLostError(
+                    "Reconnection attempt failed",
+                    reconnect_attempts=self._reconnect_attempts
+                )
             except Exception as e:
                 logger.error(f"Reconnection attempt failed: {e}")
-                await self._handle_connection_error(e)
+                error = e
     
     async def _handle_disconnection(self):
         """Handle unexpected disconnection."""
@@ -1229,6 +1415,10 @@ class SpacetimeDBConnection:
             # Just clean up internal state
             self.state = ConnectionState.DISCONNECTED
             
+            # Keep identity/token in memory and diff the next snapshot
+            self._resume_pending = True
+            self._resume_started_at = time.time()
+            
             # Cancel tasks without trying to send close frames
             if self._heartbeat_task:
                 self._heartbeat_task.cancel()
@@ -1238,13 +1428,15 @@ class SpacetimeDBConnection:
                     pass
                 self._heartbeat_task = None
             
-            if self._message_handler_task:
+            # This usually runs inside the message handler itself, which must
+            # stay alive to drive the reconnect loop below
+            if self._message_handler_task and self._message_handler_task is not asyncio.current_task():
                 self._message_handler_task.cancel()
                 try:
                     await self._message_handler_task
                 except asyncio.CancelledError:
                     pass
-                self._message_handler_task = None
+            self._message_handler_task = None
             
             # Clear websocket reference
             self.websocket = None
@@ -1289,9 +1481,57 @@ class SpacetimeDBConnection:
             'bytes_received': self._bytes_received,
             'pending_requests': len(self._pending_requests),
             'reconnect_attempts': self._reconnect_attempts,
-            'last_heartbeat': self._last_heartbeat_time
+            'last_reconnect_delay': self._last_reconnect_delay,
+            'connect_queue_time': self._connect_queue_time,
+            'connect_limiter': self._connect_limiter.get_metrics(),
+            'reducer_encoding': self._reducer_encoders.get_statistics(),
+            'last_heartbeat': self._last_heartbeat_time,
+            'resumes': self._resume_count,
+            'last_resume_duration': self._last_resume_duration
         }
     
+    @property
+    def frame_recorder(self) -> Optional[FrameRecorder]:
+        """Get the recorder capturing inbound frames, if any."""
+        return self._frame_recorder
+    
+    def start_recording(self, path: Union[str, Path], compression: Optional[str] = None) -> FrameRecorder:
+        """
+        Capture every inbound frame to a recording file for offline replay.
+        
+        Args:
+            path: Recording file (appended to if it exists)
+            compression: None, 'gzip' or 'zstd'
+            
+        Returns:
+            The frame recorder
+        """
+        self.stop_recording()
+        self._frame_recorder = FrameRecorder(path, compression=compression)
+        logger.info(f"Recording inbound frames to {path}")
+        return self._frame_recorder
+    
+    def set_frame_recorder(self, recorder: Optional[FrameRecorder]) -> None:
+        """
+        Capture inbound frames with an existing recorder (None stops capturing).
+        
+        The recorder is not closed when replaced; its owner closes it.
+        """
+        self._frame_recorder = recorder
+    
+    def stop_recording(self) -> Optional[Dict[str, Any]]:
+        """
+        Stop capturing inbound frames and close the recording.
+        
+        Returns:
+            Recording statistics, or None if no recording was active
+        """
+        recorder, self._frame_recorder = self._frame_recorder, None
+        if recorder is None:
+            return None
+        recorder.close()
+        return recorder.get_statistics()
+    
     def get_pending_request_count(self) -> int:
         """Get number of pending requests."""
         return len(self._pending_requests)
@@ -1461,39 +1701,41 @@ class SpacetimeDBConnection:
         
         # Trigger callbacks for all event name variations
         total_callbacks_executed = 0
-        
-        for event_name in events_to_trigger:
-            callbacks = self._event_callbacks.get(event_name, [])
-            
-            if callbacks:
-                logger.info(f"🚀 [EVENT] ✅ Triggering event '{event_name}' with {len(callbacks)} callbacks")
+        dispatch_started = self._profiler.start('callback_dispatch')
+        try:
+            for event_name in events_to_trigger:
+                callbacks = self._event_callbacks.get(event_name, [])
                 
-                for i, callback in enumerate(callbacks):
-                    callback_start_time = time.time()
-                    try:
-                        logger.info(f"🚀 [EVENT] Executing callback {i+1}/{len(callbacks)} for '{event_name}'")
-                        
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(data)
-                        else:
-                            callback(data)
+                if callbacks:
+                    logger.info(f"🚀 [EVENT] ✅ Triggering event '{event_name}' with {len(callbacks)} callbacks")
+                    
+                    for i, callback in enumerate(callbacks):
+                        callback_start_time = time.time()
+                        try:
+                            logger.info(f"🚀 [EVENT] Executing callback {i+1}/{len(callbacks)} for '{event_name}'")
                             
-                        callback_duration = time.time() - callback_start_time
-                        logger.info(f"🚀 [EVENT] ✅ Callback {i+1} completed in {callback_duration:.3f}s")
-                        total_callbacks_executed += 1
-                        
-                    except Exception as e:
-                        callback_duration = time.time() - callback_start_time
-                        logger.error(f"🚀 [EVENT] ❌ Callback {i+1} failed after {callback_duration:.3f}s: {e}")
-                        import traceback
-                        logger.error(f"🚀 [EVENT] Callback traceback: {traceback.format_exc()}")
-            else:
-                # Log missing callbacks with different severity based on event importance
-                if event_name in ['DatabaseUpdate', 'IdentityToken', 'InitialSubscription']:
-                    logger.warning(f"🚀 [EVENT] ⚠️ CRITICAL: No callbacks registered for important event '{event_name}'!")
+                            if asyncio.iscoroutinefunction(callback):
+                                await callback(data)
+                            else:
+                                callback(data)
+                                
+                            callback_duration = time.time() - callback_start_time
+                            logger.info(f"🚀 [EVENT] ✅ Callback {i+1} completed in {callback_duration:.3f}s")
+                            total_callbacks_executed += 1
+                            
+                        except Exception as e:
+                            callback_duration = time.time() - callback_start_time
+                            logger.error(f"🚀 [EVENT] ❌ Callback {i+1} failed after {callback_duration:.3f}s: {e}")
+                            import traceback
+                            logger.error(f"🚀 [EVENT] Callback traceback: {traceback.format_exc()}")
                 else:
-                    logger.info(f"🚀 [EVENT] 🟡 No callbacks for event '{event_name}'")
-        
+                    # Log missing callbacks with different severity based on event importance
+                    if event_name in ['DatabaseUpdate', 'IdentityToken', 'InitialSubscription']:
+                        logger.warning(f"🚀 [EVENT] ⚠️ CRITICAL: No callbacks registered for important event '{event_name}'!")
+                    else:
+                        logger.info(f"🚀 [EVENT] 🟡 No callbacks for event '{event_name}'")
+        finally:
+            self._profiler.stop('callback_dispatch', dispatch_started)
         total_duration = time.time() - trigger_start_time
         logger.info(f"🚀 [EVENT] <== Event trigger complete. Executed {total_callbacks_executed} callbacks in {total_duration:.3f}s")
 
@@ -1519,7 +1761,9 @@ class BlackholioClient:
             **kwargs: Additional configuration options
         """
         # Load configuration from environment
-        self.env_config = EnvironmentConfig()
+        from ..config.environment import get_environment_config
+        
+        self.env_config = get_environment_config()
         self.server_config = self.env_config.get_server_config(server_language)
         
         # Override with any provided kwargs
@@ -1532,8 +1776,8 @@ class BlackholioClient:
         
         # Game state
         self.player_id = None
-        self.game_entities: Dict[str, GameEntity] = {}
-        self.game_players: Dict[str, GamePlayer] = {}
+        self.game_entities: VersionedMap = VersionedMap()
+        self.game_players: VersionedMap = VersionedMap()
         
         # Set up event handlers
         self._setup_event_handlers()
@@ -1638,13 +1882,13 @@ class BlackholioClient:
             # Update entities
             if 'entities' in data:
                 for entity_data in data['entities']:
-                    entity = GameEntity.from_dict(entity_data)
+                    entity = entity_data if isinstance(entity_data, GameEntity) else GameEntity.from_dict(entity_data)
                     self.game_entities[entity.entity_id] = entity
             
             # Update players
             if 'players' in data:
                 for player_data in data['players']:
-                    player = GamePlayer.from_dict(player_data)
+                    player = player_data if isinstance(player_data, GamePlayer) else GamePlayer.from_dict(player_data)
                     self.game_players[player.player_id] = player
                     
         except Exception as e:
@@ -1667,13 +1911,13 @@ class BlackholioClient:
         """Check if client is connected."""
         return self.connection.is_connected
     
-    def get_entities(self) -> Dict[str, GameEntity]:
-        """Get current game entities."""
-        return self.game_entities.copy()
+    def get_entities(self) -> MapSnapshot:
+        """Get current game entities (immutable snapshot, no per-call copy)."""
+        return self.game_entities.snapshot()
     
-    def get_players(self) -> Dict[str, GamePlayer]:
-        """Get current game players."""
-        return self.game_players.copy()
+    def get_players(self) -> MapSnapshot:
+        """Get current game players (immutable snapshot, no per-call copy)."""
+        return self.game_players.snapshot()
     
     def get_my_player(self) -> Optional[GamePlayer]:
         """Get the current player."""
@@ -1715,13 +1959,13 @@ class BlackholioClient:
             # Process entities from transaction update
             if 'entities' in data:
                 for entity_data in data['entities']:
-                    entity = GameEntity.from_dict(entity_data)
+                    entity = entity_data if isinstance(entity_data, GameEntity) else GameEntity.from_dict(entity_data)
                     self.game_entities[entity.entity_id] = entity
                     
             # Process players from transaction update  
             if 'players' in data:
                 for player_data in data['players']:
-                    player = GamePlayer.from_dict(player_data)
+                    player = player_data if isinstance(player_data, GamePlayer) else GamePlayer.from_dict(player_data)
                     self.game_players[player.player_id] = player
                     
         except Exception as e:
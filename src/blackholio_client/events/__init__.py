@@ -36,6 +36,13 @@ from .connection_events import (
     AuthenticationEvent
 )
 from .utils import EventFilter, EventThrottle, EventBatch
+from .change_stream import (
+    ChangeStream,
+    ChangeStreamConfig,
+    ChangeStreamLagError,
+    ChangeBatch,
+    TableChange
+)
 
 # Enhanced event system (SDK-powered)
 from .enhanced_events import (
@@ -101,6 +108,10 @@ __all__ = [
     # Utilities
     'EventFilter', 'EventThrottle', 'EventBatch',
     
+    # Change stream
+    'ChangeStream', 'ChangeStreamConfig', 'ChangeStreamLagError',
+    'ChangeBatch', 'TableChange',
+    
     # Global functions
     'get_global_event_manager', 'reset_global_event_manager',
     
@@ -0,0 +1,256 @@
+"""
+Change Stream - Resumable Async Iteration over Table Deltas
+
+Callbacks run synchronously inside the receive path, so a slow consumer
+slows everything down. ChangeStream instead collects the row changes of
+each database update into a ChangeBatch, numbers it, and appends it to a
+bounded ring buffer; consumers iterate at their own pace with
+``ChangeStream.changes()`` and resume from a batch's cursor later.
+
+Publishing never waits for consumers. When a consumer's position has been
+overwritten by newer batches it gets a ChangeStreamLagError naming the
+oldest cursor it can resume from, instead of silently missing changes.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Any, Optional, List, Iterable, Deque, FrozenSet, AsyncIterator
+
+
+logger = logging.getLogger(__name__)
+
+
+INSERT = 'insert'
+UPDATE = 'update'
+DELETE = 'delete'
+
+
+class ChangeStreamLagError(Exception):
+    """Raised when a consumer's cursor is older than the oldest buffered batch."""
+
+    def __init__(self, cursor: int, oldest_cursor: int):
+        """
+        Initialize lag error.
+
+        Args:
+            cursor: Cursor the consumer tried to read after
+            oldest_cursor: Oldest cursor that can still be resumed from
+        """
+        super().__init__(f"Change stream consumer fell behind: cursor {cursor}, "
+                         f"oldest available {oldest_cursor} ({oldest_cursor - cursor} batches missed)")
+        self.cursor = cursor
+        self.oldest_cursor = oldest_cursor
+        self.missed_batches = oldest_cursor - cursor
+
+
+@dataclass
+class ChangeStreamConfig:
+    """Change stream configuration."""
+    capacity: int = 1024  # Batches kept for consumers to catch up on
+
+    def validate(self) -> None:
+        """Validate configuration parameters."""
+        if self.capacity < 1:
+            raise ValueError("capacity must be >= 1")
+
+
+@dataclass
+class TableChange:
+    """One row change."""
+    table: str
+    kind: str  # 'insert', 'update' or 'delete'
+    key: str
+    row: Any  # New row (the deleted row for deletes)
+    old: Any = None  # Previous row for updates
+
+
+@dataclass
+class ChangeBatch:
+    """Row changes of one database update."""
+    cursor: int  # Sequence number; pass as ``since`` to resume after this batch
+    timestamp: float
+    changes: List[TableChange] = field(default_factory=list)
+
+    @property
+    def tables(self) -> FrozenSet[str]:
+        """Tables with changes in this batch."""
+        return frozenset(change.table for change in self.changes)
+
+    def for_tables(self, tables: FrozenSet[str]) -> 'ChangeBatch':
+        """Get the batch restricted to some tables."""
+        return ChangeBatch(self.cursor, self.timestamp,
+                           [change for change in self.changes if change.table in tables])
+
+
+class ChangeStream:
+    """
+    Bounded, sequence-numbered buffer of ChangeBatch objects.
+
+    The producer calls ``record`` for each row change and ``commit`` once
+    per database update; consumers use ``changes()``.
+    """
+
+    def __init__(self, config: Optional[ChangeStreamConfig] = None):
+        """
+        Initialize change stream.
+
+        Args:
+            config: Change stream configuration (uses defaults if None)
+        """
+        self.config = config or ChangeStreamConfig()
+        self.config.validate()
+
+        self._batches: Deque[ChangeBatch] = deque(maxlen=self.config.capacity)
+        self._pending: List[TableChange] = []
+        self._cursor = 0
+        self._published: Optional[asyncio.Event] = None  # Created by the first waiting consumer
+        self._closed = False
+
+        # Statistics
+        self._batches_published = 0
+        self._changes_published = 0
+        self._batches_dropped = 0
+        self._lag_errors = 0
+        self._active_consumers = 0
+
+    @property
+    def cursor(self) -> int:
+        """Cursor of the latest batch (0 before the first one)."""
+        return self._cursor
+
+    @property
+    def oldest_cursor(self) -> int:
+        """Oldest cursor consumers can resume from."""
+        return self._batches[0].cursor - 1 if self._batches else self._cursor
+
+    @property
+    def closed(self) -> bool:
+        """Whether the stream has been closed."""
+        return self._closed
+
+    def record(self, table: str, kind: str, key: str, row: Any, old: Any = None) -> None:
+        """
+        Record a row change for the next batch.
+
+        Args:
+            table: Table name
+            kind: 'insert', 'update' or 'delete'
+            key: Row key
+            row: New row (the deleted row for deletes)
+            old: Previous row for updates
+        """
+        self._pending.append(TableChange(table, kind, key, row, old))
+
+    def commit(self) -> Optional[ChangeBatch]:
+        """
+        Publish the recorded changes as one batch.
+
+        Returns:
+            The published batch, or None if nothing was recorded
+        """
+        if not self._pending or self._closed:
+            self._pending = []
+            return None
+
+        self._cursor += 1
+        batch = ChangeBatch(self._cursor, time.time(), self._pending)
+        self._pending = []
+
+        if len(self._batches) == self._batches.maxlen:
+            self._batches_dropped += 1
+        self._batches.append(batch)
+        self._batches_published += 1
+        self._changes_published += len(batch.changes)
+        self._wake()
+        return batch
+
+    def close(self) -> None:
+        """Close the stream; consumers finish after the batches already buffered."""
+        self._closed = True
+        self._pending = []
+        self._wake()
+
+    def _wake(self) -> None:
+        """Wake consumers waiting for the next batch."""
+        if self._published is not None:
+            self._published.set()
+            self._published = None
+
+    def read(self, since: int) -> List[ChangeBatch]:
+        """
+        Get buffered batches after a cursor without waiting.
+
+        Args:
+            since: Cursor to read after
+
+        Returns:
+            Batches with cursor > since, oldest first
+
+        Raises:
+            ChangeStreamLagError: If batches after the cursor were already dropped
+        """
+        if since >= self._cursor:
+            return []
+        if since < self.oldest_cursor:
+            self._lag_errors += 1
+            raise ChangeStreamLagError(since, self.oldest_cursor)
+        return list(islice(self._batches, since - self.oldest_cursor, None))
+
+    def changes(self, tables: Optional[Iterable[str]] = None,
+                since: Optional[int] = None) -> AsyncIterator[ChangeBatch]:
+        """
+        Iterate over batches as they are published.
+
+        Args:
+            tables: Only yield changes to these tables (all tables if None);
+                batches without matching changes are skipped
+            since: Cursor to resume after (batches published after this call if None)
+
+        Returns:
+            Async iterator of ChangeBatch objects in cursor order; it raises
+            ChangeStreamLagError if the consumer falls more than ``capacity``
+            batches behind, and ends when the stream is closed
+        """
+        wanted = frozenset(tables) if tables is not None else None
+        return self._iterate(wanted, self._cursor if since is None else since)
+
+    async def _iterate(self, wanted: Optional[FrozenSet[str]], position: int) -> AsyncIterator[ChangeBatch]:
+        """Yield batches after a position, waiting for new ones."""
+        self._active_consumers += 1
+        try:
+            while True:
+                batches = self.read(position)
+                for batch in batches:
+                    position = batch.cursor
+                    if wanted is not None:
+                        batch = batch.for_tables(wanted)
+                        if not batch.changes:
+                            continue
+                    yield batch
+                if batches:
+                    continue
+                if self._closed:
+                    return
+                if self._published is None:
+                    self._published = asyncio.Event()
+                await self._published.wait()
+        finally:
+            self._active_consumers -= 1
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get change stream statistics."""
+        return {
+            'cursor': self._cursor,
+            'oldest_cursor': self.oldest_cursor,
+            'buffered_batches': len(self._batches),
+            'capacity': self.config.capacity,
+            'batches_published': self._batches_published,
+            'changes_published': self._changes_published,
+            'batches_dropped': self._batches_dropped,
+            'lag_errors': self._lag_errors,
+            'active_consumers': self._active_consumers
+        }
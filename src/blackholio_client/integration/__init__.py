@@ -6,11 +6,13 @@ SpacetimeDB servers across multiple languages (Rust, Python, C#, Go).
 """
 
 from .client_generator import SpacetimeDBClientGenerator
+from .generation_cache import GeneratedClientCache
 from .client_loader import ClientLoader
 from .server_manager import ServerManager
 
 __all__ = [
     'SpacetimeDBClientGenerator',
+    'GeneratedClientCache',
     'ClientLoader', 
     'ServerManager'
 ]
\ No newline at end of file
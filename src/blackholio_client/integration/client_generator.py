@@ -9,11 +9,12 @@ import os
 import subprocess
 import shutil
 import tempfile
+import threading
 import logging
 from pathlib import Path
 from typing import Dict, Optional, List, Any
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
 import asyncio
 
 def _validate_command_args(args: List[str]) -> None:
@@ -38,6 +39,7 @@ def _validate_command_args(args: List[str]) -> None:
 
 from ..config.environment import EnvironmentConfig, get_environment_config
 from ..exceptions.connection_errors import BlackholioConnectionError
+from .generation_cache import GeneratedClientCache, compute_cache_key
 
 
 logger = logging.getLogger(__name__)
@@ -63,6 +65,7 @@ class GenerationResult:
     error_message: Optional[str] = None
     stdout: Optional[str] = None
     stderr: Optional[str] = None
+    cache_hit: bool = False
 
 
 class SpacetimeDBClientGenerator:
@@ -88,16 +91,31 @@ class SpacetimeDBClientGenerator:
         'spacetimedb'  # System PATH
     ]
     
-    def __init__(self, config: Optional[EnvironmentConfig] = None):
+    def __init__(self,
+                 config: Optional[EnvironmentConfig] = None,
+                 cache_dir: Optional[str] = None,
+                 persistent_cache: bool = True):
         """
         Initialize the client generator.
         
         Args:
             config: Environment configuration (uses global if not provided)
+            cache_dir: Directory for the persistent generation cache
+                (uses BLACKHOLIO_GENERATION_CACHE_DIR or ~/.blackholio/cache/clients)
+            persistent_cache: Reuse generated clients across processes via the disk cache
         """
         self.config = config or get_environment_config()
         self.spacetimedb_cli_path = self._find_spacetimedb_cli()
         self._generated_clients_cache: Dict[str, str] = {}
+        self._disk_cache: Optional[GeneratedClientCache] = (
+            GeneratedClientCache(cache_dir) if persistent_cache else None
+        )
+        self._cli_version: Optional[str] = None
+        self._stats_lock = threading.Lock()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._generations = 0
+        self._failed_generations = 0
         
         logger.info(f"SpacetimeDB Client Generator initialized with server language: {self.config.server_language}")
     
@@ -176,37 +194,62 @@ class SpacetimeDBClientGenerator:
         language = server_language or self.config.server_language
         
         # Check cache if not forcing regeneration
-        if not force_regenerate and language in self._generated_clients_cache:
+        if not force_regenerate and language in self._generated_clients_cache and not output_dir:
             cached_dir = self._generated_clients_cache[language]
             if os.path.isdir(cached_dir):
                 logger.info(f"Using cached client for {language}: {cached_dir}")
+                self._count('_memory_hits')
                 return GenerationResult(
                     success=True,
                     output_dir=cached_dir,
-                    generated_files=self._list_generated_files(cached_dir)
+                    generated_files=self._list_generated_files(cached_dir),
+                    cache_hit=True
                 )
         
         # Create generation config
         server_path = self.get_server_path(language)
-        temp_output_dir = output_dir or tempfile.mkdtemp(prefix=f"spacetime_client_{language}_")
         
         gen_config = ClientGenerationConfig(
             server_language=language,
             server_path=server_path,
-            output_dir=temp_output_dir,
+            output_dir=output_dir or "",
             timeout=self.config.connection_timeout
         )
         
+        # Check the persistent cache
+        cache_key = self._get_cache_key(gen_config)
+        if cache_key and not force_regenerate:
+            cached_result = self._load_from_disk_cache(cache_key, language, output_dir)
+            if cached_result is not None:
+                return cached_result
+        
+        temp_output_dir = output_dir or tempfile.mkdtemp(prefix=f"spacetime_client_{language}_")
+        gen_config.output_dir = temp_output_dir
+        
         logger.info(f"Generating SpacetimeDB client for {language} server at {server_path}")
         
         try:
             result = self._execute_generation(gen_config)
             
             if result.success:
+                self._count('_generations')
+                
+                # Keep the output for other processes; serve temp output from the cache
+                if cache_key:
+                    cached_dir = self._disk_cache.store(cache_key, result.output_dir, {
+                        'server_language': language,
+                        'generated_lang': gen_config.generated_lang,
+                        'cli_version': self._cli_version
+                    })
+                    if cached_dir and not output_dir:
+                        self._cleanup_directory(temp_output_dir)
+                        result.output_dir = cached_dir
+                
                 # Cache successful generation
                 self._generated_clients_cache[language] = result.output_dir
                 logger.info(f"Successfully generated client for {language}")
             else:
+                self._count('_failed_generations')
                 logger.error(f"Failed to generate client for {language}: {result.error_message}")
                 
                 # Cleanup on error if requested
@@ -216,6 +259,7 @@ class SpacetimeDBClientGenerator:
             return result
             
         except Exception as e:
+            self._count('_failed_generations')
             logger.error(f"Unexpected error during client generation: {e}")
             
             # Cleanup on error
@@ -229,6 +273,89 @@ class SpacetimeDBClientGenerator:
                 error_message=str(e)
             )
     
+    def _count(self, counter: str):
+        """Increment a statistics counter (generation may run on several threads)."""
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+    
+    def get_cli_version(self) -> str:
+        """
+        Get the SpacetimeDB CLI version, queried once per generator.
+        
+        Returns:
+            Version string, or "unknown" if the CLI does not report one
+        """
+        if self._cli_version is None:
+            version = "unknown"
+            try:
+                result = subprocess.run([self.spacetimedb_cli_path, '--version'],
+                                        capture_output=True, text=True, timeout=10)
+                if result.returncode == 0 and result.stdout.strip():
+                    version = result.stdout.strip()
+            except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
+                logger.debug(f"Could not get SpacetimeDB CLI version: {e}")
+            self._cli_version = version
+        return self._cli_version
+    
+    def _get_cache_key(self, config: ClientGenerationConfig) -> Optional[str]:
+        """
+        Get the persistent cache key for a generation.
+        
+        Args:
+            config: Generation configuration
+            
+        Returns:
+            Cache key, or None if the persistent cache is disabled or unusable
+        """
+        if self._disk_cache is None:
+            return None
+        
+        cli_version = self.get_cli_version()
+        if cli_version == "unknown":
+            # Without a CLI version the cached output could be stale
+            return None
+        
+        try:
+            return compute_cache_key(config.server_path, cli_version, config.generated_lang)
+        except OSError as e:
+            logger.warning(f"Could not hash server sources at {config.server_path}: {e}")
+            return None
+    
+    def _load_from_disk_cache(self,
+                              cache_key: str,
+                              language: str,
+                              output_dir: Optional[str]) -> Optional[GenerationResult]:
+        """
+        Serve a generation from the persistent cache.
+        
+        Args:
+            cache_key: Cache key for the generation
+            language: Server language
+            output_dir: Requested output directory (files are copied there)
+            
+        Returns:
+            GenerationResult for a hit, or None on a miss
+        """
+        cached_dir = self._disk_cache.lookup(cache_key)
+        if cached_dir is None:
+            return None
+        
+        if output_dir:
+            shutil.copytree(cached_dir, output_dir, dirs_exist_ok=True)
+            result_dir = output_dir
+        else:
+            result_dir = cached_dir
+        
+        self._count('_disk_hits')
+        self._generated_clients_cache[language] = result_dir
+        logger.info(f"Using persistent cached client for {language}: {cached_dir}")
+        return GenerationResult(
+            success=True,
+            output_dir=result_dir,
+            generated_files=self._list_generated_files(result_dir),
+            cache_hit=True
+        )
+    
     def _execute_generation(self, config: ClientGenerationConfig) -> GenerationResult:
         """
         Execute the actual client generation process.
@@ -394,51 +521,93 @@ class SpacetimeDBClientGenerator:
     
     def generate_all_clients(self, 
                             output_base_dir: Optional[str] = None,
-                            force_regenerate: bool = False) -> Dict[str, GenerationResult]:
+                            force_regenerate: bool = False,
+                            max_workers: Optional[int] = None) -> Dict[str, GenerationResult]:
         """
-        Generate clients for all supported server languages.
+        Generate clients for all supported server languages in parallel.
         
         Args:
             output_base_dir: Base directory for outputs (uses temp dirs if not provided)
             force_regenerate: Force regeneration for all languages
+            max_workers: Maximum concurrent generations (one per language if None)
             
         Returns:
             Dictionary mapping language to GenerationResult
         """
-        results = {}
+        languages = list(self.DEFAULT_SERVER_PATHS.keys())
+        output_dirs = {
+            language: os.path.join(output_base_dir, f"client_{language}") if output_base_dir else None
+            for language in languages
+        }
         
-        for language in self.DEFAULT_SERVER_PATHS.keys():
-            try:
-                output_dir = None
-                if output_base_dir:
-                    output_dir = os.path.join(output_base_dir, f"client_{language}")
-                
-                result = self.generate_client(
+        # Generations are subprocess-bound, so threads run them concurrently
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers or len(languages)) as executor:
+            futures = {
+                executor.submit(
+                    self.generate_client,
                     server_language=language,
-                    output_dir=output_dir,
+                    output_dir=output_dirs[language],
                     force_regenerate=force_regenerate
-                )
-                results[language] = result
-                
-            except Exception as e:
-                logger.error(f"Failed to generate client for {language}: {e}")
-                results[language] = GenerationResult(
-                    success=False,
-                    output_dir=output_dir or "",
-                    generated_files=[],
-                    error_message=str(e)
-                )
+                ): language
+                for language in languages
+            }
+            
+            for future in as_completed(futures):
+                language = futures[future]
+                try:
+                    results[language] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to generate client for {language}: {e}")
+                    results[language] = GenerationResult(
+                        success=False,
+                        output_dir=output_dirs[language] or "",
+                        generated_files=[],
+                        error_message=str(e)
+                    )
         
-        return results
+        return {language: results[language] for language in languages}
     
-    def clear_cache(self):
-        """Clear the generated clients cache."""
+    def clear_cache(self, persistent: bool = False):
+        """
+        Clear the generated clients cache.
+        
+        Args:
+            persistent: Also remove the on-disk cache shared with other processes
+        """
+        cache_root = os.path.abspath(self._disk_cache.cache_dir) if self._disk_cache else None
         for language, cache_dir in self._generated_clients_cache.items():
+            # Persistent entries are shared; only remove them when asked to
+            if cache_root and os.path.commonpath([cache_root, os.path.abspath(cache_dir)]) == cache_root:
+                continue
             self._cleanup_directory(cache_dir)
         
         self._generated_clients_cache.clear()
+        
+        if persistent and self._disk_cache:
+            removed = self._disk_cache.clear()
+            logger.info(f"Removed {removed} persistent cached clients")
+        
         logger.info("Cleared generated clients cache")
     
+    def get_cache_statistics(self) -> Dict[str, Any]:
+        """
+        Get generation cache statistics.
+        
+        Returns:
+            Dictionary with in-memory and persistent cache hit/miss counts
+        """
+        with self._stats_lock:
+            stats = {
+                'memory_hits': self._memory_hits,
+                'disk_hits': self._disk_hits,
+                'generations': self._generations,
+                'failed_generations': self._failed_generations,
+                'cached_languages': list(self._generated_clients_cache.keys())
+            }
+        stats['persistent'] = self._disk_cache.get_statistics() if self._disk_cache else None
+        return stats
+    
     def get_cached_client(self, server_language: str) -> Optional[str]:
         """
         Get cached client directory for a server language.
@@ -0,0 +1,263 @@
+"""
+Generation Cache - Persistent Content-Addressed Cache for Generated Clients
+
+Stores generated SpacetimeDB client bindings on disk under a key derived
+from the server module sources, the SpacetimeDB CLI version and the
+generated language. Any process (or container sharing the cache
+directory) that generates from the same inputs reuses the stored output
+instead of running ``spacetime generate`` again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Union
+
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+# Bump when the key derivation or entry layout changes
+CACHE_FORMAT_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+
+# Build output and tooling directories that do not affect generated bindings
+IGNORED_SOURCE_DIRS = frozenset([
+    '.git', '.hg', '.svn', '.idea', '.vscode', '.spacetime',
+    'target', 'bin', 'obj', 'build', 'dist', 'node_modules',
+    '__pycache__', '.venv', 'venv', '.mypy_cache', '.pytest_cache'
+])
+
+
+def default_cache_dir() -> Path:
+    """Get the cache directory (``BLACKHOLIO_GENERATION_CACHE_DIR`` or ~/.blackholio/cache/clients)."""
+    configured = os.environ.get('BLACKHOLIO_GENERATION_CACHE_DIR')
+    if configured:
+        return Path(configured).expanduser()
+    return Path.home() / ".blackholio" / "cache" / "clients"
+
+
+def hash_source_tree(source_dir: PathLike, digest: Optional[Any] = None) -> str:
+    """
+    Hash the relative paths and contents of every source file in a directory.
+
+    Args:
+        source_dir: Server module directory
+        digest: hashlib object to update (a new sha256 if None)
+
+    Returns:
+        Hex digest
+    """
+    digest = digest or hashlib.sha256()
+    source_dir = Path(source_dir)
+
+    for root, dirs, files in os.walk(source_dir):
+        # Prune in place so os.walk skips build output; sort for a stable order
+        dirs[:] = sorted(d for d in dirs if d not in IGNORED_SOURCE_DIRS)
+        for name in sorted(files):
+            path = Path(root) / name
+            rel_path = path.relative_to(source_dir).as_posix()
+            digest.update(rel_path.encode('utf-8') + b'\0')
+            try:
+                with open(path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1 << 16), b''):
+                        digest.update(chunk)
+            except OSError as e:
+                logger.debug(f"Skipping unreadable source file {path}: {e}")
+            digest.update(b'\0')
+
+    return digest.hexdigest()
+
+
+def compute_cache_key(server_path: PathLike, cli_version: str, generated_lang: str) -> str:
+    """
+    Compute the cache key for a generation.
+
+    Args:
+        server_path: Server module directory
+        cli_version: Output of ``spacetimedb --version``
+        generated_lang: Language the bindings are generated in
+
+    Returns:
+        Hex sha256 key
+    """
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_FORMAT_VERSION}\0{cli_version.strip()}\0{generated_lang}\0".encode('utf-8'))
+    return hash_source_tree(server_path, digest)
+
+
+class GeneratedClientCache:
+    """
+    On-disk cache of generated client directories keyed by content hash.
+
+    Entries are immutable once stored: output is copied into a temporary
+    directory inside the cache and renamed into place, so concurrent
+    processes never see a partially written entry. If two processes store
+    the same key, the first rename wins and the other copy is discarded.
+    """
+
+    def __init__(self, cache_dir: Optional[PathLike] = None):
+        """
+        Initialize generation cache.
+
+        Args:
+            cache_dir: Cache root (uses default_cache_dir() if None)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._errors = 0
+
+    def entry_path(self, key: str) -> Path:
+        """Get the directory an entry is (or would be) stored in."""
+        return self.cache_dir / key
+
+    def lookup(self, key: str) -> Optional[str]:
+        """
+        Look up a cached generation.
+
+        Args:
+            key: Cache key from compute_cache_key()
+
+        Returns:
+            Directory holding the generated files, or None on a miss
+        """
+        entry = self.entry_path(key)
+        hit = (entry / MANIFEST_FILE).is_file()
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+        return self.files_dir(key) if hit else None
+
+    def store(self, key: str, source_dir: PathLike, metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Copy a generated client directory into the cache.
+
+        Args:
+            key: Cache key from compute_cache_key()
+            source_dir: Directory holding the generated files
+            metadata: Extra fields for the entry manifest
+
+        Returns:
+            Cached directory holding the files, or None if the entry could not be written
+        """
+        entry = self.entry_path(key)
+        if (entry / MANIFEST_FILE).is_file():
+            return self.files_dir(key)
+
+        staging = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            staging = Path(tempfile.mkdtemp(prefix=f".{key[:16]}.", dir=str(self.cache_dir)))
+            files_dir = staging / "files"
+            shutil.copytree(str(source_dir), str(files_dir))
+
+            manifest = dict(metadata or {})
+            manifest.update({
+                'key': key,
+                'format_version': CACHE_FORMAT_VERSION,
+                'created_at': time.time(),
+                'files': self._list_files(files_dir)
+            })
+            with open(staging / MANIFEST_FILE, 'w') as f:
+                json.dump(manifest, f, indent=2)
+
+            try:
+                os.rename(staging, entry)
+            except OSError:
+                # Another process stored the same key first
+                if not (entry / MANIFEST_FILE).is_file():
+                    raise
+                shutil.rmtree(staging, ignore_errors=True)
+            staging = None
+        except Exception as e:
+            with self._lock:
+                self._errors += 1
+            logger.warning(f"Failed to cache generated client {key[:12]}: {e}")
+            if staging is not None:
+                shutil.rmtree(staging, ignore_errors=True)
+            return None
+
+        with self._lock:
+            self._stores += 1
+        logger.debug(f"Cached generated client {key[:12]} at {entry}")
+        return self.files_dir(key)
+
+    def files_dir(self, key: str) -> str:
+        """Get the directory holding an entry's generated files."""
+        return str(self.entry_path(key) / "files")
+
+    def read_manifest(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read an entry's manifest, or None if the entry does not exist."""
+        try:
+            with open(self.entry_path(key) / MANIFEST_FILE, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _list_files(directory: Path) -> List[str]:
+        """List files under a directory, relative to it."""
+        return sorted(
+            path.relative_to(directory).as_posix()
+            for path in directory.rglob('*') if path.is_file()
+        )
+
+    def entries(self) -> List[str]:
+        """Get the keys of all complete entries."""
+        if not self.cache_dir.is_dir():
+            return []
+        return sorted(
+            path.name for path in self.cache_dir.iterdir()
+            if not path.name.startswith('.') and (path / MANIFEST_FILE).is_file()
+        )
+
+    def evict(self, key: str) -> bool:
+        """Remove one entry."""
+        entry = self.entry_path(key)
+        if not entry.is_dir():
+            return False
+        shutil.rmtree(entry, ignore_errors=True)
+        return True
+
+    def clear(self) -> int:
+        """
+        Remove every entry, including abandoned staging directories.
+
+        Returns:
+            Number of complete entries removed
+        """
+        removed = len(self.entries())
+        if self.cache_dir.is_dir():
+            for path in self.cache_dir.iterdir():
+                if path.is_dir():
+                    shutil.rmtree(path, ignore_errors=True)
+        return removed
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get generation cache statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'cache_dir': str(self.cache_dir),
+                'entries': len(self.entries()),
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'stores': self._stores,
+                'errors': self._errors
+            }
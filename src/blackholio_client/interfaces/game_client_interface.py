@@ -6,7 +6,7 @@ subscriptions, and game logic into a unified API that abstracts server language
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Mapping
 from .connection_interface import ConnectionInterface, ConnectionState
 from .auth_interface import AuthInterface
 from .subscription_interface import SubscriptionInterface, SubscriptionState
@@ -64,32 +64,32 @@ class GameClientInterface(ConnectionInterface, AuthInterface, SubscriptionInterf
         pass
 
     @abstractmethod
-    def get_all_entities(self) -> Dict[int, GameEntity]:
+    def get_all_entities(self) -> Mapping[str, GameEntity]:
         """
         Get all game entities.
         
         Returns:
-            Dictionary mapping entity IDs to entities
+            Read-only mapping of entity IDs to entities
         """
         pass
 
     @abstractmethod
-    def get_all_players(self) -> Dict[int, GamePlayer]:
+    def get_all_players(self) -> Mapping[str, GamePlayer]:
         """
         Get all players in the game.
         
         Returns:
-            Dictionary mapping player IDs to players
+            Read-only mapping of player IDs to players
         """
         pass
 
     @abstractmethod
-    def get_all_circles(self) -> Dict[int, GameCircle]:
+    def get_all_circles(self) -> Mapping[str, GameCircle]:
         """
         Get all circles in the game.
         
         Returns:
-            Dictionary mapping circle IDs to circles
+            Read-only mapping of circle IDs to circles
         """
         pass
 
@@ -33,9 +33,33 @@ from .physics import (
     find_nearest_entity,
     interpolate_position
 )
+from .interpolation import (
+    InterpolationBuffer,
+    InterpolationConfig
+)
+from .prediction import (
+    InputRecord,
+    LocalPlayerPredictor,
+    PredictionConfig
+)
+from .snapshots import (
+    MapSnapshot,
+    SecondaryIndex,
+    SnapshotDiff,
+    VersionedMap
+)
+from .training_export import (
+    ExportConfig,
+    FeatureExtractor,
+    TrainingDataExporter,
+    WorldArrays,
+    load_npy_shards
+)
 from .game_statistics import (
     PlayerStatistics,
     SessionStatistics,
+    LeaderboardIndex,
+    RollingWindowCounter,
     create_player_statistics,
     create_session_statistics
 )
@@ -116,9 +140,33 @@ __all__ = [
     "find_nearest_entity",
     "interpolate_position",
     
+    # Entity interpolation
+    "InterpolationBuffer",
+    "InterpolationConfig",
+    
+    # Client-side prediction
+    "InputRecord",
+    "LocalPlayerPredictor",
+    "PredictionConfig",
+    
+    # Versioned cache snapshots
+    "MapSnapshot",
+    "SecondaryIndex",
+    "SnapshotDiff",
+    "VersionedMap",
+    
+    # Training data export
+    "ExportConfig",
+    "FeatureExtractor",
+    "TrainingDataExporter",
+    "WorldArrays",
+    "load_npy_shards",
+    
     # Statistics tracking
     "PlayerStatistics",
     "SessionStatistics",
+    "LeaderboardIndex",
+    "RollingWindowCounter",
     "create_player_statistics",
     "create_session_statistics",
     
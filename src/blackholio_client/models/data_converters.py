@@ -420,6 +420,7 @@ class CircleConverter(DataConverter):
             value = int(data.get('value', data.get('points', 1)))
             respawn_time = data.get('respawn_time')
             is_active = bool(data.get('is_active', data.get('active', True)))
+            player_id = data.get('player_id')
             
             # Extract timestamps
             created_at = data.get('created_at')
@@ -428,6 +429,7 @@ class CircleConverter(DataConverter):
             return GameCircle(
                 entity_id=entity_id,
                 circle_id=circle_id or entity_id,
+                player_id=str(player_id) if player_id is not None else None,
                 position=position,
                 velocity=velocity,
                 mass=mass,
@@ -504,6 +504,7 @@ class GameCircle(GameEntity):
     Consolidates circle representations from both projects.
     """
     circle_id: str = ""
+    player_id: Optional[str] = None  # Owning player for player circles
     color: Optional[str] = None
     circle_type: str = "food"
     value: int = 1
@@ -549,6 +550,7 @@ class GameCircle(GameEntity):
         data = super().to_dict()
         data.update({
             'circle_id': self.circle_id,
+            'player_id': self.player_id,
             'color': self.color,
             'circle_type': self.circle_type,
             'value': self.value,
@@ -562,6 +564,7 @@ class GameCircle(GameEntity):
         return cls(
             entity_id=str(data.get('entity_id', data.get('circle_id', ''))),
             circle_id=str(data.get('circle_id', data.get('entity_id', ''))),
+            player_id=str(data['player_id']) if data.get('player_id') is not None else None,
             position=Vector2.from_dict(data.get('position', {})),
             velocity=Vector2.from_dict(data.get('velocity', {})),
             mass=float(data.get('mass', 1.0)),
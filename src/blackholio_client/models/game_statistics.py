@@ -5,12 +5,134 @@ Consolidates game statistics and metrics tracking from blackholio-agent
 and client-pygame into reusable classes for consistent performance monitoring.
 """
 
+import bisect
+import itertools
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from .game_entities import GamePlayer, GameEntity, GameCircle
 
 
+class RollingWindowCounter:
+    """
+    Sum of values over a sliding time window.
+    
+    Values are accumulated into a fixed ring of time buckets, so memory is
+    constant no matter how many values are added and expired buckets are
+    dropped as the window moves.
+    """
+    
+    def __init__(self, window_seconds: float = 60.0, bucket_count: int = 12):
+        """
+        Initialize rolling window counter.
+        
+        Args:
+            window_seconds: Length of the window
+            bucket_count: Number of buckets the window is split into
+        """
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be > 0")
+        if bucket_count < 1:
+            raise ValueError("bucket_count must be >= 1")
+        
+        self.window_seconds = window_seconds
+        self._bucket_width = window_seconds / bucket_count
+        self._buckets = [0.0] * bucket_count
+        self._current_bucket: Optional[int] = None
+    
+    def _advance(self, now: float) -> int:
+        """Move the window forward to now, clearing expired buckets."""
+        bucket = int(now // self._bucket_width)
+        if self._current_bucket is None:
+            self._current_bucket = bucket
+        elif bucket > self._current_bucket:
+            expired = min(bucket - self._current_bucket, len(self._buckets))
+            for offset in range(1, expired + 1):
+                self._buckets[(self._current_bucket + offset) % len(self._buckets)] = 0.0
+            self._current_bucket = bucket
+        return bucket
+    
+    def add(self, value: float, now: Optional[float] = None):
+        """
+        Add a value at the given time.
+        
+        Args:
+            value: Value to add
+            now: Current time (uses time.time() if None)
+        """
+        bucket = self._advance(time.time() if now is None else now)
+        if bucket > self._current_bucket - len(self._buckets):
+            self._buckets[bucket % len(self._buckets)] += value
+    
+    def total(self, now: Optional[float] = None) -> float:
+        """Get the sum of values inside the window."""
+        self._advance(time.time() if now is None else now)
+        return sum(self._buckets)
+    
+    def per_minute(self, now: Optional[float] = None) -> float:
+        """Get the windowed sum expressed as a per-minute rate."""
+        return self.total(now) * 60.0 / self.window_seconds
+
+
+class LeaderboardIndex:
+    """
+    Ordered index of players for one metric.
+    
+    Keeps (negated value, join order, player id) keys in a sorted list so
+    updates are a binary search plus a small memmove and top-k reads are a
+    slice. Ties keep the order players joined in.
+    """
+    
+    def __init__(self, metric: str):
+        """
+        Initialize leaderboard index.
+        
+        Args:
+            metric: PlayerStatistics attribute this index orders by
+        """
+        self.metric = metric
+        self._keys: List[Tuple[float, int, str]] = []
+        self._key_by_player: Dict[str, Tuple[float, int, str]] = {}
+    
+    def update(self, player_id: str, value: float, order: int):
+        """
+        Insert or move a player.
+        
+        Args:
+            player_id: Player identifier
+            value: Current metric value
+            order: Join order used to break ties
+        """
+        key = (-value, order, player_id)
+        old_key = self._key_by_player.get(player_id)
+        if old_key == key:
+            return
+        if old_key is not None:
+            del self._keys[bisect.bisect_left(self._keys, old_key)]
+        bisect.insort(self._keys, key)
+        self._key_by_player[player_id] = key
+    
+    def remove(self, player_id: str):
+        """Remove a player from the index."""
+        old_key = self._key_by_player.pop(player_id, None)
+        if old_key is not None:
+            del self._keys[bisect.bisect_left(self._keys, old_key)]
+    
+    def top(self, limit: int) -> List[str]:
+        """Get the ids of the top players, best first."""
+        return [key[2] for key in self._keys[:limit]]
+    
+    def rank(self, player_id: str) -> Optional[int]:
+        """Get a player's 1-based rank, or None if not indexed."""
+        key = self._key_by_player.get(player_id)
+        if key is None:
+            return None
+        return bisect.bisect_left(self._keys, key) + 1
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
 @dataclass
 class PlayerStatistics:
     """
@@ -65,6 +187,10 @@ class PlayerStatistics:
     wins: int = 0
     losses: int = 0
     
+    # Rolling-window growth (last minute)
+    mass_window: RollingWindowCounter = field(default_factory=RollingWindowCounter, repr=False, compare=False)
+    score_window: RollingWindowCounter = field(default_factory=RollingWindowCounter, repr=False, compare=False)
+    
     def update_mass(self, new_mass: float):
         """
         Update mass tracking statistics.
@@ -74,6 +200,7 @@ class PlayerStatistics:
         """
         if new_mass > self.current_mass:
             self.total_mass_gained += (new_mass - self.current_mass)
+            self.mass_window.add(new_mass - self.current_mass)
         elif new_mass < self.current_mass:
             self.total_mass_lost += (self.current_mass - new_mass)
         
@@ -87,6 +214,8 @@ class PlayerStatistics:
         Args:
             new_score: New score value
         """
+        if new_score > self.current_score:
+            self.score_window.add(new_score - self.current_score)
         self.current_score = new_score
         self.max_score_achieved = max(self.max_score_achieved, new_score)
     
@@ -220,7 +349,9 @@ class PlayerStatistics:
             'efficiency_score': self.calculate_efficiency_score(),
             'games_played': self.games_played,
             'wins': self.wins,
-            'losses': self.losses
+            'losses': self.losses,
+            'mass_per_minute': self.mass_window.per_minute(),
+            'score_per_minute': self.score_window.per_minute()
         }
 
 
@@ -257,6 +388,32 @@ class SessionStatistics:
     total_messages_received: int = 0
     average_latency: float = 0.0
     
+    # Incrementally maintained leaderboards for metrics that only change on updates
+    indexed_metrics: Tuple[str, ...] = (
+        'current_mass', 'max_mass_achieved', 'total_mass_gained',
+        'current_score', 'max_score_achieved', 'food_consumed', 'players_consumed'
+    )
+    _leaderboards: Dict[str, LeaderboardIndex] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _join_order: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _join_counter: Any = field(default_factory=itertools.count, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Create leaderboard indexes and index any pre-populated players."""
+        self._leaderboards = {metric: LeaderboardIndex(metric) for metric in self.indexed_metrics}
+        for player_id in self.player_statistics:
+            self._reindex_player(player_id)
+    
+    def _reindex_player(self, player_id: str):
+        """Refresh a player's position in every leaderboard index."""
+        stats = self.player_statistics.get(player_id)
+        if stats is None:
+            return
+        if player_id not in self._join_order:
+            self._join_order[player_id] = next(self._join_counter)
+        order = self._join_order[player_id]
+        for metric, index in self._leaderboards.items():
+            index.update(player_id, getattr(stats, metric), order)
+    
     def add_player(self, player_id: str, initial_mass: float = 1.0, initial_score: int = 0):
         """
         Add a new player to session tracking.
@@ -275,6 +432,7 @@ class SessionStatistics:
                 current_score=initial_score
             )
             self.total_players += 1
+            self._reindex_player(player_id)
         
         self.active_players += 1
         self.max_concurrent_players = max(self.max_concurrent_players, self.active_players)
@@ -305,6 +463,7 @@ class SessionStatistics:
         
         # Update alive status
         stats.is_alive = player.is_alive()
+        self._reindex_player(player.player_id)
     
     def record_food_spawn(self, count: int = 1):
         """
@@ -330,6 +489,7 @@ class SessionStatistics:
         
         if player_id in self.player_statistics:
             self.player_statistics[player_id].record_food_consumption(food_mass, food_value)
+            self._reindex_player(player_id)
     
     def record_player_consumption(self, consumer_id: str, consumed_id: str, consumed_mass: float):
         """
@@ -342,6 +502,7 @@ class SessionStatistics:
         """
         if consumer_id in self.player_statistics:
             self.player_statistics[consumer_id].record_player_consumption(consumed_mass)
+            self._reindex_player(consumer_id)
         
         if consumed_id in self.player_statistics:
             self.player_statistics[consumed_id].times_consumed += 1
@@ -404,7 +565,12 @@ class SessionStatistics:
         if not self.player_statistics:
             return []
         
-        # Get all players and their statistics
+        # Indexed metrics are read straight off the ordered index
+        index = self._leaderboards.get(metric)
+        if index is not None:
+            return [self.player_statistics[player_id].to_dict() for player_id in index.top(limit)]
+        
+        # Time-dependent metrics (e.g. survival_time) need a full sort
         players_data = []
         for player_id, stats in self.player_statistics.items():
             player_data = stats.to_dict()
@@ -416,6 +582,27 @@ class SessionStatistics:
         
         return players_data[:limit]
     
+    def get_player_rank(self, player_id: str, metric: str = 'max_mass_achieved') -> Optional[int]:
+        """
+        Get a player's 1-based rank for an indexed metric.
+        
+        Args:
+            player_id: Player identifier
+            metric: Indexed metric to rank by
+            
+        Returns:
+            Rank, or None if the player or metric is not indexed
+        """
+        index = self._leaderboards.get(metric)
+        return index.rank(player_id) if index is not None else None
+    
+    def get_session_rates(self) -> Dict[str, float]:
+        """Get session-wide mass and score gained per minute over the rolling window."""
+        return {
+            'mass_per_minute': sum(s.mass_window.per_minute() for s in self.player_statistics.values()),
+            'score_per_minute': sum(s.score_window.per_minute() for s in self.player_statistics.values())
+        }
+    
     def end_session(self):
         """Mark session as ended."""
         self.end_time = time.time()
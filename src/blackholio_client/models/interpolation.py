@@ -0,0 +1,323 @@
+"""
+Entity Interpolation - Smooth Positions Between Server Updates
+
+Server updates move entities at tick rate, while renderers and agents
+sample positions many times per tick. InterpolationBuffer keeps a short
+history of timestamped positions per entity and answers "where is every
+entity at render time t" in one vectorised call: it interpolates between
+the two snapshots around ``t - delay`` and extrapolates past the newest
+snapshot for at most ``max_extrapolation`` seconds.
+
+History is stored as structure-of-arrays (one row per entity slot, newest
+snapshot last), so sampling is a handful of numpy operations regardless of
+the number of entities. numpy is imported when the first buffer is created.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Tuple, Iterable, Callable
+
+from .game_entities import Vector2
+from .physics import interpolate_position
+
+
+logger = logging.getLogger(__name__)
+
+
+def _numpy():
+    """Import numpy, which entity interpolation needs."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Entity interpolation needs the 'numpy' package (pip install numpy)") from None
+    return numpy
+
+
+@dataclass
+class InterpolationConfig:
+    """Entity interpolation configuration."""
+    delay: float = 0.1  # Render this far behind the newest snapshots (~2-3 server ticks)
+    max_extrapolation: float = 0.25  # Seconds to extrapolate past the newest snapshot
+    history_size: int = 4  # Snapshots kept per entity
+    initial_capacity: int = 256  # Entity slots allocated up front (grows by doubling)
+
+    def validate(self) -> None:
+        """Validate configuration parameters."""
+        if self.delay < 0:
+            raise ValueError("delay must be >= 0")
+        if self.max_extrapolation < 0:
+            raise ValueError("max_extrapolation must be >= 0")
+        if self.history_size < 2:
+            raise ValueError("history_size must be >= 2")
+        if self.initial_capacity < 1:
+            raise ValueError("initial_capacity must be >= 1")
+
+
+class InterpolationBuffer:
+    """
+    Timestamped position history for many entities.
+
+    Snapshots are pushed as server updates arrive (``push``/``push_many``),
+    and ``sample`` returns every tracked entity's position at a render time.
+    Timestamps are seconds on ``clock`` (time.monotonic by default).
+    """
+
+    def __init__(self, config: Optional[InterpolationConfig] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize interpolation buffer.
+
+        Args:
+            config: Interpolation configuration (uses defaults if None)
+            clock: Time source for snapshot and render timestamps
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        self.config = config or InterpolationConfig()
+        self.config.validate()
+        self._np = _numpy()
+        self._clock = clock
+
+        self._slots: Dict[str, int] = {}
+        self._ids: List[Optional[str]] = []
+        self._free: List[int] = []
+        self._allocate(self.config.initial_capacity)
+
+        # Statistics
+        self._snapshots = 0
+        self._stale_snapshots = 0
+        self._samples = 0
+
+    def _allocate(self, capacity: int) -> None:
+        """Grow the history arrays to a number of entity slots."""
+        np = self._np
+        history = self.config.history_size
+        old = len(self._ids)
+
+        times = np.full((capacity, history), -np.inf)
+        xs = np.zeros((capacity, history))
+        ys = np.zeros((capacity, history))
+        counts = np.zeros(capacity, dtype=np.int64)
+        if old:
+            times[:old] = self._times
+            xs[:old] = self._xs
+            ys[:old] = self._ys
+            counts[:old] = self._counts
+
+        self._times, self._xs, self._ys, self._counts = times, xs, ys, counts
+        self._ids.extend([None] * (capacity - old))
+        self._free.extend(range(capacity - 1, old - 1, -1))
+
+    def _slot(self, entity_id: str) -> int:
+        """Get an entity's slot, assigning a free one if needed."""
+        slot = self._slots.get(entity_id)
+        if slot is None:
+            if not self._free:
+                self._allocate(len(self._ids) * 2)
+            slot = self._free.pop()
+            self._slots[entity_id] = slot
+            self._ids[slot] = entity_id
+        return slot
+
+    def push(self, entity_id: str, position: Vector2, timestamp: Optional[float] = None) -> None:
+        """
+        Record an entity's position.
+
+        Args:
+            entity_id: Entity ID
+            position: Position reported by the server
+            timestamp: Snapshot time (now if None); older than the newest snapshot is ignored
+        """
+        timestamp = self._clock() if timestamp is None else timestamp
+        slot = self._slot(entity_id)
+        times = self._times[slot]
+        if timestamp < times[-1]:
+            self._stale_snapshots += 1
+            return
+
+        if timestamp == times[-1]:
+            # Several updates in one transaction: keep the latest position
+            self._xs[slot, -1] = position.x
+            self._ys[slot, -1] = position.y
+        else:
+            times[:-1] = times[1:]
+            self._xs[slot, :-1] = self._xs[slot, 1:]
+            self._ys[slot, :-1] = self._ys[slot, 1:]
+            times[-1] = timestamp
+            self._xs[slot, -1] = position.x
+            self._ys[slot, -1] = position.y
+            self._counts[slot] = min(self._counts[slot] + 1, self.config.history_size)
+        self._snapshots += 1
+
+    def push_many(self, entity_ids: Iterable[str], xs: Iterable[float], ys: Iterable[float],
+                  timestamp: Optional[float] = None) -> None:
+        """
+        Record positions of many entities observed at the same time.
+
+        Args:
+            entity_ids: Entity IDs
+            xs: X coordinates, aligned with entity_ids
+            ys: Y coordinates, aligned with entity_ids
+            timestamp: Snapshot time (now if None)
+        """
+        np = self._np
+        timestamp = self._clock() if timestamp is None else timestamp
+        slots = np.fromiter((self._slot(entity_id) for entity_id in entity_ids), dtype=np.int64)
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+
+        newest = self._times[slots, -1]
+        fresh = newest < timestamp
+        same = newest == timestamp
+        self._stale_snapshots += int(len(slots) - fresh.sum() - same.sum())
+
+        shift = slots[fresh]
+        if len(shift):
+            self._times[shift, :-1] = self._times[shift, 1:]
+            self._xs[shift, :-1] = self._xs[shift, 1:]
+            self._ys[shift, :-1] = self._ys[shift, 1:]
+            self._counts[shift] = np.minimum(self._counts[shift] + 1, self.config.history_size)
+
+        write = fresh | same
+        rows = slots[write]
+        self._times[rows, -1] = timestamp
+        self._xs[rows, -1] = xs[write]
+        self._ys[rows, -1] = ys[write]
+        self._snapshots += int(write.sum())
+
+    def remove(self, entity_id: str) -> bool:
+        """
+        Stop tracking an entity.
+
+        Returns:
+            True if the entity was tracked
+        """
+        slot = self._slots.pop(entity_id, None)
+        if slot is None:
+            return False
+        self._times[slot] = -self._np.inf
+        self._counts[slot] = 0
+        self._ids[slot] = None
+        self._free.append(slot)
+        return True
+
+    def clear(self) -> None:
+        """Stop tracking all entities."""
+        for entity_id in list(self._slots):
+            self.remove(entity_id)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._slots
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def sample(self, render_time: Optional[float] = None,
+               entity_ids: Optional[Iterable[str]] = None) -> Tuple[List[str], Any]:
+        """
+        Get positions of tracked entities at a render time.
+
+        Args:
+            render_time: Render time on the buffer's clock (now if None); positions
+                are taken at ``render_time - delay``
+            entity_ids: Entities to sample (all tracked entities if None; unknown IDs are skipped)
+
+        Returns:
+            (entity IDs, float array of shape (n, 2) with their x, y positions)
+        """
+        np = self._np
+        if entity_ids is None:
+            ids = list(self._slots)
+            slots = np.fromiter(self._slots.values(), dtype=np.int64, count=len(ids))
+        else:
+            ids = [entity_id for entity_id in entity_ids if entity_id in self._slots]
+            slots = np.fromiter((self._slots[entity_id] for entity_id in ids), dtype=np.int64, count=len(ids))
+
+        render_time = self._clock() if render_time is None else render_time
+        self._samples += 1
+        return ids, self._positions(slots, render_time - self.config.delay)
+
+    def _positions(self, slots: Any, target: float) -> Any:
+        """Interpolate/extrapolate the given slots at a target time."""
+        np = self._np
+        history = self.config.history_size
+        rows = np.arange(len(slots))
+        times = self._times[slots]
+        xs = self._xs[slots]
+        ys = self._ys[slots]
+        counts = self._counts[slots]
+        oldest = history - counts
+
+        # Clamp to the recorded window, plus the extrapolation allowance
+        target = np.clip(target, times[rows, oldest], times[:, -1] + self.config.max_extrapolation)
+
+        # Segment around the target; past the newest snapshot, continue the last segment
+        before = (times <= target[:, None]).sum(axis=1) - 1
+        start = np.where(counts > 1, np.minimum(before, history - 2), history - 1)
+        end = np.minimum(start + 1, history - 1)
+
+        t0 = times[rows, start]
+        span = times[rows, end] - t0
+        t = np.divide(target - t0, span, out=np.zeros(len(slots)), where=span > 0)
+
+        positions = np.empty((len(slots), 2))
+        positions[:, 0] = xs[rows, start] + (xs[rows, end] - xs[rows, start]) * t
+        positions[:, 1] = ys[rows, start] + (ys[rows, end] - ys[rows, start]) * t
+        return positions
+
+    def positions_at(self, render_time: Optional[float] = None,
+                     entity_ids: Optional[Iterable[str]] = None) -> Dict[str, Vector2]:
+        """
+        Get positions at a render time as Vector2s keyed by entity ID.
+
+        Convenience over ``sample`` for callers that want model objects;
+        renderers drawing many entities should use ``sample`` directly.
+        """
+        ids, positions = self.sample(render_time, entity_ids)
+        return {entity_id: Vector2(x, y) for entity_id, (x, y) in zip(ids, positions.tolist())}
+
+    def get_position(self, entity_id: str, render_time: Optional[float] = None) -> Optional[Vector2]:
+        """
+        Get one entity's position at a render time.
+
+        Args:
+            entity_id: Entity ID
+            render_time: Render time on the buffer's clock (now if None)
+
+        Returns:
+            Interpolated position, or None if the entity is not tracked
+        """
+        slot = self._slots.get(entity_id)
+        if slot is None:
+            return None
+
+        render_time = self._clock() if render_time is None else render_time
+        target = render_time - self.config.delay
+        count = int(self._counts[slot])
+        times = self._times[slot, -count:].tolist()
+        points = [Vector2(x, y) for x, y in zip(self._xs[slot, -count:].tolist(), self._ys[slot, -count:].tolist())]
+
+        if count == 1 or target <= times[0]:
+            return points[0]
+        for i in range(1, count):
+            if target <= times[i]:
+                return interpolate_position(points[i - 1], points[i], (target - times[i - 1]) / (times[i] - times[i - 1]))
+
+        # Past the newest snapshot: continue the last segment, capped
+        target = min(target, times[-1] + self.config.max_extrapolation)
+        direction = points[-1] - points[-2]
+        return points[-1] + direction * ((target - times[-1]) / (times[-1] - times[-2]))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get interpolation statistics."""
+        return {
+            'entities': len(self._slots),
+            'capacity': len(self._ids),
+            'snapshots': self._snapshots,
+            'stale_snapshots': self._stale_snapshots,
+            'samples': self._samples,
+            'delay': self.config.delay,
+            'max_extrapolation': self.config.max_extrapolation
+        }
@@ -0,0 +1,326 @@
+"""
+Client-Side Prediction - Immediate Local Movement with Server Reconciliation
+
+Applies the local player's inputs to a simulated GamePlayer as soon as they
+are made (GamePlayer.update_movement), keeps them in a bounded history, and
+when authoritative state arrives, restarts from the server's position and
+replays the inputs the server cannot have seen yet. Small corrections are
+blended out over the following inputs instead of snapping.
+
+Each input is simulated for as long as its own direction was held: the
+latest input stays open and keeps moving the prediction until the next one
+arrives, which closes it with its final duration.
+
+The server does not echo input sequence numbers, so an input counts as
+acknowledged once it has been sent and a round trip has elapsed. Callers
+that learn about acknowledgements another way can report them through
+``acknowledge()``.
+"""
+
+import copy
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Callable, Deque, Tuple
+
+from .game_entities import GamePlayer, Vector2
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PredictionConfig:
+    """Client-side prediction configuration."""
+    history_size: int = 256  # Unacknowledged inputs kept for replay
+    max_speed: float = 100.0  # Movement physics, as in GamePlayer
+    acceleration: float = 200.0
+    max_delta_time: float = 0.25  # Longest single physics step; longer holds are simulated in steps
+    round_trip_time: float = 0.1  # Input-to-state latency estimate, refined by acknowledge()
+    smoothing: float = 0.2  # Fraction of the remaining correction removed per input
+    snap_distance: float = 50.0  # Corrections larger than this snap instead of blending
+
+    def validate(self) -> None:
+        """Validate configuration parameters."""
+        if self.history_size < 1:
+            raise ValueError("history_size must be >= 1")
+        if self.max_speed <= 0:
+            raise ValueError("max_speed must be > 0")
+        if self.max_delta_time <= 0:
+            raise ValueError("max_delta_time must be > 0")
+        if self.round_trip_time < 0:
+            raise ValueError("round_trip_time must be >= 0")
+        if not 0 < self.smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        if self.snap_distance < 0:
+            raise ValueError("snap_distance must be >= 0")
+
+
+@dataclass
+class InputRecord:
+    """One local input, as applied to the prediction."""
+    sequence: int
+    direction: Vector2
+    delta_time: float  # How long this direction was held (so far, for the open input)
+    applied_at: float
+    velocity: Vector2  # Predicted velocity after the input, used to seed replays
+
+
+class LocalPlayerPredictor:
+    """
+    Prediction and reconciliation for the local player.
+
+    ``apply_input`` moves the prediction immediately, ``mark_sent`` notes
+    which inputs have gone to the server, and ``reconcile`` rebases the
+    prediction on authoritative state.
+    """
+
+    def __init__(self, config: Optional[PredictionConfig] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize predictor.
+
+        Args:
+            config: Prediction configuration (uses defaults if None)
+            clock: Time source for input and send timestamps
+        """
+        self.config = config or PredictionConfig()
+        self.config.validate()
+        self._clock = clock
+
+        self._player = self._new_player()
+        self._history: Deque[InputRecord] = deque(maxlen=self.config.history_size)
+        self._sent: Deque[Tuple[int, float]] = deque()
+        self._sequence = 0
+        self._acknowledged = 0
+        self._held_since: Optional[float] = None  # Start of the open input, if the latest one is still held
+        self._base_velocity = Vector2.zero()  # Velocity after the last acknowledged input
+        self._correction = Vector2.zero()
+        self._has_state = False
+        self.round_trip_time = self.config.round_trip_time
+
+        # Statistics
+        self._inputs = 0
+        self._dropped_inputs = 0
+        self._reconciliations = 0
+        self._replayed_inputs = 0
+        self._snaps = 0
+        self._total_error = 0.0
+        self._max_error = 0.0
+
+    def _new_player(self) -> GamePlayer:
+        """Create the simulated player."""
+        return GamePlayer(entity_id="predicted", max_speed=self.config.max_speed,
+                          acceleration=self.config.acceleration)
+
+    def _hold(self, player: GamePlayer, direction: Vector2, seconds: float) -> None:
+        """Simulate holding a direction, in steps of at most max_delta_time."""
+        player.update_input(direction)
+        while seconds > 0:
+            step = min(seconds, self.config.max_delta_time)
+            player.update_movement(step)
+            seconds -= step
+
+    def _current(self) -> GamePlayer:
+        """Simulated player as of now, including the time the open input has been held."""
+        if self._held_since is None:
+            return self._player
+        player = copy.copy(self._player)
+        self._hold(player, self._history[-1].direction, self._clock() - self._held_since)
+        return player
+
+    def _close_held_input(self, now: float) -> None:
+        """Close the open input with the time its direction was held."""
+        if self._held_since is None:
+            return
+        record = self._history[-1]
+        record.delta_time = max(0.0, now - self._held_since)
+        self._hold(self._player, record.direction, record.delta_time)
+        record.velocity = self._player.velocity
+        self._held_since = None
+
+    @property
+    def has_state(self) -> bool:
+        """Whether authoritative state has been received."""
+        return self._has_state
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the latest input."""
+        return self._sequence
+
+    @property
+    def pending_inputs(self) -> int:
+        """Number of inputs not yet acknowledged."""
+        return len(self._history)
+
+    @property
+    def predicted_position(self) -> Vector2:
+        """Predicted position now, without correction smoothing."""
+        return self._current().position
+
+    @property
+    def position(self) -> Vector2:
+        """Position to display now: the prediction plus the correction still being blended out."""
+        return self._current().position + self._correction
+
+    @property
+    def velocity(self) -> Vector2:
+        """Predicted velocity now."""
+        return self._current().velocity
+
+    def apply_input(self, direction: Vector2, delta_time: Optional[float] = None) -> int:
+        """
+        Apply a local input to the prediction immediately.
+
+        The previous input, if still held, is first closed with the time its
+        own direction was held.
+
+        Args:
+            direction: Input direction (normalized by GamePlayer)
+            delta_time: Time the input is held for (held until the next input,
+                by the clock, if None)
+
+        Returns:
+            The input's sequence number
+        """
+        now = self._clock()
+        self._close_held_input(now)
+
+        if len(self._history) == self._history.maxlen:
+            # The oldest input falls out of the replay window
+            self._base_velocity = self._history[0].velocity
+            self._dropped_inputs += 1
+        self._sequence += 1
+        if delta_time is None:
+            self._player.update_input(direction)
+            self._held_since = now
+            delta_time = 0.0
+        else:
+            delta_time = max(0.0, delta_time)
+            self._hold(self._player, direction, delta_time)
+        self._history.append(InputRecord(self._sequence, direction, delta_time, now, self._player.velocity))
+        self._inputs += 1
+
+        self._correction = self._correction * (1.0 - self.config.smoothing)
+        if self._correction.magnitude < 0.01:
+            self._correction = Vector2.zero()
+        return self._sequence
+
+    def mark_sent(self) -> None:
+        """Note that every input applied so far has been sent to the server."""
+        if self._sequence and (not self._sent or self._sent[-1][0] < self._sequence):
+            self._sent.append((self._sequence, self._clock()))
+
+    def acknowledge(self, sequence: Optional[int] = None) -> None:
+        """
+        Report that the server has processed inputs up to a sequence number.
+
+        Args:
+            sequence: Last processed input (the oldest outstanding send if None)
+        """
+        now = self._clock()
+        if sequence is None:
+            if not self._sent:
+                return
+            sequence, sent_at = self._sent.popleft()
+            self.round_trip_time += (now - sent_at - self.round_trip_time) * 0.125
+        self._acknowledged = max(self._acknowledged, sequence)
+
+    def _acknowledged_sequence(self) -> int:
+        """Inputs sent at least one round trip ago are reflected in server state."""
+        cutoff = self._clock() - self.round_trip_time
+        while self._sent and self._sent[0][1] <= cutoff:
+            self._acknowledged = max(self._acknowledged, self._sent.popleft()[0])
+        return self._acknowledged
+
+    def reconcile(self, position: Vector2, velocity: Optional[Vector2] = None) -> float:
+        """
+        Rebase the prediction on authoritative server state.
+
+        Inputs the server has seen are dropped; the rest are replayed on top
+        of the server's position, each for the time it was held. An input
+        that is still held carries on from the server's state. The
+        difference to the previous prediction is blended out over the next
+        inputs, or snapped if it is large.
+
+        Args:
+            position: Authoritative position
+            velocity: Authoritative velocity (the predicted velocity after the
+                last acknowledged input if None)
+
+        Returns:
+            Correction distance between the old and new prediction
+        """
+        now = self._clock()
+        previous_player = self._current()
+        previous = previous_player.position + self._correction
+
+        acknowledged = self._acknowledged_sequence()
+        while self._history and self._history[0].sequence <= acknowledged:
+            record = self._history.popleft()
+            if self._held_since is not None and not self._history:
+                # The server has the held input: keep holding it from its state
+                record.velocity = previous_player.velocity
+                record.delta_time = 0.0
+                self._held_since = now
+                self._history.append(record)
+                self._base_velocity = record.velocity
+                break
+            self._base_velocity = record.velocity
+        if velocity is not None:
+            self._base_velocity = velocity
+
+        player = self._new_player()
+        player.position = position
+        player.velocity = self._base_velocity
+        replayed = list(self._history)
+        if self._held_since is not None:
+            replayed.pop()
+        for record in replayed:
+            self._hold(player, record.direction, record.delta_time)
+        if self._held_since is not None:
+            player.update_input(self._history[-1].direction)
+        self._replayed_inputs += len(self._history)
+        self._player = player
+
+        predicted = self._current().position
+        error = previous.distance_to(predicted) if self._has_state else 0.0
+        if not self._has_state or error > self.config.snap_distance:
+            if self._has_state:
+                self._snaps += 1
+            self._correction = Vector2.zero()
+        else:
+            self._correction = previous - predicted
+        self._has_state = True
+
+        self._reconciliations += 1
+        self._total_error += error
+        self._max_error = max(self._max_error, error)
+        return error
+
+    def reset(self) -> None:
+        """Forget all state and inputs (e.g. after disconnecting)."""
+        self._player = self._new_player()
+        self._history.clear()
+        self._sent.clear()
+        self._acknowledged = self._sequence
+        self._held_since = None
+        self._base_velocity = Vector2.zero()
+        self._correction = Vector2.zero()
+        self._has_state = False
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get prediction statistics."""
+        return {
+            'inputs': self._inputs,
+            'pending_inputs': len(self._history),
+            'dropped_inputs': self._dropped_inputs,
+            'reconciliations': self._reconciliations,
+            'replayed_inputs': self._replayed_inputs,
+            'snaps': self._snaps,
+            'mean_correction': self._total_error / self._reconciliations if self._reconciliations else 0.0,
+            'max_correction': self._max_error,
+            'round_trip_time': self.round_trip_time
+        }
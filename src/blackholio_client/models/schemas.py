@@ -129,6 +129,7 @@ class SchemaManager:
                 "updated_at": {"type": ["number", "null"]},
                 # GameCircle specific properties
                 "circle_id": {"type": "string"},
+                "player_id": {"type": ["string", "null"]},
                 "color": {"type": ["string", "null"]},
                 "circle_type": {"type": "string"},
                 "value": {"type": "integer", "minimum": 0},
@@ -0,0 +1,402 @@
+"""
+Versioned Snapshots - Copy-on-Write Table Caches
+
+Client caches hold tens of thousands of rows, and agents read the whole
+table every step. VersionedMap is a mutable mapping split into a fixed
+small hash buckets (the bucket count doubles as the map grows);
+``snapshot()`` returns an immutable MapSnapshot that shares the buckets
+instead of copying them. The next write to a shared bucket copies just that
+bucket, so taking a snapshot costs O(buckets) once per version (and nothing
+while the map is unchanged), and a write after a snapshot copies a handful
+of entries.
+
+Snapshots carry the map's version and diff against each other bucket by
+bucket. The map logs which buckets were written between consecutive
+snapshots, so diffing two recent snapshots only visits those buckets;
+older pairs compare every bucket and skip the ones both still share.
+
+Secondary indexes (``add_index``) group keys by a value derived from each
+entry, such as an entity's type, and are maintained on every write so
+lookups cost O(result) rather than a scan of the map.
+
+Snapshots are taken on the thread that writes the map (the client's event
+loop) and can then be read from any thread.
+"""
+
+import logging
+from collections import deque
+from collections.abc import ItemsView, KeysView, Mapping, MutableMapping, ValuesView
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Dict, Any, Optional, Iterator, List, Tuple, Set, Deque, FrozenSet, Callable, Hashable
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_BUCKETS = 64
+MAX_BUCKET_LOAD = 8  # Average entries per bucket before the bucket count doubles
+DIRTY_LOG_SIZE = 64  # Snapshots whose written buckets are remembered for diffing
+
+_MISSING = object()
+
+
+class _KeysView(KeysView):
+    def __iter__(self) -> Iterator:
+        return chain.from_iterable(self._mapping._buckets)
+
+
+class _ValuesView(ValuesView):
+    def __iter__(self) -> Iterator:
+        return chain.from_iterable(bucket.values() for bucket in self._mapping._buckets)
+
+
+class _ItemsView(ItemsView):
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        return chain.from_iterable(bucket.items() for bucket in self._mapping._buckets)
+
+
+class _BucketedMapping(Mapping):
+    """Read operations shared by VersionedMap and MapSnapshot."""
+
+    _buckets: Any
+    _mask: int
+    _len: int
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._buckets[hash(key) & self._mask][key]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._buckets[hash(key) & self._mask].get(key, default)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._buckets[hash(key) & self._mask]
+
+    def __iter__(self) -> Iterator:
+        return chain.from_iterable(self._buckets)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def keys(self) -> KeysView:
+        return _KeysView(self)
+
+    def values(self) -> ValuesView:
+        return _ValuesView(self)
+
+    def items(self) -> ItemsView:
+        return _ItemsView(self)
+
+    def copy(self) -> Dict[Any, Any]:
+        """Copy the contents into a plain dict."""
+        result: Dict[Any, Any] = {}
+        for bucket in self._buckets:
+            result.update(bucket)
+        return result
+
+
+@dataclass
+class SnapshotDiff:
+    """Changes between two snapshots of the same map."""
+    added: Dict[Any, Any] = field(default_factory=dict)  # New key -> value
+    updated: Dict[Any, Any] = field(default_factory=dict)  # Key -> replacement value
+    removed: Dict[Any, Any] = field(default_factory=dict)  # Removed key -> last value
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.updated) + len(self.removed)
+
+
+class MapSnapshot(_BucketedMapping):
+    """
+    Immutable view of a VersionedMap at one version.
+
+    Behaves as a read-only Mapping; ``copy()`` returns a plain dict for
+    callers that need one.
+    """
+
+    def __init__(self, buckets: Tuple[Dict[Any, Any], ...], length: int, version: int,
+                 sequence: int = 0, dirty_log: Optional[Deque] = None):
+        self._buckets = buckets
+        self._mask = len(buckets) - 1
+        self._len = length
+        self._version = version
+        self._sequence = sequence
+        self._dirty_log = dirty_log
+
+    @property
+    def version(self) -> int:
+        """Version of the map this snapshot was taken at."""
+        return self._version
+
+    def diff(self, older: 'MapSnapshot') -> SnapshotDiff:
+        """
+        Get the changes from an older snapshot to this one.
+
+        Values are compared by identity: cached rows are replaced, not
+        mutated, so a different object means the row was updated. If the map
+        grew its bucket count in between, every entry is compared.
+
+        Args:
+            older: Earlier snapshot of the same map
+
+        Returns:
+            SnapshotDiff from ``older`` to this snapshot
+        """
+        diff = SnapshotDiff()
+        if older is self:
+            return diff
+
+        if len(older._buckets) != len(self._buckets):
+            pairs = [(older.copy(), self.copy())]
+        else:
+            written = self._written_since(older)
+            if written is None:
+                pairs = zip(older._buckets, self._buckets)
+            else:
+                pairs = [(older._buckets[index], self._buckets[index]) for index in written]
+
+        for old, new in pairs:
+            if old is new:
+                continue
+            for key, value in new.items():
+                previous = old.get(key, _MISSING)
+                if previous is _MISSING:
+                    diff.added[key] = value
+                elif previous is not value:
+                    diff.updated[key] = value
+            for key, value in old.items():
+                if key not in new:
+                    diff.removed[key] = value
+        return diff
+
+    def _written_since(self, other: 'MapSnapshot') -> Optional[Set[int]]:
+        """Buckets written between two snapshots, if the map's log still covers them."""
+        if self._dirty_log is None or other._dirty_log is not self._dirty_log:
+            return None
+        low, high = sorted((other._sequence, self._sequence))
+        entries = [dirty for sequence, dirty in self._dirty_log if low < sequence <= high]
+        if len(entries) != high - low or any(dirty is None for dirty in entries):
+            return None
+        return set().union(*entries)
+
+    def __repr__(self) -> str:
+        return f"MapSnapshot(version={self._version}, len={self._len})"
+
+
+class SecondaryIndex:
+    """
+    Keys of a VersionedMap grouped by a value derived from each entry.
+
+    Entries whose derived value is None are not indexed.
+    """
+
+    def __init__(self, key: Callable[[Any], Optional[Hashable]]):
+        """
+        Initialize secondary index.
+
+        Args:
+            key: Function returning the value to group an entry by
+        """
+        self._key = key
+        self._groups: Dict[Hashable, Dict[Any, None]] = {}  # Insertion-ordered key sets
+
+    def _add(self, map_key: Any, value: Any) -> None:
+        group = self._key(value)
+        if group is not None:
+            self._groups.setdefault(group, {})[map_key] = None
+
+    def _discard(self, map_key: Any, value: Any) -> None:
+        group = self._key(value)
+        keys = self._groups.get(group)
+        if keys is not None:
+            keys.pop(map_key, None)
+            if not keys:
+                del self._groups[group]
+
+    def _replace(self, map_key: Any, old: Any, new: Any) -> None:
+        if old is not _MISSING:
+            group = self._key(old)
+            if group is not None and group == self._key(new):
+                return
+            self._discard(map_key, old)
+        self._add(map_key, new)
+
+    def _clear(self) -> None:
+        self._groups.clear()
+
+    def keys(self, group: Hashable) -> List[Any]:
+        """Get the keys of entries in a group."""
+        return list(self._groups.get(group, ()))
+
+    def count(self, group: Hashable) -> int:
+        """Get the number of entries in a group."""
+        return len(self._groups.get(group, ()))
+
+    def groups(self) -> Dict[Hashable, int]:
+        """Get every non-empty group with its entry count."""
+        return {group: len(keys) for group, keys in self._groups.items()}
+
+
+class VersionedMap(_BucketedMapping, MutableMapping):
+    """
+    Mutable mapping that hands out immutable, versioned snapshots.
+
+    Used for the client's entity, player and circle caches. Writes go
+    through ``__setitem__``/``__delitem__``/``pop``/``clear`` like a dict.
+    """
+
+    def __init__(self, items: Optional[Mapping] = None, buckets: int = DEFAULT_BUCKETS):
+        """
+        Initialize versioned map.
+
+        Args:
+            items: Initial contents
+            buckets: Initial number of hash buckets (a power of two)
+
+        Raises:
+            ValueError: If buckets is not a power of two
+        """
+        if buckets < 1 or buckets & (buckets - 1):
+            raise ValueError("buckets must be a power of two")
+        self._buckets: List[Dict[Any, Any]] = [{} for _ in range(buckets)]
+        self._mask = buckets - 1
+        self._shared = [False] * buckets  # Bucket is referenced by a snapshot
+        self._len = 0
+        self._version = 0
+        self._snapshot: Optional[MapSnapshot] = None
+        self._sequence = 0
+        self._dirty: Optional[Set[int]] = None  # Buckets written since the last snapshot (None: unknown)
+        self._dirty_log: Deque[Tuple[int, Optional[FrozenSet[int]]]] = deque(maxlen=DIRTY_LOG_SIZE)
+        self._indexes: Dict[str, SecondaryIndex] = {}
+
+        # Statistics
+        self._snapshots_taken = 0
+        self._buckets_copied = 0
+        self._resizes = 0
+
+        if items:
+            self.update(items)
+
+    @property
+    def version(self) -> int:
+        """Number of writes since the map was created."""
+        return self._version
+
+    def _writable(self, index: int) -> Dict[Any, Any]:
+        """Get a bucket for writing, copying it first if a snapshot shares it."""
+        bucket = self._buckets[index]
+        if self._shared[index]:
+            bucket = self._buckets[index] = dict(bucket)
+            self._shared[index] = False
+            self._dirty.add(index)
+            self._buckets_copied += 1
+        return bucket
+
+    def add_index(self, name: str, key: Callable[[Any], Optional[Hashable]]) -> SecondaryIndex:
+        """
+        Add a secondary index, built from the current entries and kept up to date on writes.
+
+        Args:
+            name: Index name, for ``index()``
+            key: Function returning the value to group an entry by (None: not indexed)
+
+        Returns:
+            The new SecondaryIndex
+        """
+        index = self._indexes[name] = SecondaryIndex(key)
+        for map_key, value in self.items():
+            index._add(map_key, value)
+        return index
+
+    def index(self, name: str) -> SecondaryIndex:
+        """Get a secondary index by name."""
+        return self._indexes[name]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        bucket = self._writable(hash(key) & self._mask)
+        previous = bucket.get(key, _MISSING)
+        bucket[key] = value
+        self._version += 1
+        self._snapshot = None
+        for index in self._indexes.values():
+            index._replace(key, previous, value)
+        if previous is _MISSING:
+            self._len += 1
+            if self._len > len(self._buckets) * MAX_BUCKET_LOAD:
+                self._resize(len(self._buckets) * 2)
+
+    def _resize(self, count: int) -> None:
+        """Rehash into a new set of buckets (existing snapshots keep the old ones)."""
+        buckets: List[Dict[Any, Any]] = [{} for _ in range(count)]
+        mask = count - 1
+        for bucket in self._buckets:
+            for key, value in bucket.items():
+                buckets[hash(key) & mask][key] = value
+        self._buckets = buckets
+        self._mask = mask
+        self._shared = [False] * count
+        self._dirty = None
+        self._resizes += 1
+
+    def __delitem__(self, key: Any) -> None:
+        self.pop(key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        index = hash(key) & self._mask
+        if key not in self._buckets[index]:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = self._writable(index).pop(key)
+        self._len -= 1
+        self._version += 1
+        self._snapshot = None
+        for secondary in self._indexes.values():
+            secondary._discard(key, value)
+        return value
+
+    def clear(self) -> None:
+        if not self._len:
+            return
+        self._buckets = [{} for _ in self._buckets]
+        self._shared = [False] * len(self._buckets)
+        self._dirty = None
+        self._len = 0
+        for index in self._indexes.values():
+            index._clear()
+        self._version += 1
+        self._snapshot = None
+
+    def snapshot(self) -> MapSnapshot:
+        """
+        Get an immutable snapshot of the current contents.
+
+        Repeated calls without writes in between return the same snapshot.
+
+        Returns:
+            MapSnapshot at the current version
+        """
+        if self._snapshot is None:
+            self._sequence += 1
+            self._dirty_log.append((self._sequence, frozenset(self._dirty) if self._dirty is not None else None))
+            self._dirty = set()
+            self._shared = [True] * len(self._buckets)
+            self._snapshot = MapSnapshot(tuple(self._buckets), self._len, self._version,
+                                         self._sequence, self._dirty_log)
+            self._snapshots_taken += 1
+        return self._snapshot
+
+    def __repr__(self) -> str:
+        return f"VersionedMap(version={self._version}, len={self._len})"
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get snapshot statistics."""
+        return {
+            'entries': self._len,
+            'version': self._version,
+            'buckets': len(self._buckets),
+            'snapshots_taken': self._snapshots_taken,
+            'buckets_copied': self._buckets_copied,
+            'resizes': self._resizes,
+            'indexes': list(self._indexes)
+        }
@@ -0,0 +1,715 @@
+"""
+Training Data Export - Stream Observations to Columnar Shards
+
+Training pipelines used to pull ``get_all_entities()`` every step and
+serialise it as JSON. TrainingDataExporter instead takes the cache
+snapshots (cheap, immutable, safe to read from another thread), hands them
+to a background writer thread through a bounded queue, and turns each one
+into a fixed-size feature vector plus the agent's action. Rows are
+buffered into columnar shards of ``rows_per_shard`` rows and written as
+one NumPy ``.npy`` file per column (memory-mappable with
+``numpy.load(mmap_mode='r')``) or as Parquet files. Shard numbers continue
+after the shards already in the output directory, so a new exporter never
+overwrites earlier data.
+
+Feature extraction is vectorised per tick by FeatureExtractor:
+
+- self: mass-weighted center x, y, total mass and number of circles
+- nearest ``nearest_food`` food entities: dx, dy, mass relative to the center
+- nearest ``nearby_players`` cells of other players: dx, dy, mass
+
+Missing neighbours are zero-padded (mass 0). Entities with a circle row are
+player cells; other entities of type food or unknown count as food.
+
+numpy is imported when the first exporter or extractor is created; the
+Parquet format also needs pyarrow.
+"""
+
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Mapping, Sequence, Tuple, Union
+
+from .game_entities import EntityType, Vector2
+from .snapshots import MapSnapshot
+
+
+logger = logging.getLogger(__name__)
+
+
+def _numpy():
+    """Import numpy, which training data export needs."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Training data export needs the 'numpy' package (pip install numpy)") from None
+    return numpy
+
+
+def _pyarrow():
+    """Import pyarrow and its Parquet writer."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Parquet export needs the 'pyarrow' package (pip install pyarrow)") from None
+    return pyarrow, pyarrow.parquet
+
+
+SHARD_FORMATS = ('npy', 'parquet')
+FOOD_TYPES = (EntityType.FOOD, EntityType.UNKNOWN)
+SELF_FEATURES = ('self_x', 'self_y', 'self_mass', 'self_circles')
+NEIGHBOUR_FEATURES = ('dx', 'dy', 'mass')
+NEAREST_CHUNK_ELEMENTS = 1 << 20  # Distance matrix elements computed at once
+
+
+@dataclass
+class ExportConfig:
+    """Training data export configuration."""
+    output_dir: str = "training_data"
+    format: str = "npy"  # 'npy' (one .npy file per column) or 'parquet'
+    shard_prefix: str = "shard"
+    rows_per_shard: int = 10000
+    queue_size: int = 256  # Ticks waiting for the writer thread
+    block_when_full: bool = True  # Wait for the writer instead of dropping the tick
+    nearest_food: int = 8
+    nearby_players: int = 4
+
+    def validate(self) -> None:
+        """Validate configuration parameters."""
+        if self.format not in SHARD_FORMATS:
+            raise ValueError(f"format must be one of {SHARD_FORMATS}")
+        if not self.shard_prefix:
+            raise ValueError("shard_prefix must not be empty")
+        if self.rows_per_shard < 1:
+            raise ValueError("rows_per_shard must be >= 1")
+        if self.queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+        if self.nearest_food < 0:
+            raise ValueError("nearest_food must be >= 0")
+        if self.nearby_players < 0:
+            raise ValueError("nearby_players must be >= 0")
+
+
+@dataclass
+class WorldArrays:
+    """
+    One tick's entities as arrays, shared by every agent extracted from it.
+
+    Arrays are indexed by slot; free slots have mass 0, owner -1 and are not food.
+    """
+    positions: Any  # (slots, 2) float64
+    masses: Any  # (slots,) float64
+    owners: Any  # (slots,) int64 owner code, -1 for entities without a circle row
+    food: Any  # (slots,) bool
+    owner_codes: Dict[str, int]  # Player ID -> owner code
+
+
+class FeatureExtractor:
+    """
+    Fixed-size observation vectors from cache snapshots.
+
+    Converting a world to arrays is the expensive part, so when consecutive
+    calls pass MapSnapshots only the rows changed in between (found with
+    ``MapSnapshot.diff``) are rewritten.
+    """
+
+    def __init__(self, nearest_food: int = 8, nearby_players: int = 4):
+        """
+        Initialize feature extractor.
+
+        Args:
+            nearest_food: Food entities described per observation
+            nearby_players: Cells of other players described per observation
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        self._np = _numpy()
+        self.nearest_food = nearest_food
+        self.nearby_players = nearby_players
+
+        self._entities: Optional[MapSnapshot] = None
+        self._circles: Optional[MapSnapshot] = None
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._world: Optional[WorldArrays] = None
+        self._owner_codes: Dict[str, int] = {}
+
+        # Statistics
+        self._rebuilds = 0
+        self._incremental_updates = 0
+        self._rows_converted = 0
+
+    @property
+    def size(self) -> int:
+        """Length of a feature vector."""
+        return len(SELF_FEATURES) + len(NEIGHBOUR_FEATURES) * (self.nearest_food + self.nearby_players)
+
+    @property
+    def feature_names(self) -> List[str]:
+        """Name of each feature vector element."""
+        names = list(SELF_FEATURES)
+        for prefix, count in (('food', self.nearest_food), ('player', self.nearby_players)):
+            for i in range(count):
+                names.extend(f"{prefix}{i}_{name}" for name in NEIGHBOUR_FEATURES)
+        return names
+
+    def world_arrays(self, entities: Mapping[str, Any], circles: Mapping[str, Any]) -> WorldArrays:
+        """
+        Convert entity and circle snapshots to arrays.
+
+        The returned arrays are reused, so they are only valid until the next call.
+
+        Args:
+            entities: Entity ID -> GameEntity
+            circles: Circle (entity) ID -> GameCircle, used for cell ownership
+
+        Returns:
+            WorldArrays with one slot per entity (plus free slots)
+        """
+        changed = None
+        if (self._world is not None and isinstance(entities, MapSnapshot) and isinstance(circles, MapSnapshot)
+                and isinstance(self._entities, MapSnapshot) and isinstance(self._circles, MapSnapshot)):
+            entity_diff = entities.diff(self._entities)
+            circle_diff = circles.diff(self._circles)
+            changed = set(entity_diff.added).union(entity_diff.updated, entity_diff.removed,
+                                                   circle_diff.added, circle_diff.updated, circle_diff.removed)
+            if len(changed) > len(entities) // 2:
+                changed = None
+
+        if changed is None:
+            self._rebuild(entities, circles)
+        else:
+            for entity_id in changed:
+                self._write(entity_id, entities.get(entity_id), circles.get(entity_id))
+            self._incremental_updates += 1
+            self._rows_converted += len(changed)
+
+        self._entities = entities if isinstance(entities, MapSnapshot) else None
+        self._circles = circles if isinstance(circles, MapSnapshot) else None
+        return self._world
+
+    def _owner_code(self, circle: Any) -> int:
+        """Get the owner code of a circle row (-1 for no owner)."""
+        player_id = circle.player_id if circle is not None else None
+        if not player_id:
+            return -1
+        code = self._owner_codes.get(player_id)
+        if code is None:
+            code = self._owner_codes[player_id] = len(self._owner_codes)
+        return code
+
+    def _rebuild(self, entities: Mapping[str, Any], circles: Mapping[str, Any]) -> None:
+        """Convert every entity."""
+        np = self._np
+        count = len(entities)
+        coordinates = []
+        masses = []
+        owners = []
+        food = []
+        for entity_id, entity in entities.items():
+            position = entity.position
+            coordinates.append(position.x)
+            coordinates.append(position.y)
+            masses.append(entity.mass)
+            circle = circles.get(entity_id)
+            owners.append(self._owner_code(circle))
+            food.append(circle is None and entity.entity_type in FOOD_TYPES)
+
+        self._slots = {entity_id: slot for slot, entity_id in enumerate(entities)}
+        self._free = []
+        self._world = WorldArrays(np.array(coordinates, dtype=np.float64).reshape(count, 2),
+                                  np.array(masses, dtype=np.float64),
+                                  np.array(owners, dtype=np.int64),
+                                  np.array(food, dtype=bool),
+                                  self._owner_codes)
+        self._rebuilds += 1
+        self._rows_converted += count
+
+    def _write(self, entity_id: str, entity: Any, circle: Any) -> None:
+        """Rewrite, add or free one entity's slot."""
+        world = self._world
+        slot = self._slots.get(entity_id)
+        if entity is None:
+            if slot is not None:
+                del self._slots[entity_id]
+                self._free.append(slot)
+                world.masses[slot] = 0.0
+                world.owners[slot] = -1
+                world.food[slot] = False
+            return
+
+        if slot is None:
+            if not self._free:
+                world = self._grow()
+            slot = self._free.pop()
+            self._slots[entity_id] = slot
+        position = entity.position
+        world.positions[slot] = (position.x, position.y)
+        world.masses[slot] = entity.mass
+        world.owners[slot] = self._owner_code(circle)
+        world.food[slot] = circle is None and entity.entity_type in FOOD_TYPES
+
+    def _grow(self) -> WorldArrays:
+        """Double the number of slots."""
+        np = self._np
+        world = self._world
+        old = len(world.masses)
+        capacity = max(old * 2, 16)
+        positions = np.zeros((capacity, 2))
+        masses = np.zeros(capacity)
+        owners = np.full(capacity, -1, dtype=np.int64)
+        food = np.zeros(capacity, dtype=bool)
+        positions[:old] = world.positions
+        masses[:old] = world.masses
+        owners[:old] = world.owners
+        food[:old] = world.food
+        self._world = WorldArrays(positions, masses, owners, food, self._owner_codes)
+        self._free.extend(range(capacity - 1, old - 1, -1))
+        return self._world
+
+    def extract(self, world: WorldArrays, player_id: Optional[str]) -> Any:
+        """
+        Get one agent's feature vector.
+
+        Args:
+            world: Arrays from world_arrays()
+            player_id: Agent's player ID
+
+        Returns:
+            float32 array of length ``size``; all zeros if the player has no cells
+        """
+        return self.extract_many(world, [player_id])[0]
+
+    def extract_many(self, world: WorldArrays, player_ids: Sequence[Optional[str]]) -> Any:
+        """
+        Get the feature vectors of several agents in one world at once.
+
+        Args:
+            world: Arrays from world_arrays()
+            player_ids: Agents' player IDs
+
+        Returns:
+            float32 array of shape (len(player_ids), size); rows of players
+            without cells are all zeros
+        """
+        np = self._np
+        features = np.zeros((len(player_ids), self.size), dtype=np.float32)
+        codes = np.array([world.owner_codes.get(str(player_id), -1) if player_id else -1
+                          for player_id in player_ids], dtype=np.int64)
+        owned = world.owners >= 0
+        if not len(codes) or not owned.any():
+            return features
+
+        # Mass-weighted centers of every owner's cells
+        cell_owners = world.owners[owned]
+        cell_positions = world.positions[owned]
+        cell_masses = world.masses[owned]
+        owner_count = len(world.owner_codes)
+        total_mass = np.bincount(cell_owners, weights=cell_masses, minlength=owner_count)
+        weighted_x = np.bincount(cell_owners, weights=cell_masses * cell_positions[:, 0], minlength=owner_count)
+        weighted_y = np.bincount(cell_owners, weights=cell_masses * cell_positions[:, 1], minlength=owner_count)
+        cell_count = np.bincount(cell_owners, minlength=owner_count)
+
+        present = np.flatnonzero(codes >= 0)
+        present = present[total_mass[codes[present]] > 0]
+        if not len(present):
+            return features
+        agent_codes = codes[present]
+        mass = total_mass[agent_codes]
+        centers = np.column_stack((weighted_x[agent_codes] / mass, weighted_y[agent_codes] / mass))
+
+        self_width = len(SELF_FEATURES)
+        food_width = self.nearest_food * len(NEIGHBOUR_FEATURES)
+        features[present, 0:2] = centers
+        features[present, 2] = mass
+        features[present, 3] = cell_count[agent_codes]
+        features[present, self_width:self_width + food_width] = self._nearest(
+            centers, world.positions[world.food], world.masses[world.food], self.nearest_food
+        ).reshape(len(present), -1)
+        features[present, self_width + food_width:] = self._nearest(
+            centers, cell_positions, cell_masses, self.nearby_players,
+            exclude=cell_owners[None, :] == agent_codes[:, None]
+        ).reshape(len(present), -1)
+        return features
+
+    def _nearest(self, centers: Any, positions: Any, masses: Any, count: int, exclude: Any = None) -> Any:
+        """
+        Describe the ``count`` entities closest to each center as (dx, dy, mass) rows.
+
+        Args:
+            centers: (agents, 2) centers
+            positions: (n, 2) candidate positions
+            masses: (n,) candidate masses
+            count: Neighbours per center
+            exclude: Optional (agents, n) mask of candidates to skip per center
+
+        Returns:
+            float32 array of shape (agents, count, 3), zero-padded
+        """
+        np = self._np
+        rows = np.zeros((len(centers), count, len(NEIGHBOUR_FEATURES)), dtype=np.float32)
+        if count == 0 or not len(positions):
+            return rows
+
+        # Bound the (agents, n) distance matrix by working through the agents in chunks
+        chunk = max(1, NEAREST_CHUNK_ELEMENTS // len(positions))
+        width = min(count, len(positions))
+        for start in range(0, len(centers), chunk):
+            stop = start + chunk
+            dx = positions[:, 0] - centers[start:stop, 0:1]
+            dy = positions[:, 1] - centers[start:stop, 1:2]
+            distances = dx * dx
+            distances += dy * dy
+            if exclude is not None:
+                distances[exclude[start:stop]] = np.inf
+            if len(positions) > width:
+                closest = np.argpartition(distances, width - 1, axis=1)[:, :width]
+            else:
+                closest = np.broadcast_to(np.arange(width), distances.shape).copy()
+            closest = np.take_along_axis(
+                closest, np.argsort(np.take_along_axis(distances, closest, axis=1), axis=1), axis=1)
+
+            found = np.isfinite(np.take_along_axis(distances, closest, axis=1))
+            block = rows[start:stop]
+            block[:, :width, 0] = np.where(found, np.take_along_axis(dx, closest, axis=1), 0.0)
+            block[:, :width, 1] = np.where(found, np.take_along_axis(dy, closest, axis=1), 0.0)
+            block[:, :width, 2] = np.where(found, masses[closest], 0.0)
+        return rows
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get conversion statistics."""
+        return {
+            'rebuilds': self._rebuilds,
+            'incremental_updates': self._incremental_updates,
+            'rows_converted': self._rows_converted,
+            'slots': len(self._world.masses) if self._world is not None else 0
+        }
+
+
+_FLUSH = object()
+
+
+class TrainingDataExporter:
+    """
+    Background writer of per-tick observations and actions.
+
+    ``record`` only enqueues the snapshots; feature extraction and file I/O
+    happen on the writer thread. Each row has the columns ``tick``,
+    ``timestamp``, ``agent``, ``action`` (direction x, y) and ``features``.
+    """
+
+    COLUMNS = ('tick', 'timestamp', 'agent', 'action', 'features')
+
+    def __init__(self, config: Optional[ExportConfig] = None):
+        """
+        Initialize exporter and start its writer thread.
+
+        Args:
+            config: Export configuration (uses defaults if None)
+
+        Raises:
+            ImportError: If numpy (or pyarrow for Parquet) is not installed
+        """
+        self.config = config or ExportConfig()
+        self.config.validate()
+        self._np = _numpy()
+        if self.config.format == 'parquet':
+            _pyarrow()
+        self.extractor = FeatureExtractor(self.config.nearest_food, self.config.nearby_players)
+
+        self._output_dir = Path(self.config.output_dir)
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        self._next_shard = self._first_free_shard()
+        self._write_metadata()
+
+        self._queue: queue.Queue = queue.Queue(maxsize=self.config.queue_size)
+        self._ticks: Dict[int, int] = {}
+        self._allocate_shard()
+        self._closed = False
+
+        # Statistics
+        self._started_at = time.perf_counter()
+        self._ticks_recorded = 0
+        self._ticks_dropped = 0
+        self._rows_written = 0
+        self._shards_written = 0
+        self._write_errors = 0
+        self._writer_seconds = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="training-data-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def output_dir(self) -> Path:
+        """Directory shards are written to."""
+        return self._output_dir
+
+    @property
+    def closed(self) -> bool:
+        """Whether the exporter has been closed."""
+        return self._closed
+
+    def record(self, entities: Mapping[str, Any], circles: Mapping[str, Any], player_id: Optional[str],
+               action: Union[Vector2, Tuple[float, float], None] = None,
+               tick: Optional[int] = None, agent: int = 0, block: Optional[bool] = None) -> bool:
+        """
+        Queue one tick of world state for an agent.
+
+        Pass immutable snapshots (e.g. ``client.get_all_entities()``): they are
+        read later on the writer thread.
+
+        Args:
+            entities: Entity ID -> GameEntity
+            circles: Circle ID -> GameCircle
+            player_id: Agent's player ID
+            action: Direction the agent sent this tick (zero if None)
+            tick: Tick number (the agent's next tick if None)
+            agent: Agent index, for several agents sharing one output
+            block: Wait for room when the queue is full (``block_when_full`` if None);
+                pass False from an event loop
+
+        Returns:
+            True if queued, False if dropped because the queue was full
+
+        Raises:
+            RuntimeError: If the exporter is closed
+        """
+        if self._closed:
+            raise RuntimeError("Training data exporter is closed")
+
+        if tick is None:
+            tick = self._ticks.get(agent, 0)
+        self._ticks[agent] = tick + 1
+        if action is None:
+            action = (0.0, 0.0)
+        elif isinstance(action, Vector2):
+            action = (action.x, action.y)
+
+        item = (tick, time.time(), agent, action, player_id, entities, circles)
+        if self.config.block_when_full if block is None else block:
+            self._queue.put(item)
+        else:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self._ticks_dropped += 1
+                return False
+        self._ticks_recorded += 1
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued ticks and write the current partial shard.
+
+        Args:
+            timeout: Seconds to wait (forever if None)
+
+        Returns:
+            True if everything queued before the call is on disk
+        """
+        if self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Write everything queued and stop the writer thread.
+
+        Args:
+            timeout: Seconds to wait for the writer (forever if None)
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _first_free_shard(self) -> int:
+        """Number after the highest shard with this prefix already in the output directory."""
+        pattern = re.compile(re.escape(self.config.shard_prefix) + r"-(\d+)\.")
+        numbers = [int(match.group(1)) for match in
+                   (pattern.match(path.name) for path in self._output_dir.glob(f"{self.config.shard_prefix}-*"))
+                   if match]
+        return max(numbers) + 1 if numbers else 0
+
+    def _write_metadata(self) -> None:
+        """Describe the columns and features next to the shards."""
+        metadata = {
+            'columns': list(self.COLUMNS),
+            'feature_names': self.extractor.feature_names,
+            'config': asdict(self.config)
+        }
+        path = self._output_dir / f"{self.config.shard_prefix}-metadata.json"
+        path.write_text(json.dumps(metadata, indent=2))
+
+    def _allocate_shard(self) -> None:
+        """Start an empty shard buffer."""
+        np = self._np
+        rows = self.config.rows_per_shard
+        self._buffer = {
+            'tick': np.empty(rows, dtype=np.int64),
+            'timestamp': np.empty(rows, dtype=np.float64),
+            'agent': np.empty(rows, dtype=np.int32),
+            'action': np.empty((rows, 2), dtype=np.float32),
+            'features': np.empty((rows, self.extractor.size), dtype=np.float32)
+        }
+        self._buffered = 0
+
+    def _run(self) -> None:
+        """Writer thread: extract features and write full shards."""
+        pending: List[Any] = []
+        while True:
+            item = pending.pop() if pending else self._queue.get()
+            if item is None:
+                self._write_shard()
+                return
+            if item[0] is _FLUSH:
+                self._write_shard()
+                item[1].set()
+                continue
+
+            # Agents recorded from the same snapshots are extracted together
+            group = [item]
+            while len(group) < self.config.queue_size:
+                try:
+                    following = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if (following is None or following[0] is _FLUSH
+                        or following[5] is not item[5] or following[6] is not item[6]):
+                    pending.append(following)
+                    break
+                group.append(following)
+
+            start_time = time.perf_counter()
+            try:
+                self._append(group)
+            except Exception as e:
+                self._write_errors += 1
+                logger.error(f"Training data export failed: {e}")
+            finally:
+                self._writer_seconds += time.perf_counter() - start_time
+
+    def _append(self, group: List[Any]) -> None:
+        """Extract the features of queued ticks sharing one world and buffer their rows."""
+        entities, circles = group[0][5:]
+        # Only rows changed since the previous snapshots are converted
+        world = self.extractor.world_arrays(entities, circles)
+        columns = {
+            'tick': [item[0] for item in group],
+            'timestamp': [item[1] for item in group],
+            'agent': [item[2] for item in group],
+            'action': [item[3] for item in group],
+            'features': self.extractor.extract_many(world, [item[4] for item in group])
+        }
+
+        written = 0
+        while written < len(group):
+            row = self._buffered
+            count = min(len(group) - written, self.config.rows_per_shard - row)
+            for column, values in columns.items():
+                self._buffer[column][row:row + count] = values[written:written + count]
+            self._buffered += count
+            written += count
+            if self._buffered == self.config.rows_per_shard:
+                self._write_shard()
+
+    def _write_shard(self) -> None:
+        """Write the buffered rows as one shard and start a new buffer."""
+        rows = self._buffered
+        if not rows:
+            return
+
+        start_time = time.perf_counter()
+        name = f"{self.config.shard_prefix}-{self._next_shard:05d}"
+        columns = {column: values[:rows] for column, values in self._buffer.items()}
+        try:
+            if self.config.format == 'parquet':
+                self._write_parquet(name, columns)
+            else:
+                self._write_npy(name, columns)
+            self._next_shard += 1
+            self._shards_written += 1
+            self._rows_written += rows
+        except Exception as e:
+            self._write_errors += 1
+            logger.error(f"Failed to write training data shard {name}: {e}")
+        finally:
+            self._allocate_shard()
+            self._writer_seconds += time.perf_counter() - start_time
+
+    def _write_npy(self, name: str, columns: Dict[str, Any]) -> None:
+        """Write one .npy file per column."""
+        for column, values in columns.items():
+            path = self._output_dir / f"{name}.{column}.npy"
+            temporary = path.with_suffix('.tmp')
+            with open(temporary, 'wb') as f:
+                self._np.save(f, values)
+            os.replace(temporary, path)
+
+    def _write_parquet(self, name: str, columns: Dict[str, Any]) -> None:
+        """Write one Parquet file; action and features become fixed-size list columns."""
+        pa, pq = _pyarrow()
+        table = pa.table({
+            column: (pa.FixedSizeListArray.from_arrays(pa.array(values.ravel()), values.shape[1])
+                     if values.ndim == 2 else pa.array(values))
+            for column, values in columns.items()
+        })
+        path = self._output_dir / f"{name}.parquet"
+        temporary = path.with_suffix('.tmp')
+        pq.write_table(table, temporary)
+        os.replace(temporary, path)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get export statistics, including throughput in rows per second."""
+        elapsed = time.perf_counter() - self._started_at
+        return {
+            'format': self.config.format,
+            'output_dir': str(self._output_dir),
+            'ticks_recorded': self._ticks_recorded,
+            'ticks_dropped': self._ticks_dropped,
+            'queue_depth': self._queue.qsize(),
+            'buffered_rows': self._buffered,
+            'rows_written': self._rows_written,
+            'shards_written': self._shards_written,
+            'write_errors': self._write_errors,
+            'rows_per_second': self._rows_written / elapsed if elapsed > 0 else 0.0,
+            'writer_rows_per_second': (self._rows_written / self._writer_seconds
+                                       if self._writer_seconds > 0 else 0.0),
+            'extractor': self.extractor.get_statistics()
+        }
+
+
+def load_npy_shards(output_dir: Union[str, Path], shard_prefix: str = "shard",
+                    mmap: bool = False) -> Dict[str, Any]:
+    """
+    Load .npy shards written by TrainingDataExporter.
+
+    Args:
+        output_dir: Directory the shards were written to
+        shard_prefix: Prefix the exporter was configured with
+        mmap: Memory-map the files instead of reading them
+
+    Returns:
+        Column name -> array of all shards' rows in shard order
+    """
+    np = _numpy()
+    output_dir = Path(output_dir)
+    columns: Dict[str, List[Any]] = {column: [] for column in TrainingDataExporter.COLUMNS}
+    for path in sorted(output_dir.glob(f"{shard_prefix}-*.tick.npy")):
+        name = path.name[:-len('.tick.npy')]
+        for column in columns:
+            columns[column].append(np.load(output_dir / f"{name}.{column}.npy",
+                                           mmap_mode='r' if mmap else None))
+    return {column: np.concatenate(parts) if parts else np.empty(0)
+            for column, parts in columns.items()}
@@ -8,11 +8,20 @@ and handling reducer responses with type safety and validation.
 from .reducer_client import ReducerClient, ReducerError
 from .action_formatter import ActionFormatter, Action
 from .game_reducers import GameReducers
+from .input_channel import InputChannel, InputChannelConfig
+from .outcome_tracker import ReducerOutcomeTracker, ReducerOutcome
+from .reducer_batcher import ReducerBatcher, BatchingConfig
 
 __all__ = [
     "ReducerClient",
     "ReducerError",
     "ActionFormatter", 
     "Action",
-    "GameReducers"
+    "GameReducers",
+    "InputChannel",
+    "InputChannelConfig",
+    "ReducerOutcomeTracker",
+    "ReducerOutcome",
+    "ReducerBatcher",
+    "BatchingConfig"
 ]
\ No newline at end of file
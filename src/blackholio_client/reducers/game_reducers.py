@@ -6,6 +6,7 @@ with proper validation, error handling, and type safety.
 """
 
 import asyncio
+import heapq
 import logging
 from typing import Dict, Any, List, Optional, Union
 
@@ -296,8 +297,8 @@ class GameReducers:
                     # Single player response
                     players = [GamePlayer.from_dict(result) if isinstance(result, dict) else result]
                 
-                # Sort by score descending
-                players.sort(key=lambda p: p.score, reverse=True)
+                # Partial selection of the top scores instead of a full sort
+                players = heapq.nlargest(limit, players, key=lambda p: p.score)
                 
                 logger.debug(f"Retrieved leaderboard with {len(players)} players")
                 return players
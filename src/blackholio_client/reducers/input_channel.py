@@ -0,0 +1,191 @@
+"""
+Input Channel - Latest-Wins Player Input Sending
+
+Collapses per-frame player input into at most one update_player_input
+call per server tick. Only the most recent direction is kept, and a send
+is skipped when the direction has not changed by more than an epsilon,
+so input traffic scales with the tick rate instead of the frame rate.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Callable, Awaitable
+
+
+logger = logging.getLogger(__name__)
+
+Direction = Dict[str, float]
+
+
+@dataclass
+class InputChannelConfig:
+    """Input channel configuration."""
+    tick_rate: float = 20.0  # Maximum sends per second (server tick rate)
+    epsilon: float = 0.01  # Per-axis change below which a send is skipped
+
+    def validate(self) -> None:
+        """Validate configuration parameters."""
+        if self.tick_rate <= 0:
+            raise ValueError("tick_rate must be > 0")
+        if self.epsilon < 0:
+            raise ValueError("epsilon must be >= 0")
+
+    @property
+    def tick_interval(self) -> float:
+        """Seconds between sends."""
+        return 1.0 / self.tick_rate
+
+
+class InputChannel:
+    """
+    Latest-wins input channel.
+
+    ``submit()`` only records the direction and wakes the sender task; the
+    sender waits for the next tick boundary, takes whatever direction is
+    newest at that point and sends it unless it is within ``epsilon`` of
+    the last direction sent.
+    """
+
+    def __init__(self, send: Callable[[Direction], Awaitable[bool]],
+                 config: Optional[InputChannelConfig] = None):
+        """
+        Initialize input channel.
+
+        Args:
+            send: Coroutine function that sends one direction to the server
+            config: Channel configuration (uses defaults if None)
+        """
+        self.config = config or InputChannelConfig()
+        self.config.validate()
+        self._send = send
+
+        self._latest: Optional[Direction] = None
+        self._last_sent: Optional[Direction] = None
+        self._last_send_time: Optional[float] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        # Statistics
+        self._submitted = 0
+        self._sent = 0
+        self._coalesced = 0
+        self._suppressed = 0
+        self._failed = 0
+
+    def submit(self, direction: Direction) -> bool:
+        """
+        Record the newest input direction.
+
+        Args:
+            direction: Direction as {"x": ..., "y": ...}
+
+        Returns:
+            True if the direction was accepted
+        """
+        if self._closed:
+            return False
+
+        self._submitted += 1
+        if self._latest is not None:
+            self._coalesced += 1
+        self._latest = {'x': float(direction['x']), 'y': float(direction['y'])}
+
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="input_channel")
+        self._wakeup.set()
+        return True
+
+    def _is_negligible(self, direction: Direction) -> bool:
+        """Check if a direction is within epsilon of the last one sent."""
+        if self._last_sent is None:
+            return False
+        return (abs(direction['x'] - self._last_sent['x']) <= self.config.epsilon and
+                abs(direction['y'] - self._last_sent['y']) <= self.config.epsilon)
+
+    async def _run(self) -> None:
+        """Send the latest direction once per tick while input keeps arriving."""
+        while not self._closed:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            if self._last_send_time is not None:
+                delay = self._last_send_time + self.config.tick_interval - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            await self.flush()
+
+    async def flush(self) -> bool:
+        """
+        Send the pending direction now, ignoring the tick schedule.
+
+        Returns:
+            True if a direction was sent successfully
+        """
+        direction, self._latest = self._latest, None
+        if direction is None:
+            return False
+
+        if self._is_negligible(direction):
+            self._suppressed += 1
+            return False
+
+        self._last_send_time = time.monotonic()
+        try:
+            success = await self._send(direction)
+        except Exception as e:
+            logger.debug(f"Input send failed: {e}")
+            success = False
+
+        if success:
+            self._sent += 1
+            self._last_sent = direction
+        else:
+            self._failed += 1
+        return success
+
+    async def _stop_task(self) -> None:
+        """Cancel the sender task if it is running."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def reset(self) -> None:
+        """Drop pending input and send state (e.g. after a disconnect)."""
+        await self._stop_task()
+        self._latest = None
+        self._last_sent = None
+        self._last_send_time = None
+
+    async def close(self, flush: bool = True) -> None:
+        """
+        Stop the sender task.
+
+        Args:
+            flush: Send any pending direction before stopping
+        """
+        self._closed = True
+        await self._stop_task()
+        if flush:
+            await self.flush()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get input channel statistics."""
+        return {
+            'tick_rate': self.config.tick_rate,
+            'submitted': self._submitted,
+            'sent': self._sent,
+            'coalesced': self._coalesced,
+            'suppressed': self._suppressed,
+            'failed': self._failed,
+            'send_ratio': self._sent / self._submitted if self._submitted else 0.0,
+            'last_sent': dict(self._last_sent) if self._last_sent else None
+        }
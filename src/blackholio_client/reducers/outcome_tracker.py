@@ -0,0 +1,299 @@
+"""
+Outcome Tracker - Reducer Commit Tracking
+
+Correlates reducer calls with the server's TransactionUpdate messages by
+the u32 request id sent in each CallReducer, so callers can await the
+committed outcome of a call. Pending calls live in a bounded,
+insertion-ordered map; entries that outlive the timeout or overflow the
+bound are resolved as timeouts.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Deque, List, Tuple
+
+from ..interfaces.reducer_interface import ReducerStatus
+from ..utils.debugging import sorted_percentile
+
+
+logger = logging.getLogger(__name__)
+
+_MAX_WIRE_ID = 0xFFFFFFFF  # CallReducer.request_id is a u32
+
+
+@dataclass
+class ReducerOutcome:
+    """Committed (or failed) outcome of a tracked reducer call."""
+    request_id: str
+    reducer_name: str
+    status: ReducerStatus
+    error: Optional[str] = None
+    commit_latency: Optional[float] = None
+    energy_used: Optional[Any] = None
+    execution_duration: Optional[Any] = None
+
+    @property
+    def is_success(self) -> bool:
+        """Check if the reducer committed."""
+        return self.status == ReducerStatus.SUCCESS
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert outcome to dictionary."""
+        return {
+            'request_id': self.request_id,
+            'reducer_name': self.reducer_name,
+            'status': self.status,
+            'error': self.error,
+            'commit_latency': self.commit_latency,
+            'energy_used': self.energy_used,
+            'execution_duration': self.execution_duration
+        }
+
+
+@dataclass
+class _PendingCall:
+    """A sent reducer call waiting for its TransactionUpdate."""
+    wire_id: int
+    reducer_name: str
+    sent_at: float
+    future: asyncio.Future
+
+
+class ReducerOutcomeTracker:
+    """
+    Bounded tracker of reducer calls awaiting their TransactionUpdate.
+
+    Expiry is lazy: stale entries are swept whenever a call is registered
+    or resolved, and ``wait_for()`` enforces its own timeout. Recently
+    settled outcomes are kept (also bounded) for status lookups.
+    """
+
+    def __init__(self, max_pending: int = 1024, timeout: float = 10.0, history_size: int = 1024):
+        """
+        Initialize outcome tracker.
+
+        Args:
+            max_pending: Maximum calls awaiting an outcome at once
+            timeout: Seconds after which a pending call is reported as timed out
+            history_size: Number of settled outcomes kept for lookups
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+        if timeout <= 0:
+            raise ValueError("timeout must be > 0")
+
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.history_size = history_size
+
+        self._pending: 'OrderedDict[str, _PendingCall]' = OrderedDict()
+        self._by_wire_id: Dict[int, str] = {}
+        self._history: 'OrderedDict[str, ReducerOutcome]' = OrderedDict()
+        self._next_wire_id = 1
+        self._commit_latencies: Deque[float] = deque(maxlen=1024)
+
+        # Statistics
+        self._registered = 0
+        self._committed = 0
+        self._failed = 0
+        self._timeouts = 0
+        self._evicted = 0
+        self._unmatched = 0
+
+    def _allocate_wire_id(self) -> int:
+        """Get the next free u32 request id."""
+        while True:
+            wire_id = self._next_wire_id
+            self._next_wire_id = wire_id + 1 if wire_id < _MAX_WIRE_ID else 1
+            if wire_id not in self._by_wire_id:
+                return wire_id
+
+    def register(self, request_id: str, reducer_name: str) -> Tuple[int, asyncio.Future]:
+        """
+        Start tracking a reducer call that is about to be sent.
+
+        Args:
+            request_id: Caller-facing request id
+            reducer_name: Reducer name
+
+        Returns:
+            Tuple of (u32 id to send with the CallReducer, future resolving
+            to the call's ReducerOutcome)
+        """
+        if request_id in self._pending:
+            self._settle(request_id, ReducerStatus.FAILED, "Superseded by a call with the same request id",
+                         time.monotonic())
+
+        now = time.monotonic()
+        self.expire(now)
+
+        while len(self._pending) >= self.max_pending:
+            old_id, _ = next(iter(self._pending.items()))
+            self._evicted += 1
+            self._settle(old_id, ReducerStatus.TIMEOUT, error="Evicted from pending reducer window", now=now)
+
+        wire_id = self._allocate_wire_id()
+        future = asyncio.get_event_loop().create_future()
+        self._pending[request_id] = _PendingCall(wire_id=wire_id, reducer_name=reducer_name,
+                                                 sent_at=now, future=future)
+        self._by_wire_id[wire_id] = request_id
+        self._registered += 1
+        return wire_id, future
+
+    def resolve(self, wire_id: int, status: ReducerStatus, error: Optional[str] = None,
+                energy_used: Optional[Any] = None, execution_duration: Optional[Any] = None) -> Optional[ReducerOutcome]:
+        """
+        Record the server's outcome for a call.
+
+        Unknown ids (already settled, duplicate deliveries, or calls made by
+        other code on the same connection) are ignored.
+
+        Args:
+            wire_id: Request id echoed in the TransactionUpdate's reducer_call
+            status: SUCCESS for committed, FAILED otherwise
+            error: Failure message from the server
+            energy_used: Energy reported by the server
+            execution_duration: Host execution duration reported by the server
+
+        Returns:
+            The outcome, or None if the request id is not pending
+        """
+        now = time.monotonic()
+        request_id = self._by_wire_id.get(wire_id)
+        if request_id is None:
+            self._unmatched += 1
+            self.expire(now)
+            return None
+
+        outcome = self._settle(request_id, status, error, now, energy_used, execution_duration)
+        self.expire(now)
+        return outcome
+
+    def fail(self, request_id: str, error: str) -> Optional[ReducerOutcome]:
+        """Resolve a call that could not be sent."""
+        if request_id not in self._pending:
+            return None
+        return self._settle(request_id, ReducerStatus.FAILED, error, time.monotonic())
+
+    def _settle(self, request_id: str, status: ReducerStatus, error: Optional[str], now: float,
+                energy_used: Optional[Any] = None, execution_duration: Optional[Any] = None) -> ReducerOutcome:
+        """Remove a pending call and resolve its future."""
+        call = self._pending.pop(request_id)
+        self._by_wire_id.pop(call.wire_id, None)
+        latency = now - call.sent_at
+
+        if status == ReducerStatus.SUCCESS:
+            self._committed += 1
+            self._commit_latencies.append(latency)
+        elif status == ReducerStatus.TIMEOUT:
+            self._timeouts += 1
+        else:
+            self._failed += 1
+
+        outcome = ReducerOutcome(
+            request_id=request_id,
+            reducer_name=call.reducer_name,
+            status=status,
+            error=error,
+            commit_latency=latency if status == ReducerStatus.SUCCESS else None,
+            energy_used=energy_used,
+            execution_duration=execution_duration
+        )
+        if not call.future.done():
+            call.future.set_result(outcome)
+
+        self._history[request_id] = outcome
+        self._history.move_to_end(request_id)
+        while len(self._history) > self.history_size:
+            self._history.popitem(last=False)
+        return outcome
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """
+        Time out pending calls older than the timeout.
+
+        Args:
+            now: Current monotonic time (uses time.monotonic() if None)
+
+        Returns:
+            Number of calls timed out
+        """
+        now = time.monotonic() if now is None else now
+        expired = 0
+        while self._pending:
+            request_id, call = next(iter(self._pending.items()))
+            if now - call.sent_at < self.timeout:
+                break
+            logger.debug(f"Reducer '{call.reducer_name}' request {request_id} timed out")
+            self._settle(request_id, ReducerStatus.TIMEOUT, "Timed out waiting for TransactionUpdate", now)
+            expired += 1
+        return expired
+
+    async def wait_for(self, request_id: str, timeout: Optional[float] = None) -> ReducerOutcome:
+        """
+        Wait for a call's outcome.
+
+        Args:
+            request_id: Request id passed to register()
+            timeout: Seconds to wait (uses the tracker timeout if None)
+
+        Returns:
+            The call's outcome (TIMEOUT if none arrived in time)
+
+        Raises:
+            KeyError: If the request id is neither pending nor recently settled
+        """
+        call = self._pending.get(request_id)
+        if call is None:
+            return self._history[request_id]
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(call.future), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            if request_id in self._pending:
+                return self._settle(request_id, ReducerStatus.TIMEOUT,
+                                    "Timed out waiting for TransactionUpdate", time.monotonic())
+            return call.future.result()
+
+    def cancel(self, request_id: str) -> bool:
+        """Stop tracking a pending call, resolving it as failed."""
+        if request_id not in self._pending:
+            return False
+        self._settle(request_id, ReducerStatus.FAILED, "Cancelled", time.monotonic())
+        return True
+
+    def get_status(self, request_id: str) -> Optional[ReducerStatus]:
+        """Get the status of a pending or recently settled call."""
+        if request_id in self._pending:
+            return ReducerStatus.PENDING
+        outcome = self._history.get(request_id)
+        return outcome.status if outcome else None
+
+    def pending_ids(self) -> List[str]:
+        """Get the request ids still awaiting an outcome."""
+        return list(self._pending.keys())
+
+    def clear(self) -> None:
+        """Time out every pending call (e.g. after a disconnect)."""
+        now = time.monotonic()
+        for request_id in list(self._pending.keys()):
+            self._settle(request_id, ReducerStatus.TIMEOUT, "Connection closed", now)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get reducer outcome statistics."""
+        latencies = sorted(self._commit_latencies)
+        return {
+            'pending': len(self._pending),
+            'registered': self._registered,
+            'committed': self._committed,
+            'failed': self._failed,
+            'timeouts': self._timeouts,
+            'evicted': self._evicted,
+            'unmatched_updates': self._unmatched,
+            'commit_latency_p50': sorted_percentile(latencies, 50),
+            'commit_latency_p90': sorted_percentile(latencies, 90),
+            'commit_latency_p99': sorted_percentile(latencies, 99)
+        }
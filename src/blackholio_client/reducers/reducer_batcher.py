@@ -0,0 +1,214 @@
+"""
+Reducer Batcher - Micro-Batched Reducer Sends
+
+Collects fire-and-forget reducer calls for a short window and sends them
+as one batch. A batch is flushed when it reaches its size limit or when
+its window expires, whichever comes first. Within a batch, calls to
+latest-wins reducers (such as player input) replace earlier calls to the
+same reducer, so only the newest one becomes a frame.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Tuple, Callable, Awaitable, FrozenSet
+
+
+logger = logging.getLogger(__name__)
+
+ReducerCall = Tuple[str, Dict[str, Any]]
+
+
+@dataclass
+class BatchingConfig:
+    """Reducer batching configuration."""
+    max_batch_size: int = 32  # Flush as soon as this many frames are queued
+    max_delay: float = 0.005  # Flush at most this many seconds after the first queued call
+    coalesce_reducers: FrozenSet[str] = field(
+        default_factory=lambda: frozenset({'update_player_input'})
+    )  # Latest-wins reducers: a newer call replaces a queued one
+
+    def validate(self) -> None:
+        """Validate configuration parameters."""
+        if self.max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        if self.max_delay < 0:
+            raise ValueError("max_delay must be >= 0")
+
+
+@dataclass
+class _BatchEntry:
+    """A queued reducer call and the futures waiting on it."""
+    reducer_name: str
+    args: Dict[str, Any]
+    futures: List[asyncio.Future]
+    superseded: bool = False
+
+
+class ReducerBatcher:
+    """
+    Micro-batching window for outgoing reducer calls.
+
+    ``submit()`` queues a call and returns a future that resolves once the
+    batch containing it has been written. Batches are sent in submission
+    order, one at a time.
+    """
+
+    def __init__(self, send_batch: Callable[[List[ReducerCall]], Awaitable[Any]],
+                 config: Optional[BatchingConfig] = None):
+        """
+        Initialize reducer batcher.
+
+        Args:
+            send_batch: Coroutine function that sends a list of (reducer_name, args)
+            config: Batching configuration (uses defaults if None)
+        """
+        self.config = config or BatchingConfig()
+        self.config.validate()
+        self._send_batch = send_batch
+
+        self._entries: List[_BatchEntry] = []
+        self._latest: Dict[str, _BatchEntry] = {}
+        self._frames_queued = 0
+        self._timer: Optional[asyncio.Task] = None
+        self._flush_tasks: set = set()
+        self._send_lock = asyncio.Lock()
+
+        # Statistics
+        self._calls = 0
+        self._frames_sent = 0
+        self._frames_saved = 0
+        self._batches = 0
+        self._size_flushes = 0
+        self._time_flushes = 0
+        self._failed_calls = 0
+
+    def submit(self, reducer_name: str, args: Dict[str, Any]) -> asyncio.Future:
+        """
+        Queue a reducer call for the current batch.
+
+        Args:
+            reducer_name: Name of the reducer to call
+            args: Arguments for the reducer
+
+        Returns:
+            Future resolving to True once the call's batch has been sent
+        """
+        future = asyncio.get_event_loop().create_future()
+        self._calls += 1
+
+        futures = [future]
+        previous = self._latest.get(reducer_name) if reducer_name in self.config.coalesce_reducers else None
+        if previous is not None:
+            # Latest wins: the queued call is dropped and sent as this one
+            previous.superseded = True
+            futures = previous.futures + futures
+            self._frames_queued -= 1
+            self._frames_saved += 1
+
+        entry = _BatchEntry(reducer_name, args, futures)
+        self._entries.append(entry)
+        if reducer_name in self.config.coalesce_reducers:
+            self._latest[reducer_name] = entry
+        self._frames_queued += 1
+
+        if self._frames_queued >= self.config.max_batch_size:
+            self._size_flushes += 1
+            self._schedule_flush()
+        elif self._timer is None:
+            self._timer = asyncio.ensure_future(self._flush_after_delay())
+        return future
+
+    def _schedule_flush(self) -> None:
+        """Flush the current batch from a background task."""
+        self._cancel_timer()
+        task = asyncio.ensure_future(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    def _cancel_timer(self) -> None:
+        """Stop the pending time-based flush."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    async def _flush_after_delay(self) -> None:
+        """Flush the batch once its window expires."""
+        await asyncio.sleep(self.config.max_delay)
+        self._timer = None
+        if self._entries:
+            self._time_flushes += 1
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Send everything queued so far.
+
+        Returns:
+            Number of frames sent
+        """
+        entries, self._entries = self._entries, []
+        self._latest = {}
+        self._frames_queued = 0
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._cancel_timer()
+
+        entries = [entry for entry in entries if not entry.superseded]
+        if not entries:
+            return 0
+
+        async with self._send_lock:
+            try:
+                await self._send_batch([(entry.reducer_name, entry.args) for entry in entries])
+            except Exception as e:
+                logger.warning(f"Reducer batch of {len(entries)} failed: {e}")
+                for entry in entries:
+                    self._failed_calls += len(entry.futures)
+                    for future in entry.futures:
+                        if not future.done():
+                            future.set_exception(e)
+                return 0
+
+        self._batches += 1
+        self._frames_sent += len(entries)
+        for entry in entries:
+            for future in entry.futures:
+                if not future.done():
+                    future.set_result(True)
+        return len(entries)
+
+    async def close(self, flush: bool = True) -> None:
+        """
+        Stop the batcher.
+
+        Args:
+            flush: Send queued calls first (otherwise they are cancelled)
+        """
+        self._cancel_timer()
+        if flush:
+            await self.flush()
+        else:
+            for entry in self._entries:
+                for future in entry.futures:
+                    future.cancel()
+            self._entries = []
+            self._latest = {}
+            self._frames_queued = 0
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get reducer batching statistics."""
+        return {
+            'max_batch_size': self.config.max_batch_size,
+            'max_delay': self.config.max_delay,
+            'calls': self._calls,
+            'queued': self._frames_queued,
+            'batches': self._batches,
+            'frames_sent': self._frames_sent,
+            'frames_saved': self._frames_saved,
+            'size_flushes': self._size_flushes,
+            'time_flushes': self._time_flushes,
+            'failed_calls': self._failed_calls,
+            'average_batch_size': self._frames_sent / self._batches if self._batches else 0.0
+        }
@@ -7,13 +7,18 @@ proper error handling, response validation, and type safety.
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List, Union, Callable, Type
+import time
+from collections import deque
+from typing import Dict, Any, Optional, List, Union, Callable, Type, Deque, Iterable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 from .action_formatter import ActionFormatter, GameActionFormatter, Action, ActionType
+from .reducer_batcher import ReducerBatcher, BatchingConfig
 from ..connection.spacetimedb_connection import SpacetimeDBConnection
+from ..config.environment import get_environment_config
 from ..models.game_entities import Vector2, GameEntity, GamePlayer, GameCircle
+from ..utils.debugging import sorted_percentile
 from ..exceptions.connection_errors import (
     SpacetimeDBError,
     DataValidationError,
@@ -87,7 +92,9 @@ class ReducerClient:
     def __init__(self, connection: SpacetimeDBConnection, 
                  default_timeout: float = 30.0,
                  auto_retry: bool = True,
-                 max_retries: int = 3):
+                 max_retries: int = 3,
+                 max_in_flight: int = 64,
+                 validate_actions: Optional[bool] = None):
         """
         Initialize reducer client.
         
@@ -96,11 +103,20 @@ class ReducerClient:
             default_timeout: Default timeout for reducer calls
             auto_retry: Enable automatic retries on failure
             max_retries: Maximum number of retry attempts
+            max_in_flight: Maximum pipelined calls awaiting a response at once
+            validate_actions: Validate every formatted action (defaults to on in debug mode only)
         """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        
         self.connection = connection
         self.default_timeout = default_timeout
         self.auto_retry = auto_retry
         self.max_retries = max_retries
+        self.max_in_flight = max_in_flight
+        if validate_actions is None:
+            validate_actions = get_environment_config().is_development_mode()
+        self.validate_actions = validate_actions
         
         # Formatters
         self.action_formatter = ActionFormatter()
@@ -109,10 +125,22 @@ class ReducerClient:
         # Response handlers
         self._response_handlers: Dict[str, Callable] = {}
         
+        # Pipelined calls waiting for a slot in the in-flight window
+        self._pipeline_queue: Deque[Tuple[str, Dict[str, Any], Optional[float], asyncio.Future]] = deque()
+        self._in_flight = 0
+        self._max_in_flight_seen = 0
+        self._pipeline_tasks: set = set()
+        
+        # Fire-and-forget sends (micro-batched once batching is enabled)
+        self._batcher: Optional[ReducerBatcher] = None
+        
         # Statistics
         self._calls_made = 0
         self._calls_successful = 0
         self._calls_failed = 0
+        self._pipelined_calls = 0
+        self._latencies: Deque[float] = deque(maxlen=1024)
+        self._completion_times: Deque[float] = deque(maxlen=1024)
         
         logger.info("Reducer client initialized")
     
@@ -126,7 +154,34 @@ class ReducerClient:
             reducer_name: Name of the reducer to call
             args: Arguments for the reducer
             timeout: Call timeout (uses default if None)
-            retry_count: Current retry attempt (internal use)
+            retry_count: Retry attempts already used
+            
+        Returns:
+            ReducerResult with response data or error
+        """
+        while True:
+            result = await self._call_once(reducer_name, args, timeout)
+            
+            # Retry if enabled and retries remaining
+            if (result.is_success or not self.auto_retry or
+                    retry_count >= self.max_retries or
+                    not self._should_retry_error(result)):
+                return result
+            
+            retry_delay = min(2.0 ** retry_count, 10.0)  # Exponential backoff
+            logger.info(f"Retrying reducer {reducer_name} in {retry_delay}s (attempt {retry_count + 1})")
+            await asyncio.sleep(retry_delay)
+            retry_count += 1
+    
+    async def _call_once(self, reducer_name: str, args: Dict[str, Any],
+                         timeout: Optional[float] = None) -> ReducerResult:
+        """
+        Make a single reducer call attempt.
+        
+        Args:
+            reducer_name: Name of the reducer to call
+            args: Arguments for the reducer
+            timeout: Call timeout (uses default if None)
             
         Returns:
             ReducerResult with response data or error
@@ -142,8 +197,9 @@ class ReducerClient:
                 reducer_name, args
             )
             
-            # Validate action
-            self.action_formatter.validate_action(action_message['action'])
+            # Validate action (debug mode only; the formatter builds valid actions)
+            if self.validate_actions:
+                self.action_formatter.validate_action(action_message['action'])
             
             # Send request
             logger.debug(f"Calling reducer: {reducer_name} with args: {args}")
@@ -163,23 +219,10 @@ class ReducerClient:
             else:
                 self._calls_failed += 1
                 logger.warning(f"Reducer {reducer_name} failed: {result.get_error_message()}")
-                
-                # Retry if enabled and retries remaining
-                if (self.auto_retry and 
-                    retry_count < self.max_retries and 
-                    self._should_retry_error(result)):
-                    
-                    retry_delay = min(2.0 ** retry_count, 10.0)  # Exponential backoff
-                    logger.info(f"Retrying reducer {reducer_name} in {retry_delay}s (attempt {retry_count + 1})")
-                    
-                    await asyncio.sleep(retry_delay)
-                    return await self.call_reducer(reducer_name, args, timeout, retry_count + 1)
-            
-            return result
             
         except BlackholioTimeoutError as e:
             self._calls_failed += 1
-            return ReducerResult(
+            result = ReducerResult(
                 status=ReducerStatus.TIMEOUT,
                 error=str(e),
                 error_code="TIMEOUT",
@@ -189,12 +232,135 @@ class ReducerClient:
         except Exception as e:
             self._calls_failed += 1
             logger.error(f"Reducer call failed: {e}")
-            return ReducerResult(
+            result = ReducerResult(
                 status=ReducerStatus.FAILED,
                 error=str(e),
                 error_code="CALL_FAILED",
                 execution_time=asyncio.get_event_loop().time() - start_time
             )
+        
+        if result.execution_time is not None:
+            self._latencies.append(result.execution_time)
+        self._completion_times.append(time.monotonic())
+        return result
+    
+    def submit(self, reducer_name: str, args: Dict[str, Any],
+               timeout: Optional[float] = None) -> asyncio.Future:
+        """
+        Queue a pipelined reducer call without waiting for its response.
+        
+        Calls are sent in submission order with at most ``max_in_flight``
+        awaiting a response, so calls to the same reducer always reach the
+        server in the order they were submitted. Pipelined calls are not
+        retried automatically, since a retry would overtake later calls.
+        
+        Args:
+            reducer_name: Name of the reducer to call
+            args: Arguments for the reducer
+            timeout: Call timeout (uses default if None)
+            
+        Returns:
+            Future resolving to the call's ReducerResult
+        """
+        future = asyncio.get_event_loop().create_future()
+        self._pipeline_queue.append((reducer_name, args, timeout, future))
+        self._pipelined_calls += 1
+        self._dispatch_pipeline()
+        return future
+    
+    async def call_many(self, calls: Iterable[Tuple[str, Dict[str, Any]]],
+                        timeout: Optional[float] = None) -> List[ReducerResult]:
+        """
+        Pipeline a batch of reducer calls and wait for all of them.
+        
+        Args:
+            calls: (reducer_name, args) pairs
+            timeout: Per-call timeout (uses default if None)
+            
+        Returns:
+            Results in the same order as the calls
+        """
+        futures = [self.submit(reducer_name, args, timeout) for reducer_name, args in calls]
+        return list(await asyncio.gather(*futures))
+    
+    def _dispatch_pipeline(self):
+        """Start queued calls, in order, while the in-flight window has room."""
+        while self._pipeline_queue and self._in_flight < self.max_in_flight:
+            reducer_name, args, timeout, future = self._pipeline_queue.popleft()
+            if future.done():
+                continue
+            
+            self._in_flight += 1
+            self._max_in_flight_seen = max(self._max_in_flight_seen, self._in_flight)
+            task = asyncio.ensure_future(self._run_pipelined(reducer_name, args, timeout, future))
+            self._pipeline_tasks.add(task)
+            task.add_done_callback(self._pipeline_tasks.discard)
+    
+    async def _run_pipelined(self, reducer_name: str, args: Dict[str, Any],
+                             timeout: Optional[float], future: asyncio.Future):
+        """Run one pipelined call and resolve its future."""
+        try:
+            result = await self._call_once(reducer_name, args, timeout)
+            if not future.done():
+                future.set_result(result)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            self._in_flight -= 1
+            self._dispatch_pipeline()
+    
+    def enable_batching(self, config: Optional[BatchingConfig] = None) -> ReducerBatcher:
+        """
+        Coalesce send() calls into micro-batches.
+        
+        Args:
+            config: Batching configuration (uses defaults if None)
+            
+        Returns:
+            The active ReducerBatcher
+        """
+        self._batcher = ReducerBatcher(self.connection.send_reducer_batch, config)
+        return self._batcher
+    
+    async def disable_batching(self) -> None:
+        """Flush queued sends and go back to one write per send()."""
+        batcher = self._batcher
+        self._batcher = None
+        if batcher:
+            await batcher.close()
+    
+    def send(self, reducer_name: str, args: Dict[str, Any]) -> asyncio.Future:
+        """
+        Send a reducer call without waiting for a response.
+        
+        With batching enabled the call joins the current micro-batch;
+        otherwise it is written on its own.
+        
+        Args:
+            reducer_name: Name of the reducer to call
+            args: Arguments for the reducer
+            
+        Returns:
+            Future resolving to True once the call has been written
+        """
+        if self._batcher:
+            return self._batcher.submit(reducer_name, args)
+        
+        async def send_one() -> bool:
+            await self.connection.send_reducer_batch([(reducer_name, args)])
+            return True
+        
+        return asyncio.ensure_future(send_one())
+    
+    async def flush(self) -> int:
+        """
+        Send the current micro-batch now.
+        
+        Returns:
+            Number of frames sent
+        """
+        return await self._batcher.flush() if self._batcher else 0
     
     async def call_reducer_safe(self, reducer_name: str, args: Dict[str, Any], 
                                timeout: Optional[float] = None) -> Optional[Any]:
@@ -294,12 +460,26 @@ class ReducerClient:
         total_calls = self._calls_made
         success_rate = (self._calls_successful / total_calls * 100) if total_calls > 0 else 0
         
+        latencies = sorted(self._latencies)
+        completions = self._completion_times
+        window = completions[-1] - completions[0] if len(completions) > 1 else 0.0
+        
         return {
             'total_calls': total_calls,
             'successful_calls': self._calls_successful,
             'failed_calls': self._calls_failed,
             'success_rate': success_rate,
-            'connection_state': self.connection.state.value if self.connection else None
+            'connection_state': self.connection.state.value if self.connection else None,
+            'pipelined_calls': self._pipelined_calls,
+            'in_flight': self._in_flight,
+            'queued': len(self._pipeline_queue),
+            'max_in_flight': self.max_in_flight,
+            'max_in_flight_seen': self._max_in_flight_seen,
+            'throughput_per_second': (len(completions) - 1) / window if window > 0 else 0.0,
+            'latency_p50': sorted_percentile(latencies, 50),
+            'latency_p90': sorted_percentile(latencies, 90),
+            'latency_p99': sorted_percentile(latencies, 99),
+            'batching': self._batcher.get_statistics() if self._batcher else {'enabled': False}
         }
 
 
@@ -28,10 +28,13 @@ from .logging_config import (
     LoggingConfig,
     ColoredFormatter,
     JsonFormatter,
+    RateLimitFilter,
+    BoundedQueueHandler,
     PerformanceLogger,
     StructuredLogger,
     setup_logging,
     get_logger,
+    shutdown_logging,
     log_performance,
     enable_debug_logging,
     enable_production_logging,
@@ -82,12 +85,16 @@ from .debugging import (
     ErrorReport,
     DebugCapture,
     PerformanceProfiler,
+    LatencyHistogram,
+    sorted_percentile,
+    SpanProfiler,
     ErrorReporter,
     DiagnosticCollector,
     debug_context,
     debug_function,
     get_error_reporter,
     get_diagnostic_collector,
+    get_span_profiler,
     capture_exception,
     generate_diagnostics
 )
@@ -121,10 +128,13 @@ __all__ = [
     "LoggingConfig",
     "ColoredFormatter",
     "JsonFormatter",
+    "RateLimitFilter",
+    "BoundedQueueHandler",
     "PerformanceLogger",
     "StructuredLogger",
     "setup_logging",
     "get_logger",
+    "shutdown_logging",
     "log_performance",
     "enable_debug_logging",
     "enable_production_logging",
@@ -172,12 +182,16 @@ __all__ = [
     "ErrorReport",
     "DebugCapture",
     "PerformanceProfiler",
+    "LatencyHistogram",
+    "sorted_percentile",
+    "SpanProfiler",
     "ErrorReporter",
     "DiagnosticCollector",
     "debug_context",
     "debug_function",
     "get_error_reporter",
     "get_diagnostic_collector",
+    "get_span_profiler",
     "capture_exception",
     "generate_diagnostics",
     
@@ -412,6 +412,10 @@ class MessageConverter:
     def _convert_to_entity(self, data: Dict[str, Any]) -> Optional[GameEntity]:
         """Convert data to appropriate entity type."""
         try:
+            # Protocol handlers already emit model objects
+            if isinstance(data, GameEntity):
+                return data
+            
             # Determine entity type
             entity_type = data.get('entity_type', 'unknown')
             
@@ -16,7 +16,7 @@ import traceback
 from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable, Union, TextIO
+from typing import Any, Dict, List, Optional, Callable, Union, TextIO, Tuple
 from datetime import datetime
 import threading
 import asyncio
@@ -276,6 +276,309 @@ class PerformanceProfiler:
         self.stop()
 
 
+def sorted_percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """
+    Get a percentile of an already sorted list.
+    
+    Picks the value at the rounded linear index ``pct / 100 * (n - 1)``,
+    without interpolating between neighbours.
+    
+    Args:
+        sorted_values: Values in ascending order
+        pct: Percentile between 0 and 100
+        
+    Returns:
+        The percentile value, or None for an empty list
+    """
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the style of HdrHistogram.
+    
+    Each power of two is split into ``2 ** precision_bits`` sub-buckets, so
+    a recorded value is reported within about 3% (at the default 5 bits)
+    whatever its magnitude, using a small, bounded number of buckets.
+    Values are recorded in nanoseconds.
+    """
+    
+    def __init__(self, precision_bits: int = 5):
+        """
+        Initialize latency histogram.
+        
+        Args:
+            precision_bits: Sub-bucket bits per power of two
+        """
+        if not 1 <= precision_bits <= 10:
+            raise ValueError("precision_bits must be between 1 and 10")
+        self.precision_bits = precision_bits
+        self._sub_buckets = 1 << precision_bits
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+    
+    def bucket_index(self, value: int) -> int:
+        """Get the bucket a value falls into."""
+        if value < 2 * self._sub_buckets:
+            return max(value, 0)
+        shift = value.bit_length() - self.precision_bits - 1
+        return shift * self._sub_buckets + (value >> shift)
+    
+    def bucket_bounds(self, index: int) -> Tuple[int, int]:
+        """Get the (lowest, highest) value a bucket holds."""
+        if index < 2 * self._sub_buckets:
+            return index, index
+        shift = index // self._sub_buckets - 1
+        mantissa = index - shift * self._sub_buckets
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+    
+    def record(self, value: int) -> None:
+        """
+        Record a value.
+        
+        Args:
+            value: Latency in nanoseconds
+        """
+        index = self.bucket_index(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+    
+    def percentile(self, percentile: float) -> int:
+        """
+        Get a percentile (highest value equivalent to the matching bucket).
+        
+        Args:
+            percentile: Percentile between 0 and 100
+            
+        Returns:
+            Latency in nanoseconds (0 if empty)
+        """
+        if not self.count:
+            return 0
+        target = max(1, int(percentile / 100.0 * self.count + 0.5))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self.bucket_bounds(index)[1], self.max)
+        return self.max
+    
+    def get_buckets(self) -> List[Tuple[int, int]]:
+        """Get non-empty buckets as (highest value in ns, count), in order."""
+        return [(self.bucket_bounds(index)[1], self._counts[index]) for index in sorted(self._counts)]
+    
+    def to_dict(self, include_buckets: bool = False) -> Dict[str, Any]:
+        """Convert histogram to dictionary (latencies in milliseconds)."""
+        data = {
+            'count': self.count,
+            'min_ms': (self.min or 0) / 1e6,
+            'max_ms': (self.max or 0) / 1e6,
+            'mean_ms': self.total / self.count / 1e6 if self.count else 0.0,
+            'p50_ms': self.percentile(50) / 1e6,
+            'p90_ms': self.percentile(90) / 1e6,
+            'p99_ms': self.percentile(99) / 1e6,
+            'p999_ms': self.percentile(99.9) / 1e6
+        }
+        if include_buckets:
+            data['buckets'] = [(upper / 1e6, count) for upper, count in self.get_buckets()]
+        return data
+
+
+class _NullSpan:
+    """Span returned for calls that are not sampled."""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Timed span that records its duration on exit."""
+    
+    __slots__ = ('_profiler', '_name', '_start')
+    
+    def __init__(self, profiler: 'SpanProfiler', name: str):
+        self._profiler = profiler
+        self._name = name
+        self._start = 0
+    
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._profiler.record(self._name, time.perf_counter_ns() - self._start)
+        return False
+
+
+class SpanProfiler:
+    """
+    Sampled span profiler for client hot paths.
+    
+    Every call of a span is counted, but only every ``1 / sample_rate``-th
+    call per span is timed into that span's LatencyHistogram, so the
+    profiler can stay on in production. Hot paths use ``start()``/``stop()``,
+    which skip the context manager protocol for calls that are not sampled.
+    Calls that raise are timed too.
+    
+    Example:
+        started = profiler.start('frame_decode')
+        try:
+            data = decode(frame)
+        finally:
+            profiler.stop('frame_decode', started)
+        
+        with profiler.span('reducer_send'):
+            await send(frame)
+    """
+    
+    def __init__(self, sample_rate: float = 0.01, enabled: bool = True, precision_bits: int = 5):
+        """
+        Initialize span profiler.
+        
+        Args:
+            sample_rate: Fraction of calls timed per span (0 < rate <= 1)
+            enabled: Whether spans are counted and sampled at all
+            precision_bits: Histogram sub-bucket bits per power of two
+        """
+        self.enabled = enabled
+        self.precision_bits = precision_bits
+        self._interval = 1
+        self.set_sample_rate(sample_rate)
+        
+        self._calls: Dict[str, int] = {}
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def sample_rate(self) -> float:
+        """Fraction of calls that are timed."""
+        return 1.0 / self._interval
+    
+    def set_sample_rate(self, sample_rate: float) -> None:
+        """
+        Change the sampling rate.
+        
+        Args:
+            sample_rate: Fraction of calls timed per span (0 < rate <= 1)
+        """
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1]")
+        self._interval = max(1, int(round(1.0 / sample_rate)))
+    
+    def start(self, name: str) -> int:
+        """
+        Count a call of a span and start timing it if it is sampled.
+        
+        Args:
+            name: Span name
+            
+        Returns:
+            Start time in perf_counter nanoseconds, or 0 if not sampled
+        """
+        if not self.enabled:
+            return 0
+        calls = self._calls
+        count = calls.get(name, 0) + 1
+        calls[name] = count
+        if count % self._interval:
+            return 0
+        return time.perf_counter_ns()
+    
+    def stop(self, name: str, started: int) -> None:
+        """
+        Finish a call started with start().
+        
+        Args:
+            name: Span name
+            started: Value returned by start()
+        """
+        if started:
+            self.record(name, time.perf_counter_ns() - started)
+    
+    def span(self, name: str):
+        """
+        Get a context manager timing one call of a span (if sampled).
+        
+        Args:
+            name: Span name
+            
+        Returns:
+            Context manager
+        """
+        if not self.start(name):
+            return _NULL_SPAN
+        return _Span(self, name)
+    
+    def record(self, name: str, duration_ns: int) -> None:
+        """
+        Record a span duration directly.
+        
+        Args:
+            name: Span name
+            duration_ns: Duration in nanoseconds
+        """
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram(self.precision_bits)
+            histogram.record(duration_ns)
+    
+    def get_histogram(self, name: str) -> Optional[LatencyHistogram]:
+        """Get the histogram of a span, if it has been sampled."""
+        return self._histograms.get(name)
+    
+    def reset(self) -> None:
+        """Drop all recorded spans."""
+        with self._lock:
+            self._calls.clear()
+            self._histograms.clear()
+    
+    def get_statistics(self, include_buckets: bool = False) -> Dict[str, Any]:
+        """
+        Get per-span latency statistics.
+        
+        Args:
+            include_buckets: Include the non-empty histogram buckets
+            
+        Returns:
+            Dictionary with call counts and latency percentiles per span
+        """
+        with self._lock:
+            spans = {}
+            for name, calls in list(self._calls.items()):
+                histogram = self._histograms.get(name)
+                span_stats = {'calls': calls}
+                span_stats.update(histogram.to_dict(include_buckets) if histogram
+                                  else LatencyHistogram(self.precision_bits).to_dict(include_buckets))
+                span_stats['sampled'] = span_stats.pop('count')
+                spans[name] = span_stats
+        
+        return {
+            'enabled': self.enabled,
+            'sample_rate': self.sample_rate,
+            'spans': spans
+        }
+
+
 class ErrorReporter:
     """
     Comprehensive error reporter for debugging and monitoring.
@@ -768,6 +1071,8 @@ def debug_function(capture_args: bool = True,
 # Global instances
 _global_error_reporter: Optional[ErrorReporter] = None
 _global_diagnostic_collector: Optional[DiagnosticCollector] = None
+_global_span_profiler: Optional[SpanProfiler] = None
+_span_profiler_lock = threading.Lock()
 
 
 def get_error_reporter() -> ErrorReporter:
@@ -786,6 +1091,26 @@ def get_diagnostic_collector() -> DiagnosticCollector:
     return _global_diagnostic_collector
 
 
+def get_span_profiler() -> SpanProfiler:
+    """
+    Get global span profiler instance.
+    
+    Sampling defaults to 1% and can be set with BLACKHOLIO_PROFILER_SAMPLE_RATE
+    (0 disables the profiler).
+    """
+    global _global_span_profiler
+    if _global_span_profiler is None:
+        with _span_profiler_lock:
+            if _global_span_profiler is None:
+                try:
+                    sample_rate = float(os.environ.get('BLACKHOLIO_PROFILER_SAMPLE_RATE', '0.01'))
+                except ValueError:
+                    sample_rate = 0.01
+                enabled = 0 < sample_rate <= 1
+                _global_span_profiler = SpanProfiler(sample_rate if enabled else 0.01, enabled=enabled)
+    return _global_span_profiler
+
+
 # Convenience functions
 def capture_exception(exception: Exception, **kwargs) -> ErrorReport:
     """Capture exception with error report."""
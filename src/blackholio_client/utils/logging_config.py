@@ -6,10 +6,14 @@ handlers, and filtering for the blackholio client with proper log rotation
 and performance considerations.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import re
 import sys
+import threading
 import time
 import functools
 from pathlib import Path
@@ -28,11 +32,26 @@ class LogLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
+# Standard LogRecord attributes (everything else on a record is an extra field)
+_RECORD_ATTRIBUTES = frozenset([
+    'name', 'msg', 'args', 'levelname', 'levelno',
+    'pathname', 'filename', 'module', 'lineno',
+    'funcName', 'created', 'msecs', 'relativeCreated',
+    'thread', 'threadName', 'processName', 'process', 'taskName',
+    'getMessage', 'exc_info', 'exc_text', 'stack_info', 'message', 'asctime'
+])
+
+# Set on records by RateLimitFilter; not an extra field
+_RATE_LIMITED_ATTRIBUTE = '_rate_limited'
+
+
 class JsonFormatter(logging.Formatter):
     """
     JSON formatter for structured logging.
     
     Outputs log records as JSON objects for easy parsing and analysis.
+    The record is serialized in a single ``json.dumps`` call; values that
+    are not JSON-serializable are written as their ``str()``.
     """
     
     def __init__(self, include_extra: bool = True):
@@ -65,19 +84,23 @@ class JsonFormatter(logging.Formatter):
         # Add extra fields if enabled
         if self.include_extra:
             for key, value in record.__dict__.items():
-                if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 
-                              'pathname', 'filename', 'module', 'lineno', 
-                              'funcName', 'created', 'msecs', 'relativeCreated',
-                              'thread', 'threadName', 'processName', 'process',
-                              'getMessage', 'exc_info', 'exc_text', 'stack_info']:
-                    try:
-                        # Only include JSON-serializable values
-                        json.dumps(value)
-                        log_data[key] = value
-                    except (TypeError, ValueError):
-                        log_data[key] = str(value)
+                if key not in _RECORD_ATTRIBUTES and key != _RATE_LIMITED_ATTRIBUTE:
+                    log_data[key] = value
         
-        return json.dumps(log_data)
+        try:
+            return json.dumps(log_data, default=str)
+        except (TypeError, ValueError):
+            # Non-string keys or circular references: fall back field by field
+            return json.dumps({key: self._safe_value(value) for key, value in log_data.items()})
+    
+    @staticmethod
+    def _safe_value(value: Any) -> Any:
+        """Return the value if it serializes on its own, otherwise its str()."""
+        try:
+            json.dumps(value, default=str)
+            return value
+        except (TypeError, ValueError):
+            return str(value)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -185,7 +208,9 @@ class SensitiveDataFilter(logging.Filter):
     Filter to remove sensitive data from logs.
     
     Prevents passwords, tokens, and other sensitive information
-    from being logged in production environments.
+    from being logged in production environments. All patterns are
+    matched by one precompiled regex, and text that contains none of
+    the keywords is returned without running it.
     """
     
     SENSITIVE_PATTERNS = [
@@ -205,6 +230,20 @@ class SensitiveDataFilter(logging.Filter):
         """
         super().__init__()
         self.mask_value = mask_value
+        
+        patterns = sorted(set(pattern.lower() for pattern in self.SENSITIVE_PATTERNS), key=len, reverse=True)
+        alternation = '|'.join(re.escape(pattern) for pattern in patterns)
+        # Match key=value or key: value patterns
+        self._regex = re.compile(
+            rf'((?:{alternation})["\']?\s*[:=]\s*["\']?)([^,\s}}\]]+)',
+            re.IGNORECASE
+        )
+        self._replacement = r'\g<1>' + mask_value.replace('\\', r'\\')
+        # Keywords for the pre-check; patterns containing another pattern are redundant
+        self._keywords = tuple(
+            pattern for pattern in patterns
+            if not any(other != pattern and other in pattern for other in patterns)
+        )
     
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter sensitive data from log records."""
@@ -215,7 +254,7 @@ class SensitiveDataFilter(logging.Filter):
         # Check args
         if record.args:
             record.args = tuple(
-                self._mask_sensitive_data(str(arg)) if isinstance(arg, str) else arg
+                self._mask_sensitive_data(arg) if isinstance(arg, str) else arg
                 for arg in record.args
             )
         
@@ -223,17 +262,173 @@ class SensitiveDataFilter(logging.Filter):
     
     def _mask_sensitive_data(self, text: str) -> str:
         """Mask sensitive data in text."""
-        import re
-        
-        # Simple pattern matching for common sensitive fields
-        for pattern in self.SENSITIVE_PATTERNS:
-            # Match key=value or key: value patterns
-            regex = rf'({pattern}["\']?\s*[:=]\s*["\']?)([^,\s}}\]]+)'
-            text = re.sub(regex, rf'\1{self.mask_value}', text, flags=re.IGNORECASE)
+        if ':' not in text and '=' not in text:
+            return text
         
+        lowered = text.lower()
+        for keyword in self._keywords:
+            if keyword in lowered:
+                return self._regex.sub(self._replacement, text)
         return text
 
 
+class RateLimitFilter(logging.Filter):
+    """
+    Per-logger rate limiting for hot-path log messages.
+    
+    Each logger gets a token bucket; records below ``exempt_level`` are
+    dropped once its bucket is empty. The next record that gets through
+    carries a ``suppressed`` field with the number of records dropped
+    before it. Limits can be set per logger name prefix.
+    """
+    
+    def __init__(self,
+                 rate: Optional[float] = None,
+                 burst: Optional[int] = None,
+                 logger_rates: Optional[Dict[str, float]] = None,
+                 exempt_level: int = logging.WARNING):
+        """
+        Initialize rate limit filter.
+        
+        Args:
+            rate: Default records per second per logger (None for unlimited)
+            burst: Records allowed back-to-back (defaults to one second's worth)
+            logger_rates: Records per second by logger name prefix, overriding rate
+            exempt_level: Records at or above this level are never dropped
+        """
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.logger_rates = dict(logger_rates or {})
+        self.exempt_level = exempt_level
+        
+        self._lock = threading.Lock()
+        self._limits: Dict[str, Optional[float]] = {}
+        self._buckets: Dict[str, List[float]] = {}  # name -> [tokens, last refill]
+        self._pending_suppressed: Dict[str, int] = {}
+        self._suppressed: Dict[str, int] = {}
+        self._passed = 0
+    
+    def _limit_for(self, name: str) -> Optional[float]:
+        """Resolve the rate for a logger from the most specific matching prefix."""
+        if name not in self._limits:
+            limit = self.rate
+            best = -1
+            for prefix, prefix_rate in self.logger_rates.items():
+                if (name == prefix or name.startswith(prefix + '.')) and len(prefix) > best:
+                    limit, best = prefix_rate, len(prefix)
+            self._limits[name] = limit
+        return self._limits[name]
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Drop the record if its logger is over its rate."""
+        # One decision per record, even when the filter sits on several handlers
+        decision = record.__dict__.get(_RATE_LIMITED_ATTRIBUTE)
+        if decision is not None:
+            return not decision
+        
+        allowed = self._allow(record)
+        setattr(record, _RATE_LIMITED_ATTRIBUTE, not allowed)
+        return allowed
+    
+    def _allow(self, record: logging.LogRecord) -> bool:
+        """Take a token for the record's logger."""
+        if record.levelno >= self.exempt_level:
+            return True
+        
+        name = record.name
+        with self._lock:
+            limit = self._limit_for(name)
+            if limit is None:
+                return True
+            
+            burst = float(self.burst if self.burst is not None else max(1.0, limit))
+            now = time.monotonic()
+            bucket = self._buckets.get(name)
+            if bucket is None:
+                bucket = self._buckets[name] = [burst, now]
+            else:
+                bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * limit)
+                bucket[1] = now
+            
+            if bucket[0] < 1.0:
+                self._pending_suppressed[name] = self._pending_suppressed.get(name, 0) + 1
+                self._suppressed[name] = self._suppressed.get(name, 0) + 1
+                return False
+            
+            bucket[0] -= 1.0
+            self._passed += 1
+            suppressed = self._pending_suppressed.pop(name, 0)
+        
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get rate limiting statistics."""
+        with self._lock:
+            return {
+                'passed': self._passed,
+                'suppressed': sum(self._suppressed.values()),
+                'suppressed_by_logger': dict(self._suppressed)
+            }
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that never blocks the caller.
+    
+    Records go into a bounded queue drained by a QueueListener thread.
+    When the queue is full the record is dropped and counted instead of
+    stalling the event loop.
+    """
+    
+    def __init__(self, maxsize: int = 10000):
+        """
+        Initialize bounded queue handler.
+        
+        Args:
+            maxsize: Maximum records waiting to be written
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        super().__init__(queue.Queue(maxsize))
+        self.maxsize = maxsize
+        self._stats_lock = threading.Lock()
+        self._enqueued = 0
+        self._dropped = 0
+        self._dropped_by_level: Dict[str, int] = {}
+        self._high_water = 0
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._stats_lock:
+                self._dropped += 1
+                self._dropped_by_level[record.levelname] = self._dropped_by_level.get(record.levelname, 0) + 1
+            return
+        
+        with self._stats_lock:
+            self._enqueued += 1
+            size = self.queue.qsize()
+            if size > self._high_water:
+                self._high_water = size
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get queue statistics."""
+        with self._stats_lock:
+            return {
+                'capacity': self.maxsize,
+                'queued': self.queue.qsize(),
+                'high_water': self._high_water,
+                'enqueued': self._enqueued,
+                'dropped': self._dropped,
+                'dropped_by_level': dict(self._dropped_by_level)
+            }
+
+
 class LoggingConfig:
     """
     Centralized logging configuration for the blackholio client.
@@ -248,6 +443,10 @@ class LoggingConfig:
         self.formatters: Dict[str, logging.Formatter] = {}
         self.filters: Dict[str, logging.Filter] = {}
         self._configured = False
+        
+        # Async logging (records are written by a QueueListener thread)
+        self.queue_handler: Optional[BoundedQueueHandler] = None
+        self._queue_listener: Optional[logging.handlers.QueueListener] = None
     
     def setup_logging(self,
                      level: Union[str, int] = logging.INFO,
@@ -257,7 +456,11 @@ class LoggingConfig:
                      max_file_size: int = 10 * 1024 * 1024,  # 10MB
                      backup_count: int = 5,
                      performance_logging: bool = False,
-                     filter_sensitive: bool = True) -> Dict[str, Any]:
+                     filter_sensitive: bool = True,
+                     async_logging: bool = False,
+                     queue_size: int = 10000,
+                     rate_limit: Optional[float] = None,
+                     logger_rate_limits: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """
         Setup logging configuration.
         
@@ -270,6 +473,10 @@ class LoggingConfig:
             backup_count: Number of backup files to keep
             performance_logging: Whether to enable performance logging
             filter_sensitive: Whether to filter sensitive data
+            async_logging: Write records from a background thread instead of the caller
+            queue_size: Maximum records buffered in async mode (extra records are dropped)
+            rate_limit: Records per second allowed per logger below WARNING
+            logger_rate_limits: Records per second by logger name prefix
             
         Returns:
             Dictionary with configuration details
@@ -282,14 +489,25 @@ class LoggingConfig:
         self._create_formatters(format_type, json_logs)
         
         # Create filters
-        self._create_filters(performance_logging, filter_sensitive)
+        self._create_filters(performance_logging, filter_sensitive, rate_limit, logger_rate_limits)
+        
+        # Replace any previous async pipeline
+        self.stop_async_logging()
+        self.handlers.clear()
+        
+        # In async mode filters run once, before records are queued
+        handler_filters = not async_logging
         
         # Setup console handler
-        self._setup_console_handler(level, format_type)
+        self._setup_console_handler(level, format_type, handler_filters)
         
         # Setup file handler if requested
         if log_file:
-            self._setup_file_handler(log_file, level, json_logs, max_file_size, backup_count)
+            self._setup_file_handler(log_file, level, json_logs, max_file_size, backup_count, handler_filters)
+        
+        output_handlers = list(self.handlers.values())
+        if async_logging:
+            output_handlers = [self._start_async_logging(level, queue_size)]
         
         # Configure root logger
         root_logger = logging.getLogger()
@@ -303,7 +521,7 @@ class LoggingConfig:
         client_logger.handlers.clear()
         
         # Add handlers to client logger
-        for handler in self.handlers.values():
+        for handler in output_handlers:
             client_logger.addHandler(handler)
         
         # Prevent propagation to root logger
@@ -317,7 +535,9 @@ class LoggingConfig:
             'log_file': str(log_file) if log_file else None,
             'json_logs': json_logs,
             'performance_logging': performance_logging,
-            'filter_sensitive': filter_sensitive
+            'filter_sensitive': filter_sensitive,
+            'async_logging': async_logging,
+            'rate_limit': rate_limit
         }
         
         logging.info(f"Logging configured: {config_info}")
@@ -343,15 +563,55 @@ class LoggingConfig:
         if json_logs:
             self.formatters['json'] = JsonFormatter()
     
-    def _create_filters(self, performance_logging: bool, filter_sensitive: bool):
+    def _create_filters(self, performance_logging: bool, filter_sensitive: bool,
+                        rate_limit: Optional[float] = None,
+                        logger_rate_limits: Optional[Dict[str, float]] = None):
         """Create logging filters."""
+        self.filters.clear()
+        
+        # Rate limiting runs first so dropped records skip the other filters
+        if rate_limit is not None or logger_rate_limits:
+            self.filters['rate_limit'] = RateLimitFilter(rate_limit, logger_rates=logger_rate_limits)
+        
         if performance_logging:
             self.filters['performance'] = PerformanceFilter()
         
         if filter_sensitive:
             self.filters['sensitive'] = SensitiveDataFilter()
     
-    def _setup_console_handler(self, level: int, format_type: str):
+    def _start_async_logging(self, level: int, queue_size: int) -> BoundedQueueHandler:
+        """Route records through a bounded queue to a listener thread."""
+        queue_handler = BoundedQueueHandler(queue_size)
+        queue_handler.setLevel(level)
+        for filter_obj in self.filters.values():
+            queue_handler.addFilter(filter_obj)
+        
+        listener = logging.handlers.QueueListener(
+            queue_handler.queue, *self.handlers.values(), respect_handler_level=True
+        )
+        listener.start()
+        
+        self.queue_handler = queue_handler
+        self._queue_listener = listener
+        return queue_handler
+    
+    def stop_async_logging(self) -> None:
+        """Write out queued records and stop the listener thread."""
+        listener, self._queue_listener = self._queue_listener, None
+        if listener is not None:
+            listener.stop()
+            logging.getLogger('blackholio_client').removeHandler(self.queue_handler)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get async queue and rate limiting statistics."""
+        rate_limit = self.filters.get('rate_limit')
+        return {
+            'async_logging': self._queue_listener is not None,
+            'queue': self.queue_handler.get_statistics() if self.queue_handler else None,
+            'rate_limit': rate_limit.get_statistics() if rate_limit else None
+        }
+    
+    def _setup_console_handler(self, level: int, format_type: str, add_filters: bool = True):
         """Setup console handler."""
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
@@ -361,8 +621,9 @@ class LoggingConfig:
         console_handler.setFormatter(formatter)
         
         # Add filters
-        for filter_obj in self.filters.values():
-            console_handler.addFilter(filter_obj)
+        if add_filters:
+            for filter_obj in self.filters.values():
+                console_handler.addFilter(filter_obj)
         
         self.handlers['console'] = console_handler
     
@@ -371,7 +632,8 @@ class LoggingConfig:
                            level: int,
                            json_logs: bool,
                            max_file_size: int,
-                           backup_count: int):
+                           backup_count: int,
+                           add_filters: bool = True):
         """Setup file handler with rotation."""
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -392,8 +654,9 @@ class LoggingConfig:
             file_handler.setFormatter(self.formatters['detailed'])
         
         # Add filters
-        for filter_obj in self.filters.values():
-            file_handler.addFilter(filter_obj)
+        if add_filters:
+            for filter_obj in self.filters.values():
+                file_handler.addFilter(filter_obj)
         
         self.handlers['file'] = file_handler
     
@@ -527,6 +790,15 @@ def get_logger(name: str) -> logging.Logger:
     return config.get_logger(name)
 
 
+def shutdown_logging() -> None:
+    """Flush and stop the async logging pipeline, if running."""
+    if _global_logging_config is not None:
+        _global_logging_config.stop_async_logging()
+
+
+atexit.register(shutdown_logging)
+
+
 def log_performance(operation: str = None, level: int = logging.INFO):
     """
     Decorator for logging function performance.
@@ -589,15 +861,16 @@ def enable_debug_logging():
     )
 
 
-def enable_production_logging(log_file: Union[str, Path]):
-    """Enable production logging with file output."""
+def enable_production_logging(log_file: Union[str, Path], async_logging: bool = False):
+    """Enable production logging with file output (async_logging opts into the lossy bounded queue)."""
     setup_logging(
         level=logging.INFO,
         format_type="simple",
         log_file=log_file,
         json_logs=True,
         performance_logging=False,
-        filter_sensitive=True
+        filter_sensitive=True,
+        async_logging=async_logging
     )
 
 
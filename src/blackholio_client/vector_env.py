@@ -0,0 +1,469 @@
+"""
+Vector Game Environment - Many Agents Stepped in Lockstep
+
+Reinforcement learning setups run many agents, each a GameClient. Driving
+them one by one from separate loops wastes most of the time waiting on the
+network. VectorGameEnv hosts N GameClients on one event loop:
+
+- ``step(actions)`` sends every changed input direction concurrently, then
+  waits until each agent has applied a database update after the send
+  (one server tick) or ``tick_timeout`` passes
+- observations are the FeatureExtractor vectors of every agent stacked into
+  one (N, features) float32 array; rewards are per-step mass changes
+
+Each agent keeps its own connection and caches, because SpacetimeDB ties a
+player to the connection's identity. Per-agent observation cost stays low
+because each agent's FeatureExtractor only converts the rows that changed
+since the previous step.
+
+For large N, ShardedVectorGameEnv splits the agents over worker processes,
+each running a VectorGameEnv on its own event loop, and stacks their results.
+
+numpy is imported when the first environment is created.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from dataclasses import dataclass, replace
+from typing import Dict, Any, Optional, List, Tuple
+
+from .client import GameClient
+from .config.environment import get_environment_config
+from .events.change_stream import ChangeStream, ChangeStreamConfig, ChangeStreamLagError
+from .exceptions.connection_errors import BlackholioConnectionError
+from .models.training_export import FeatureExtractor, SELF_FEATURES
+
+
+logger = logging.getLogger(__name__)
+
+MASS_FEATURE = SELF_FEATURES.index('self_mass')
+
+
+def _numpy():
+    """Import numpy, which the vector environment needs."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("The vector environment needs the 'numpy' package (pip install numpy)") from None
+    return numpy
+
+
+@dataclass
+class VectorEnvConfig:
+    """Vector environment configuration."""
+    host: str = "localhost:3000"
+    database: str = "blackholio"
+    server_language: str = "rust"
+    num_agents: int = 4
+    name_prefix: str = "agent"  # Agents enter the game as "<prefix>-<index>"
+    agent_offset: int = 0  # Index of the first agent, for names across shards
+    tick_timeout: float = 0.5  # Longest a step waits for every agent's next server tick
+    spawn_timeout: float = 5.0  # Longest reset() waits for the agents' circles to appear
+    connect_concurrency: int = 16  # Agents connecting at the same time
+    auto_respawn: bool = True  # Re-enter the game when an agent loses all its circles
+    input_epsilon: float = 1e-3  # Skip sending a direction this close to the last one sent
+    nearest_food: int = 8
+    nearby_players: int = 4
+
+    def validate(self) -> None:
+        """Validate configuration parameters."""
+        if self.num_agents < 1:
+            raise ValueError("num_agents must be >= 1")
+        if not self.name_prefix:
+            raise ValueError("name_prefix must not be empty")
+        if self.agent_offset < 0:
+            raise ValueError("agent_offset must be >= 0")
+        if self.tick_timeout <= 0:
+            raise ValueError("tick_timeout must be > 0")
+        if self.spawn_timeout < 0:
+            raise ValueError("spawn_timeout must be >= 0")
+        if self.connect_concurrency < 1:
+            raise ValueError("connect_concurrency must be >= 1")
+        if self.input_epsilon < 0:
+            raise ValueError("input_epsilon must be >= 0")
+        if self.nearest_food < 0 or self.nearby_players < 0:
+            raise ValueError("nearest_food and nearby_players must be >= 0")
+
+
+class VectorGameEnv:
+    """
+    N GameClient agents on one event loop, stepped in lockstep.
+
+    Usage:
+        env = VectorGameEnv(VectorEnvConfig(host="localhost:3000", num_agents=32))
+        observations = await env.reset()
+        observations, rewards, dones, info = await env.step(actions)  # actions: (N, 2)
+        await env.close()
+    """
+
+    def __init__(self, config: Optional[VectorEnvConfig] = None):
+        """
+        Initialize vector environment; agents connect on reset().
+
+        Args:
+            config: Environment configuration (uses defaults if None)
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        self.config = config or VectorEnvConfig()
+        self.config.validate()
+        self._np = _numpy()
+
+        count = self.config.num_agents
+        self._clients: List[GameClient] = []
+        self._streams: List[ChangeStream] = []
+        self._extractors = [FeatureExtractor(self.config.nearest_food, self.config.nearby_players)
+                            for _ in range(count)]
+        self._last_actions = self._np.full((count, 2), self._np.nan, dtype=self._np.float32)
+        self._observations = self._np.zeros((count, self._extractors[0].size), dtype=self._np.float32)
+
+        # Statistics
+        self._steps = 0
+        self._step_seconds = 0.0
+        self._tick_wait_seconds = 0.0
+        self._late_agents = 0
+        self._inputs_sent = 0
+        self._inputs_skipped = 0
+        self._respawns = 0
+
+    @property
+    def num_agents(self) -> int:
+        """Number of agents."""
+        return self.config.num_agents
+
+    @property
+    def observation_size(self) -> int:
+        """Length of one agent's observation vector."""
+        return self._extractors[0].size
+
+    @property
+    def feature_names(self) -> List[str]:
+        """Name of each observation vector element."""
+        return self._extractors[0].feature_names
+
+    @property
+    def clients(self) -> List[GameClient]:
+        """The agents' clients (empty before reset())."""
+        return list(self._clients)
+
+    def agent_name(self, index: int) -> str:
+        """Get the player name of an agent."""
+        return f"{self.config.name_prefix}-{self.config.agent_offset + index}"
+
+    async def reset(self) -> Any:
+        """
+        Connect every agent if needed and enter the game.
+
+        Returns:
+            (N, features) float32 observations
+
+        Raises:
+            BlackholioConnectionError: If an agent cannot connect
+        """
+        if not self._clients:
+            await self._connect_all()
+
+        await asyncio.gather(*(client.enter_game(self.agent_name(i)) for i, client in enumerate(self._clients)))
+        deadline = time.monotonic() + self.config.spawn_timeout
+        while not all(client.get_local_player_entities() for client in self._clients):
+            if time.monotonic() >= deadline:
+                missing = sum(1 for client in self._clients if not client.get_local_player_entities())
+                logger.warning(f"{missing} of {self.num_agents} agents have not spawned after "
+                               f"{self.config.spawn_timeout}s")
+                break
+            await asyncio.sleep(0.01)
+
+        self._last_actions[:] = self._np.nan
+        return self._observe().copy()
+
+    async def _connect_all(self) -> None:
+        """Connect the agents, a bounded number at a time."""
+        semaphore = asyncio.Semaphore(self.config.connect_concurrency)
+
+        async def connect(client: GameClient) -> bool:
+            async with semaphore:
+                return await client.connect()
+
+        clients = [GameClient(self.config.host, self.config.database, self.config.server_language,
+                              auto_reconnect=False)
+                   for _ in range(self.num_agents)]
+        connected = await asyncio.gather(*(connect(client) for client in clients))
+        if not all(connected):
+            await asyncio.gather(*(client.disconnect() for client in clients), return_exceptions=True)
+            raise BlackholioConnectionError(
+                f"{connected.count(False)} of {self.num_agents} agents could not connect to {self.config.host}")
+
+        self._clients = clients
+        self._streams = [client.enable_change_stream(ChangeStreamConfig(capacity=16)) for client in clients]
+
+    async def step(self, actions: Any) -> Tuple[Any, Any, Any, Dict[str, Any]]:
+        """
+        Send every agent's input and wait for the next server tick.
+
+        Args:
+            actions: (N, 2) input directions
+
+        Returns:
+            (observations (N, features) float32, rewards (N,) float32,
+            dones (N,) bool, info); an agent is done when it loses its last
+            circle, and the reward is its mass change over the step
+
+        Raises:
+            RuntimeError: If reset() has not been called
+        """
+        if not self._clients:
+            raise RuntimeError("Vector environment is not connected; call reset() first")
+        np = self._np
+        started = time.perf_counter()
+        actions = np.asarray(actions, dtype=np.float32).reshape(self.num_agents, 2)
+        previous_mass = self._observations[:, MASS_FEATURE].copy()
+        cursors = [stream.cursor for stream in self._streams]
+
+        # Only directions that changed are sent, all at once
+        changed = ~(np.abs(actions - self._last_actions) <= self.config.input_epsilon).all(axis=1)
+        senders = [self._clients[i].update_player_input({'x': float(actions[i, 0]), 'y': float(actions[i, 1])})
+                   for i in np.flatnonzero(changed)]
+        await asyncio.gather(*senders)
+        self._last_actions[changed] = actions[changed]
+        self._inputs_sent += len(senders)
+        self._inputs_skipped += self.num_agents - len(senders)
+
+        waited = time.perf_counter()
+        deadline = time.monotonic() + self.config.tick_timeout
+        ticked = await asyncio.gather(*(self._wait_for_tick(stream, cursor, deadline)
+                                        for stream, cursor in zip(self._streams, cursors)))
+        self._tick_wait_seconds += time.perf_counter() - waited
+        late = ticked.count(False)
+        self._late_agents += late
+
+        observations = self._observe()
+        mass = observations[:, MASS_FEATURE]
+        dones = (previous_mass > 0) & (mass <= 0)
+        rewards = np.where((previous_mass > 0) & (mass > 0), mass - previous_mass, 0.0).astype(np.float32)
+        if self.config.auto_respawn and dones.any():
+            await asyncio.gather(*(self._clients[i].enter_game(self.agent_name(i)) for i in np.flatnonzero(dones)))
+            self._respawns += int(dones.sum())
+
+        self._steps += 1
+        self._step_seconds += time.perf_counter() - started
+        return observations.copy(), rewards, dones, {'late_agents': late}
+
+    @staticmethod
+    async def _wait_for_tick(stream: ChangeStream, cursor: int, deadline: float) -> bool:
+        """Wait until a stream has a batch after a cursor; False on timeout."""
+        if stream.cursor > cursor:
+            return True
+        iterator = stream.changes(since=cursor)
+        try:
+            await asyncio.wait_for(iterator.__anext__(), max(0.0, deadline - time.monotonic()))
+            return True
+        except ChangeStreamLagError:
+            return True
+        except (asyncio.TimeoutError, StopAsyncIteration):
+            return False
+        finally:
+            await iterator.aclose()
+
+    def _observe(self) -> Any:
+        """Extract every agent's observation into the shared array."""
+        for i, (client, extractor) in enumerate(zip(self._clients, self._extractors)):
+            player = client.get_local_player()
+            world = extractor.world_arrays(client.get_all_entities(), client.get_all_circles())
+            self._observations[i] = extractor.extract(world, player.player_id if player else None)
+        return self._observations
+
+    async def close(self) -> None:
+        """Disconnect every agent."""
+        clients, self._clients, self._streams = self._clients, [], []
+        await asyncio.gather(*(client.disconnect() for client in clients), return_exceptions=True)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get environment statistics, including throughput in agent-steps per second."""
+        agent_steps = self._steps * self.num_agents
+        return {
+            'agents': self.num_agents,
+            'connected_agents': len(self._clients),
+            'steps': self._steps,
+            'agent_steps': agent_steps,
+            'agent_steps_per_second': agent_steps / self._step_seconds if self._step_seconds > 0 else 0.0,
+            'average_tick_wait_ms': self._tick_wait_seconds * 1000 / self._steps if self._steps else 0.0,
+            'late_agents': self._late_agents,
+            'inputs_sent': self._inputs_sent,
+            'inputs_skipped': self._inputs_skipped,
+            'respawns': self._respawns
+        }
+
+
+def _run_shard(config: VectorEnvConfig, pipe: Any, log_level: int) -> None:
+    """Worker process entry point: serve one VectorGameEnv over a pipe."""
+    asyncio.run(_serve_shard(config, pipe, log_level))
+
+
+async def _serve_shard(config: VectorEnvConfig, pipe: Any, log_level: int) -> None:
+    """Run commands from the parent process until it asks to close."""
+    # Load the environment config, which sets up logging, before taking the parent's level
+    get_environment_config()
+    logging.getLogger('blackholio_client').setLevel(log_level)
+    env = VectorGameEnv(config)
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            # Receive off the loop so the agents' connections keep being serviced
+            command, payload = await loop.run_in_executor(None, pipe.recv)
+            if command == 'close':
+                break
+            try:
+                if command == 'reset':
+                    result = await env.reset()
+                elif command == 'step':
+                    result = await env.step(payload)
+                else:
+                    result = env.get_statistics()
+                pipe.send(('ok', result))
+            except Exception as e:
+                pipe.send(('error', f"{type(e).__name__}: {e}"))
+    finally:
+        await env.close()
+        pipe.send(('ok', None))
+
+
+class ShardedVectorGameEnv:
+    """
+    VectorGameEnv split over worker processes for large agent counts.
+
+    Each shard process runs its own event loop and agents; ``step`` sends
+    every shard its slice of the actions at once and stacks the results in
+    agent order. The API is synchronous, since the parent only exchanges
+    arrays with the shards. Shards log at the parent's ``blackholio_client``
+    log level.
+    """
+
+    def __init__(self, config: Optional[VectorEnvConfig] = None, shards: int = 2):
+        """
+        Start the shard processes; agents connect on reset().
+
+        Args:
+            config: Environment configuration for all agents together (uses defaults if None)
+            shards: Number of worker processes (at most one per agent)
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        self.config = config or VectorEnvConfig()
+        self.config.validate()
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        self._np = _numpy()
+
+        shards = min(shards, self.config.num_agents)
+        base, extra = divmod(self.config.num_agents, shards)
+        self._sizes = [base + (1 if i < extra else 0) for i in range(shards)]
+        self._pipes = []
+        self._processes = []
+        context = multiprocessing.get_context('spawn')
+        log_level = logging.getLogger('blackholio_client').getEffectiveLevel()
+        offset = self.config.agent_offset
+        for size in self._sizes:
+            parent, child = context.Pipe()
+            shard_config = replace(self.config, num_agents=size, agent_offset=offset)
+            process = context.Process(target=_run_shard, args=(shard_config, child, log_level),
+                                      name=f"vector-env-shard-{len(self._processes)}", daemon=True)
+            process.start()
+            self._pipes.append(parent)
+            self._processes.append(process)
+            offset += size
+        self._closed = False
+
+        # Statistics
+        self._steps = 0
+        self._step_seconds = 0.0
+
+    @property
+    def num_agents(self) -> int:
+        """Number of agents across all shards."""
+        return self.config.num_agents
+
+    @property
+    def shard_sizes(self) -> List[int]:
+        """Agents per shard."""
+        return list(self._sizes)
+
+    def _broadcast(self, command: str, payloads: Optional[List[Any]] = None) -> List[Any]:
+        """Send a command to every shard, then collect the replies in shard order."""
+        if self._closed:
+            raise RuntimeError("Sharded vector environment is closed")
+        for i, pipe in enumerate(self._pipes):
+            pipe.send((command, payloads[i] if payloads is not None else None))
+        replies = [pipe.recv() for pipe in self._pipes]
+        for i, (status, result) in enumerate(replies):
+            if status == 'error':
+                raise RuntimeError(f"Vector environment shard {i} failed: {result}")
+        return [result for _, result in replies]
+
+    def reset(self) -> Any:
+        """
+        Connect and spawn every shard's agents.
+
+        Returns:
+            (N, features) float32 observations
+        """
+        return self._np.concatenate(self._broadcast('reset'))
+
+    def step(self, actions: Any) -> Tuple[Any, Any, Any, Dict[str, Any]]:
+        """
+        Step every shard in lockstep.
+
+        Args:
+            actions: (N, 2) input directions
+
+        Returns:
+            (observations, rewards, dones, info) stacked over all agents, as in VectorGameEnv.step
+        """
+        np = self._np
+        started = time.perf_counter()
+        actions = np.asarray(actions, dtype=np.float32).reshape(self.num_agents, 2)
+        bounds = np.cumsum([0] + self._sizes)
+        results = self._broadcast('step', [actions[bounds[i]:bounds[i + 1]] for i in range(len(self._sizes))])
+        self._steps += 1
+        self._step_seconds += time.perf_counter() - started
+        observations, rewards, dones, infos = zip(*results)
+        info = {'late_agents': sum(item['late_agents'] for item in infos)}
+        return np.concatenate(observations), np.concatenate(rewards), np.concatenate(dones), info
+
+    def close(self, timeout: float = 10.0) -> None:
+        """
+        Disconnect every agent and stop the shard processes.
+
+        Args:
+            timeout: Seconds to wait for each shard to exit before terminating it
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for pipe, process in zip(self._pipes, self._processes):
+            try:
+                pipe.send(('close', None))
+                if pipe.poll(timeout):
+                    pipe.recv()
+            except (OSError, EOFError):
+                pass
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+            pipe.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get per-shard statistics and agent-steps per second as seen by the parent."""
+        shards = self._broadcast('statistics')
+        agent_steps = self._steps * self.num_agents
+        return {
+            'agents': self.num_agents,
+            'shards': shards,
+            'steps': self._steps,
+            'agent_steps': agent_steps,
+            'agent_steps_per_second': agent_steps / self._step_seconds if self._step_seconds > 0 else 0.0,
+            'late_agents': sum(shard['late_agents'] for shard in shards)
+        }
@@ -110,4 +110,38 @@ def temp_config_file(tmp_path):
 def reset_singletons():
     """Reset any singleton instances between tests."""
     # Add any singleton resets here as needed
-    yield
\ No newline at end of file
+    yield
+
+@pytest.fixture(autouse=True)
+def isolated_generation_cache(tmp_path, monkeypatch):
+    """Keep the persistent generated-client cache out of the user's home directory."""
+    monkeypatch.setenv("BLACKHOLIO_GENERATION_CACHE_DIR", str(tmp_path / "generation_cache"))
+
+
+@pytest.fixture
+def fake_server():
+    """Start fake SpacetimeDB servers on background threads and stop them afterwards."""
+    from tests.fake_spacetimedb_server import FakeServerConfig, FakeServerThread
+
+    servers = []
+
+    def start(**config) -> FakeServerThread:
+        server = FakeServerThread(FakeServerConfig(**config)).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture
+def quiet_logging(monkeypatch):
+    """Run clients (and any processes they spawn) with LOG_LEVEL=WARNING, as in production."""
+    from blackholio_client.config.environment import get_environment_config
+
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+    get_environment_config(reload=True)
+    yield
+    monkeypatch.undo()
+    get_environment_config(reload=True)
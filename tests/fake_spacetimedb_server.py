@@ -0,0 +1,691 @@
+#!/usr/bin/env python3
+"""
+Fake SpacetimeDB Server - In-Process Websocket Stand-In for Client Benchmarks
+
+Speaks enough of the ``v1.json.spacetimedb`` subprotocol for GameClient and
+SpacetimeDBConnection to connect, subscribe and call reducers without a real
+SpacetimeDB server:
+
+- IdentityToken as soon as a client connects
+- InitialSubscription holding the subscribed tables in reply to Subscribe
+- TransactionUpdate for every world tick and every CallReducer
+
+World size, tick rate, rows moved per tick and one-way network delay are
+configurable, so throughput and latency runs are repeatable on a laptop or in
+CI. Identities are sent as hex strings. Run it standalone, e.g. to point
+load_testing.py at it, with:
+
+    python tests/fake_spacetimedb_server.py --port 3000 --world-size 2000
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import logging
+import random
+import re
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from websockets.asyncio.server import serve
+from websockets.exceptions import ConnectionClosed
+
+
+logger = logging.getLogger(__name__)
+
+SUBPROTOCOL = "v1.json.spacetimedb"
+
+# Identity of the module itself, the caller of scheduled reducers (world ticks)
+MODULE_IDENTITY = "0x" + "00" * 31 + "01"
+
+TABLE_IDS = {'entity': 4096, 'circle': 4097, 'player': 4098, 'food': 4099, 'config': 4100}
+REDUCER_IDS = {'enter_game': 1, 'update_player_input': 2, 'player_split': 3, 'move_all_players': 4}
+
+_QUERY_TABLE = re.compile(r'\bfrom\s+"?(\w+)"?', re.IGNORECASE)
+_encode = json.JSONEncoder(separators=(',', ':')).encode
+
+
+def timestamp_micros() -> int:
+    """Get the current wall-clock time in microseconds since the Unix epoch."""
+    return time.time_ns() // 1000
+
+
+def update_timestamp_micros(update_data: Dict[str, Any]) -> Optional[int]:
+    """
+    Get the server timestamp of a TransactionUpdate.
+
+    Args:
+        update_data: TransactionUpdate payload
+
+    Returns:
+        Microseconds since the Unix epoch, or None if the update has no timestamp
+    """
+    value = update_data.get('timestamp') if isinstance(update_data, dict) else None
+    if isinstance(value, dict):
+        value = value.get('__timestamp_micros_since_unix_epoch__')
+    return value if isinstance(value, int) else None
+
+
+@dataclass
+class FakeServerConfig:
+    """Fake server configuration."""
+    host: str = "127.0.0.1"
+    port: int = 0  # 0 picks a free port
+    world_size: int = 1000  # Food entities in the world
+    world_extent: float = 1000.0  # Side of the square world
+    tick_rate: float = 20.0  # World ticks per second (0 = only broadcast_ticks())
+    moves_per_tick: int = 50  # Entity rows moved by each tick
+    network_delay: float = 0.0  # One-way delay added to every server frame, in seconds
+    jitter: float = 0.0  # Extra uniform random delay per frame, in seconds
+    seed: int = 0  # Seed for world layout and jitter
+
+    def validate(self) -> None:
+        """Validate configuration parameters."""
+        if self.world_size < 0:
+            raise ValueError("world_size must be >= 0")
+        if self.world_extent <= 0:
+            raise ValueError("world_extent must be > 0")
+        if self.tick_rate < 0:
+            raise ValueError("tick_rate must be >= 0")
+        if self.moves_per_tick < 0:
+            raise ValueError("moves_per_tick must be >= 0")
+        if self.network_delay < 0 or self.jitter < 0:
+            raise ValueError("network_delay and jitter must be >= 0")
+
+
+@dataclass
+class _Session:
+    """One connected client."""
+    websocket: Any
+    identity: str
+    connection_id: int
+    tables: Optional[frozenset] = None  # Subscribed tables, None until Subscribe
+    outbox: asyncio.Queue = field(default_factory=asyncio.Queue)
+    last_due: float = 0.0
+    sender: Optional[asyncio.Task] = None
+
+
+class FakeSpacetimeDBServer:
+    """
+    Websocket server that simulates a Blackholio SpacetimeDB module.
+
+    The world is a set of food entities plus one circle entity per player
+    who called ``enter_game``. Every tick moves the next ``moves_per_tick``
+    entities (round-robin) and broadcasts the change to subscribers as one
+    TransactionUpdate, the way a scheduled reducer would. Each frame is
+    held back by ``network_delay`` (plus jitter) before it is written,
+    without reordering frames on a connection.
+    """
+
+    def __init__(self, config: Optional[FakeServerConfig] = None):
+        """
+        Initialize fake server.
+
+        Args:
+            config: Server configuration (uses defaults if None)
+        """
+        self.config = config or FakeServerConfig()
+        self.config.validate()
+        self._random = random.Random(self.config.seed)
+
+        self._server = None
+        self._tick_task: Optional[asyncio.Task] = None
+        self._sessions: List[_Session] = []
+
+        # World state; rows are kept encoded so deletes reuse the insert text
+        self._entities: Dict[int, Dict[str, Any]] = {}
+        self._entity_rows: Dict[int, str] = {}
+        self._food: Dict[int, str] = {}
+        self._circles: Dict[int, Dict[str, Any]] = {}
+        self._players: Dict[str, Dict[str, Any]] = {}
+        self._next_entity_id = 1
+        self._next_player_id = 1
+        self._move_order: List[int] = []
+        self._move_cursor = 0
+        self._build_world()
+
+        # Statistics
+        self._connections = 0
+        self._ticks = 0
+        self._frames_sent = 0
+        self._bytes_sent = 0
+        self._frames_received = 0
+        self._reducer_calls: Dict[str, int] = {}
+        self._failed_reducers = 0
+
+    @property
+    def port(self) -> int:
+        """Get the port the server is listening on."""
+        if self._server is None:
+            return self.config.port
+        return self._server.sockets[0].getsockname()[1]
+
+    @property
+    def host(self) -> str:
+        """Get the ``host:port`` string GameClient connects to."""
+        return f"{self.config.host}:{self.port}"
+
+    @property
+    def subscriber_count(self) -> int:
+        """Get the number of connected clients that have subscribed."""
+        return sum(1 for session in self._sessions if session.tables is not None)
+
+    async def start(self) -> 'FakeSpacetimeDBServer':
+        """Start listening and, if ``tick_rate`` is set, ticking the world."""
+        self._server = await serve(
+            self._handle_connection,
+            self.config.host,
+            self.config.port,
+            subprotocols=[SUBPROTOCOL],
+            max_size=10 * 1024 * 1024
+        )
+        if self.config.tick_rate > 0:
+            self._tick_task = asyncio.create_task(self._tick_loop(), name="fake_server_ticks")
+        logger.info(f"Fake SpacetimeDB server listening on ws://{self.host}")
+        return self
+
+    async def stop(self) -> None:
+        """Stop ticking and close every connection."""
+        if self._tick_task:
+            self._tick_task.cancel()
+            try:
+                await self._tick_task
+            except asyncio.CancelledError:
+                pass
+            self._tick_task = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for session in list(self._sessions):
+            if session.sender:
+                session.sender.cancel()
+
+    async def __aenter__(self) -> 'FakeSpacetimeDBServer':
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    async def wait_for_subscribers(self, count: int = 1, timeout: float = 5.0) -> bool:
+        """
+        Wait until a number of clients have subscribed.
+
+        Args:
+            count: Subscribers to wait for
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if that many clients subscribed in time
+        """
+        deadline = time.monotonic() + timeout
+        while self.subscriber_count < count:
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.005)
+        return True
+
+    async def broadcast_ticks(self, count: int) -> int:
+        """
+        Run world ticks back-to-back, as fast as frames can be queued.
+
+        Args:
+            count: Number of ticks
+
+        Returns:
+            Number of ticks run
+        """
+        for _ in range(count):
+            self._tick()
+            # Let the per-connection senders write while frames are produced
+            await asyncio.sleep(0)
+        return count
+
+    # World
+
+    def _build_world(self) -> None:
+        """Place the initial food entities."""
+        for _ in range(self.config.world_size):
+            entity_id = self._add_entity(self._random_position(), mass=self._random.randint(2, 5))
+            self._food[entity_id] = _encode({'entity_id': entity_id})
+
+    def _random_position(self) -> Dict[str, float]:
+        """Pick a random point in the world."""
+        extent = self.config.world_extent
+        return {'x': round(self._random.uniform(0, extent), 3), 'y': round(self._random.uniform(0, extent), 3)}
+
+    def _add_entity(self, position: Dict[str, float], mass: int) -> int:
+        """Create an entity row."""
+        entity_id = self._next_entity_id
+        self._next_entity_id += 1
+        self._entities[entity_id] = {'entity_id': entity_id, 'position': position, 'mass': mass}
+        self._entity_rows[entity_id] = _encode(self._entities[entity_id])
+        self._move_order.append(entity_id)
+        return entity_id
+
+    def _move_entity(self, entity_id: int) -> Tuple[str, str]:
+        """
+        Move one entity a step.
+
+        Circles follow their player's input direction; food drifts randomly.
+
+        Returns:
+            (deleted row, inserted row)
+        """
+        entity = self._entities[entity_id]
+        circle = self._circles.get(entity_id)
+        if circle is not None:
+            dx = circle['direction']['x'] * circle['speed']
+            dy = circle['direction']['y'] * circle['speed']
+        else:
+            dx = self._random.uniform(-1.0, 1.0)
+            dy = self._random.uniform(-1.0, 1.0)
+
+        extent = self.config.world_extent
+        position = entity['position']
+        entity['position'] = {
+            'x': round(min(max(position['x'] + dx, 0.0), extent), 3),
+            'y': round(min(max(position['y'] + dy, 0.0), extent), 3)
+        }
+        old_row = self._entity_rows[entity_id]
+        new_row = self._entity_rows[entity_id] = _encode(entity)
+        return old_row, new_row
+
+    def _tick(self) -> None:
+        """Move the next batch of entities and broadcast the change."""
+        self._ticks += 1
+        order = self._move_order
+        moves = min(self.config.moves_per_tick, len(order))
+        if not moves:
+            return
+
+        deletes, inserts = [], []
+        for _ in range(moves):
+            self._move_cursor %= len(order)
+            old_row, new_row = self._move_entity(order[self._move_cursor])
+            self._move_cursor += 1
+            deletes.append(old_row)
+            inserts.append(new_row)
+
+        tables = [self._table_update('entity', inserts, deletes)]
+        frame = self._transaction_update(tables, MODULE_IDENTITY, 'move_all_players', "[]", 0)
+        self._broadcast(frame, {'entity'})
+
+    def _snapshot_rows(self, table_name: str) -> List[str]:
+        """Get every row of a table, encoded."""
+        if table_name == 'entity':
+            return list(self._entity_rows.values())
+        if table_name == 'food':
+            return list(self._food.values())
+        if table_name == 'circle':
+            return [_encode(circle) for circle in self._circles.values()]
+        if table_name == 'player':
+            return [_encode(player) for player in self._players.values()]
+        if table_name == 'config':
+            return [_encode({'id': 0, 'world_size': int(self.config.world_extent)})]
+        return []
+
+    # Frames
+
+    @staticmethod
+    def _table_update(table_name: str, inserts: List[str], deletes: List[str]) -> Dict[str, Any]:
+        """Build a TableUpdate."""
+        return {
+            'table_id': TABLE_IDS.get(table_name, 0),
+            'table_name': table_name,
+            'num_rows': len(inserts) + len(deletes),
+            'updates': [{'deletes': deletes, 'inserts': inserts}]
+        }
+
+    @staticmethod
+    def _transaction_update(tables: List[Dict[str, Any]], caller_identity: str, reducer_name: str,
+                            args: str, request_id: int, failure: Optional[str] = None,
+                            caller_connection_id: int = 0) -> str:
+        """Build a TransactionUpdate frame."""
+        started = time.perf_counter_ns()
+        status = {'Failed': failure} if failure is not None else {'Committed': {'tables': tables}}
+        return _encode({'TransactionUpdate': {
+            'status': status,
+            'timestamp': {'__timestamp_micros_since_unix_epoch__': timestamp_micros()},
+            'caller_identity': caller_identity,
+            'caller_connection_id': {'__connection_id__': caller_connection_id},
+            'reducer_call': {
+                'reducer_name': reducer_name,
+                'reducer_id': REDUCER_IDS.get(reducer_name, 0),
+                'args': args,
+                'request_id': request_id
+            },
+            'energy_quanta_used': {'quanta': 0},
+            'total_host_execution_duration': {
+                '__time_duration_micros__': (time.perf_counter_ns() - started) // 1000
+            }
+        }})
+
+    # Connections
+
+    async def _handle_connection(self, websocket) -> None:
+        """Serve one client connection."""
+        self._connections += 1
+        session = _Session(websocket, identity="0x" + secrets.token_hex(32), connection_id=self._connections)
+        session.sender = asyncio.create_task(self._sender(session))
+        self._sessions.append(session)
+        logger.debug(f"Client {session.connection_id} connected on {websocket.request.path}")
+
+        self._send(session, _encode({'IdentityToken': {
+            'identity': session.identity,
+            'token': "fake." + secrets.token_urlsafe(24),
+            'connection_id': {'__connection_id__': session.connection_id}
+        }}))
+
+        try:
+            async for message in websocket:
+                self._frames_received += 1
+                self._handle_client_message(session, message)
+        except ConnectionClosed:
+            pass
+        finally:
+            self._sessions.remove(session)
+            session.sender.cancel()
+            logger.debug(f"Client {session.connection_id} disconnected")
+
+    def _send(self, session: _Session, frame: str) -> None:
+        """Queue a frame for a client, after the configured network delay."""
+        due = time.monotonic() + self.config.network_delay
+        if self.config.jitter:
+            due += self._random.uniform(0, self.config.jitter)
+        # Frames on one connection never overtake each other
+        due = max(due, session.last_due)
+        session.last_due = due
+        session.outbox.put_nowait((due, frame))
+        self._frames_sent += 1
+        self._bytes_sent += len(frame)
+
+    async def _sender(self, session: _Session) -> None:
+        """Write a client's queued frames once they are due."""
+        try:
+            while True:
+                due, frame = await session.outbox.get()
+                delay = due - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await session.websocket.send(frame)
+        except ConnectionClosed:
+            pass
+
+    def _broadcast(self, frame: str, tables: set, caller: Optional[_Session] = None) -> None:
+        """Send a frame to the caller and every client subscribed to one of the tables."""
+        for session in self._sessions:
+            if session is caller or (session.tables is not None and not session.tables.isdisjoint(tables)):
+                self._send(session, frame)
+
+    def _handle_client_message(self, session: _Session, message: Any) -> None:
+        """Dispatch one client message."""
+        if isinstance(message, bytes):
+            logger.warning("Fake server only speaks the JSON protocol; ignoring binary frame")
+            return
+        try:
+            data = json.loads(message)
+        except json.JSONDecodeError:
+            logger.warning(f"Fake server received invalid JSON: {message[:100]}")
+            return
+
+        if 'Subscribe' in data:
+            self._subscribe(session, data['Subscribe'])
+        elif 'CallReducer' in data:
+            self._call_reducer(session, data['CallReducer'])
+        else:
+            logger.debug(f"Fake server ignoring message: {list(data)[:3]}")
+
+    def _subscribe(self, session: _Session, subscribe: Dict[str, Any]) -> None:
+        """Reply to Subscribe with an InitialSubscription of the queried tables."""
+        started = time.perf_counter_ns()
+        queried = {match.lower() for query in subscribe.get('query_strings', [])
+                   for match in _QUERY_TABLE.findall(query)}
+        tables = frozenset(queried & set(TABLE_IDS)) or frozenset(TABLE_IDS)
+        session.tables = tables
+
+        table_updates = [
+            self._table_update(table_name, self._snapshot_rows(table_name), [])
+            for table_name in TABLE_IDS if table_name in tables
+        ]
+        self._send(session, _encode({'InitialSubscription': {
+            'database_update': {'tables': table_updates},
+            'request_id': subscribe.get('request_id', 0),
+            'total_host_execution_duration': {
+                '__time_duration_micros__': (time.perf_counter_ns() - started) // 1000
+            }
+        }}))
+
+    def _call_reducer(self, session: _Session, call: Dict[str, Any]) -> None:
+        """Run a reducer and send its TransactionUpdate."""
+        reducer_name = call.get('reducer', '')
+        raw_args = call.get('args', '{}')
+        request_id = int(call.get('request_id') or 0)
+        self._reducer_calls[reducer_name] = self._reducer_calls.get(reducer_name, 0) + 1
+
+        try:
+            args = json.loads(raw_args) if isinstance(raw_args, str) else raw_args
+            reducer = getattr(self, f"_reducer_{reducer_name}", None)
+            if reducer is None:
+                raise ValueError(f"No such reducer: {reducer_name}")
+            tables = reducer(session, args)
+            failure = None
+        except Exception as e:
+            self._failed_reducers += 1
+            tables, failure = [], str(e)
+
+        frame = self._transaction_update(
+            tables, session.identity, reducer_name,
+            raw_args if isinstance(raw_args, str) else _encode(raw_args),
+            request_id, failure, session.connection_id
+        )
+        self._broadcast(frame, {table['table_name'] for table in tables}, caller=session)
+
+    @staticmethod
+    def _argument(args: Any, name: str) -> Any:
+        """Get a reducer argument given by name or position."""
+        if isinstance(args, dict):
+            return args.get(name, next(iter(args.values()), None))
+        if isinstance(args, list) and args:
+            return args[0]
+        return None
+
+    # Reducers
+
+    def _reducer_enter_game(self, session: _Session, args: Any) -> List[Dict[str, Any]]:
+        """Create the caller's player and starting circle."""
+        name = self._argument(args, 'name')
+        if not name:
+            raise ValueError("Name must not be empty")
+
+        tables = []
+        player = self._players.get(session.identity)
+        if player is None:
+            player = {'identity': session.identity, 'player_id': self._next_player_id, 'name': name}
+            self._next_player_id += 1
+            self._players[session.identity] = player
+            tables.append(self._table_update('player', [_encode(player)], []))
+
+        entity_id = self._add_entity(self._random_position(), mass=15)
+        circle = self._circles[entity_id] = {
+            'entity_id': entity_id,
+            'player_id': player['player_id'],
+            'direction': {'x': 0.0, 'y': 1.0},
+            'speed': 0.0,
+            'last_split_time': {'__timestamp_micros_since_unix_epoch__': timestamp_micros()}
+        }
+        tables.append(self._table_update('circle', [_encode(circle)], []))
+        tables.append(self._table_update('entity', [self._entity_rows[entity_id]], []))
+        return tables
+
+    def _reducer_update_player_input(self, session: _Session, args: Any) -> List[Dict[str, Any]]:
+        """Steer the caller's circles; they move on the next ticks."""
+        direction = self._argument(args, 'direction') or {}
+        x, y = float(direction.get('x', 0.0)), float(direction.get('y', 0.0))
+        length = (x * x + y * y) ** 0.5
+        player = self._players.get(session.identity)
+        if player is None:
+            raise ValueError("Player not in game")
+
+        for circle in self._circles.values():
+            if circle['player_id'] == player['player_id']:
+                circle['direction'] = {'x': x / length, 'y': y / length} if length else {'x': 0.0, 'y': 1.0}
+                circle['speed'] = min(length, 1.0) * 5.0
+        return []
+
+    def _reducer_player_split(self, session: _Session, args: Any) -> List[Dict[str, Any]]:
+        """Accept a split request without changing the world."""
+        if session.identity not in self._players:
+            raise ValueError("Player not in game")
+        return []
+
+    async def _tick_loop(self) -> None:
+        """Tick the world at ``tick_rate``."""
+        interval = 1.0 / self.config.tick_rate
+        next_tick = time.monotonic()
+        while True:
+            next_tick += interval
+            self._tick()
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get fake server statistics."""
+        return {
+            'address': f"ws://{self.host}",
+            'connections': self._connections,
+            'active_connections': len(self._sessions),
+            'subscribers': self.subscriber_count,
+            'entities': len(self._entities),
+            'players': len(self._players),
+            'ticks': self._ticks,
+            'frames_sent': self._frames_sent,
+            'bytes_sent': self._bytes_sent,
+            'frames_received': self._frames_received,
+            'reducer_calls': dict(self._reducer_calls),
+            'failed_reducers': self._failed_reducers
+        }
+
+
+class FakeServerThread:
+    """
+    Run a FakeSpacetimeDBServer on its own event loop in a background thread.
+
+    Keeps the server's work off the client's thread, so the client's CPU
+    time can be measured with ``time.thread_time()``.
+    """
+
+    def __init__(self, config: Optional[FakeServerConfig] = None):
+        """
+        Initialize server thread.
+
+        Args:
+            config: Server configuration (uses defaults if None)
+        """
+        self.server = FakeSpacetimeDBServer(config)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        """Get the ``host:port`` string GameClient connects to."""
+        return self.server.host
+
+    def start(self, timeout: float = 10.0) -> 'FakeServerThread':
+        """Start the server thread and wait until it is listening."""
+        ready = threading.Event()
+        errors: List[BaseException] = []
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._loop.run_until_complete(self.server.start())
+            except BaseException as e:
+                errors.append(e)
+                ready.set()
+                return
+            ready.set()
+            try:
+                self._loop.run_forever()
+                self._loop.run_until_complete(self.server.stop())
+            finally:
+                self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="fake-spacetimedb-server", daemon=True)
+        self._thread.start()
+        if not ready.wait(timeout):
+            raise TimeoutError("Fake SpacetimeDB server did not start")
+        if errors:
+            raise errors[0]
+        return self
+
+    def submit(self, coroutine) -> concurrent.futures.Future:
+        """Schedule a coroutine (e.g. ``server.broadcast_ticks(100)``) on the server loop."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def call(self, coroutine, timeout: float = 30.0) -> Any:
+        """Run a coroutine on the server loop and wait for its result."""
+        return self.submit(coroutine).result(timeout)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the server and join its thread."""
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def __enter__(self) -> 'FakeServerThread':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+async def _serve_forever(config: FakeServerConfig) -> None:
+    """Run the server until interrupted."""
+    server = FakeSpacetimeDBServer(config)
+    await server.start()
+    print(f"Fake SpacetimeDB server on ws://{server.host} "
+          f"({config.world_size} entities, {config.tick_rate:g} ticks/s, "
+          f"{config.network_delay * 1000:g}ms delay)")
+    try:
+        await asyncio.Future()
+    finally:
+        await server.stop()
+
+
+def main():
+    """Main entry point for running the fake server standalone."""
+    parser = argparse.ArgumentParser(description="Fake SpacetimeDB server for client benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--world-size", type=int, default=1000, help="Food entities in the world")
+    parser.add_argument("--tick-rate", type=float, default=20.0, help="World ticks per second")
+    parser.add_argument("--moves-per-tick", type=int, default=50, help="Entity rows moved per tick")
+    parser.add_argument("--delay-ms", type=float, default=0.0, help="One-way network delay")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra random delay per frame")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    config = FakeServerConfig(
+        host=args.host,
+        port=args.port,
+        world_size=args.world_size,
+        tick_rate=args.tick_rate,
+        moves_per_tick=args.moves_per_tick,
+        network_delay=args.delay_ms / 1000.0,
+        jitter=args.jitter_ms / 1000.0
+    )
+    try:
+        asyncio.run(_serve_forever(config))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
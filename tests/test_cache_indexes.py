@@ -0,0 +1,146 @@
+"""
+Tests and benchmark for secondary indexes on the client caches.
+"""
+
+import json
+import time
+
+import pytest
+
+from blackholio_client.client import GameClient
+from blackholio_client.models.game_entities import EntityType, GameCircle, GameEntity, GamePlayer, Vector2
+from blackholio_client.models.snapshots import VersionedMap
+
+
+def make_client() -> GameClient:
+    return GameClient("localhost:3000", "test_db", auto_reconnect=False)
+
+
+def table_update(table_name, inserts=(), deletes=()):
+    return {'table_name': table_name, 'updates': [{
+        'inserts': [json.dumps(row) for row in inserts],
+        'deletes': [json.dumps(row) for row in deletes]
+    }]}
+
+
+def transaction(*tables):
+    return {'type': 'transaction_update',
+            'update_data': {'status': {'Committed': {'tables': list(tables)}}}}
+
+
+def entity_row(entity_id, x=0.0, mass=10):
+    return {'entity_id': entity_id, 'position': {'x': x, 'y': 0.0}, 'mass': mass}
+
+
+def circle_row(entity_id, player_id):
+    return {'entity_id': entity_id, 'player_id': player_id, 'direction': {'x': 0, 'y': 0}, 'speed': 0.0}
+
+
+class TestSecondaryIndex:
+    """Test index maintenance on VersionedMap writes."""
+
+    def test_maintained_on_writes(self):
+        cache = VersionedMap()
+        index = cache.add_index('kind', lambda value: value['kind'])
+        cache['a'] = {'kind': 'food'}
+        cache['b'] = {'kind': 'food'}
+        cache['c'] = {'kind': 'obstacle'}
+        assert index.keys('food') == ['a', 'b']
+
+        cache['a'] = {'kind': 'obstacle'}
+        del cache['b']
+        assert index.keys('food') == []
+        assert sorted(index.keys('obstacle')) == ['a', 'c']
+        assert index.groups() == {'obstacle': 2}
+
+        cache.pop('c')
+        cache.clear()
+        assert index.count('obstacle') == 0
+        assert cache.index('kind') is index
+
+    def test_built_from_existing_entries_and_none_skipped(self):
+        cache = VersionedMap({'a': {'owner': '1'}, 'b': {'owner': None}})
+        index = cache.add_index('owner', lambda value: value['owner'])
+        assert index.groups() == {'1': 1}
+
+
+class TestClientIndexes:
+    """Test the GameClient query methods backed by indexes."""
+
+    @pytest.mark.asyncio
+    async def test_player_entities_from_circle_rows(self):
+        client = make_client()
+        client._local_player = GamePlayer(entity_id='7', player_id='7')
+        await client._handle_transaction_update_data(transaction(
+            table_update('entity', inserts=[entity_row(1), entity_row(2), entity_row(3)]),
+            table_update('circle', inserts=[circle_row(1, 7), circle_row(2, 7), circle_row(3, 8)])
+        ))
+
+        assert sorted(entity.entity_id for entity in client.get_local_player_entities()) == ['1', '2']
+        assert [entity.entity_id for entity in client.get_player_entities('8')] == ['3']
+
+        # Deleting a circle row removes the entity from its owner
+        await client._handle_transaction_update_data(transaction(
+            table_update('circle', deletes=[circle_row(2, 7)]),
+            table_update('entity', deletes=[entity_row(2)])
+        ))
+        assert [entity.entity_id for entity in client.get_local_player_entities()] == ['1']
+        assert '2' not in client.get_all_entities()
+        assert '2' not in client.get_all_circles()
+
+    @pytest.mark.asyncio
+    async def test_delete_and_insert_in_one_operation_is_an_update(self):
+        client = make_client()
+        await client._handle_transaction_update_data(transaction(
+            table_update('entity', inserts=[entity_row(1, x=0.0)])
+        ))
+        destroyed = []
+        client.on_entity_destroyed(destroyed.append)
+
+        await client._handle_transaction_update_data(transaction(
+            table_update('entity', inserts=[entity_row(1, x=5.0)], deletes=[entity_row(1, x=0.0)])
+        ))
+        assert client.get_all_entities()['1'].position == Vector2(5.0, 0.0)
+        assert destroyed == []
+
+    def test_entities_and_circles_by_type(self):
+        client = make_client()
+        client._entities['1'] = GameEntity(entity_id='1', entity_type=EntityType.FOOD)
+        client._entities['2'] = GameEntity(entity_id='2', entity_type=EntityType.OBSTACLE)
+        client._entities['3'] = GameEntity(entity_id='3', entity_type=EntityType.FOOD)
+
+        assert sorted(e.entity_id for e in client.get_entities_by_type(EntityType.FOOD)) == ['1', '3']
+        assert [e.entity_id for e in client.get_entities_by_type('Obstacle')] == ['2']
+        assert client.get_entities_by_type(EntityType.PLAYER) == []
+
+        client._circles['6'] = GameCircle(entity_id='6', circle_type='Food')
+        assert [c.circle_id for c in client.get_circles_by_type('food')] == ['6']
+
+
+class TestIndexBenchmark:
+    """Compare an indexed owner lookup against a full scan at 50k entities."""
+
+    def test_owner_lookup(self):
+        client = make_client()
+        for i in range(50_000):
+            entity_id = str(i)
+            client._entities[entity_id] = GameEntity(entity_id=entity_id)
+            if i % 1000 == 0:
+                client._circles[entity_id] = GameCircle(entity_id=entity_id, player_id='7', circle_type='player')
+        client._local_player = GamePlayer(entity_id='7', player_id='7')
+
+        start_time = time.perf_counter()
+        for _ in range(10):
+            scanned = [entity for entity in client._entities.values()
+                       if client._circles.get(entity.entity_id) is not None
+                       and client._circles[entity.entity_id].player_id == '7']
+        scan_ms = (time.perf_counter() - start_time) * 100
+
+        start_time = time.perf_counter()
+        for _ in range(100):
+            indexed = client.get_local_player_entities()
+        index_ms = (time.perf_counter() - start_time) * 10
+
+        print(f"Local player entities (50 of 50k): scan {scan_ms:.3f}ms, index {index_ms:.4f}ms")
+        assert sorted(e.entity_id for e in indexed) == sorted(e.entity_id for e in scanned)
+        assert index_ms < scan_ms
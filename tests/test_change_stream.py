@@ -0,0 +1,201 @@
+"""
+Tests for the change stream of table deltas.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from blackholio_client.client import GameClient
+from blackholio_client.connection.interest_management import InterestConfiguration
+from blackholio_client.events.change_stream import (
+    ChangeStream,
+    ChangeStreamConfig,
+    ChangeStreamLagError
+)
+from blackholio_client.models.game_entities import Vector2
+
+
+def transaction(table_name, inserts=(), deletes=()):
+    return {'type': 'transaction_update', 'update_data': {'status': {'Committed': {'tables': [{
+        'table_name': table_name,
+        'updates': [{'inserts': [json.dumps(row) for row in inserts],
+                     'deletes': [json.dumps(row) for row in deletes]}]
+    }]}}}}
+
+
+def entity_row(entity_id, x=0.0):
+    return {'entity_id': entity_id, 'position': {'x': x, 'y': 0.0}, 'mass': 10}
+
+
+def publish(stream: ChangeStream, table: str = 'entity', key: str = '1'):
+    stream.record(table, 'insert', key, {'key': key})
+    return stream.commit()
+
+
+def kinds_of(stream: ChangeStream):
+    return [[(change.table, change.kind, change.key) for change in batch.changes] for batch in stream.read(0)]
+
+
+async def take(iterator, count):
+    return [await iterator.__anext__() for _ in range(count)]
+
+
+class TestChangeStream:
+    """Test buffering, cursors and lag detection."""
+
+    def test_batches_are_numbered(self):
+        stream = ChangeStream()
+        assert stream.commit() is None
+        first = publish(stream)
+        second = publish(stream, key='2')
+
+        assert (first.cursor, second.cursor) == (1, 2)
+        assert stream.cursor == 2
+        assert stream.read(0) == [first, second]
+        assert stream.read(1) == [second]
+        assert stream.read(2) == []
+
+    @pytest.mark.asyncio
+    async def test_live_iteration(self):
+        stream = ChangeStream()
+        publish(stream, key='old')
+        iterator = stream.changes()
+
+        async def producer():
+            await asyncio.sleep(0.01)
+            publish(stream, key='a')
+            publish(stream, key='b')
+
+        task = asyncio.create_task(producer())
+        batches = await asyncio.wait_for(take(iterator, 2), timeout=1.0)
+        await task
+        assert [batch.changes[0].key for batch in batches] == ['a', 'b']
+
+    @pytest.mark.asyncio
+    async def test_resume_from_cursor_and_filter(self):
+        stream = ChangeStream()
+        publish(stream, 'entity', '1')
+        publish(stream, 'player', '2')
+        publish(stream, 'entity', '3')
+        stream.close()
+
+        batches = [batch async for batch in stream.changes(tables=['entity'], since=1)]
+        assert [batch.cursor for batch in batches] == [3]
+        assert batches[0].tables == {'entity'}
+
+        everything = [batch async for batch in stream.changes(since=0)]
+        assert [batch.cursor for batch in everything] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_is_told_it_fell_behind(self):
+        stream = ChangeStream(ChangeStreamConfig(capacity=3))
+        for i in range(5):
+            publish(stream, key=str(i))
+
+        with pytest.raises(ChangeStreamLagError) as info:
+            await stream.changes(since=0).__anext__()
+        assert info.value.oldest_cursor == 2
+        assert info.value.missed_batches == 2
+
+        # Resuming from the oldest cursor works
+        stream.close()
+        batches = [batch async for batch in stream.changes(since=info.value.oldest_cursor)]
+        assert [batch.cursor for batch in batches] == [3, 4, 5]
+        stats = stream.get_statistics()
+        assert stats['batches_dropped'] == 2
+        assert stats['lag_errors'] == 1
+
+    @pytest.mark.asyncio
+    async def test_publishing_never_waits_for_consumers(self):
+        stream = ChangeStream(ChangeStreamConfig(capacity=10))
+        iterator = stream.changes()
+        for i in range(1000):
+            publish(stream, key=str(i))
+        with pytest.raises(ChangeStreamLagError):
+            await iterator.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_close_ends_iteration(self):
+        stream = ChangeStream()
+        iterator = stream.changes()
+        waiter = asyncio.create_task(iterator.__anext__())
+        await asyncio.sleep(0.01)
+        stream.close()
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(waiter, timeout=1.0)
+
+    def test_config_validation(self):
+        with pytest.raises(ValueError):
+            ChangeStreamConfig(capacity=0).validate()
+
+
+class TestClientChangeStream:
+    """Test that GameClient publishes cache changes."""
+
+    @pytest.mark.asyncio
+    async def test_database_updates_become_batches(self):
+        client = GameClient("localhost:3000", "test_db", auto_reconnect=False)
+        with pytest.raises(RuntimeError):
+            client.changes()
+        stream = client.enable_change_stream()
+
+        await client._handle_transaction_update_data(transaction('entity', inserts=[entity_row(1), entity_row(2)]))
+        await client._handle_transaction_update_data(transaction('entity', inserts=[entity_row(1), entity_row(2)]))
+        await client._handle_transaction_update_data(
+            transaction('entity', inserts=[entity_row(1, x=5.0)], deletes=[entity_row(1)]))
+        await client._handle_transaction_update_data(transaction('entity', deletes=[entity_row(2)]))
+        client.disable_change_stream()
+
+        batches = [batch async for batch in stream.changes(since=0)]
+        kinds = [[(change.kind, change.key) for change in batch.changes] for batch in batches]
+        # Re-applying identical rows publishes nothing
+        assert kinds == [
+            [('insert', '1'), ('insert', '2')],
+            [('update', '1')],
+            [('delete', '2')]
+        ]
+        update = batches[1].changes[0]
+        assert update.old.position.x == 0.0 and update.row.position.x == 5.0
+        assert client.get_change_stream_statistics() == {'enabled': False}
+
+    @pytest.mark.asyncio
+    async def test_interest_evictions_publish_deletes(self):
+        client = GameClient("localhost:3000", "test_db", auto_reconnect=False)
+        for entity_id, x in (('near', 10.0), ('far', 50000.0), ('drifting', 20.0)):
+            await client._process_table_insert('entity', entity_row(entity_id, x=x))
+            await client._process_table_insert('circle', {'entity_id': entity_id, 'player_id': 1})
+        stream = client.enable_change_stream()
+        client.enable_interest_management(InterestConfiguration(cell_size=100.0, min_resubscribe_interval=0.0))
+
+        assert await client.update_interest(Vector2(0.0, 0.0), 10.0)
+        await client._handle_transaction_update_data(transaction('entity', inserts=[entity_row('drifting', x=90000.0)],
+                                                                 deletes=[entity_row('drifting', x=20.0)]))
+
+        assert sorted(client._entities) == sorted(client._circles) == ['near']
+        assert kinds_of(stream) == [
+            [('entity', 'delete', 'far'), ('circle', 'delete', 'far')],
+            [('entity', 'delete', 'drifting'), ('circle', 'delete', 'drifting')]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_resume_publishes_one_batch_with_circle_updates(self):
+        client = GameClient("localhost:3000", "test_db", auto_reconnect=False)
+        await client._handle_initial_subscription_data({'tables': {
+            'entity': [entity_row(1), entity_row(2)],
+            'circle': [{'entity_id': 1, 'radius': 1.0}, {'entity_id': 2, 'radius': 1.0}]
+        }})
+        stream = client.enable_change_stream()
+
+        await client._handle_initial_subscription_data({'resume': True, 'tables': {
+            'entity': [entity_row(1)],
+            'circle': [{'entity_id': 1, 'radius': 9.0}]
+        }})
+
+        # Stale rows are deleted in the same batch as the snapshot's changes
+        assert kinds_of(stream) == [
+            [('circle', 'update', '1'), ('entity', 'delete', '2'), ('circle', 'delete', '2')]
+        ]
+        update = stream.read(0)[0].changes[0]
+        assert (update.old.radius, update.row.radius) == (1.0, 9.0)
@@ -0,0 +1,218 @@
+"""
+Client benchmarks against the in-process fake SpacetimeDB server.
+
+GameClient and SpacetimeDBConnection talk to FakeSpacetimeDBServer over a
+real websocket, with the server on a background thread, so messages/sec,
+client CPU per message and end-to-end update latency can be measured
+without a SpacetimeDB server.
+
+TestFakeServer checks behaviour only. TestClientBenchmarks asserts
+wall-clock targets, so it is marked `benchmark` and left out of the
+default run (pytest -m benchmark runs it).
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from blackholio_client.client import GameClient
+from tests.fake_spacetimedb_server import (
+    FakeServerConfig,
+    FakeServerThread,
+    timestamp_micros,
+    update_timestamp_micros,
+)
+
+
+# Benchmark targets (50 entity rows per TransactionUpdate)
+BENCHMARK_TARGETS = {
+    'transaction_updates_per_second': 50,  # msgs/sec
+    'client_cpu_per_update_ms': 20.0,  # client thread CPU per message
+    'update_latency_p99_ms': 100.0,  # server tick to cache applied, over the network delay
+    'replay_frames_per_second': 50,  # recorded frames decoded and applied offline
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Get a percentile of a list of samples."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class UpdateProbe:
+    """Counts TransactionUpdates once GameClient has applied them to its cache."""
+
+    def __init__(self):
+        self.count = 0
+        self.latencies_ms: List[float] = []
+
+    def __call__(self, data: Dict[str, Any]) -> None:
+        self.count += 1
+        sent_at = update_timestamp_micros(data.get('update_data', {}))
+        if sent_at is not None:
+            self.latencies_ms.append((timestamp_micros() - sent_at) / 1000.0)
+
+    async def wait_for(self, count: int, timeout: float = 30.0) -> None:
+        """Wait until a number of updates have been applied."""
+        deadline = time.monotonic() + timeout
+        while self.count < count:
+            assert time.monotonic() < deadline, f"Only {self.count}/{count} updates arrived"
+            await asyncio.sleep(0.001)
+
+
+async def connect_client(server: FakeServerThread) -> GameClient:
+    """Connect a GameClient to a fake server."""
+    client = GameClient(server.host, "blackholio", auto_reconnect=False)
+    assert await client.connect()
+    return client
+
+
+def attach_probe(client: GameClient) -> UpdateProbe:
+    """Register an UpdateProbe after GameClient's own TransactionUpdate handlers."""
+    probe = UpdateProbe()
+    client._active_connection.on('transaction_update', probe)
+    return probe
+
+
+class TestFakeServer:
+    """Test the fake server against GameClient."""
+
+    @pytest.mark.asyncio
+    async def test_initial_subscription_populates_cache(self, fake_server):
+        server = fake_server(world_size=100, tick_rate=0)
+        client = await connect_client(server)
+        try:
+            assert len(client.get_all_entities()) == 100
+            assert client.identity.startswith("0x")
+            assert server.server.get_statistics()['subscribers'] == 1
+        finally:
+            await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_reducer_round_trip(self, fake_server):
+        server = fake_server(world_size=10, tick_rate=0)
+        client = await connect_client(server)
+        try:
+            result = await client.call_reducer_with_response("enter_game", "alice", timeout=5.0)
+            assert result['success']
+            assert client.get_local_player().name == "alice"
+            assert len(client.get_all_entities()) == 11
+            assert len(client.get_all_circles()) == 1
+
+            result = await client.call_reducer_with_response("enter_game", "", timeout=5.0)
+            assert not result['success']
+            assert result['error'] == "Name must not be empty"
+            assert server.server.get_statistics()['reducer_calls'] == {'enter_game': 2}
+        finally:
+            await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_ticks_move_entities(self, fake_server):
+        server = fake_server(world_size=20, tick_rate=0, moves_per_tick=5)
+        client = await connect_client(server)
+        try:
+            before = {entity_id: entity.position for entity_id, entity in client.get_all_entities().items()}
+            probe = attach_probe(client)
+            await asyncio.wrap_future(server.submit(server.server.broadcast_ticks(2)))
+            await probe.wait_for(2, timeout=5.0)
+
+            after = client.get_all_entities()
+            moved = [entity_id for entity_id in before if after[entity_id].position != before[entity_id]]
+            assert len(after) == 20
+            assert len(moved) == 10
+        finally:
+            await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_network_delay(self, fake_server):
+        server = fake_server(world_size=10, tick_rate=50, moves_per_tick=1, network_delay=0.03)
+        client = await connect_client(server)
+        try:
+            probe = attach_probe(client)
+            await probe.wait_for(5, timeout=5.0)
+            assert min(probe.latencies_ms) >= 30.0
+        finally:
+            await client.disconnect()
+
+    def test_config_validation(self):
+        with pytest.raises(ValueError):
+            FakeServerConfig(tick_rate=-1).validate()
+        with pytest.raises(ValueError):
+            FakeServerConfig(network_delay=-0.1).validate()
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+class TestClientBenchmarks:
+    """Benchmark the client's receive pipeline against the fake server."""
+
+    @pytest.mark.asyncio
+    async def test_transaction_update_throughput(self, fake_server, quiet_logging):
+        """Measure TransactionUpdates/sec and client CPU per update, sent back-to-back."""
+        updates = 200
+        server = fake_server(world_size=1000, tick_rate=0, moves_per_tick=50)
+        client = await connect_client(server)
+        try:
+            probe = attach_probe(client)
+            cpu_start = time.thread_time()
+            start_time = time.perf_counter()
+            send = server.submit(server.server.broadcast_ticks(updates))
+            await probe.wait_for(updates)
+            elapsed = time.perf_counter() - start_time
+            cpu_ms = (time.thread_time() - cpu_start) * 1000 / updates
+            await asyncio.wrap_future(send)
+        finally:
+            await client.disconnect()
+
+        updates_per_second = updates / elapsed
+        print(f"TransactionUpdate throughput: {updates_per_second:.0f} msgs/sec, "
+              f"{updates_per_second * 50:.0f} rows/sec, client CPU {cpu_ms:.2f}ms/msg")
+        assert updates_per_second > BENCHMARK_TARGETS['transaction_updates_per_second'], \
+            f"Receive pipeline too slow: {updates_per_second:.0f} msgs/sec"
+        assert cpu_ms < BENCHMARK_TARGETS['client_cpu_per_update_ms'], \
+            f"Client CPU per update too high: {cpu_ms:.2f}ms"
+
+    @pytest.mark.asyncio
+    async def test_update_latency_under_network_delay(self, fake_server, quiet_logging):
+        """Measure server tick to client cache latency at 30 ticks/sec with 10ms delay."""
+        delay_ms = 10.0
+        server = fake_server(world_size=1000, tick_rate=30, moves_per_tick=50, network_delay=delay_ms / 1000)
+        client = await connect_client(server)
+        try:
+            probe = attach_probe(client)
+            await probe.wait_for(60)
+        finally:
+            await client.disconnect()
+
+        p50, p99 = percentile(probe.latencies_ms, 50), percentile(probe.latencies_ms, 99)
+        print(f"Update latency with {delay_ms:.0f}ms delay: p50 {p50:.1f}ms, p99 {p99:.1f}ms")
+        assert p50 >= delay_ms
+        assert p99 - delay_ms < BENCHMARK_TARGETS['update_latency_p99_ms'], \
+            f"Update latency too high: p99 {p99:.1f}ms"
+
+    @pytest.mark.asyncio
+    async def test_recorded_session_replay_throughput(self, fake_server, quiet_logging, tmp_path):
+        """Record a session, then measure decode and cache throughput replaying it offline."""
+        updates = 200
+        path = tmp_path / "session.bhfr"
+        server = fake_server(world_size=1000, tick_rate=0, moves_per_tick=50)
+        client = await connect_client(server)
+        client.start_recording(path, compression='gzip')
+        try:
+            probe = attach_probe(client)
+            await asyncio.wrap_future(server.submit(server.server.broadcast_ticks(updates)))
+            await probe.wait_for(updates)
+        finally:
+            await client.disconnect()
+            client.stop_recording()
+
+        replayed = GameClient("localhost:3000", "blackholio", auto_reconnect=False)
+        stats = await replayed.replay_recording(path)
+
+        print(f"Replay throughput: {stats['frames_per_second']:.0f} frames/sec "
+              f"({stats['frames']} frames, {path.stat().st_size / 1024:.0f}KB recorded)")
+        assert stats['frames'] == updates
+        assert stats['frames_per_second'] > BENCHMARK_TARGETS['replay_frames_per_second'], \
+            f"Replay too slow: {stats['frames_per_second']:.0f} frames/sec"
@@ -0,0 +1,113 @@
+"""
+Tests for Connect Limiter - Reconnect Storm Protection
+
+Covers the process-wide connect token bucket, decorrelated-jitter backoff
+and the iterative SpacetimeDBConnection retry loop.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from blackholio_client.connection.connect_limiter import (
+    ConnectRateLimiter,
+    decorrelated_jitter,
+    get_connect_rate_limiter
+)
+from blackholio_client.connection.server_config import ServerConfig
+from blackholio_client.connection.spacetimedb_connection import SpacetimeDBConnection, ConnectionState
+from blackholio_client.exceptions.connection_errors import ConnectionLostError
+
+
+@pytest.fixture
+def server_config():
+    """Create test server configuration."""
+    return ServerConfig(
+        language="rust",
+        host="localhost",
+        port=8080,
+        db_identity="test_db",
+        protocol="v1.json.spacetimedb",
+        use_ssl=False
+    )
+
+
+class TestDecorrelatedJitter:
+    """Test decorrelated-jitter backoff."""
+
+    def test_delay_stays_within_bounds(self):
+        """Delays stay between the base and three times the previous delay, capped."""
+        delay = 1.0
+        for _ in range(200):
+            previous = delay
+            delay = decorrelated_jitter(previous, 1.0, 30.0)
+            assert 1.0 <= delay <= min(30.0, previous * 3)
+
+    def test_delays_are_spread_out(self):
+        """Clients starting from the same state do not pick the same delay."""
+        delays = {round(decorrelated_jitter(2.0, 2.0, 60.0), 6) for _ in range(20)}
+        assert len(delays) > 1
+
+
+class TestConnectRateLimiter:
+    """Test the connect token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_queue(self):
+        """Attempts beyond the burst are queued and counted."""
+        limiter = ConnectRateLimiter(rate=100.0, burst=2)
+        waits = await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+
+        assert waits[:2] == [0.0, 0.0]
+        assert all(wait > 0 for wait in waits[2:])
+
+        metrics = limiter.get_metrics()
+        assert metrics['attempts'] == 5
+        assert metrics['queued_attempts'] == 3
+        assert metrics['max_waiting'] == 3
+        assert metrics['waiting'] == 0
+
+    def test_invalid_configuration(self):
+        """Invalid bucket parameters are rejected."""
+        with pytest.raises(ValueError):
+            ConnectRateLimiter(rate=0)
+        with pytest.raises(ValueError):
+            ConnectRateLimiter(burst=0)
+
+    def test_connections_share_process_limiter(self, server_config):
+        """Connections use the process-wide limiter by default."""
+        connection = SpacetimeDBConnection(server_config)
+        assert connection._connect_limiter is get_connect_rate_limiter()
+
+
+class TestReconnectLoop:
+    """Test the iterative reconnect loop."""
+
+    @pytest.mark.asyncio
+    async def test_retries_until_connected(self, server_config):
+        """Failed attempts are retried in a loop until one succeeds."""
+        connection = SpacetimeDBConnection(server_config)
+        connection._connect_once = AsyncMock(side_effect=[ConnectionLostError("down"), False, True])
+
+        with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+            assert await connection._handle_connection_error(ConnectionLostError("lost"))
+
+        assert connection._connect_once.await_count == 3
+        assert sleep.await_count == 3
+        assert connection._reconnect_attempts == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, server_config):
+        """The loop stops and reports failure after the attempt limit."""
+        connection = SpacetimeDBConnection(server_config)
+        connection._connect_once = AsyncMock(side_effect=ConnectionLostError("down"))
+        failures = []
+        connection.on('connection_failed', failures.append)
+
+        with patch("asyncio.sleep", new=AsyncMock()):
+            assert not await connection._handle_connection_error(ConnectionLostError("lost"))
+
+        assert connection._connect_once.await_count == connection._max_reconnect_attempts
+        assert connection.state == ConnectionState.FAILED
+        assert failures
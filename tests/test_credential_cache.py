@@ -0,0 +1,104 @@
+"""
+Tests for Credential Cache - Shared Credential and Identity File Caching
+
+Covers mtime invalidation, atomic merged writes, credential loading on
+connect and lazy identity loading.
+"""
+
+import json
+import os
+
+import pytest
+
+from blackholio_client.auth.credential_cache import CredentialCache
+from blackholio_client.auth.identity_manager import IdentityManager
+from blackholio_client.connection.server_config import ServerConfig
+from blackholio_client.connection.spacetimedb_connection import SpacetimeDBConnection
+
+
+class TestCredentialCache:
+    """Test the mtime-invalidated JSON cache."""
+
+    def test_reads_are_cached_until_file_changes(self, tmp_path):
+        """Repeat reads hit memory; an external edit is picked up."""
+        path = tmp_path / "credentials.json"
+        path.write_text(json.dumps({'a': 1}))
+        cache = CredentialCache()
+
+        assert cache.read(path) == {'a': 1}
+        assert cache.read(path) == {'a': 1}
+        assert cache.get_statistics()['hits'] == 1
+
+        path.write_text(json.dumps({'a': 2, 'b': 3}))
+        os.utime(path, ns=(0, 10 ** 9))
+        assert cache.read(path) == {'a': 2, 'b': 3}
+        assert cache.get_statistics()['misses'] == 2
+
+    def test_reads_return_copies(self, tmp_path):
+        """Mutating a returned dict does not corrupt the cache."""
+        path = tmp_path / "credentials.json"
+        path.write_text(json.dumps({'a': {'token': 'x'}}))
+        cache = CredentialCache()
+
+        cache.read(path)['a']['token'] = 'changed'
+        assert cache.read(path) == {'a': {'token': 'x'}}
+
+    def test_missing_file(self, tmp_path):
+        """Missing files read as None."""
+        assert CredentialCache().read(tmp_path / "missing.json") is None
+
+    @pytest.mark.asyncio
+    async def test_update_merges_atomically(self, tmp_path):
+        """Updates keep other keys and leave no temporary files behind."""
+        path = tmp_path / "nested" / "credentials.json"
+        cache = CredentialCache()
+
+        await cache.update_async(path, 'host:a', {'token': '1'})
+        await cache.update_async(path, 'host:b', {'token': '2'})
+
+        assert json.loads(path.read_text()) == {'host:a': {'token': '1'}, 'host:b': {'token': '2'}}
+        assert [p.name for p in path.parent.iterdir()] == ['credentials.json']
+        if os.name != 'nt':
+            assert path.stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.asyncio
+    async def test_connection_round_trips_credentials(self, tmp_path):
+        """Credentials stored by one connection are loaded by the next."""
+        config = ServerConfig(language="rust", host="localhost", port=3000,
+                              db_identity="test_db", protocol="v1.json.spacetimedb", use_ssl=False)
+        first = SpacetimeDBConnection(config)
+        first._credentials_file = tmp_path / "credentials.json"
+        first._identity, first._auth_token = "abc", "token"
+        await first._store_credentials()
+
+        second = SpacetimeDBConnection(config)
+        second._credentials_file = first._credentials_file
+        await second._load_credentials()
+        assert (second._identity, second._auth_token) == ("abc", "token")
+
+
+class TestLazyIdentityLoading:
+    """Test lazy per-identity loading in IdentityManager."""
+
+    def test_identities_load_on_demand(self, tmp_path, monkeypatch):
+        """Construction reads nothing; identities load one file at a time."""
+        monkeypatch.chdir(tmp_path)
+        IdentityManager(tmp_path / "ids").create_identity("alice")
+        IdentityManager(tmp_path / "ids").create_identity("bob")
+
+        manager = IdentityManager(tmp_path / "ids")
+        assert manager._identities == {}
+
+        assert manager.load_identity("alice").name == "alice"
+        assert list(manager._identities) == ["alice"]
+        assert manager.load_identity("carol") is None
+
+        assert sorted(manager.list_identities()) == ["alice", "bob"]
+
+    def test_duplicate_detected_without_full_scan(self, tmp_path, monkeypatch):
+        """Creating an identity that exists on disk is rejected."""
+        monkeypatch.chdir(tmp_path)
+        IdentityManager(tmp_path / "ids").create_identity("alice")
+
+        with pytest.raises(ValueError):
+            IdentityManager(tmp_path / "ids").create_identity("alice")
@@ -0,0 +1,229 @@
+"""
+Tests for capturing inbound frames and replaying them through the receive pipeline.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from blackholio_client.client import GameClient
+from blackholio_client.connection.frame_recording import (
+    FrameReader,
+    FrameRecorder,
+    FrameReplayer,
+    RecordedFrame,
+    read_frames,
+)
+from blackholio_client.connection.server_config import ServerConfig
+from blackholio_client.connection.spacetimedb_connection import SpacetimeDBConnection
+from tests.fake_spacetimedb_server import FakeServerConfig, FakeServerThread
+
+
+def entity_row(entity_id: int, x: float, y: float, mass: int = 10) -> str:
+    return json.dumps({'entity_id': entity_id, 'position': {'x': x, 'y': y}, 'mass': mass})
+
+
+def transaction_update(inserts, deletes=()) -> str:
+    return json.dumps({'TransactionUpdate': {
+        'status': {'Committed': {'tables': [{
+            'table_name': 'entity',
+            'updates': [{'inserts': list(inserts), 'deletes': list(deletes)}]
+        }]}},
+        'timestamp': {'__timestamp_micros_since_unix_epoch__': 0}
+    }})
+
+
+def session_frames(count: int = 20, gap_ns: int = 5_000_000):
+    """Build an InitialSubscription followed by updates moving one entity."""
+    initial = json.dumps({'InitialSubscription': {
+        'database_update': {'tables': [{
+            'table_name': 'entity',
+            'updates': [{'inserts': [entity_row(1, 0, 0), entity_row(2, 50, 50)], 'deletes': []}]
+        }]},
+        'request_id': 1
+    }})
+    frames = [RecordedFrame(1_000_000_000, initial)]
+    for i in range(1, count):
+        update = transaction_update([entity_row(1, i, i)], [entity_row(1, i - 1, i - 1)])
+        frames.append(RecordedFrame(1_000_000_000 + i * gap_ns, update))
+    return frames
+
+
+class TestFrameFile:
+    """Test the recording file format."""
+
+    @pytest.mark.parametrize("compression", [None, 'gzip'])
+    def test_round_trip(self, tmp_path, compression):
+        path = tmp_path / "session.bhfr"
+        with FrameRecorder(path, compression=compression, buffer_size=128) as recorder:
+            recorder.record('{"a": "ünïcode"}', timestamp_ns=1)
+            recorder.record(b"\x00\x01binary", timestamp_ns=2)
+            for i in range(100):
+                recorder.record(json.dumps({'i': i}), timestamp_ns=10 + i)
+
+        frames = read_frames(path)
+        assert len(frames) == 102
+        assert frames[0] == RecordedFrame(1, '{"a": "ünïcode"}')
+        assert frames[1] == RecordedFrame(2, b"\x00\x01binary")
+        assert frames[-1].data == '{"i": 99}'
+        assert recorder.get_statistics()['frames'] == 102
+
+    def test_zstd_round_trip(self, tmp_path):
+        pytest.importorskip("zstandard")
+        path = tmp_path / "session.bhfr"
+        with FrameRecorder(path, compression='zstd') as recorder:
+            for i in range(50):
+                recorder.record(json.dumps({'i': i}))
+        with FrameRecorder(path, compression='zstd') as recorder:
+            recorder.record("second session")
+
+        frames = read_frames(path)
+        assert len(frames) == 51
+        assert frames[-1].data == "second session"
+
+    def test_gzip_compresses(self, tmp_path):
+        frames = session_frames(200)
+        sizes = {}
+        for compression in (None, 'gzip'):
+            path = tmp_path / f"{compression}.bhfr"
+            with FrameRecorder(path, compression=compression) as recorder:
+                for frame in frames:
+                    recorder.record(frame.data, frame.timestamp_ns)
+            sizes[compression] = path.stat().st_size
+        assert sizes['gzip'] < sizes[None] / 4
+
+    @pytest.mark.parametrize("compression", [None, 'gzip'])
+    def test_appending_sessions(self, tmp_path, compression):
+        path = tmp_path / "session.bhfr"
+        for session in range(3):
+            with FrameRecorder(path, compression=compression) as recorder:
+                recorder.record(f"session {session}")
+        assert [frame.data for frame in read_frames(path)] == ["session 0", "session 1", "session 2"]
+
+    def test_compression_mismatch(self, tmp_path):
+        path = tmp_path / "session.bhfr"
+        FrameRecorder(path, compression='gzip').close()
+        with pytest.raises(ValueError):
+            FrameRecorder(path)
+        with pytest.raises(ValueError):
+            FrameRecorder(tmp_path / "other.bhfr", compression='lz4')
+
+    def test_not_a_recording(self, tmp_path):
+        path = tmp_path / "session.bhfr"
+        path.write_bytes(b"not a recording")
+        with pytest.raises(ValueError):
+            FrameReader(path)
+
+    def test_truncated_tail(self, tmp_path):
+        path = tmp_path / "session.bhfr"
+        with FrameRecorder(path) as recorder:
+            for i in range(10):
+                recorder.record(f"frame {i}")
+        path.write_bytes(path.read_bytes()[:-3])
+
+        reader = FrameReader(path)
+        frames = list(reader)
+        assert len(frames) == 9
+        assert reader.truncated
+
+    def test_flush_makes_frames_readable(self, tmp_path):
+        path = tmp_path / "session.bhfr"
+        recorder = FrameRecorder(path, compression='gzip')
+        recorder.record("first")
+        recorder.flush()
+        try:
+            assert [frame.data for frame in read_frames(path)] == ["first"]
+        finally:
+            recorder.close()
+
+
+class TestFrameReplayer:
+    """Test replay pacing and pipeline replay."""
+
+    async def _drain(self, replayer: FrameReplayer):
+        return [frame async for frame in replayer.iter_frames()]
+
+    @pytest.mark.asyncio
+    async def test_as_fast_as_possible(self):
+        replayer = FrameReplayer(session_frames(20, gap_ns=50_000_000))
+        frames = await self._drain(replayer)
+        stats = replayer.get_statistics()
+        assert len(frames) == 20
+        assert stats['elapsed'] < replayer.recorded_duration / 10
+
+    @pytest.mark.asyncio
+    async def test_speed_multiplier(self):
+        replayer = FrameReplayer(session_frames(11, gap_ns=20_000_000), speed=4.0)
+        await self._drain(replayer)
+        stats = replayer.get_statistics()
+        assert replayer.recorded_duration == pytest.approx(0.2)
+        assert 0.05 <= stats['elapsed'] < 0.15
+
+    def test_invalid_speed(self):
+        with pytest.raises(ValueError):
+            FrameReplayer([], speed=-1)
+
+    @pytest.mark.asyncio
+    async def test_replay_through_connection(self):
+        connection = SpacetimeDBConnection(ServerConfig(
+            language='rust', host='localhost', port=3000, db_identity='blackholio', protocol='v1.json.spacetimedb'
+        ))
+        received = []
+        connection.on('transaction_update', received.append)
+
+        stats = await FrameReplayer(session_frames(10)).replay(connection)
+        assert stats['frames'] == 10
+        assert len(received) == 9
+        assert connection.connection_stats['messages_received'] == 10
+        assert connection.websocket is None
+
+    @pytest.mark.asyncio
+    async def test_replay_into_client(self, tmp_path):
+        path = tmp_path / "session.bhfr"
+        with FrameRecorder(path, compression='gzip') as recorder:
+            for frame in session_frames(30):
+                recorder.record(frame.data, frame.timestamp_ns)
+
+        client = GameClient("localhost:3000", "blackholio", auto_reconnect=False)
+        stats = await client.replay_recording(path)
+
+        entities = client.get_all_entities()
+        assert stats['frames'] == 30
+        assert stats['entities_count'] == 2
+        assert entities['1'].position.x == 29
+
+
+class TestLiveCapture:
+    """Capture a session against the fake server and replay it offline."""
+
+    @pytest.mark.asyncio
+    async def test_capture_and_replay_match_live_cache(self, tmp_path):
+        path = tmp_path / "live.bhfr"
+        with FakeServerThread(FakeServerConfig(world_size=50, tick_rate=0, moves_per_tick=10)) as server:
+            live = GameClient(server.host, "blackholio", auto_reconnect=False)
+            live.start_recording(path, compression='gzip')
+            assert await live.connect()
+            try:
+                await asyncio.wrap_future(server.submit(server.server.broadcast_ticks(20)))
+                deadline = time.monotonic() + 5.0
+                while live._active_connection.connection_stats['messages_received'] < 22:
+                    assert time.monotonic() < deadline
+                    await asyncio.sleep(0.01)
+                live_positions = {entity_id: entity.position for entity_id, entity in live.get_all_entities().items()}
+                live_identity = live.identity
+            finally:
+                await live.disconnect()
+                recording = live.stop_recording()
+
+        assert recording['frames'] >= 22
+
+        replayed = GameClient("localhost:3000", "blackholio", auto_reconnect=False)
+        stats = await replayed.replay_recording(path)
+
+        assert stats['frames'] == recording['frames']
+        replayed_positions = {entity_id: entity.position for entity_id, entity in replayed.get_all_entities().items()}
+        assert replayed_positions == live_positions
+        assert len(live_positions) == 50
+        assert replayed.identity == live_identity
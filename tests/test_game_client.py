@@ -0,0 +1,246 @@
+"""
+Tests for GameClient - Cache Maintenance and Session Handling
+
+Exercises GameClient cache behaviour directly through its table
+processing methods, without requiring a running SpacetimeDB server.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from blackholio_client.client import GameClient
+from blackholio_client.models.game_entities import Vector2
+from blackholio_client.reducers.input_channel import InputChannel, InputChannelConfig
+
+
+def make_client() -> GameClient:
+    """Create a GameClient that never touches the network."""
+    return GameClient("localhost:3000", "test_db", auto_reconnect=False)
+
+
+def snapshot(entities):
+    """Build a DatabaseUpdate-style snapshot for the entity table."""
+    return {'tables': {'entity': entities}}
+
+
+class TestResumeSnapshot:
+    """Test resuming a session by diffing the new snapshot against the caches."""
+
+    @pytest.mark.asyncio
+    async def test_resume_fires_only_real_changes(self):
+        """Unchanged rows fire no callbacks; changed, new and missing rows do."""
+        client = make_client()
+        await client._handle_initial_subscription_data(snapshot([
+            {'entity_id': 1, 'position': {'x': 0, 'y': 0}, 'mass': 10},
+            {'entity_id': 2, 'position': {'x': 5, 'y': 5}, 'mass': 10},
+            {'entity_id': 3, 'position': {'x': 9, 'y': 9}, 'mass': 10},
+        ]))
+
+        created, updated, destroyed = [], [], []
+        client.on_entity_created(created.append)
+        client.on_entity_updated(lambda old, new: updated.append(new))
+        client.on_entity_destroyed(destroyed.append)
+
+        resumed = snapshot([
+            {'entity_id': 1, 'position': {'x': 0, 'y': 0}, 'mass': 10},
+            {'entity_id': 2, 'position': {'x': 6, 'y': 5}, 'mass': 10},
+            {'entity_id': 4, 'position': {'x': 1, 'y': 1}, 'mass': 10},
+        ])
+        resumed['resume'] = True
+        await client._handle_initial_subscription_data(resumed)
+
+        assert [e.entity_id for e in created] == ['4']
+        assert [e.entity_id for e in updated] == ['2']
+        assert [e.entity_id for e in destroyed] == ['3']
+        assert sorted(client.get_all_entities()) == ['1', '2', '4']
+        assert client.get_client_statistics()['last_resume_diff'] == {
+            'inserts': 1, 'updates': 1, 'deletes': 1, 'unchanged': 1
+        }
+
+    @pytest.mark.asyncio
+    async def test_snapshot_without_resume_rehydrates(self):
+        """Without the resume flag every row is processed as an insert."""
+        client = make_client()
+        created = []
+        client.on_entity_created(created.append)
+
+        await client._handle_initial_subscription_data(snapshot([
+            {'entity_id': 1, 'position': {'x': 0, 'y': 0}},
+        ]))
+
+        assert len(created) == 1
+        assert client.get_client_statistics()['resumed_snapshots'] == 0
+
+
+class TestInputChannel:
+    """Test latest-wins, tick-aligned player input."""
+
+    @pytest.mark.asyncio
+    async def test_frames_collapse_to_ticks(self):
+        """Many submits within one tick produce one send of the newest direction."""
+        sent = []
+
+        async def send(direction):
+            sent.append(direction)
+            return True
+
+        channel = InputChannel(send, InputChannelConfig(tick_rate=20.0))
+        channel.submit({'x': 1.0, 'y': 0.0})
+        await asyncio.sleep(0)
+        for i in range(10):
+            channel.submit({'x': 0.0, 'y': i / 10})
+        await asyncio.sleep(0.08)
+        await channel.close()
+
+        assert sent == [{'x': 1.0, 'y': 0.0}, {'x': 0.0, 'y': 0.9}]
+        stats = channel.get_statistics()
+        assert stats['submitted'] == 11
+        assert stats['coalesced'] == 9
+        assert stats['sent'] == 2
+
+    @pytest.mark.asyncio
+    async def test_small_changes_are_suppressed(self):
+        """Directions within epsilon of the last send are not re-sent."""
+        send = AsyncMock(return_value=True)
+        channel = InputChannel(send, InputChannelConfig(tick_rate=1000.0, epsilon=0.05))
+
+        channel.submit({'x': 0.5, 'y': 0.5})
+        await channel.flush()
+        channel.submit({'x': 0.52, 'y': 0.49})
+        await channel.flush()
+        await channel.close()
+
+        assert send.await_count == 1
+        assert channel.get_statistics()['suppressed'] == 1
+
+    @pytest.mark.asyncio
+    async def test_game_client_routes_input_through_channel(self):
+        """move_player goes through the channel once it is enabled."""
+        client = make_client()
+        client._active_connection = AsyncMock()
+        client.enable_input_channel(InputChannelConfig(tick_rate=1000.0))
+
+        for _ in range(5):
+            assert await client.move_player(Vector2(1.0, 0.0))
+        await client.disable_input_channel()
+
+        client._active_connection.call_reducer.assert_awaited_once_with(
+            "update_player_input", [{'x': 1.0, 'y': 0.0}]
+        )
+        assert client.get_client_statistics()['input'] == {'enabled': False}
+
+    def test_invalid_configuration(self):
+        """Invalid configuration is rejected."""
+        with pytest.raises(ValueError):
+            InputChannel(AsyncMock(), InputChannelConfig(tick_rate=0))
+
+
+def transaction_update(request_id, status, caller_identity=None):
+    """Build the connection's transaction_update event for a reducer call."""
+    update = {
+        'status': status,
+        'reducer_call': {'reducer_name': 'enter_game', 'reducer_id': 0, 'args': '', 'request_id': request_id},
+        'energy_quanta_used': {'quanta': 10},
+    }
+    if caller_identity is not None:
+        update['caller_identity'] = caller_identity
+    return {'type': 'transaction_update', 'update_data': update}
+
+
+class TestReducerOutcomes:
+    """Test correlating reducer calls with their TransactionUpdate."""
+
+    @staticmethod
+    def sent_request_id(client):
+        """Get the u32 request id of the last reducer call sent."""
+        return client._active_connection.call_reducer.await_args.kwargs['request_id']
+
+    @pytest.mark.asyncio
+    async def test_call_stays_pending_until_committed(self):
+        """Sending a reducer does not mark it successful."""
+        client = make_client()
+        client._active_connection = AsyncMock()
+
+        assert await client.call_reducer("enter_game", "alice", request_id="req-1")
+        assert client.get_reducer_status("req-1").value == "pending"
+        assert client.get_client_statistics()['successful_reducers'] == 0
+
+        await client._handle_transaction_update_data(
+            transaction_update(self.sent_request_id(client), {'Committed': {'tables': []}})
+        )
+        assert client.get_reducer_status("req-1").value == "success"
+        assert client.get_pending_reducers() == []
+        assert client.get_client_statistics()['successful_reducers'] == 1
+
+    @pytest.mark.asyncio
+    async def test_call_with_response_awaits_commit(self):
+        """call_reducer_with_response returns the committed outcome and latency."""
+        client = make_client()
+        client._active_connection = AsyncMock()
+
+        async def commit_soon():
+            while not client._active_connection.call_reducer.await_count:
+                await asyncio.sleep(0)
+            await client._handle_transaction_update_data(
+                transaction_update(self.sent_request_id(client), {'Committed': {'tables': []}})
+            )
+            # The duplicate 'TransactionUpdate' event is ignored
+            await client._handle_transaction_update_data(
+                transaction_update(self.sent_request_id(client), {'Committed': {'tables': []}})
+            )
+
+        result, _ = await asyncio.gather(
+            client.call_reducer_with_response("enter_game", "alice", timeout=1.0),
+            commit_soon()
+        )
+
+        assert result['success']
+        assert result['commit_latency'] >= 0
+        assert client.get_client_statistics()['reducer_outcomes']['committed'] == 1
+
+    @pytest.mark.asyncio
+    async def test_server_failure_is_reported(self):
+        """A Failed status resolves the call as failed with the server's message."""
+        client = make_client()
+        client._identity = "0xABCD"
+        client._active_connection = AsyncMock()
+        errors = []
+        client.on_reducer_error(lambda request_id, error: errors.append((request_id, error)))
+
+        await client.call_reducer("enter_game", "", request_id="req-2")
+        await client._handle_transaction_update_data(
+            transaction_update(self.sent_request_id(client), {'Failed': 'Name must not be empty'},
+                               caller_identity={'__identity__': 'abcd'})
+        )
+
+        assert client.get_reducer_status("req-2").value == "failed"
+        assert errors == [("req-2", "Name must not be empty")]
+
+    @pytest.mark.asyncio
+    async def test_other_callers_updates_are_ignored(self):
+        """Updates for another identity's request ids do not resolve our calls."""
+        client = make_client()
+        client._identity = "0xabcd"
+        client._active_connection = AsyncMock()
+
+        await client.call_reducer("enter_game", "alice", request_id="req-3")
+        await client._handle_transaction_update_data(
+            transaction_update(self.sent_request_id(client), {'Committed': {'tables': []}},
+                               caller_identity="0x1234")
+        )
+
+        assert client.get_reducer_status("req-3").value == "pending"
+
+    @pytest.mark.asyncio
+    async def test_unanswered_call_times_out(self):
+        """A call with no TransactionUpdate is reported as timed out."""
+        client = make_client()
+        client._active_connection = AsyncMock()
+
+        result = await client.call_reducer_with_response("enter_game", "alice", timeout=0.01)
+
+        assert not result['success']
+        assert result['status'].value == "timeout"
+        assert client.get_client_statistics()['reducer_outcomes']['timeouts'] == 1
@@ -0,0 +1,97 @@
+"""
+Tests for Game Statistics - Leaderboards and Rolling Metrics
+
+Covers the incrementally maintained SessionStatistics leaderboards and
+the rolling-window growth counters.
+"""
+
+import random
+
+import pytest
+
+from blackholio_client.models.game_entities import GamePlayer
+from blackholio_client.models.game_statistics import (
+    SessionStatistics,
+    LeaderboardIndex,
+    RollingWindowCounter
+)
+
+
+def make_player(player_id: str, mass: float, score: int = 0) -> GamePlayer:
+    """Create a player with the given mass and score."""
+    return GamePlayer(entity_id=player_id, player_id=player_id, mass=mass, score=score)
+
+
+class TestLeaderboard:
+    """Test the incrementally maintained leaderboards."""
+
+    def test_matches_full_sort(self):
+        """Indexed top-k agrees with sorting every player."""
+        rng = random.Random(7)
+        session = SessionStatistics(session_id="s")
+        for _ in range(500):
+            player_id = f"p{rng.randrange(50)}"
+            session.update_player_statistics(make_player(player_id, rng.uniform(1, 100), rng.randrange(1000)))
+
+        for metric in ('current_mass', 'max_score_achieved'):
+            expected = sorted(session.player_statistics.values(), key=lambda s: getattr(s, metric), reverse=True)
+            top = session.get_top_players(metric, limit=10)
+            assert [p['player_id'] for p in top] == [s.player_id for s in expected[:10]]
+
+    def test_ties_keep_join_order(self):
+        """Players with equal values are ranked in the order they joined."""
+        session = SessionStatistics(session_id="s")
+        for player_id in ("a", "b", "c"):
+            session.add_player(player_id, initial_mass=5.0)
+
+        assert [p['player_id'] for p in session.get_top_players('current_mass', 3)] == ["a", "b", "c"]
+        assert session.get_player_rank("c", 'current_mass') == 3
+
+    def test_consumption_updates_rank(self):
+        """Recording consumption moves the player in the index."""
+        session = SessionStatistics(session_id="s")
+        session.add_player("a")
+        session.add_player("b")
+        session.record_player_consumption("b", "a", 10.0)
+
+        assert session.get_top_players('players_consumed', 1)[0]['player_id'] == "b"
+
+    def test_unindexed_metric_falls_back_to_sort(self):
+        """Time-dependent metrics are still sorted on demand."""
+        session = SessionStatistics(session_id="s")
+        session.add_player("a")
+        assert len(session.get_top_players('survival_time')) == 1
+
+    def test_index_remove(self):
+        """Removed players leave the index."""
+        index = LeaderboardIndex('current_mass')
+        index.update("a", 1.0, 0)
+        index.update("b", 2.0, 1)
+        index.remove("b")
+        assert index.top(5) == ["a"]
+        assert len(index) == 1
+
+
+class TestRollingWindowCounter:
+    """Test the bucketed rolling window."""
+
+    def test_values_expire(self):
+        """Values older than the window drop out."""
+        counter = RollingWindowCounter(window_seconds=60.0, bucket_count=6)
+        counter.add(10.0, now=0.0)
+        counter.add(5.0, now=30.0)
+
+        assert counter.total(now=30.0) == 15.0
+        assert counter.total(now=65.0) == 5.0
+        assert counter.per_minute(now=200.0) == 0.0
+
+    def test_player_rates(self):
+        """Mass and score growth show up as per-minute rates."""
+        session = SessionStatistics(session_id="s")
+        session.update_player_statistics(make_player("a", 10.0, 0))
+        session.update_player_statistics(make_player("a", 25.0, 40))
+
+        stats = session.player_statistics["a"].to_dict()
+        assert stats['mass_per_minute'] == pytest.approx(15.0)
+        assert stats['score_per_minute'] == pytest.approx(40.0)
+        assert session.get_session_rates()['mass_per_minute'] == pytest.approx(15.0)
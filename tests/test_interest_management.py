@@ -0,0 +1,159 @@
+"""
+Tests for Interest Management - Area-of-Interest Subscriptions
+
+Covers region computation, hysteresis, query building and GameClient
+cache eviction for viewport-following subscriptions.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from blackholio_client.client import GameClient
+from blackholio_client.connection.interest_management import (
+    InterestManager,
+    InterestConfiguration,
+    column_query_builder
+)
+from blackholio_client.models.game_entities import GameEntity, GamePlayer, Vector2
+from blackholio_client.models.physics import calculate_view_distance
+
+
+@pytest.fixture
+def interest_config():
+    """Create a small-grid interest configuration."""
+    return InterestConfiguration(
+        cell_size=100.0,
+        view_margin=1.0,
+        hysteresis_cells=1,
+        min_resubscribe_interval=0.0
+    )
+
+
+class TestInterestManager:
+    """Test area-of-interest region tracking."""
+
+    def test_region_covers_view_distance(self, interest_config):
+        """Region must cover the full view distance around the player."""
+        manager = InterestManager(interest_config)
+        center = Vector2(1000.0, 1000.0)
+        region = manager.compute_region(center, mass=100.0)
+
+        view = calculate_view_distance(100.0)
+        assert region.contains(center.x - view, center.y)
+        assert region.contains(center.x + view - 1e-6, center.y + view - 1e-6)
+        assert not region.contains(center.x + view + 2 * interest_config.cell_size, center.y)
+
+    def test_hysteresis_suppresses_small_moves(self, interest_config):
+        """Moves within the hysteresis band do not trigger a re-subscription."""
+        manager = InterestManager(interest_config)
+        assert manager.update(Vector2(1050.0, 1050.0), 100.0, now=0.0) is not None
+        assert manager.update(Vector2(1140.0, 1050.0), 100.0, now=1.0) is None
+        assert manager.update(Vector2(1350.0, 1050.0), 100.0, now=2.0) is not None
+        assert manager.get_statistics()['resubscriptions'] == 2
+
+    def test_rate_limit_suppresses_resubscription(self):
+        """Re-subscriptions are rate limited."""
+        manager = InterestManager(InterestConfiguration(cell_size=100.0, min_resubscribe_interval=5.0))
+        manager.update(Vector2(0.0, 0.0), 10.0, now=0.0)
+        assert manager.update(Vector2(5000.0, 0.0), 10.0, now=1.0) is None
+        assert manager.get_statistics()['suppressed_resubscriptions'] == 1
+        assert manager.update(Vector2(5000.0, 0.0), 10.0, now=6.0) is not None
+
+    def test_default_queries_are_whole_tables(self, interest_config):
+        """Subscription SQL cannot filter on position fields, so the default subscribes whole tables."""
+        manager = InterestManager(interest_config)
+        queries = manager.update(Vector2(0.0, 0.0), 10.0, now=0.0)
+
+        assert queries == [f"SELECT * FROM {table}" for table in
+                           interest_config.global_tables + interest_config.spatial_tables]
+
+    def test_column_query_builder_filters_scalar_columns(self, interest_config):
+        """Servers with scalar position columns can filter the region server-side."""
+        manager = InterestManager(interest_config, column_query_builder("pos_x", "pos_y"))
+        queries = manager.update(Vector2(0.0, 0.0), 10.0, now=0.0)
+
+        min_x, min_y, max_x, max_y = manager.region.bounds
+        assert "SELECT * FROM player" in queries
+        assert (f"SELECT * FROM entity WHERE pos_x >= {min_x} AND pos_x < {max_x} AND "
+                f"pos_y >= {min_y} AND pos_y < {max_y}") in queries
+
+    def test_invalid_configuration(self):
+        """Invalid configuration is rejected."""
+        with pytest.raises(ValueError):
+            InterestManager(InterestConfiguration(cell_size=0))
+
+
+class TestGameClientInterest:
+    """Test GameClient cache eviction with interest management enabled."""
+
+    @pytest.mark.asyncio
+    async def test_out_of_view_rows_are_evicted(self, interest_config):
+        """Entities outside the area of interest are dropped from the caches."""
+        client = GameClient("localhost:3000", "test_db", auto_reconnect=False)
+        client.enable_interest_management(interest_config)
+        client._local_player = GamePlayer(entity_id="1", player_id="1", position=Vector2(0.0, 0.0), mass=10.0)
+
+        client._entities["near"] = GameEntity(entity_id="near", position=Vector2(10.0, 10.0))
+        client._entities["far"] = GameEntity(entity_id="far", position=Vector2(50000.0, 0.0))
+
+        assert await client.update_interest()
+        assert "near" in client._entities
+        assert "far" not in client._entities
+
+        stats = client.get_interest_statistics()
+        assert stats['enabled']
+        assert stats['rows_evicted'] == 1
+        assert stats['rows_in_view'] == 1
+
+    @pytest.mark.asyncio
+    async def test_out_of_view_inserts_are_rejected(self, interest_config):
+        """Inserts outside the area of interest are counted but not cached."""
+        client = GameClient("localhost:3000", "test_db", auto_reconnect=False)
+        client.enable_interest_management(interest_config)
+        await client.update_interest(Vector2(0.0, 0.0), 10.0)
+
+        await client._process_table_insert("entity", {"entity_id": 1, "position": {"x": 5.0, "y": 5.0}})
+        await client._process_table_insert("entity", {"entity_id": 2, "position": {"x": 90000.0, "y": 0.0}})
+
+        assert list(client._entities.keys()) == ["1"]
+        stats = client.get_interest_statistics()
+        assert stats['rows_received'] == 2
+        assert stats['rows_rejected'] == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_queries_are_not_resent(self, interest_config):
+        """Moving the region only re-subscribes when the query set changes."""
+        connection = MagicMock(subscribe_queries=AsyncMock())
+        client = GameClient("localhost:3000", "test_db", auto_reconnect=False)
+        client._active_connection = connection
+        client.enable_interest_management(interest_config)
+
+        assert await client.update_interest(Vector2(0.0, 0.0), 10.0)
+        assert await client.update_interest(Vector2(5000.0, 0.0), 10.0)
+        assert connection.subscribe_queries.await_count == 1
+
+        client.enable_interest_management(interest_config, column_query_builder())
+        assert await client.update_interest(Vector2(0.0, 0.0), 10.0)
+        assert await client.update_interest(Vector2(5000.0, 0.0), 10.0)
+        assert connection.subscribe_queries.await_count == 3
+        assert client.get_interest_statistics()['subscriptions_sent'] == 2
+
+    @pytest.mark.asyncio
+    async def test_circles_follow_their_entities(self, interest_config):
+        """Circles of evicted entities are not re-cached until the entity is back in view."""
+        client = GameClient("localhost:3000", "test_db", auto_reconnect=False)
+        client.enable_interest_management(interest_config)
+        await client.update_interest(Vector2(0.0, 0.0), 10.0)
+
+        await client._process_table_insert("circle", {"entity_id": 1, "player_id": 7})
+        await client._process_table_insert("entity", {"entity_id": 1, "position": {"x": 5.0, "y": 5.0}})
+        assert list(client._circles) == ["1"]
+
+        await client._process_table_update("entity", {"entity_id": 1, "position": {"x": 90000.0, "y": 0.0}})
+        await client._process_table_update("circle", {"entity_id": 1, "player_id": 7, "radius": 3.0})
+        assert not client._entities and not client._circles
+
+        await client._process_table_update("entity", {"entity_id": 1, "position": {"x": 6.0, "y": 5.0}})
+        assert list(client._circles) == ["1"]
+        assert client._circles["1"].radius == 3.0
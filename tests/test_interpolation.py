@@ -0,0 +1,202 @@
+"""
+Tests for entity interpolation and extrapolation between server updates.
+"""
+
+import asyncio
+import json
+import random
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from blackholio_client.client import GameClient
+from blackholio_client.models.game_entities import Vector2
+from blackholio_client.models.interpolation import InterpolationBuffer, InterpolationConfig
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_buffer(**config) -> InterpolationBuffer:
+    config.setdefault('delay', 0.0)
+    return InterpolationBuffer(InterpolationConfig(**config), clock=FakeClock())
+
+
+class TestInterpolationBuffer:
+    """Test InterpolationBuffer sampling."""
+
+    def test_interpolates_between_snapshots(self):
+        buffer = make_buffer()
+        buffer.push('1', Vector2(0, 0), timestamp=1.0)
+        buffer.push('1', Vector2(10, 20), timestamp=2.0)
+
+        ids, positions = buffer.sample(1.25)
+        assert ids == ['1']
+        assert positions[0].tolist() == [2.5, 5.0]
+        assert buffer.get_position('1', 1.25) == Vector2(2.5, 5.0)
+
+    def test_delay(self):
+        buffer = make_buffer(delay=0.5)
+        buffer.push('1', Vector2(0, 0), timestamp=1.0)
+        buffer.push('1', Vector2(10, 0), timestamp=2.0)
+        assert buffer.positions_at(2.0)['1'] == Vector2(5.0, 0.0)
+
+    def test_extrapolation_capped(self):
+        buffer = make_buffer(max_extrapolation=0.5)
+        buffer.push('1', Vector2(0, 0), timestamp=1.0)
+        buffer.push('1', Vector2(10, 0), timestamp=2.0)
+
+        assert buffer.positions_at(2.25)['1'] == Vector2(12.5, 0.0)
+        assert buffer.positions_at(10.0)['1'] == Vector2(15.0, 0.0)
+        assert buffer.get_position('1', 10.0) == Vector2(15.0, 0.0)
+
+    def test_clamps_before_oldest_and_single_snapshot(self):
+        buffer = make_buffer()
+        buffer.push('1', Vector2(3, 4), timestamp=1.0)
+        buffer.push('2', Vector2(0, 0), timestamp=1.0)
+        buffer.push('2', Vector2(10, 0), timestamp=2.0)
+
+        positions = buffer.positions_at(0.0)
+        assert positions == {'1': Vector2(3, 4), '2': Vector2(0, 0)}
+        assert buffer.positions_at(5.0)['1'] == Vector2(3, 4)
+
+    def test_history_window(self):
+        buffer = make_buffer(history_size=3)
+        for i in range(10):
+            buffer.push('1', Vector2(i, 0), timestamp=float(i))
+        # Only the last three snapshots (t=7..9) are kept
+        assert buffer.positions_at(0.0)['1'] == Vector2(7, 0)
+        assert buffer.positions_at(8.5)['1'] == Vector2(8.5, 0)
+
+    def test_stale_and_duplicate_snapshots(self):
+        buffer = make_buffer()
+        buffer.push('1', Vector2(0, 0), timestamp=1.0)
+        buffer.push('1', Vector2(10, 0), timestamp=2.0)
+        buffer.push('1', Vector2(99, 0), timestamp=1.5)
+        buffer.push('1', Vector2(20, 0), timestamp=2.0)
+
+        assert buffer.positions_at(1.5)['1'] == Vector2(10.0, 0.0)
+        assert buffer.get_statistics()['stale_snapshots'] == 1
+
+    def test_push_many_matches_push(self):
+        single, bulk = make_buffer(), make_buffer()
+        rng = random.Random(3)
+        ids = [str(i) for i in range(50)]
+        for tick in range(6):
+            xs = [rng.uniform(0, 100) for _ in ids]
+            ys = [rng.uniform(0, 100) for _ in ids]
+            bulk.push_many(ids, xs, ys, timestamp=tick * 0.05)
+            for entity_id, x, y in zip(ids, xs, ys):
+                single.push(entity_id, Vector2(x, y), timestamp=tick * 0.05)
+
+        for render_time in (0.0, 0.12, 0.25, 0.3, 1.0):
+            assert np.allclose(single.sample(render_time)[1], bulk.sample(render_time)[1])
+
+    def test_vectorised_matches_scalar(self):
+        buffer = make_buffer(history_size=5, max_extrapolation=0.1)
+        rng = random.Random(11)
+        for entity in range(200):
+            t = rng.uniform(0, 0.2)
+            for _ in range(rng.randint(1, 8)):
+                buffer.push(str(entity), Vector2(rng.uniform(-50, 50), rng.uniform(-50, 50)), timestamp=t)
+                t += rng.uniform(0.01, 0.1)
+
+        for render_time in (0.0, 0.1, 0.3, 0.6, 2.0):
+            ids, positions = buffer.sample(render_time)
+            for entity_id, (x, y) in zip(ids, positions.tolist()):
+                expected = buffer.get_position(entity_id, render_time)
+                assert x == pytest.approx(expected.x)
+                assert y == pytest.approx(expected.y)
+
+    def test_remove_and_growth(self):
+        buffer = make_buffer(initial_capacity=2)
+        for i in range(10):
+            buffer.push(str(i), Vector2(i, i), timestamp=1.0)
+        assert buffer.get_statistics()['capacity'] >= 10
+
+        assert buffer.remove('3')
+        assert not buffer.remove('3')
+        buffer.push('new', Vector2(-1, -1), timestamp=1.0)
+
+        positions = buffer.positions_at(1.0)
+        assert '3' not in positions
+        assert positions['new'] == Vector2(-1, -1)
+        assert positions['9'] == Vector2(9, 9)
+        assert buffer.positions_at(1.0, entity_ids=['9', 'missing']) == {'9': Vector2(9, 9)}
+
+    def test_config_validation(self):
+        with pytest.raises(ValueError):
+            InterpolationConfig(history_size=1).validate()
+        with pytest.raises(ValueError):
+            InterpolationConfig(max_extrapolation=-1).validate()
+
+
+def entity_update(entity_id: int, x: float, y: float) -> dict:
+    row = json.dumps({'entity_id': entity_id, 'position': {'x': x, 'y': y}, 'mass': 10})
+    return {'type': 'transaction_update', 'update_data': {'status': {'Committed': {'tables': [
+        {'table_name': 'entity', 'updates': [{'inserts': [row], 'deletes': []}]}
+    ]}}}}
+
+
+class TestClientInterpolation:
+    """Test that GameClient records entity updates for interpolation."""
+
+    @pytest.mark.asyncio
+    async def test_updates_are_interpolated(self):
+        client = GameClient("localhost:3000", "test_db", auto_reconnect=False)
+        with pytest.raises(RuntimeError):
+            client.get_interpolated_positions()
+
+        buffer = client.enable_interpolation(InterpolationConfig(delay=0.0))
+        await client._handle_transaction_update_data(entity_update(1, 0, 0))
+        first = time.monotonic()
+        await asyncio.sleep(0.02)
+        await client._handle_transaction_update_data(entity_update(1, 10, 0))
+
+        ids, positions = client.get_interpolated_positions(first)
+        assert ids == ['1']
+        assert 0.0 <= positions[0][0] < 10.0
+        assert client.get_client_statistics()['interpolation']['entities'] == 1
+
+        client.clear_table_cache()
+        assert len(buffer) == 0
+
+    def test_disabled_statistics(self):
+        client = GameClient("localhost:3000", "test_db", auto_reconnect=False)
+        assert client.get_interpolation_statistics() == {'enabled': False}
+
+
+class TestInterpolationBenchmark:
+    """Benchmark sampling every entity once per render frame."""
+
+    def test_sample_throughput(self):
+        entities = 5000
+        buffer = make_buffer(delay=0.1)
+        rng = random.Random(5)
+        ids = [str(i) for i in range(entities)]
+        for tick in range(4):
+            buffer.push_many(ids, [rng.uniform(0, 1000) for _ in ids], [rng.uniform(0, 1000) for _ in ids],
+                             timestamp=tick / 20)
+
+        frames = 50
+        start_time = time.perf_counter()
+        for frame in range(frames):
+            buffer.sample(0.1 + frame / 240)
+        vectorised_ms = (time.perf_counter() - start_time) * 1000 / frames
+
+        start_time = time.perf_counter()
+        for entity_id in ids:
+            buffer.get_position(entity_id, 0.15)
+        per_entity_ms = (time.perf_counter() - start_time) * 1000
+
+        print(f"Interpolating {entities} entities: {vectorised_ms:.2f}ms/frame vectorised, "
+              f"{per_entity_ms:.2f}ms/frame per-entity")
+        assert vectorised_ms < per_entity_ms
+        assert vectorised_ms < 16.0, f"Sampling misses a 60fps frame budget: {vectorised_ms:.2f}ms"
@@ -0,0 +1,196 @@
+"""
+Tests for the logging pipeline: JSON formatting, rate limiting and
+bounded async logging.
+"""
+
+import json
+import logging
+
+import pytest
+
+from blackholio_client.utils.logging_config import (
+    BoundedQueueHandler,
+    JsonFormatter,
+    LoggingConfig,
+    RateLimitFilter,
+    SensitiveDataFilter,
+)
+
+
+def make_record(name="blackholio_client.test", level=logging.INFO, msg="hello", **extra):
+    """Create a log record with extra fields."""
+    record = logging.LogRecord(name, level, __file__, 1, msg, None, None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+class ListHandler(logging.Handler):
+    """Handler that keeps records in memory."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestJsonFormatter:
+    """Test JsonFormatter."""
+
+    def test_extra_fields_included(self):
+        output = json.loads(JsonFormatter().format(make_record(player_id=7, tags=["a"])))
+        assert output['message'] == "hello"
+        assert output['player_id'] == 7
+        assert output['tags'] == ["a"]
+        assert 'msg' not in output
+
+    def test_unserializable_values_become_strings(self):
+        value = object()
+        output = json.loads(JsonFormatter().format(make_record(obj=value)))
+        assert output['obj'] == str(value)
+
+    def test_non_string_keys_fall_back(self):
+        circular = []
+        circular.append(circular)
+        output = json.loads(JsonFormatter().format(make_record(mapping={(1, 2): 3}, loop=circular)))
+        assert output['mapping'] == str({(1, 2): 3})
+        assert output['loop'] == str(circular)
+
+    def test_rate_limit_marker_skipped(self):
+        output = json.loads(JsonFormatter().format(make_record(_rate_limited=False, _trace_id="abc")))
+        assert '_rate_limited' not in output
+        # Other underscore-prefixed extras are still fields
+        assert output['_trace_id'] == "abc"
+
+
+class TestSensitiveDataFilter:
+    """Test SensitiveDataFilter."""
+
+    def test_masks_all_patterns(self):
+        sensitive_filter = SensitiveDataFilter()
+        text = "password=hunter2, API_KEY: abc, {'access_token': zz}, private_key=k1 user=bob"
+        assert sensitive_filter._mask_sensitive_data(text) == (
+            "password=[REDACTED], API_KEY: [REDACTED], {'access_token': [REDACTED]}, "
+            "private_key=[REDACTED] user=bob"
+        )
+
+    def test_text_without_keywords_unchanged(self):
+        sensitive_filter = SensitiveDataFilter()
+        text = "Connected to localhost:3000 in 12.5ms"
+        assert sensitive_filter._mask_sensitive_data(text) is text
+
+    def test_masks_message_and_args(self):
+        record = logging.LogRecord("blackholio_client.auth", logging.INFO, __file__, 1,
+                                   "secret=%s", ("token=abc", 5), None)
+        assert SensitiveDataFilter(mask_value="***").filter(record)
+        assert record.msg == "secret=***"
+        assert record.args == ("token=***", 5)
+
+    def test_mask_value_is_literal(self):
+        assert SensitiveDataFilter(mask_value=r"<\1>")._mask_sensitive_data("pwd=x") == r"pwd=<\1>"
+
+
+class TestRateLimitFilter:
+    """Test RateLimitFilter."""
+
+    def test_burst_then_suppressed(self):
+        rate_filter = RateLimitFilter(rate=1.0, burst=3)
+        results = [rate_filter.filter(make_record()) for _ in range(5)]
+        assert results == [True, True, True, False, False]
+
+        stats = rate_filter.get_statistics()
+        assert stats['passed'] == 3
+        assert stats['suppressed'] == 2
+
+    def test_warnings_exempt(self):
+        rate_filter = RateLimitFilter(rate=1.0, burst=1)
+        rate_filter.filter(make_record())
+        assert rate_filter.filter(make_record()) is False
+        assert rate_filter.filter(make_record(level=logging.WARNING)) is True
+
+    def test_suppressed_count_reported(self):
+        rate_filter = RateLimitFilter(rate=1000.0, burst=1)
+        assert rate_filter.filter(make_record())
+        assert not rate_filter.filter(make_record())
+
+        # Refill the bucket
+        rate_filter._buckets["blackholio_client.test"][0] = 1.0
+        record = make_record()
+        assert rate_filter.filter(record)
+        assert record.suppressed == 1
+
+    def test_per_logger_limits(self):
+        rate_filter = RateLimitFilter(logger_rates={'blackholio_client.connection': 1.0})
+        hot = [rate_filter.filter(make_record(name="blackholio_client.connection.ws")) for _ in range(3)]
+        other = [rate_filter.filter(make_record(name="blackholio_client.client")) for _ in range(3)]
+        assert hot == [True, False, False]
+        assert other == [True, True, True]
+
+    def test_decision_shared_across_handlers(self):
+        rate_filter = RateLimitFilter(rate=1.0, burst=1)
+        record = make_record()
+        assert rate_filter.filter(record)
+        assert rate_filter.filter(record)
+        assert rate_filter.get_statistics()['passed'] == 1
+
+
+class TestBoundedQueueHandler:
+    """Test BoundedQueueHandler."""
+
+    def test_drops_when_full(self):
+        handler = BoundedQueueHandler(maxsize=2)
+        for _ in range(3):
+            handler.handle(make_record())
+        handler.handle(make_record(level=logging.ERROR))
+
+        stats = handler.get_statistics()
+        assert stats['enqueued'] == 2
+        assert stats['dropped'] == 2
+        assert stats['dropped_by_level'] == {'INFO': 1, 'ERROR': 1}
+        assert stats['high_water'] == 2
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            BoundedQueueHandler(maxsize=0)
+
+
+class TestAsyncLogging:
+    """Test LoggingConfig async mode."""
+
+    @pytest.fixture
+    def config(self):
+        config = LoggingConfig()
+        yield config
+        config.stop_async_logging()
+        config.setup_logging(level="INFO")
+
+    def test_records_written_by_listener(self, config):
+        config.setup_logging(level="INFO", async_logging=True, filter_sensitive=False)
+        target = ListHandler()
+        config._queue_listener.handlers = config._queue_listener.handlers + (target,)
+
+        client_logger = logging.getLogger("blackholio_client")
+        assert client_logger.handlers == [config.queue_handler]
+
+        logging.getLogger("blackholio_client.test").info("async %s", "message")
+        config.stop_async_logging()
+
+        assert [record.getMessage() for record in target.records] == ["async message"]
+        assert config.get_statistics()['queue']['enqueued'] == 1
+        assert config.queue_handler not in client_logger.handlers
+
+    def test_rate_limit_configured(self, config):
+        config.setup_logging(level="INFO", async_logging=True, rate_limit=1.0)
+        stats = config.get_statistics()
+        assert stats['async_logging'] is True
+        assert stats['rate_limit'] == {'passed': 0, 'suppressed': 0, 'suppressed_by_logger': {}}
+        assert config.queue_handler.filters[0] is config.filters['rate_limit']
+
+    def test_resetup_replaces_listener(self, config):
+        config.setup_logging(level="INFO", async_logging=True)
+        first = config._queue_listener
+        config.setup_logging(level="INFO")
+        assert first._thread is None
+        assert config.get_statistics()['async_logging'] is False
@@ -0,0 +1,102 @@
+"""
+Tests for Outcome Tracker - Reducer Commit Tracking
+
+Covers request id allocation, bounded pending state, lazy expiry and
+commit latency statistics.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from blackholio_client.connection.reducer_encoding import stamp_request_id
+from blackholio_client.interfaces.reducer_interface import ReducerStatus
+from blackholio_client.reducers.outcome_tracker import ReducerOutcomeTracker
+
+
+class TestReducerOutcomeTracker:
+    """Test the reducer outcome tracker."""
+
+    @pytest.mark.asyncio
+    async def test_resolve_completes_future(self):
+        """Resolving a wire id completes the caller's future with the outcome."""
+        tracker = ReducerOutcomeTracker()
+        wire_id, future = tracker.register("a", "enter_game")
+
+        outcome = tracker.resolve(wire_id, ReducerStatus.SUCCESS)
+
+        assert future.done()
+        assert future.result() is outcome
+        assert outcome.commit_latency >= 0
+        assert tracker.resolve(wire_id, ReducerStatus.SUCCESS) is None
+        assert tracker.get_statistics()['unmatched_updates'] == 1
+
+    @pytest.mark.asyncio
+    async def test_wire_ids_are_unique(self):
+        """Each pending call gets its own u32 request id."""
+        tracker = ReducerOutcomeTracker()
+        wire_ids = {tracker.register(str(i), "enter_game")[0] for i in range(100)}
+        assert len(wire_ids) == 100
+        assert all(0 < wire_id <= 0xFFFFFFFF for wire_id in wire_ids)
+
+    @pytest.mark.asyncio
+    async def test_pending_calls_are_bounded(self):
+        """Registering past the bound evicts the oldest call as a timeout."""
+        tracker = ReducerOutcomeTracker(max_pending=2)
+        _, first = tracker.register("a", "enter_game")
+        tracker.register("b", "enter_game")
+        tracker.register("c", "enter_game")
+
+        assert first.result().status == ReducerStatus.TIMEOUT
+        assert tracker.pending_ids() == ["b", "c"]
+        assert tracker.get_statistics()['evicted'] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_calls_expire(self):
+        """Calls older than the timeout are swept on the next operation."""
+        tracker = ReducerOutcomeTracker(timeout=0.01)
+        tracker.register("a", "enter_game")
+        await asyncio.sleep(0.02)
+
+        assert tracker.expire() == 1
+        assert tracker.get_status("a") == ReducerStatus.TIMEOUT
+        assert tracker.get_statistics()['timeouts'] == 1
+
+    @pytest.mark.asyncio
+    async def test_latency_percentiles(self):
+        """Commit latencies feed the percentile statistics."""
+        tracker = ReducerOutcomeTracker()
+        for i in range(10):
+            wire_id, _ = tracker.register(str(i), "enter_game")
+            tracker.resolve(wire_id, ReducerStatus.SUCCESS)
+
+        stats = tracker.get_statistics()
+        assert stats['committed'] == 10
+        assert 0 <= stats['commit_latency_p50'] <= stats['commit_latency_p99']
+
+    def test_invalid_configuration(self):
+        """Invalid bounds are rejected."""
+        with pytest.raises(ValueError):
+            ReducerOutcomeTracker(max_pending=0)
+        with pytest.raises(ValueError):
+            ReducerOutcomeTracker(timeout=0)
+
+
+class TestRequestIdEncoding:
+    """Test stamping request ids onto encoded CallReducer messages."""
+
+    def test_request_id_is_set(self):
+        """The request id replaces the encoder's default."""
+        encoded = json.dumps({'CallReducer': {'reducer': 'enter_game', 'args': '{}', 'request_id': 0, 'flags': 0}})
+        stamped = stamp_request_id(encoded, 42)
+        assert json.loads(stamped)['CallReducer']['request_id'] == 42
+
+        stamped_bytes = stamp_request_id(encoded.encode('utf-8'), 7)
+        assert isinstance(stamped_bytes, bytes)
+        assert json.loads(stamped_bytes)['CallReducer']['request_id'] == 7
+
+    def test_other_messages_are_untouched(self):
+        """Messages that are not CallReducer JSON pass through unchanged."""
+        assert stamp_request_id(b'\x00\x01', 1) == b'\x00\x01'
+        assert stamp_request_id('{"Subscribe": {}}', 1) == '{"Subscribe": {}}'
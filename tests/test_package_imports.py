@@ -0,0 +1,110 @@
+"""
+Tests for the package's lazily loaded public API and its import-time budget.
+"""
+
+import importlib
+import os
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+
+import blackholio_client
+
+
+# Cumulative `python -X importtime` budget for `import blackholio_client`
+IMPORT_TIME_BUDGET_US = 250_000
+
+# Modules that must not be loaded just by importing the package
+HEAVY_MODULES = [
+    "blackholio_client.connection",
+    "blackholio_client.auth",
+    "blackholio_client.events",
+    "blackholio_client.integration",
+    "blackholio_client.factory",
+    "cryptography",
+    "websockets",
+]
+
+# Subpackages, each of which must import first in a fresh interpreter
+SUBPACKAGES = sorted(
+    f"blackholio_client.{module.name}"
+    for module in pkgutil.iter_modules(blackholio_client.__path__)
+    if module.ispkg
+)
+
+
+def run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter with the current import path."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if p)
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True, text=True, env=env, timeout=60
+    )
+
+
+class TestLazyPublicAPI:
+    """Test that the public API is unchanged by lazy loading."""
+
+    @pytest.mark.parametrize("name", blackholio_client.__all__)
+    def test_name_resolves_to_defining_object(self, name):
+        module_name, attribute = blackholio_client._LAZY_IMPORTS[name]
+        module = importlib.import_module(f"blackholio_client.{module_name}")
+        assert getattr(blackholio_client, name) is getattr(module, attribute)
+
+    def test_all_matches_lazy_names(self):
+        assert set(blackholio_client.__all__) == set(blackholio_client._LAZY_IMPORTS)
+
+    def test_backward_compatible_alias(self):
+        assert blackholio_client.get_global_config is blackholio_client.get_environment_config
+
+    def test_dir_lists_public_api(self):
+        assert set(blackholio_client.__all__) <= set(dir(blackholio_client))
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            blackholio_client.NotAName
+
+    def test_from_import(self):
+        from blackholio_client import GameClient, Vector2
+        assert GameClient.__name__ == "GameClient"
+        assert Vector2(1.0, 2.0).x == 1.0
+
+
+class TestSubpackageImports:
+    """Test that no subpackage relies on another being imported before it."""
+
+    @pytest.mark.parametrize("package", SUBPACKAGES)
+    def test_subpackage_imports_first(self, package):
+        result = run_python(f"import {package}")
+        assert result.returncode == 0, result.stderr
+
+
+class TestImportTime:
+    """Guard the cost of `import blackholio_client`."""
+
+    def test_heavy_modules_not_loaded(self):
+        result = run_python(
+            "import sys, blackholio_client; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == ""
+
+    def test_import_time_budget(self):
+        result = run_python("import blackholio_client", "-X", "importtime")
+        assert result.returncode == 0, result.stderr
+
+        # Lines look like: "import time:   self [us] | cumulative | name"
+        cumulative = None
+        for line in result.stderr.splitlines():
+            parts = [part.strip() for part in line.split("|")]
+            if len(parts) == 3 and parts[2] == "blackholio_client":
+                cumulative = int(parts[1])
+        assert cumulative is not None, result.stderr
+
+        print(f"import blackholio_client: {cumulative / 1000:.1f}ms")
+        assert cumulative < IMPORT_TIME_BUDGET_US, \
+            f"import blackholio_client took {cumulative / 1000:.1f}ms (budget {IMPORT_TIME_BUDGET_US / 1000:.0f}ms)"
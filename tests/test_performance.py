@@ -12,6 +12,7 @@ import pytest
 import time
 import threading
 import json
+import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Callable
@@ -23,13 +24,19 @@ from memory_profiler import profile
 from blackholio_client.client import GameClient, create_game_client
 from blackholio_client.config.environment import EnvironmentConfig, get_environment_config
 from blackholio_client.connection.connection_manager import ConnectionManager, get_connection_manager
+from blackholio_client.connection.reducer_encoding import ReducerEncoderCache, build_reducer_args
+from blackholio_client.connection.server_config import ServerConfig
+from blackholio_client.connection.spacetimedb_connection import SpacetimeDBConnection, ConnectionState
 from blackholio_client.factory.client_factory import create_client
 from blackholio_client.models.game_entities import Vector2, GameEntity, GamePlayer, GameCircle
 from blackholio_client.models.serialization import JSONSerializer, BinarySerializer
 from blackholio_client.models.data_converters import EntityConverter, PlayerConverter, CircleConverter
 from blackholio_client.models.data_pipeline import DataPipeline, PipelineConfiguration
 from blackholio_client.events import get_global_event_manager
-from blackholio_client.utils.debugging import PerformanceProfiler
+from blackholio_client.utils.debugging import PerformanceProfiler, SpanProfiler
+from blackholio_client.utils.logging_config import (
+    BoundedQueueHandler, JsonFormatter, RateLimitFilter, SensitiveDataFilter
+)
 from blackholio_client.exceptions.connection_errors import BlackholioConnectionError
 
 
@@ -666,6 +673,205 @@ class TestDataPipelinePerformance:
             f"Data pipeline failure rate too high: {1 - benchmark.success_rate}"
 
 
+class TestReducerEncodingPerformance:
+    """Test per-call cost of encoding reducer calls."""
+    
+    @staticmethod
+    def make_connection() -> SpacetimeDBConnection:
+        """Create a connected SpacetimeDBConnection whose websocket discards frames."""
+        class NullWebSocket:
+            async def send(self, frame):
+                pass
+        
+        connection = SpacetimeDBConnection(ServerConfig(
+            language="rust", host="localhost", port=3000, db_identity="benchmark",
+            protocol="v1.json.spacetimedb", use_ssl=False
+        ))
+        connection.websocket = NullWebSocket()
+        connection.state = ConnectionState.CONNECTED
+        return connection
+    
+    def test_compiled_encoder_performance(self):
+        """Compare compiled update_player_input frames with per-call helper encoding."""
+        connection = self.make_connection()
+        helper = connection.protocol_helper
+        cache = ReducerEncoderCache(helper)
+        direction = {"x": 0.6, "y": -0.8}
+        
+        legacy = performance_tester.measure_operation(
+            lambda: helper.encode_reducer_call(
+                "update_player_input", build_reducer_args("update_player_input", [direction])
+            ),
+            iterations=10000,
+            operation_name="update_player_input_helper_encoding"
+        )
+        compiled = performance_tester.measure_operation(
+            lambda: cache.encode("update_player_input", [direction]),
+            iterations=10000,
+            operation_name="update_player_input_compiled_encoding"
+        )
+        
+        assert compiled.success_rate > 0.99
+        if cache.get("update_player_input", 1).compiled:
+            assert compiled.operations_per_second > legacy.operations_per_second, \
+                f"Compiled encoding slower than helper: {compiled.operations_per_second} ops/sec"
+    
+    def test_update_player_input_calls_per_second(self):
+        """Measure update_player_input calls/sec through SpacetimeDBConnection.call_reducer."""
+        connection = self.make_connection()
+        calls = 20000
+        
+        async def send_inputs():
+            for i in range(calls):
+                await connection.call_reducer("update_player_input", [{"x": (i % 100) / 100.0, "y": 0.0}])
+        
+        start_time = time.perf_counter()
+        asyncio.run(send_inputs())
+        elapsed = time.perf_counter() - start_time
+        calls_per_second = calls / elapsed
+        
+        print(f"update_player_input: {calls_per_second:.0f} calls/sec")
+        assert connection.connection_stats['messages_sent'] == calls
+        # Performance target: > 20,000 calls/sec
+        assert calls_per_second > 20000, \
+            f"update_player_input too slow: {calls_per_second:.0f} calls/sec"
+
+
+class TestSpanProfilerOverhead:
+    """Test that always-on span profiling stays cheap."""
+    
+    @staticmethod
+    def transaction_update_frame(rows: int = 10) -> str:
+        """Build a TransactionUpdate TEXT frame with entity inserts."""
+        inserts = [json.dumps({"entity_id": i, "position": {"x": 1.0, "y": 2.0}, "mass": 10})
+                   for i in range(rows)]
+        return json.dumps({"TransactionUpdate": {
+            "status": {"Committed": {"tables": [
+                {"table_name": "entity", "updates": [{"inserts": inserts, "deletes": []}]}
+            ]}},
+            "timestamp": {"microseconds": 1},
+            "caller_identity": "0x1",
+            "reducer_call": {"reducer_name": "update_player_input", "reducer_id": 1, "args": "{}", "request_id": 3},
+            "energy_quanta_used": {"quanta": 1},
+            "total_host_execution_duration": {"micros": 5}
+        }})
+    
+    def test_overhead_at_one_percent_sampling(self):
+        """Estimate profiler overhead on the message path at 1% sampling."""
+        class ReplayWebSocket:
+            def __init__(self, frames):
+                self.frames = frames
+            
+            async def __aiter__(self):
+                for frame in self.frames:
+                    yield frame
+        
+        connection = TestReducerEncodingPerformance.make_connection()
+        connection.on('transaction_update', lambda data: None)
+        frames = [self.transaction_update_frame()] * 2000
+        
+        def replay(profiler: SpanProfiler) -> float:
+            connection._profiler = profiler
+            connection.websocket = ReplayWebSocket(frames)
+            start_time = time.perf_counter()
+            asyncio.run(connection._message_handler())
+            return (time.perf_counter() - start_time) / len(frames)
+        
+        replay(SpanProfiler(enabled=False))  # warm up
+        message_time = replay(SpanProfiler(enabled=False))
+        profiler = SpanProfiler(sample_rate=0.01)
+        replay(profiler)
+        spans = profiler.get_statistics()['spans']
+        span_calls_per_message = sum(span['calls'] for span in spans.values()) / len(frames)
+        
+        # Cost of one start()/stop() pair at 1% sampling
+        probe = SpanProfiler(sample_rate=0.01)
+        iterations = 200000
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            probe.stop('probe', probe.start('probe'))
+        span_cost = (time.perf_counter() - start_time) / iterations
+        
+        overhead = span_cost * span_calls_per_message / message_time
+        print(f"Span profiler: {span_cost * 1e9:.0f}ns/span, {span_calls_per_message:.1f} spans/message, "
+              f"{message_time * 1e6:.1f}us/message, overhead {overhead:.2%}")
+        assert spans['frame_decode']['sampled'] == len(frames) // 100
+        # Performance target: < 1% overhead at 1% sampling
+        assert overhead < 0.01, f"Span profiler overhead too high: {overhead:.2%}"
+
+class TestLoggingPerformance:
+    """Test cost of logging on the hot path."""
+    
+    @staticmethod
+    def make_record(level: int = logging.DEBUG) -> logging.LogRecord:
+        """Create a record with the extra fields a game event log carries."""
+        record = logging.LogRecord("blackholio_client.client", level, __file__, 1,
+                                   "Entity %s moved", ("entity_1",), None)
+        record.entity_id = "entity_1"
+        record.position = {"x": 10.0, "y": 20.0}
+        record.mass = 42
+        record.tags = ["player", "circle"]
+        return record
+    
+    def test_json_formatter_performance(self):
+        """Measure JSON formatting of records with extra fields."""
+        formatter = JsonFormatter()
+        record = self.make_record()
+        
+        result = performance_tester.measure_operation(
+            lambda: formatter.format(record),
+            iterations=10000,
+            operation_name="json_log_formatting"
+        )
+        
+        assert result.success_rate > 0.99
+        assert result.operations_per_second > PERFORMANCE_TARGETS['json_log_formatting'], \
+            f"JSON log formatting too slow: {result.operations_per_second} ops/sec"
+    
+    def test_sensitive_data_filter_performance(self):
+        """Measure records/sec through SensitiveDataFilter."""
+        sensitive_filter = SensitiveDataFilter()
+        messages = [
+            ("Received %s update with %d rows", ("entity", 12)),
+            ("Connected to %s in %.1fms", ("localhost:3000", 12.5)),
+            ("Loaded identity token=%s", ("abcdef",)),
+        ]
+        
+        def filter_records():
+            for msg, args in messages:
+                record = logging.LogRecord("blackholio_client.connection", logging.INFO,
+                                           __file__, 1, msg, args, None)
+                sensitive_filter.filter(record)
+        
+        result = performance_tester.measure_operation(
+            filter_records,
+            iterations=5000,
+            operation_name="sensitive_data_filtering"
+        )
+        
+        records_per_second = result.operations_per_second * len(messages)
+        print(f"SensitiveDataFilter: {records_per_second:.0f} records/sec")
+        assert result.success_rate > 0.99
+        assert records_per_second > PERFORMANCE_TARGETS['sensitive_data_filtering'], \
+            f"Sensitive data filtering too slow: {records_per_second:.0f} records/sec"
+    
+    def test_async_logging_does_not_block(self):
+        """Measure enqueue cost of rate-limited records on a full queue."""
+        handler = BoundedQueueHandler(maxsize=100)
+        handler.addFilter(RateLimitFilter(rate=100.0))
+        
+        result = performance_tester.measure_operation(
+            lambda: handler.handle(self.make_record()),
+            iterations=10000,
+            operation_name="async_log_enqueue"
+        )
+        
+        stats = handler.get_statistics()
+        assert result.success_rate > 0.99
+        assert stats['enqueued'] <= 100
+        assert result.operations_per_second > PERFORMANCE_TARGETS['async_log_enqueue'], \
+            f"Async log enqueue too slow: {result.operations_per_second} ops/sec"
+
 class TestMemoryUsage:
     """Test memory usage and memory leaks."""
     
@@ -783,6 +989,10 @@ PERFORMANCE_TARGETS = {
     'event_publishing': 5000,  # ops/sec
     'event_subscription_handling': 2000,  # ops/sec
     'data_pipeline_processing': 100,  # ops/sec
+    'update_player_input_compiled_encoding': 50000,  # ops/sec
+    'json_log_formatting': 10000,  # ops/sec
+    'async_log_enqueue': 20000,  # ops/sec
+    'sensitive_data_filtering': 20000,  # records/sec
 }
 
 
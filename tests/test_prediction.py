@@ -0,0 +1,222 @@
+"""
+Tests for client-side prediction and server reconciliation of the local player.
+"""
+
+import pytest
+
+from blackholio_client.client import GameClient
+from blackholio_client.models.game_entities import GamePlayer, Vector2
+from blackholio_client.models.prediction import LocalPlayerPredictor, PredictionConfig
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_predictor(**config):
+    clock = FakeClock()
+    config.setdefault('round_trip_time', 0.1)
+    return LocalPlayerPredictor(PredictionConfig(**config), clock=clock), clock
+
+
+def simulate(start: Vector2, inputs) -> GamePlayer:
+    player = GamePlayer(entity_id="reference")
+    player.position = start
+    for direction, delta_time in inputs:
+        player.update_input(direction)
+        player.update_movement(delta_time)
+    return player
+
+
+class TestLocalPlayerPredictor:
+    """Test prediction, acknowledgement and reconciliation."""
+
+    def test_input_moves_immediately(self):
+        predictor, _ = make_predictor()
+        predictor.reconcile(Vector2(10, 10))
+        predictor.apply_input(Vector2(1, 0), delta_time=0.05)
+
+        assert predictor.position.x > 10
+        assert predictor.position.y == pytest.approx(10)
+        assert predictor.pending_inputs == 1
+
+    def test_delta_time_from_clock(self):
+        predictor, clock = make_predictor(max_delta_time=0.2)
+        predictor.apply_input(Vector2(1, 0))
+        clock.now += 5.0
+        predictor.apply_input(Vector2(1, 0))
+
+        # Each input is closed with the time its own direction was held
+        assert [record.delta_time for record in predictor._history] == [5.0, 0.0]
+
+    def test_turn_after_holding_a_direction(self):
+        predictor, clock = make_predictor(max_delta_time=0.05)
+        predictor.reconcile(Vector2(0, 0))
+        predictor.apply_input(Vector2(1, 0))
+        assert predictor.position == Vector2(0, 0)
+
+        # A held input keeps moving the prediction between calls
+        clock.now += 0.2
+        held = [(Vector2(1, 0), 0.05)] * 4
+        assert predictor.position.x == pytest.approx(simulate(Vector2(0, 0), held).position.x)
+        assert predictor.position.y == pytest.approx(0.0)
+
+        # Turning keeps the time spent moving along +x
+        predictor.apply_input(Vector2(0, 1))
+        clock.now += 0.1
+        expected = simulate(Vector2(0, 0), held + [(Vector2(0, 1), 0.05)] * 2)
+        assert predictor.position.x == pytest.approx(expected.position.x)
+        assert predictor.position.y == pytest.approx(expected.position.y)
+        assert predictor.position.y > 0
+        assert [record.delta_time for record in predictor._history] == [pytest.approx(0.2), 0.0]
+
+        # Replaying both inputs from the same start reproduces the prediction
+        error = predictor.reconcile(Vector2(0, 0))
+        assert error == pytest.approx(0.0)
+        assert predictor.position.x == pytest.approx(expected.position.x)
+
+    def test_acknowledged_held_input_continues_from_server_state(self):
+        predictor, clock = make_predictor(round_trip_time=0.1, max_delta_time=0.05)
+        predictor.reconcile(Vector2(0, 0))
+        predictor.apply_input(Vector2(1, 0))
+        predictor.mark_sent()
+        clock.now += 0.2
+
+        predictor.reconcile(Vector2(10, 0), velocity=Vector2(0, 0))
+        assert predictor.pending_inputs == 1
+        assert predictor.predicted_position == Vector2(10, 0)
+        clock.now += 0.1
+        assert predictor.predicted_position.x > 10
+
+    def test_unacknowledged_inputs_replayed(self):
+        predictor, clock = make_predictor()
+        predictor.reconcile(Vector2(0, 0))
+        inputs = [(Vector2(1, 0), 0.05), (Vector2(1, 1), 0.05), (Vector2(0, 1), 0.05)]
+        for direction, delta_time in inputs:
+            predictor.apply_input(direction, delta_time)
+            predictor.mark_sent()
+
+        # Server state from before any input arrived: all inputs are replayed
+        error = predictor.reconcile(Vector2(0, 0))
+        expected = simulate(Vector2(0, 0), inputs)
+        assert error == pytest.approx(0.0)
+        assert predictor.predicted_position.x == pytest.approx(expected.position.x)
+        assert predictor.predicted_position.y == pytest.approx(expected.position.y)
+
+        # Reconciling again against the same state is stable
+        predictor.reconcile(Vector2(0, 0))
+        assert predictor.predicted_position.x == pytest.approx(expected.position.x)
+
+    def test_acknowledged_inputs_dropped_after_round_trip(self):
+        predictor, clock = make_predictor(round_trip_time=0.1)
+        predictor.reconcile(Vector2(0, 0))
+        first = [(Vector2(1, 0), 0.05), (Vector2(1, 0), 0.05)]
+        for direction, delta_time in first:
+            predictor.apply_input(direction, delta_time)
+        predictor.mark_sent()
+
+        clock.now += 0.15
+        predictor.apply_input(Vector2(0, 1), 0.05)
+        predictor.mark_sent()
+
+        # The server has applied the first two inputs
+        server = simulate(Vector2(0, 0), first)
+        predictor.reconcile(server.position)
+        assert predictor.pending_inputs == 1
+
+        expected = simulate(Vector2(0, 0), first + [(Vector2(0, 1), 0.05)])
+        assert predictor.predicted_position.x == pytest.approx(expected.position.x)
+        assert predictor.predicted_position.y == pytest.approx(expected.position.y)
+
+    def test_explicit_acknowledge_measures_round_trip(self):
+        predictor, clock = make_predictor(round_trip_time=1.0)
+        predictor.apply_input(Vector2(1, 0), 0.05)
+        predictor.mark_sent()
+        clock.now += 0.2
+        predictor.acknowledge()
+
+        assert predictor.round_trip_time == pytest.approx(1.0 - 0.8 * 0.125)
+        predictor.reconcile(Vector2(0, 0))
+        assert predictor.pending_inputs == 0
+
+    def test_small_corrections_blend(self):
+        predictor, _ = make_predictor(smoothing=0.5, snap_distance=50)
+        predictor.reconcile(Vector2(0, 0))
+
+        error = predictor.reconcile(Vector2(4, 0))
+        assert error == pytest.approx(4.0)
+        # Displayed position still starts where it was and converges on the new state
+        assert predictor.position == Vector2(0, 0)
+        predictor.apply_input(Vector2(0, 0), 0.0)
+        assert predictor.position.x == pytest.approx(2.0)
+        for _ in range(20):
+            predictor.apply_input(Vector2(0, 0), 0.0)
+        assert predictor.position == Vector2(4, 0)
+
+    def test_large_corrections_snap(self):
+        predictor, _ = make_predictor(snap_distance=10)
+        predictor.reconcile(Vector2(0, 0))
+        predictor.reconcile(Vector2(100, 0))
+
+        assert predictor.position == Vector2(100, 0)
+        assert predictor.get_statistics()['snaps'] == 1
+
+    def test_history_is_bounded(self):
+        predictor, _ = make_predictor(history_size=4)
+        for _ in range(10):
+            predictor.apply_input(Vector2(1, 0), 0.01)
+
+        assert predictor.pending_inputs == 4
+        assert predictor.get_statistics()['dropped_inputs'] == 6
+
+    def test_reset(self):
+        predictor, _ = make_predictor()
+        predictor.reconcile(Vector2(5, 5))
+        predictor.apply_input(Vector2(1, 0), 0.05)
+        predictor.reset()
+
+        assert not predictor.has_state
+        assert predictor.pending_inputs == 0
+        assert predictor.position == Vector2(0, 0)
+
+    def test_config_validation(self):
+        with pytest.raises(ValueError):
+            PredictionConfig(history_size=0).validate()
+        with pytest.raises(ValueError):
+            PredictionConfig(smoothing=0).validate()
+        with pytest.raises(ValueError):
+            PredictionConfig(round_trip_time=-1).validate()
+
+
+class TestClientPrediction:
+    """Test GameClient integration."""
+
+    @pytest.mark.asyncio
+    async def test_move_player_predicts(self):
+        client = GameClient("localhost:3000", "test_db", auto_reconnect=False)
+        assert client.get_prediction_statistics() == {'enabled': False}
+        assert client.get_predicted_position() is None
+
+        local_player = GamePlayer(entity_id="1", player_id="1")
+        local_player.position = Vector2(50, 50)
+        client._local_player = local_player
+
+        client.enable_prediction()
+        client.enable_input_channel()
+        assert client.get_predicted_position() == Vector2(50, 50)
+
+        assert await client.move_player(Vector2(1, 0))
+        assert await client.move_player(Vector2(1, 0))
+        assert client.get_predicted_position().x > 50
+
+        stats = client.get_client_statistics()['prediction']
+        assert stats['enabled'] is True
+        assert stats['inputs'] == 2
+
+        await client.disable_input_channel()
+        client.disable_prediction()
+        assert client.get_predicted_position() is None
@@ -0,0 +1,187 @@
+"""
+Tests for Reducer Client - Pipelined Reducer Calls
+
+Covers the in-flight window, submission ordering, completion futures,
+latency statistics, the iterative retry loop and micro-batched sends.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from blackholio_client.reducers.reducer_batcher import BatchingConfig
+from blackholio_client.reducers.reducer_client import ReducerClient, ReducerStatus
+
+
+class FakeConnection:
+    """Connection stub that answers send_request after a short delay."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.sent = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.state = Mock(value="connected")
+
+    async def send_request(self, message_type, data, timeout=30.0):
+        self.sent.append(data)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return {'result': 'ok'}
+
+    async def send_reducer_batch(self, calls):
+        self.sent.append(list(calls))
+        return len(calls)
+
+
+class TestPipelinedCalls:
+    """Test submit/call_many pipelining."""
+
+    @pytest.mark.asyncio
+    async def test_window_bounds_in_flight_calls(self):
+        """No more than max_in_flight calls wait for a response at once."""
+        connection = FakeConnection()
+        client = ReducerClient(connection, max_in_flight=4)
+
+        results = await client.call_many(("move", {"i": i}) for i in range(20))
+
+        assert len(results) == 20
+        assert all(result.is_success for result in results)
+        assert connection.max_in_flight == 4
+
+        stats = client.get_statistics()
+        assert stats['pipelined_calls'] == 20
+        assert stats['max_in_flight_seen'] == 4
+        assert stats['in_flight'] == 0 and stats['queued'] == 0
+        assert stats['latency_p50'] is not None
+        assert stats['throughput_per_second'] > 0
+
+    @pytest.mark.asyncio
+    async def test_calls_are_sent_in_submission_order(self):
+        """Calls to the same reducer reach the connection in order."""
+        connection = FakeConnection(delay=0.0)
+        client = ReducerClient(connection, max_in_flight=3)
+
+        futures = [client.submit("move", {"seq": i}) for i in range(10)]
+        await asyncio.gather(*futures)
+
+        assert [msg['action']['args']['seq'] for msg in connection.sent] == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_failures_resolve_futures(self):
+        """A failing call resolves its future with a failed result."""
+        connection = FakeConnection()
+        connection.send_request = AsyncMock(side_effect=RuntimeError("boom"))
+        client = ReducerClient(connection)
+
+        result = await client.submit("move", {})
+        assert result.status == ReducerStatus.FAILED
+        assert client.get_statistics()['in_flight'] == 0
+
+    def test_invalid_window(self):
+        """The in-flight window must be positive."""
+        with pytest.raises(ValueError):
+            ReducerClient(FakeConnection(), max_in_flight=0)
+
+
+class TestRetries:
+    """Test the iterative retry loop."""
+
+    @pytest.mark.asyncio
+    async def test_retries_without_recursion(self):
+        """Retryable errors are retried up to max_retries."""
+        connection = FakeConnection()
+        connection.send_request = AsyncMock(return_value={'error': {'code': 'SERVER_ERROR', 'message': 'busy'}})
+        client = ReducerClient(connection, max_retries=3)
+
+        with patch("asyncio.sleep", new=AsyncMock()):
+            result = await client.call_reducer("move", {})
+
+        assert result.is_failed
+        assert connection.send_request.await_count == 4
+
+
+class TestBatchedSends:
+    """Test micro-batched fire-and-forget sends."""
+
+    @pytest.mark.asyncio
+    async def test_flush_on_size(self):
+        """A full batch is written in one pass without waiting for the window."""
+        connection = FakeConnection()
+        client = ReducerClient(connection)
+        client.enable_batching(BatchingConfig(max_batch_size=3, max_delay=10.0))
+
+        futures = [client.send("player_split", {}) for _ in range(3)]
+        assert await asyncio.gather(*futures) == [True, True, True]
+
+        assert connection.sent == [[("player_split", {})] * 3]
+        stats = client.get_statistics()['batching']
+        assert stats['size_flushes'] == 1
+        assert stats['batches'] == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_on_time(self):
+        """A partial batch is written once its window expires."""
+        connection = FakeConnection()
+        client = ReducerClient(connection)
+        client.enable_batching(BatchingConfig(max_batch_size=100, max_delay=0.01))
+
+        first = client.send("enter_game", {"name": "a"})
+        second = client.send("enter_game", {"name": "b"})
+        await asyncio.gather(first, second)
+
+        assert connection.sent == [[("enter_game", {"name": "a"}), ("enter_game", {"name": "b"})]]
+        assert client.get_statistics()['batching']['time_flushes'] == 1
+
+    @pytest.mark.asyncio
+    async def test_latest_wins_reducers_are_coalesced(self):
+        """Only the newest queued input is sent, after calls queued before it."""
+        connection = FakeConnection()
+        client = ReducerClient(connection)
+        client.enable_batching(BatchingConfig(max_batch_size=100, max_delay=10.0))
+
+        futures = [
+            client.send("update_player_input", {"direction": {"x": 1, "y": 0}}),
+            client.send("player_split", {}),
+            client.send("update_player_input", {"direction": {"x": 0, "y": 1}}),
+        ]
+        assert await client.flush() == 2
+        assert all(await asyncio.gather(*futures))
+
+        assert connection.sent == [[
+            ("player_split", {}),
+            ("update_player_input", {"direction": {"x": 0, "y": 1}}),
+        ]]
+        stats = client.get_statistics()['batching']
+        assert stats['frames_saved'] == 1
+        assert stats['frames_sent'] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_fails_its_futures(self):
+        """A send error is delivered to every call in the batch."""
+        connection = FakeConnection()
+        connection.send_reducer_batch = AsyncMock(side_effect=RuntimeError("closed"))
+        client = ReducerClient(connection)
+        client.enable_batching(BatchingConfig(max_batch_size=100, max_delay=10.0))
+
+        future = client.send("player_split", {})
+        await client.flush()
+
+        with pytest.raises(RuntimeError):
+            await future
+        assert client.get_statistics()['batching']['failed_calls'] == 1
+
+    @pytest.mark.asyncio
+    async def test_unbatched_send_writes_immediately(self):
+        """Without batching each send is its own write."""
+        connection = FakeConnection()
+        client = ReducerClient(connection)
+
+        assert await client.send("player_split", {})
+        assert connection.sent == [[("player_split", {})]]
+        assert client.get_statistics()['batching'] == {'enabled': False}
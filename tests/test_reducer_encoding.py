@@ -0,0 +1,161 @@
+"""
+Tests for Reducer Encoding - Pre-Encoded CallReducer Templates
+
+Checks that compiled encoders produce the same CallReducer messages as
+the protocol helper they were compiled from.
+"""
+
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from blackholio_client.connection.reducer_encoding import (
+    ReducerEncoderCache,
+    ReducerMessageEncoder,
+    build_reducer_args
+)
+from blackholio_client.connection.server_config import ServerConfig
+from blackholio_client.connection.spacetimedb_connection import SpacetimeDBConnection, ConnectionState
+from blackholio_client.exceptions.connection_errors import DataValidationError
+from blackholio_client.models.game_entities import Vector2
+
+
+class JsonProtocolHelper:
+    """Protocol helper producing v1 JSON CallReducer messages."""
+
+    def __init__(self, args_as_string: bool = True):
+        self.args_as_string = args_as_string
+        self.calls = 0
+
+    def encode_reducer_call(self, reducer, args):
+        self.calls += 1
+        encoded_args = json.dumps(args) if self.args_as_string else args
+        return json.dumps({'CallReducer': {'reducer': reducer, 'args': encoded_args, 'request_id': 0, 'flags': 0}})
+
+
+class BinaryProtocolHelper:
+    """Protocol helper producing opaque binary frames."""
+
+    def encode_reducer_call(self, reducer, args):
+        return b'\x00' + reducer.encode('utf-8')
+
+
+def decode(frame):
+    """Decode a CallReducer frame and its string-encoded args."""
+    call = json.loads(frame)['CallReducer']
+    if isinstance(call['args'], str):
+        call['args'] = json.loads(call['args'])
+    return call
+
+
+class TestReducerArgs:
+    """Test positional-to-named argument mapping."""
+
+    def test_known_reducers(self):
+        """Known reducers use their parameter names."""
+        assert build_reducer_args('enter_game', ['alice']) == {'name': 'alice'}
+        assert build_reducer_args('update_player_input', [{'x': 1, 'y': 0}]) == {'direction': {'x': 1, 'y': 0}}
+        assert build_reducer_args('player_split', []) == {}
+
+    def test_generic_reducers(self):
+        """Other reducers use value / argN names."""
+        assert build_reducer_args('custom', [5]) == {'value': 5}
+        assert build_reducer_args('custom', [1, 2]) == {'arg0': 1, 'arg1': 2}
+        assert build_reducer_args('enter_game', ['a', 'b']) == {'arg0': 'a', 'arg1': 'b'}
+
+
+class TestReducerMessageEncoder:
+    """Test compiled reducer encoders."""
+
+    @pytest.mark.parametrize("args_as_string", [True, False])
+    def test_matches_protocol_helper(self, args_as_string):
+        """Compiled frames decode to the helper's message, with the request id set."""
+        helper = JsonProtocolHelper(args_as_string)
+        encoder = ReducerMessageEncoder('update_player_input', ('direction',), helper)
+        assert encoder.compiled
+
+        frame = encoder.encode([Vector2(0.5, -1.0)], request_id=9)
+        call = decode(frame)
+
+        assert isinstance(frame, str)
+        assert call['reducer'] == 'update_player_input'
+        assert call['args'] == {'direction': {'x': 0.5, 'y': -1.0}}
+        assert call['request_id'] == 9
+        assert call['flags'] == 0
+
+    def test_envelope_encoded_once(self):
+        """The protocol helper is only used to compile the template."""
+        helper = JsonProtocolHelper()
+        cache = ReducerEncoderCache(helper)
+        for i in range(100):
+            cache.encode('update_player_input', [{'x': i, 'y': 0}])
+
+        assert helper.calls == 1
+        stats = cache.get_statistics()
+        assert stats['compiled_encoders'] == 1
+        assert stats['encoded'] == 100
+        assert stats['fallback_encoded'] == 0
+
+    def test_binary_protocol_falls_back(self):
+        """Non-JSON envelopes are encoded by the helper on every call."""
+        cache = ReducerEncoderCache(BinaryProtocolHelper(), text_frames=False)
+        frame = cache.encode('player_split', [])
+
+        assert frame == b'\x00player_split'
+        assert not cache.get('player_split', 0).compiled
+        assert cache.get_statistics()['fallback_encoded'] == 1
+
+    def test_validation_catches_mismatch(self):
+        """Debug-mode validation rejects frames that differ from the helper's."""
+        helper = JsonProtocolHelper()
+        encoder = ReducerMessageEncoder('enter_game', ('name',), helper, validate=True)
+        encoder.encode(['alice'])
+
+        encoder.parameter_names = ('player_name',)
+        with pytest.raises(DataValidationError):
+            encoder.encode(['alice'])
+
+
+class TestConnectionReducerCalls:
+    """Test SpacetimeDBConnection sending through compiled encoders."""
+
+    @pytest.mark.asyncio
+    async def test_call_reducer_sends_compiled_frame(self):
+        """call_reducer writes the compiled frame directly to the websocket."""
+        connection = SpacetimeDBConnection(ServerConfig(
+            language="rust", host="localhost", port=3000, db_identity="test_db",
+            protocol="v1.json.spacetimedb", use_ssl=False
+        ))
+        connection.protocol_helper = JsonProtocolHelper()
+        connection._reducer_encoders = ReducerEncoderCache(connection.protocol_helper)
+        connection.websocket = AsyncMock()
+        connection.state = ConnectionState.CONNECTED
+
+        assert await connection.call_reducer('enter_game', ['alice'], request_id=3)
+
+        frame = connection.websocket.send.await_args.args[0]
+        assert decode(frame)['args'] == {'name': 'alice'}
+        assert decode(frame)['request_id'] == 3
+        assert connection.connection_stats['messages_sent'] == 1
+
+    @pytest.mark.asyncio
+    async def test_send_reducer_batch_encodes_named_args(self):
+        """Batched calls keep their argument names and order."""
+        connection = SpacetimeDBConnection(ServerConfig(
+            language="rust", host="localhost", port=3000, db_identity="test_db",
+            protocol="v1.json.spacetimedb", use_ssl=False
+        ))
+        connection.protocol_helper = JsonProtocolHelper()
+        connection._reducer_encoders = ReducerEncoderCache(connection.protocol_helper)
+        connection.websocket = AsyncMock()
+        connection.state = ConnectionState.CONNECTED
+
+        sent = await connection.send_reducer_batch([
+            ('enter_game', {'player_name': 'bot-1'}),
+            ('player_split', {}),
+        ])
+
+        frames = [call.args[0] for call in connection.websocket.send.await_args_list]
+        assert sent == 2
+        assert [decode(frame)['args'] for frame in frames] == [{'player_name': 'bot-1'}, {}]
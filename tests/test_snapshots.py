@@ -0,0 +1,217 @@
+"""
+Tests and benchmark for versioned copy-on-write cache snapshots.
+"""
+
+import random
+import threading
+import time
+
+import pytest
+
+from blackholio_client.client import GameClient
+from blackholio_client.models.game_entities import GameEntity, Vector2
+from blackholio_client.models.snapshots import MapSnapshot, VersionedMap
+
+
+BENCHMARK_ENTITIES = 50_000
+
+
+def make_entity(entity_id: int, x: float = 0.0) -> GameEntity:
+    return GameEntity(entity_id=str(entity_id), position=Vector2(x, 0.0), mass=10.0)
+
+
+class TestVersionedMap:
+    """Test VersionedMap as a mapping and its snapshots."""
+
+    def test_mapping_behaviour(self):
+        cache = VersionedMap(buckets=4)
+        for i in range(20):
+            cache[str(i)] = i
+        cache['3'] = 33
+        del cache['4']
+        assert cache.pop('5') == 5
+        assert cache.pop('missing', None) is None
+        with pytest.raises(KeyError):
+            del cache['missing']
+
+        expected = {str(i): i for i in range(20) if i not in (4, 5)}
+        expected['3'] = 33
+        assert len(cache) == len(expected)
+        assert dict(cache.items()) == expected
+        assert sorted(cache.keys()) == sorted(expected)
+        assert sorted(cache.values()) == sorted(expected.values())
+        assert cache == expected
+        assert cache.get('3') == 33 and '4' not in cache
+
+    def test_snapshot_is_immutable_and_cached(self):
+        cache = VersionedMap({'a': 1, 'b': 2}, buckets=2)
+        snapshot = cache.snapshot()
+        assert cache.snapshot() is snapshot
+        assert isinstance(snapshot, MapSnapshot)
+        with pytest.raises(TypeError):
+            snapshot['c'] = 3
+
+        cache['a'] = 10
+        cache['c'] = 3
+        del cache['b']
+        assert snapshot == {'a': 1, 'b': 2}
+        assert snapshot.copy() == {'a': 1, 'b': 2}
+        assert cache.snapshot() == {'a': 10, 'c': 3}
+        assert cache.snapshot().version > snapshot.version
+
+    def test_clear_keeps_snapshots(self):
+        cache = VersionedMap({'a': 1})
+        snapshot = cache.snapshot()
+        cache.clear()
+        assert len(cache) == 0
+        assert snapshot == {'a': 1}
+
+    def test_writes_copy_only_shared_buckets(self):
+        cache = VersionedMap({str(i): i for i in range(1000)}, buckets=64)
+        cache.snapshot()
+        for i in range(10):
+            cache[str(i)] = -i
+        assert cache.get_statistics()['buckets_copied'] <= 10
+
+        # Further writes to the same buckets do not copy again
+        copied = cache.get_statistics()['buckets_copied']
+        for i in range(10):
+            cache[str(i)] = i
+        assert cache.get_statistics()['buckets_copied'] == copied
+
+    def test_diff(self):
+        cache = VersionedMap({str(i): make_entity(i) for i in range(100)}, buckets=16)
+        before = cache.snapshot()
+        replacement = make_entity(1, x=5.0)
+        cache['1'] = replacement
+        cache['new'] = make_entity(200)
+        removed = cache.pop('2')
+        after = cache.snapshot()
+
+        diff = after.diff(before)
+        assert diff.added == {'new': after['new']}
+        assert diff.updated == {'1': replacement}
+        assert diff.removed == {'2': removed}
+        assert len(diff) == 3
+        assert len(after.diff(after)) == 0
+
+        reverse = before.diff(after)
+        assert set(reverse.added) == {'2'} and set(reverse.removed) == {'new'}
+
+    def test_diff_across_resize(self):
+        cache = VersionedMap({'a': 1, 'b': 2}, buckets=2)
+        before = cache.snapshot()
+        for i in range(100):
+            cache[str(i)] = i
+        del cache['a']
+        assert cache.get_statistics()['resizes'] > 0
+
+        diff = cache.snapshot().diff(before)
+        assert set(diff.added) == {str(i) for i in range(100)}
+        assert diff.removed == {'a': 1}
+        assert cache.snapshot() == {'b': 2, **{str(i): i for i in range(100)}}
+
+    def test_diff_beyond_dirty_log(self):
+        cache = VersionedMap({str(i): i for i in range(100)}, buckets=16)
+        first = cache.snapshot()
+        for step in range(100):
+            cache[str(step)] = -step - 1
+            cache.snapshot()
+
+        diff = cache.snapshot().diff(first)
+        assert set(diff.updated) == {str(i) for i in range(100)}
+        assert not diff.added and not diff.removed
+
+    def test_bucket_count_validation(self):
+        with pytest.raises(ValueError):
+            VersionedMap(buckets=3)
+
+    def test_snapshot_read_from_other_thread(self):
+        cache = VersionedMap({str(i): i for i in range(1000)})
+        snapshot = cache.snapshot()
+        seen = []
+
+        reader = threading.Thread(target=lambda: seen.append(sum(snapshot.values())))
+        reader.start()
+        for i in range(1000):
+            cache[str(i)] = 0
+        reader.join()
+        assert seen == [sum(range(1000))]
+
+
+class TestClientSnapshots:
+    """Test that GameClient hands out snapshots."""
+
+    def test_get_all_entities_returns_snapshot(self):
+        client = GameClient("localhost:3000", "test_db", auto_reconnect=False)
+        client._entities['1'] = make_entity(1)
+        first = client.get_all_entities()
+        assert client.get_all_entities() is first
+
+        client._entities['2'] = make_entity(2)
+        second = client.get_all_entities()
+        assert list(first) == ['1']
+        assert set(second) == {'1', '2'}
+        assert set(second.diff(first).added) == {'2'}
+        assert len(client.get_all_players()) == 0
+        assert len(client.get_all_circles()) == 0
+
+
+class TestSnapshotBenchmark:
+    """Compare per-step dict copies against snapshots on a 50k-entity cache."""
+
+    def test_step_snapshot_throughput(self):
+        rng = random.Random(9)
+        entities = {str(i): make_entity(i, rng.uniform(0, 1000)) for i in range(BENCHMARK_ENTITIES)}
+        keys = list(entities)
+        steps = 50
+        updates = [[(rng.choice(keys), make_entity(0)) for _ in range(200)] for _ in range(steps)]
+
+        plain = dict(entities)
+        copy_time = write_time = naive_diff_time = 0.0
+        previous_copy = plain.copy()
+        for changed in updates:
+            start_time = time.perf_counter()
+            for key, entity in changed:
+                plain[key] = entity
+            write_time += time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            current_copy = plain.copy()
+            copy_time += time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            naive = {key: value for key, value in current_copy.items() if previous_copy.get(key) is not value}
+            naive_diff_time += time.perf_counter() - start_time
+            previous_copy = current_copy
+
+        versioned = VersionedMap(entities)
+        snapshot_time = versioned_write_time = diff_time = 0.0
+        previous = versioned.snapshot()
+        for changed in updates:
+            start_time = time.perf_counter()
+            for key, entity in changed:
+                versioned[key] = entity
+            versioned_write_time += time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            current = versioned.snapshot()
+            snapshot_time += time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            diff = current.diff(previous)
+            diff_time += time.perf_counter() - start_time
+            previous = current
+
+        assert set(diff.updated) == set(naive)
+        assert current == plain
+
+        def per_step(seconds: float) -> float:
+            return seconds * 1000 / steps
+
+        print(f"{BENCHMARK_ENTITIES} entities, 200 updates/step (ms/step): "
+              f"dict.copy {per_step(copy_time):.3f} vs snapshot {per_step(snapshot_time):.3f}; "
+              f"full diff {per_step(naive_diff_time):.3f} vs snapshot diff {per_step(diff_time):.3f}; "
+              f"writes {per_step(write_time):.3f} vs {per_step(versioned_write_time):.3f}")
+        assert snapshot_time < copy_time
+        assert diff_time < naive_diff_time
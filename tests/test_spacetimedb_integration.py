@@ -15,6 +15,7 @@ from blackholio_client.integration.client_generator import (
     ClientGenerationConfig,
     GenerationResult
 )
+from blackholio_client.integration.generation_cache import GeneratedClientCache, compute_cache_key
 from blackholio_client.integration.client_loader import ClientLoader, LoadedClient
 from blackholio_client.integration.server_manager import ServerManager, ServerInfo, ServerStatus
 from blackholio_client.config.environment import EnvironmentConfig
@@ -184,6 +185,125 @@ class TestSpacetimeDBClientGenerator:
             assert validation['generate_help_available']
 
 
+class TestGenerationCache:
+    """Test the persistent generated-client cache."""
+    
+    def setup_method(self):
+        """Setup test environment."""
+        self.config = EnvironmentConfig(
+            server_language="rust",
+            server_ip="localhost",
+            server_port=3000
+        )
+    
+    @staticmethod
+    def make_server(root):
+        """Create a minimal server module directory."""
+        server = root / "server-rust"
+        (server / "src").mkdir(parents=True)
+        (server / "src" / "lib.rs").write_text("pub fn enter_game() {}")
+        return server
+    
+    @staticmethod
+    def fake_cli(calls):
+        """Fake subprocess.run for the SpacetimeDB CLI, recording generate calls."""
+        def run(cmd, **kwargs):
+            if '--version' in cmd:
+                return Mock(returncode=0, stdout="spacetimedb 1.2.0\n", stderr="")
+            out_dir = cmd[cmd.index('--out-dir') + 1]
+            with open(os.path.join(out_dir, 'client.py'), 'w') as f:
+                f.write("class SpacetimeDBClient:\n    pass\n")
+            calls.append(cmd)
+            return Mock(returncode=0, stdout="Generated", stderr="")
+        return run
+    
+    def test_cache_key_tracks_sources(self, tmp_path):
+        """Test that the key changes with sources and CLI version but not build output."""
+        server = self.make_server(tmp_path)
+        key = compute_cache_key(server, "spacetimedb 1.2.0", "python")
+        
+        (server / "target").mkdir()
+        (server / "target" / "debug.o").write_bytes(b"build output")
+        assert compute_cache_key(server, "spacetimedb 1.2.0", "python") == key
+        
+        assert compute_cache_key(server, "spacetimedb 1.3.0", "python") != key
+        (server / "src" / "lib.rs").write_text("pub fn enter_game(name: String) {}")
+        assert compute_cache_key(server, "spacetimedb 1.2.0", "python") != key
+    
+    def test_store_and_lookup(self, tmp_path):
+        """Test storing and looking up an entry."""
+        generated = tmp_path / "generated"
+        generated.mkdir()
+        (generated / "client.py").write_text("# client")
+        
+        cache = GeneratedClientCache(tmp_path / "cache")
+        assert cache.lookup("abc") is None
+        
+        cached_dir = cache.store("abc", generated, {'server_language': 'rust'})
+        assert cache.lookup("abc") == cached_dir
+        assert os.path.isfile(os.path.join(cached_dir, "client.py"))
+        assert cache.read_manifest("abc")['files'] == ["client.py"]
+        
+        stats = cache.get_statistics()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['stores'] == 1
+        assert stats['entries'] == 1
+        
+        assert cache.clear() == 1
+        assert cache.lookup("abc") is None
+    
+    def test_generation_reused_across_generators(self, tmp_path):
+        """Test that a second generator (another process) reuses the cached output."""
+        server = self.make_server(tmp_path)
+        cache_dir = str(tmp_path / "cache")
+        calls = []
+        
+        with patch.object(SpacetimeDBClientGenerator, '_find_spacetimedb_cli', return_value='spacetimedb'), \
+                patch.object(SpacetimeDBClientGenerator, 'get_server_path', return_value=str(server)), \
+                patch('blackholio_client.integration.client_generator.subprocess.run',
+                      side_effect=self.fake_cli(calls)):
+            first = SpacetimeDBClientGenerator(self.config, cache_dir=cache_dir)
+            result = first.generate_client('rust')
+            assert result.success and not result.cache_hit
+            assert result.output_dir.startswith(cache_dir)
+            
+            second = SpacetimeDBClientGenerator(self.config, cache_dir=cache_dir)
+            cached = second.generate_client('rust')
+            assert cached.success and cached.cache_hit
+            assert cached.output_dir == result.output_dir
+            assert cached.generated_files == ['client.py']
+            
+            copied = second.generate_client('rust', output_dir=str(tmp_path / "out"))
+            assert copied.cache_hit
+            assert os.path.isfile(tmp_path / "out" / "client.py")
+            
+            second.clear_cache()
+            assert os.path.isdir(result.output_dir)
+        
+        assert len(calls) == 1
+        stats = second.get_cache_statistics()
+        assert stats['disk_hits'] == 2
+        assert stats['generations'] == 0
+        assert stats['persistent']['hits'] == 2
+    
+    def test_generate_all_clients_parallel(self, tmp_path):
+        """Test that every language is generated and returned in order."""
+        server = self.make_server(tmp_path)
+        calls = []
+        
+        with patch.object(SpacetimeDBClientGenerator, '_find_spacetimedb_cli', return_value='spacetimedb'), \
+                patch.object(SpacetimeDBClientGenerator, 'get_server_path', return_value=str(server)), \
+                patch('blackholio_client.integration.client_generator.subprocess.run',
+                      side_effect=self.fake_cli(calls)):
+            generator = SpacetimeDBClientGenerator(self.config, persistent_cache=False)
+            results = generator.generate_all_clients(output_base_dir=str(tmp_path / "all"))
+        
+        assert list(results) == list(SpacetimeDBClientGenerator.DEFAULT_SERVER_PATHS)
+        assert all(result.success for result in results.values())
+        assert len(calls) == len(results)
+        assert generator.get_cache_statistics()['persistent'] is None
+
 class TestClientLoader:
     """Test SpacetimeDB client loading."""
     
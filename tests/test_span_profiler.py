@@ -0,0 +1,139 @@
+"""
+Tests for the sampled span profiler and its latency histograms.
+"""
+
+import random
+from unittest.mock import AsyncMock
+
+import pytest
+
+from blackholio_client.client import GameClient
+from blackholio_client.utils.debugging import LatencyHistogram, SpanProfiler, get_span_profiler, sorted_percentile
+
+
+class TestLatencyHistogram:
+    """Test LatencyHistogram."""
+
+    def test_bucket_bounds_contain_values(self):
+        histogram = LatencyHistogram()
+        for value in list(range(200)) + [random.randint(0, 10 ** 9) for _ in range(2000)]:
+            low, high = histogram.bucket_bounds(histogram.bucket_index(value))
+            assert low <= value <= high
+            # 5 precision bits: bucket width within 1/32 of its lower bound
+            assert high - low <= max(0, low // 32)
+
+    def test_percentiles_within_precision(self):
+        histogram = LatencyHistogram()
+        values = sorted(random.randint(1_000, 10_000_000) for _ in range(20000))
+        for value in values:
+            histogram.record(value)
+
+        for percentile in (50, 90, 99):
+            exact = values[int(percentile / 100 * len(values)) - 1]
+            assert abs(histogram.percentile(percentile) - exact) <= exact * 0.04
+
+        assert histogram.count == len(values)
+        assert histogram.percentile(100) == values[-1]
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(99) == 0
+        assert histogram.to_dict()['count'] == 0
+
+    def test_buckets_exported(self):
+        histogram = LatencyHistogram()
+        for value in (10, 10, 5_000_000):
+            histogram.record(value)
+        data = histogram.to_dict(include_buckets=True)
+        assert [count for _, count in data['buckets']] == [2, 1]
+        assert data['max_ms'] == 5.0
+
+
+    def test_sorted_percentile_uses_rounded_linear_index(self):
+        values = [10.0, 20.0, 30.0, 40.0, 50.0]
+        assert sorted_percentile(values, 50) == 30.0
+        # 90% of the way through 4 steps is index 3.6, rounded to 4
+        assert sorted_percentile(values, 90) == 50.0
+        assert sorted_percentile(values, 0) == 10.0
+        assert sorted_percentile([], 99) is None
+
+
+class TestSpanProfiler:
+    """Test SpanProfiler sampling."""
+
+    def test_samples_one_in_n(self):
+        profiler = SpanProfiler(sample_rate=0.01)
+        for _ in range(1000):
+            with profiler.span('decode'):
+                pass
+
+        span = profiler.get_statistics()['spans']['decode']
+        assert span['calls'] == 1000
+        assert span['sampled'] == 10
+
+    def test_start_stop(self):
+        profiler = SpanProfiler(sample_rate=1.0)
+        started = profiler.start('send')
+        assert started
+        profiler.stop('send', started)
+        profiler.stop('send', 0)
+        assert profiler.get_histogram('send').count == 1
+
+    def test_disabled(self):
+        profiler = SpanProfiler(enabled=False)
+        assert profiler.start('decode') == 0
+        with profiler.span('decode'):
+            pass
+        assert profiler.get_statistics()['spans'] == {}
+
+    def test_invalid_sample_rate(self):
+        with pytest.raises(ValueError):
+            SpanProfiler(sample_rate=0)
+        with pytest.raises(ValueError):
+            SpanProfiler(sample_rate=1.5)
+
+    def test_reset(self):
+        profiler = SpanProfiler(sample_rate=1.0)
+        with profiler.span('decode'):
+            pass
+        profiler.reset()
+        assert profiler.get_statistics()['spans'] == {}
+
+
+class TestClientStatistics:
+    """Test that GameClient exports the profiler's spans."""
+
+    @pytest.fixture
+    def profiler(self):
+        profiler = get_span_profiler()
+        sample_rate = profiler.sample_rate
+        profiler.set_sample_rate(1.0)
+        profiler.reset()
+        yield profiler
+        profiler.set_sample_rate(sample_rate)
+        profiler.reset()
+
+    @pytest.mark.asyncio
+    async def test_cache_update_span(self, profiler):
+        client = GameClient("localhost:3000", "test_db", auto_reconnect=False)
+        await client._handle_transaction_update_data({
+            'type': 'transaction_update',
+            'update_data': {'database_update': {'tables': []}}
+        })
+
+        stats = client.get_client_statistics()['profiler']
+        assert stats['sample_rate'] == 1.0
+        assert stats['spans']['cache_update']['calls'] == 1
+        assert stats['spans']['cache_update']['sampled'] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_cache_update_is_timed(self, profiler):
+        client = GameClient("localhost:3000", "test_db", auto_reconnect=False)
+        client._process_database_update = AsyncMock(side_effect=ValueError("bad row"))
+        await client._handle_transaction_update_data({
+            'type': 'transaction_update',
+            'update_data': {'database_update': {'tables': []}}
+        })
+
+        span = client.get_client_statistics()['profiler']['spans']['cache_update']
+        assert span['calls'] == span['sampled'] == 1
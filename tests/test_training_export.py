@@ -0,0 +1,252 @@
+"""
+Tests and benchmark for streaming training data export.
+"""
+
+import json
+import random
+import threading
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from blackholio_client.client import GameClient
+from blackholio_client.models.game_entities import EntityType, GameCircle, GameEntity, GamePlayer, Vector2
+from blackholio_client.models.snapshots import VersionedMap
+from blackholio_client.models.training_export import (
+    ExportConfig,
+    FeatureExtractor,
+    TrainingDataExporter,
+    load_npy_shards
+)
+
+
+def entity(entity_id, x, y, mass=10.0, entity_type=EntityType.FOOD):
+    return GameEntity(entity_id=str(entity_id), position=Vector2(x, y), mass=mass, entity_type=entity_type)
+
+
+def cell(entity_id, player_id):
+    return GameCircle(entity_id=str(entity_id), player_id=str(player_id), circle_type='player')
+
+
+def small_world():
+    entities = VersionedMap({
+        '1': entity(1, 0.0, 0.0, mass=30.0, entity_type=EntityType.CIRCLE),
+        '2': entity(2, 10.0, 0.0, mass=10.0, entity_type=EntityType.CIRCLE),
+        '3': entity(3, 100.0, 100.0, mass=50.0, entity_type=EntityType.CIRCLE),
+        '4': entity(4, 5.0, 1.0, mass=1.0),
+        '5': entity(5, -20.0, 0.0, mass=2.0),
+        '6': entity(6, 1000.0, 0.0, mass=3.0),
+        '7': entity(7, 6.0, 0.0, mass=9.0, entity_type=EntityType.OBSTACLE)
+    })
+    circles = VersionedMap({'1': cell(1, 'me'), '2': cell(2, 'me'), '3': cell(3, 'them')})
+    return entities, circles
+
+
+class TestFeatureExtractor:
+    """Test the vectorised feature layout."""
+
+    def test_features(self):
+        extractor = FeatureExtractor(nearest_food=2, nearby_players=2)
+        entities, circles = small_world()
+        world = extractor.world_arrays(entities.snapshot(), circles.snapshot())
+        features = extractor.extract(world, 'me')
+
+        assert features.dtype == np.float32 and len(features) == extractor.size == 16
+        named = dict(zip(extractor.feature_names, features.tolist()))
+        # Mass-weighted center of the two cells
+        assert (named['self_x'], named['self_y']) == (2.5, 0.0)
+        assert (named['self_mass'], named['self_circles']) == (40.0, 2.0)
+        # Nearest food first; the obstacle and the far food are not included
+        assert (named['food0_dx'], named['food0_dy'], named['food0_mass']) == (2.5, 1.0, 1.0)
+        assert (named['food1_dx'], named['food1_mass']) == (-22.5, 2.0)
+        assert (named['player0_dx'], named['player0_dy'], named['player0_mass']) == (97.5, 100.0, 50.0)
+        # Missing neighbours are zero-padded
+        assert (named['player1_dx'], named['player1_mass']) == (0.0, 0.0)
+
+    def test_incremental_conversion_matches_rebuild(self):
+        extractor = FeatureExtractor(nearest_food=3, nearby_players=2)
+        entities, circles = small_world()
+        for i in range(100, 300):
+            entities[str(i)] = entity(i, 5000.0 + i, 5000.0)
+        extractor.world_arrays(entities.snapshot(), circles.snapshot())
+
+        entities['4'] = entity(4, 2.0, 2.0, mass=4.0)
+        del entities['5']
+        for i in range(8, 40):
+            entities[str(i)] = entity(i, float(i), -1.0)
+        entities['9'] = entity(9, 3.0, 0.0, mass=30.0, entity_type=EntityType.CIRCLE)
+        circles['9'] = cell(9, 'them')
+        del entities['2']
+        del circles['2']
+
+        world = extractor.world_arrays(entities.snapshot(), circles.snapshot())
+        stats = extractor.get_statistics()
+        assert (stats['rebuilds'], stats['incremental_updates']) == (1, 1)
+
+        fresh = FeatureExtractor(nearest_food=3, nearby_players=2)
+        expected = fresh.extract_many(fresh.world_arrays(entities, circles), ['me', 'them', None])
+        assert np.array_equal(extractor.extract_many(world, ['me', 'them', None]), expected)
+        assert expected[0][4:7].tolist() == [2.0, 2.0, 4.0]
+
+    def test_unknown_player_is_all_zeros(self):
+        extractor = FeatureExtractor()
+        entities, circles = small_world()
+        world = extractor.world_arrays(entities, circles)
+        assert not extractor.extract(world, 'nobody').any()
+        assert not extractor.extract(extractor.world_arrays({}, {}), 'me').any()
+
+
+class TestTrainingDataExporter:
+    """Test sharding, flushing and bounded queueing."""
+
+    def test_shards_round_trip(self, tmp_path):
+        config = ExportConfig(output_dir=str(tmp_path), rows_per_shard=4, nearest_food=2, nearby_players=1)
+        exporter = TrainingDataExporter(config)
+        entities, circles = small_world()
+        for step in range(10):
+            entities['4'] = entity(4, 5.0 + step, 1.0, mass=1.0)
+            assert exporter.record(entities.snapshot(), circles.snapshot(), 'me', Vector2(1.0, -step))
+        exporter.flush()
+        assert exporter.get_statistics()['shards_written'] == 3
+        exporter.close()
+
+        data = load_npy_shards(tmp_path)
+        assert data['tick'].tolist() == list(range(10))
+        assert data['features'].shape == (10, exporter.extractor.size)
+        assert data['action'][9].tolist() == [1.0, -9.0]
+        # Each row saw the snapshot of its own tick
+        assert data['features'][:, 4].tolist() == [2.5 + step for step in range(10)]
+
+        metadata = json.loads((tmp_path / 'shard-metadata.json').read_text())
+        assert metadata['feature_names'] == exporter.extractor.feature_names
+        stats = exporter.get_statistics()
+        assert stats['rows_written'] == 10 and stats['write_errors'] == 0
+        assert stats['rows_per_second'] > 0
+        with pytest.raises(RuntimeError):
+            exporter.record({}, {}, 'me')
+
+    def test_second_exporter_continues_shard_numbers(self, tmp_path):
+        entities, circles = small_world()
+        for rows in (5, 3):
+            exporter = TrainingDataExporter(ExportConfig(output_dir=str(tmp_path), rows_per_shard=4))
+            for tick in range(rows):
+                exporter.record(entities, circles, 'me', tick=tick)
+            exporter.close()
+
+        assert sorted(path.name for path in tmp_path.glob('*.tick.npy')) == [
+            'shard-00000.tick.npy', 'shard-00001.tick.npy', 'shard-00002.tick.npy'
+        ]
+        assert load_npy_shards(tmp_path)['tick'].tolist() == [0, 1, 2, 3, 4, 0, 1, 2]
+
+    def test_full_queue_drops_when_not_blocking(self, tmp_path):
+        config = ExportConfig(output_dir=str(tmp_path), queue_size=1, block_when_full=False)
+        exporter = TrainingDataExporter(config)
+        entities, circles = small_world()
+        results = [exporter.record(entities, circles, 'me') for _ in range(1000)]
+        exporter.close()
+
+        stats = exporter.get_statistics()
+        assert stats['ticks_dropped'] == results.count(False) > 0
+        assert stats['rows_written'] == stats['ticks_recorded'] == results.count(True)
+
+    def test_parquet_needs_pyarrow(self, tmp_path):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError):
+                TrainingDataExporter(ExportConfig(output_dir=str(tmp_path), format='parquet'))
+        else:
+            exporter = TrainingDataExporter(ExportConfig(output_dir=str(tmp_path), format='parquet'))
+            exporter.record({}, {}, 'me')
+            exporter.close()
+            assert list(tmp_path.glob('*.parquet'))
+
+    def test_config_validation(self):
+        with pytest.raises(ValueError):
+            ExportConfig(format='csv').validate()
+        with pytest.raises(ValueError):
+            ExportConfig(rows_per_shard=0).validate()
+        with pytest.raises(ValueError):
+            ExportConfig(nearest_food=-1).validate()
+
+
+class TestClientTrainingExport:
+    """Test that GameClient exports a row per database update."""
+
+    @pytest.mark.asyncio
+    async def test_rows_follow_database_updates(self, tmp_path):
+        client = GameClient("localhost:3000", "test_db", auto_reconnect=False)
+        client._local_player = GamePlayer(entity_id='7', player_id='7')
+        client.enable_training_export(ExportConfig(output_dir=str(tmp_path)))
+
+        for step in range(3):
+            client._last_input = Vector2(float(step), 0.0)
+            rows = [json.dumps({'entity_id': 1, 'position': {'x': step, 'y': 0.0}, 'mass': 10})]
+            await client._handle_transaction_update_data({'type': 'transaction_update', 'update_data': {
+                'status': {'Committed': {'tables': [{'table_name': 'entity',
+                                                     'updates': [{'inserts': rows, 'deletes': []}]}]}}}})
+        assert client.get_training_export_statistics()['ticks_recorded'] == 3
+        await client.disable_training_export()
+        assert client.get_training_export_statistics() == {'enabled': False}
+
+        data = load_npy_shards(tmp_path)
+        assert data['action'][:, 0].tolist() == [0.0, 1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_never_blocks_updates(self, tmp_path):
+        client = GameClient("localhost:3000", "test_db", auto_reconnect=False)
+        exporter = client.enable_training_export(ExportConfig(output_dir=str(tmp_path), queue_size=1))
+        # Stall the writer so its queue fills up
+        writer_released = threading.Event()
+        append = exporter._append
+        exporter._append = lambda group: (writer_released.wait(), append(group))
+
+        for step in range(5):
+            rows = [json.dumps({'entity_id': 1, 'position': {'x': step, 'y': 0.0}, 'mass': 10})]
+            await client._handle_transaction_update_data({'type': 'transaction_update', 'update_data': {
+                'status': {'Committed': {'tables': [{'table_name': 'entity',
+                                                     'updates': [{'inserts': rows, 'deletes': []}]}]}}}})
+        stats = client.get_training_export_statistics()
+        assert stats['ticks_dropped'] > 0
+        assert stats['ticks_recorded'] + stats['ticks_dropped'] == 5
+
+        writer_released.set()
+        await client.disable_training_export()
+        assert exporter.get_statistics()['rows_written'] == stats['ticks_recorded']
+
+
+class TestTrainingExportBenchmark:
+    """Throughput of the writer on a crowded world."""
+
+    def test_rows_per_second(self, tmp_path):
+        rng = random.Random(4)
+        entities = VersionedMap({str(i): entity(i, rng.uniform(0, 1000), rng.uniform(0, 1000), 1.0)
+                                 for i in range(5000)})
+        circles = VersionedMap()
+        for agent in range(16):
+            for i in range(4):
+                entity_id = str(5000 + agent * 4 + i)
+                entities[entity_id] = entity(entity_id, rng.uniform(0, 1000), rng.uniform(0, 1000), 20.0,
+                                             EntityType.CIRCLE)
+                circles[entity_id] = cell(entity_id, agent)
+
+        exporter = TrainingDataExporter(ExportConfig(output_dir=str(tmp_path), rows_per_shard=1000))
+        ticks = 50
+        start_time = time.perf_counter()
+        for tick in range(ticks):
+            entities[str(tick)] = entity(tick, 0.0, 0.0, 1.0)
+            snapshot, owners = entities.snapshot(), circles.snapshot()
+            for agent in range(16):
+                exporter.record(snapshot, owners, str(agent), (1.0, 0.0), tick=tick, agent=agent)
+        record_seconds = time.perf_counter() - start_time
+        exporter.close()
+        total_seconds = time.perf_counter() - start_time
+
+        stats = exporter.get_statistics()
+        rows = ticks * 16
+        print(f"Training export, 5k entities x 16 agents: record {rows / record_seconds:,.0f} rows/s, "
+              f"end to end {rows / total_seconds:,.0f} rows/s, writer {stats['writer_rows_per_second']:,.0f} rows/s")
+        assert stats['rows_written'] == rows
+        assert load_npy_shards(tmp_path, mmap=True)['features'].shape == (rows, exporter.extractor.size)
@@ -0,0 +1,137 @@
+"""
+Tests and benchmark for the multi-agent vector environment, against the
+in-process fake SpacetimeDB server.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from blackholio_client.vector_env import ShardedVectorGameEnv, VectorEnvConfig, VectorGameEnv
+
+
+# A ticking world light enough for several agent connections on one core
+TICKING_WORLD = dict(world_size=300, tick_rate=20, moves_per_tick=10)
+
+
+class TestVectorGameEnv:
+    """Test lockstep stepping of several agents on one event loop."""
+
+    @pytest.mark.asyncio
+    async def test_reset_and_step(self, fake_server, quiet_logging):
+        server = fake_server(**TICKING_WORLD)
+        env = VectorGameEnv(VectorEnvConfig(host=server.host, num_agents=4))
+        with pytest.raises(RuntimeError):
+            await env.step(np.zeros((4, 2)))
+        try:
+            observations = await env.reset()
+            assert observations.shape == (4, env.observation_size)
+            assert observations.dtype == np.float32
+            assert observations[:, env.feature_names.index('self_mass')].tolist() == [15.0] * 4
+            # Every agent sees food around it
+            assert (observations[:, env.feature_names.index('food0_mass')] > 0).all()
+            names = sorted(client.get_local_player().name for client in env.clients)
+            assert names == ['agent-0', 'agent-1', 'agent-2', 'agent-3']
+
+            actions = np.tile([1.0, 0.0], (4, 1))
+            for _ in range(3):
+                observations, rewards, dones, info = await env.step(actions)
+            assert observations.shape == (4, env.observation_size)
+            assert rewards.shape == (4,) and dones.shape == (4,) and not dones.any()
+
+            stats = env.get_statistics()
+            assert stats['steps'] == 3 and stats['agent_steps'] == 12
+            # Repeated directions are not re-sent
+            assert stats['inputs_sent'] == 4 and stats['inputs_skipped'] == 8
+            assert stats['late_agents'] == 0 and info['late_agents'] == 0
+            assert stats['agent_steps_per_second'] > 0
+        finally:
+            await env.close()
+
+    @pytest.mark.asyncio
+    async def test_lost_agent_is_done_and_respawns(self, fake_server, quiet_logging):
+        server = fake_server(**TICKING_WORLD)
+        env = VectorGameEnv(VectorEnvConfig(host=server.host, num_agents=2))
+        try:
+            await env.reset()
+            # Drop agent 0's circle from its caches, as if it had been eaten
+            client = env.clients[0]
+            for entity in client.get_local_player_entities():
+                del client._circles[entity.entity_id]
+                del client._entities[entity.entity_id]
+
+            observations, rewards, dones, _ = await env.step(np.zeros((2, 2)))
+            assert dones.tolist() == [True, False]
+            assert rewards[0] == 0.0
+            assert env.get_statistics()['respawns'] == 1
+
+            for _ in range(50):
+                observations, _, dones, _ = await env.step(np.zeros((2, 2)))
+                if observations[0, env.feature_names.index('self_mass')] > 0:
+                    break
+            assert observations[0, env.feature_names.index('self_mass')] == 15.0
+        finally:
+            await env.close()
+
+    def test_config_validation(self):
+        with pytest.raises(ValueError):
+            VectorEnvConfig(num_agents=0).validate()
+        with pytest.raises(ValueError):
+            VectorEnvConfig(tick_timeout=0).validate()
+        with pytest.raises(ValueError):
+            VectorEnvConfig(name_prefix="").validate()
+
+
+class TestShardedVectorGameEnv:
+    """Test agents split over worker processes."""
+
+    def test_shards_step_in_agent_order(self, fake_server, quiet_logging):
+        server = fake_server(**TICKING_WORLD)
+        env = ShardedVectorGameEnv(VectorEnvConfig(host=server.host, num_agents=5), shards=2)
+        try:
+            assert env.shard_sizes == [3, 2]
+            observations = env.reset()
+            assert observations.shape[0] == 5
+            observations, rewards, dones, info = env.step(np.ones((5, 2)))
+            assert observations.shape[0] == rewards.shape[0] == dones.shape[0] == 5
+
+            stats = env.get_statistics()
+            assert stats['agent_steps'] == 5
+            assert [shard['agents'] for shard in stats['shards']] == [3, 2]
+        finally:
+            env.close()
+        with pytest.raises(RuntimeError):
+            env.step(np.ones((5, 2)))
+
+
+class TestVectorEnvBenchmark:
+    """Agent-steps per second with all agents in one process and in two shards."""
+
+    @pytest.mark.asyncio
+    async def test_agent_steps_per_second(self, fake_server, quiet_logging):
+        server = fake_server(**TICKING_WORLD)
+        agents, steps = 8, 20
+        env = VectorGameEnv(VectorEnvConfig(host=server.host, num_agents=agents))
+        try:
+            await env.reset()
+            rng = np.random.default_rng(3)
+            for _ in range(steps):
+                await env.step(rng.uniform(-1, 1, (agents, 2)))
+            single = env.get_statistics()
+        finally:
+            await env.close()
+
+        sharded_env = ShardedVectorGameEnv(VectorEnvConfig(host=server.host, num_agents=agents), shards=2)
+        try:
+            sharded_env.reset()
+            for _ in range(steps):
+                sharded_env.step(rng.uniform(-1, 1, (agents, 2)))
+            sharded = sharded_env.get_statistics()
+        finally:
+            sharded_env.close()
+
+        print(f"Vector env, {agents} agents at 20 ticks/s: "
+              f"{single['agent_steps_per_second']:,.0f} agent-steps/s in one process "
+              f"(tick wait {single['average_tick_wait_ms']:.1f}ms), "
+              f"{sharded['agent_steps_per_second']:,.0f} agent-steps/s in 2 shards")
+        assert single['agent_steps'] == sharded['agent_steps'] == agents * steps